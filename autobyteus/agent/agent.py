@@ -1,19 +1,29 @@
 # file: autobyteus/autobyteus/agent/agent.py
 import asyncio
 import logging
-from typing import AsyncIterator, Optional, List, Any, Dict, TYPE_CHECKING 
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Optional, List, Any, Dict
 
 from autobyteus.agent.runtime.agent_runtime import AgentRuntime
+from autobyteus.agent.context import AgentContext, AgentRuntimeState
+from autobyteus.agent.events.notifiers import AgentExternalEventNotifier
+from autobyteus.agent.shutdown_steps import AgentShutdownOrchestrator, LLMInstanceCleanupStep, ToolCleanupStep
 from autobyteus.agent.status.status_enum import AgentStatus 
 from autobyteus.agent.message.agent_input_user_message import AgentInputUserMessage
 from autobyteus.agent.message.inter_agent_message import InterAgentMessage
 from autobyteus.agent.events import UserMessageReceivedEvent, InterAgentMessageReceivedEvent, ToolExecutionApprovalEvent, BaseEvent 
 
-if TYPE_CHECKING:
-    from autobyteus.agent.context import AgentContext 
-
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class _Hibernation:
+    """What a hibernated agent keeps in memory."""
+    notifier: AgentExternalEventNotifier
+    # Config, LLM and tool instances, workspace, custom data and ToDo list; no runtime state.
+    context: AgentContext
+
+
 class Agent:
     """
     User-facing API for interacting with an agent's runtime.
@@ -21,30 +31,102 @@ class Agent:
     into events for the agent's event processing loop by submitting them
     to AgentRuntime. Output is consumed via AgentEventStream which listens
     to AgentExternalEventNotifier.
+
+    An idle agent can be hibernated: its runtime is stopped and released, and the
+    next message (or start()) rehydrates it from its persisted working context
+    through `rehydrate`, which AgentFactory provides.
     """
 
-    def __init__(self, runtime: AgentRuntime):
+    def __init__(self, runtime: AgentRuntime, rehydrate: Optional[Callable[[], AgentRuntime]] = None):
         if not isinstance(runtime, AgentRuntime): # pragma: no cover
             raise TypeError(f"Agent requires an AgentRuntime instance, got {type(runtime).__name__}")
         
-        self._runtime: AgentRuntime = runtime
+        self._runtime: Optional[AgentRuntime] = runtime
         self.agent_id: str = self._runtime.context.agent_id 
+        self._rehydrate = rehydrate
+        self._hibernation: Optional[_Hibernation] = None
+        self._rehydrating = False
+        # The detached context of an agent stopped while hibernated.
+        self._stopped_context: Optional[AgentContext] = None
+        # Serializes hibernation with event submission, so no event reaches a stopping runtime.
+        # Created on first use, inside a running loop: agents are often built outside the loop
+        # they run on, and before Python 3.10 an asyncio.Lock binds to the loop current at creation.
+        self._lifecycle_lock_instance: Optional[asyncio.Lock] = None
         
         logger.info(f"Agent facade initialized for agent_id '{self.agent_id}'.")
 
     @property
-    def context(self) -> 'AgentContext': 
+    def _lifecycle_lock(self) -> asyncio.Lock:
+        if self._lifecycle_lock_instance is None:
+            self._lifecycle_lock_instance = asyncio.Lock()
+        return self._lifecycle_lock_instance
+
+    @property
+    def context(self) -> AgentContext:
+        """
+        The agent's context. While hibernated, a detached context that holds the config,
+        the LLM and tool instances and custom data but no runtime state; reading it
+        never rehydrates the agent.
+        """
+        if self._hibernation is not None:
+            return self._hibernation.context
+        if self._runtime is None:
+            return self._stopped_context
         return self._runtime.context
 
+    @property
+    def external_event_notifier(self) -> Optional[AgentExternalEventNotifier]:
+        """The notifier output and status events are emitted through; kept across hibernation."""
+        if self._hibernation is not None:
+            return self._hibernation.notifier
+        return self._runtime.external_event_notifier if self._runtime else None
+
+    @property
+    def is_hibernated(self) -> bool:
+        return self._hibernation is not None
+
+    @property
+    def last_activity_time(self) -> Optional[float]:
+        """Wall-clock time of the agent's latest event; None while hibernated or before it starts."""
+        event_store = self._runtime.context.state.event_store if self._runtime else None
+        return event_store.latest_timestamp() if event_store else None
+
+    def _wake(self, runtime: AgentRuntime) -> AgentRuntime:
+        """Starts `runtime`, built by `rehydrate`, in place of the hibernated agent."""
+        detached_state = self._hibernation.context.state
+        runtime.context.state.custom_data = detached_state.custom_data
+        runtime.context.state.todo_list = detached_state.todo_list
+        runtime.replace_external_event_notifier(self._hibernation.notifier)
+        self._runtime = runtime
+        self._hibernation = None
+        runtime.start()
+        return runtime
+
+    async def _rehydrate_in_thread(self) -> AgentRuntime:
+        logger.info(f"Agent '{self.agent_id}': Rehydrating from hibernation.")
+        self._rehydrating = True
+        try:
+            # Building the runtime reads the persisted working context from disk.
+            runtime = await asyncio.to_thread(self._rehydrate)
+        finally:
+            self._rehydrating = False
+        return self._wake(runtime)
+
     async def _submit_event_to_runtime(self, event: BaseEvent) -> None:
         """Internal helper to submit an event to the runtime and handle startup."""
-        if not self._runtime.is_running: # pragma: no cover
-            logger.info(f"Agent '{self.agent_id}' runtime is not running. Calling start() before submitting event.")
-            self.start() 
-            await asyncio.sleep(0.05) 
-        
-        logger.debug(f"Agent '{self.agent_id}': Submitting {type(event).__name__} to runtime.")
-        await self._runtime.submit_event(event)
+        async with self._lifecycle_lock:
+            if self._hibernation is not None:
+                runtime = await self._rehydrate_in_thread()
+                while runtime.is_running and runtime.get_worker_loop() is None:
+                    await asyncio.sleep(0.01)
+
+            if not self.is_running: # pragma: no cover
+                logger.info(f"Agent '{self.agent_id}' runtime is not running. Calling start() before submitting event.")
+                self.start() 
+                await asyncio.sleep(0.05) 
+            
+            logger.debug(f"Agent '{self.agent_id}': Submitting {type(event).__name__} to runtime.")
+            await self._runtime.submit_event(event)
 
     async def post_user_message(self, agent_input_user_message: AgentInputUserMessage) -> None:
         if not isinstance(agent_input_user_message, AgentInputUserMessage): # pragma: no cover
@@ -88,17 +170,29 @@ class Agent:
         Returns:
             AgentStatus: The current status of the agent.
         """
-        # If the runtime hasn't started yet, we are uninitialized.
+        # A hibernated agent accepts input like an idle one; it is rehydrated on demand.
+        if self._hibernation is not None:
+            return AgentStatus.IDLE
+        # The runtime is only dropped when a hibernated agent is stopped.
         if not self._runtime:
-            return AgentStatus.UNINITIALIZED
+            return AgentStatus.SHUTDOWN_COMPLETE
         
         return self._runtime.current_status_property
     
     @property
     def is_running(self) -> bool:
-        return self._runtime.is_running
+        return self._runtime is not None and self._runtime.is_running
 
     def start(self) -> None: 
+        if self._hibernation is not None:
+            if self._rehydrating:
+                logger.info(f"Agent '{self.agent_id}' is already being rehydrated. Ignoring start command.")
+                return
+            logger.info(f"Agent '{self.agent_id}': Rehydrating from hibernation.")
+            self._wake(self._rehydrate())
+            return
+        if self._runtime is None:
+            raise RuntimeError(f"Agent '{self.agent_id}' was stopped while hibernated and cannot be started.")
         if self._runtime.is_running: # pragma: no cover
             logger.info(f"Agent '{self.agent_id}' runtime is already running. Ignoring start command.")
             return
@@ -107,10 +201,73 @@ class Agent:
         self._runtime.start() 
 
     async def stop(self, timeout: float = 10.0) -> None: # pragma: no cover
+        # Under the lock, so a rehydration in progress completes first.
+        async with self._lifecycle_lock:
+            hibernation = self._hibernation
+            if hibernation is not None:
+                self._hibernation = None
+                self._rehydrate = None
+                self._stopped_context = hibernation.context
+        if hibernation is not None:
+            await self._stop_hibernated(hibernation)
+            return
+        if self._runtime is None:
+            return
         logger.info(f"Agent '{self.agent_id}' requesting runtime to stop (timeout: {timeout}s).")
         await self._runtime.stop(timeout=timeout) 
 
+    async def _stop_hibernated(self, hibernation: _Hibernation) -> None:
+        """Cleans up the LLM and tool instances a hibernated agent kept, without rehydrating it."""
+        logger.info(f"Agent '{self.agent_id}' is hibernated; cleaning up its LLM and tools instead of stopping a runtime.")
+        context = hibernation.context
+        hibernation.notifier.notify_status_updated(AgentStatus.SHUTTING_DOWN, AgentStatus.IDLE)
+        # MCP server instances were already cleaned up when the agent hibernated.
+        orchestrator = AgentShutdownOrchestrator(steps=[LLMInstanceCleanupStep(), ToolCleanupStep()])
+        if not await orchestrator.run(context):
+            logger.warning(f"Agent '{self.agent_id}': Cleanup after hibernation completed with errors.")
+        context.state.current_status = AgentStatus.SHUTDOWN_COMPLETE
+        hibernation.notifier.notify_status_updated(AgentStatus.SHUTDOWN_COMPLETE, AgentStatus.SHUTTING_DOWN)
+
+    async def hibernate(self, timeout: float = 10.0) -> bool:
+        """
+        Stops an idle agent and releases its runtime: working context, event history,
+        input queues and worker thread. The working context is persisted first, and the
+        agent is rehydrated from it on the next message or start(). The config, LLM and
+        tool instances stay with the agent and are cleaned up by stop().
+
+        Returns:
+            bool: True if the agent is hibernated, False if it is busy or cannot be rehydrated.
+        """
+        async with self._lifecycle_lock:
+            if self._hibernation is not None:
+                return True
+            if self._rehydrate is None:
+                logger.warning(f"Agent '{self.agent_id}' has no rehydration hook and cannot hibernate.")
+                return False
+            if not self._runtime.is_running or self._runtime.current_status_property != AgentStatus.IDLE:
+                return False
+
+            runtime = self._runtime
+            state = runtime.context.state
+            notifier = await runtime.hibernate(timeout=timeout)
+            if state.memory_manager is not None:
+                await asyncio.to_thread(state.memory_manager.persist_working_context_snapshot)
+            detached_state = AgentRuntimeState(
+                agent_id=self.agent_id, workspace=state.workspace, custom_data=state.custom_data
+            )
+            detached_state.current_status = AgentStatus.IDLE
+            detached_state.llm_instance = state.llm_instance
+            detached_state.tool_instances = state.tool_instances
+            detached_state.todo_list = state.todo_list
+            self._hibernation = _Hibernation(
+                notifier=notifier,
+                context=AgentContext(agent_id=self.agent_id, config=runtime.context.config, state=detached_state),
+            )
+            self._runtime = None
+            logger.info(f"Agent '{self.agent_id}' hibernated.")
+            return True
+
 
     def __repr__(self) -> str:
-        status_val = self._runtime.current_status_property.value 
+        status_val = self.get_current_status().value 
         return f"<Agent agent_id='{self.agent_id}', current_status='{status_val}'>"
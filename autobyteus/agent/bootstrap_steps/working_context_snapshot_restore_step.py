@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import TYPE_CHECKING
 
@@ -31,7 +32,8 @@ class WorkingContextSnapshotRestoreStep(BaseBootstrapStep):
             system_prompt = llm_instance.config.system_message if llm_instance else ""
 
         try:
-            self._bootstrapper.bootstrap(memory_manager, system_prompt, restore_options)
+            # In a worker thread, so agents restored together read their snapshots in parallel.
+            await asyncio.to_thread(self._bootstrapper.bootstrap, memory_manager, system_prompt, restore_options)
             return True
         except Exception as exc:  # pragma: no cover - defensive
             logger.error("WorkingContextSnapshotRestoreStep failed: %s", exc, exc_info=True)
@@ -6,10 +6,13 @@ from .agent_config import AgentConfig
 from .agent_runtime_state import AgentRuntimeState
 from .agent_context import AgentContext
 from .agent_context_registry import AgentContextRegistry
+from .agent_memory_footprint import AgentMemoryFootprint, measure_agent_memory
 
 __all__ = [
     "AgentContext",
     "AgentConfig", 
     "AgentRuntimeState",
     "AgentContextRegistry",
+    "AgentMemoryFootprint",
+    "measure_agent_memory",
 ]
@@ -4,6 +4,7 @@ from typing import Dict, Optional, TYPE_CHECKING
 import weakref
 
 from autobyteus.utils.singleton import SingletonMeta
+from .agent_memory_footprint import AgentMemoryFootprint, measure_agent_memory
 
 if TYPE_CHECKING:
     from .agent_context import AgentContext
@@ -71,3 +72,20 @@ class AgentContextRegistry(metaclass=SingletonMeta):
                 del self._contexts[agent_id]
         
         return None
+
+    def get_memory_footprints(self) -> Dict[str, AgentMemoryFootprint]:
+        """
+        Measures the approximate memory held by each live agent, by component.
+
+        This walks every agent's state, so it is meant for periodic accounting rather
+        than hot paths. Hibernated agents have no live context and are not listed.
+
+        Returns:
+            A dictionary mapping agent_id to its AgentMemoryFootprint.
+        """
+        footprints: Dict[str, AgentMemoryFootprint] = {}
+        for agent_id in list(self._contexts):
+            context = self.get_context(agent_id)
+            if context is not None:
+                footprints[agent_id] = measure_agent_memory(context)
+        return footprints
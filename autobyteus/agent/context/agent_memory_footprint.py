@@ -0,0 +1,116 @@
+# file: autobyteus/autobyteus/agent/context/agent_memory_footprint.py
+"""
+Approximate per-agent memory accounting.
+
+Sizes are `sys.getsizeof` summed over the object graph of each component. An object
+reachable from several components is counted once, under the first one (in the order
+of `COMPONENTS`) that reaches it. Classes, modules, functions, loggers and singletons
+are shared by every agent and are not counted.
+"""
+import logging
+import sys
+import types
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Set, TYPE_CHECKING
+
+from autobyteus.utils.singleton import SingletonMeta
+
+if TYPE_CHECKING:
+    from .agent_context import AgentContext
+
+logger = logging.getLogger(__name__)
+
+COMPONENTS = ("working_context", "event_store", "llm", "tools", "memory_manager", "runtime_state")
+
+_SHARED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+    logging.Logger,
+)
+_LEAF_TYPES = (str, bytes, bytearray, int, float, complex, bool, type(None), range)
+
+
+@dataclass(frozen=True)
+class AgentMemoryFootprint:
+    agent_id: str
+    components: Dict[str, int]
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.components.values())
+
+
+def _references(obj: Any) -> Iterable[Any]:
+    if isinstance(obj, dict):
+        # Copied first: a running agent may mutate its state while it is measured.
+        items = list(obj.items())
+        return [part for item in items for part in item]
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return list(obj)
+    refs = []
+    attrs = getattr(obj, "__dict__", None)
+    if isinstance(attrs, dict):
+        refs.append(attrs)
+    for klass in type(obj).__mro__:
+        for slot in klass.__dict__.get("__slots__", ()):
+            value = getattr(obj, slot, None)
+            if value is not None:
+                refs.append(value)
+    if not refs and hasattr(obj, "__iter__") and hasattr(obj, "__len__"):
+        # deque, array and other sized containers without a __dict__.
+        try:
+            refs.extend(obj)
+        except Exception:
+            pass
+    return refs
+
+
+def approximate_size(obj: Any, seen: Optional[Set[int]] = None) -> int:
+    """Bytes held by `obj` and everything it references, skipping (and adding to) `seen`."""
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, _SHARED_TYPES) or isinstance(type(current), SingletonMeta):
+            continue
+        try:
+            total += sys.getsizeof(current)
+        except TypeError:
+            continue
+        if isinstance(current, _LEAF_TYPES):
+            continue
+        try:
+            stack.extend(_references(current))
+        except RuntimeError:
+            # Changed size while being copied; count what was reached so far.
+            continue
+    return total
+
+
+def measure_agent_memory(context: 'AgentContext') -> AgentMemoryFootprint:
+    state = context.state
+    memory_manager = state.memory_manager
+    # The context objects themselves are reached from components via back-references;
+    # stopping there keeps each component to what it owns.
+    seen: Set[int] = {id(context), id(state), id(context.config)}
+    if state.status_manager_ref is not None:
+        seen.add(id(state.status_manager_ref))
+
+    roots = {
+        "working_context": getattr(memory_manager, "working_context_snapshot", None),
+        "event_store": state.event_store,
+        "llm": state.llm_instance,
+        "tools": state.tool_instances,
+        "memory_manager": memory_manager,
+        "runtime_state": vars(state),
+    }
+    components = {name: approximate_size(roots[name], seen) if roots[name] is not None else 0 for name in COMPONENTS}
+    return AgentMemoryFootprint(agent_id=context.agent_id, components=components)
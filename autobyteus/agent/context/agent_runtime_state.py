@@ -12,6 +12,7 @@ from autobyteus.llm.base_llm import BaseLLM
 from autobyteus.agent.status.status_enum import AgentStatus 
 from autobyteus.agent.workspace.base_workspace import BaseAgentWorkspace
 from autobyteus.agent.tool_invocation import ToolInvocation
+from autobyteus.utils.file_line_index import FileLineIndexCache
 # LLMConfig is no longer needed here
 # from autobyteus.llm.utils.llm_config import LLMConfig 
 from autobyteus.task_management.todo_list import ToDoList
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
     from autobyteus.tools.base_tool import BaseTool 
     from autobyteus.agent.tool_invocation import ToolInvocationTurn
     from autobyteus.memory.memory_manager import MemoryManager
+    from autobyteus.agent.streaming.utils.write_file_stager import WriteFileStager
     from autobyteus.memory.restore.working_context_snapshot_bootstrapper import WorkingContextSnapshotBootstrapOptions
 
 logger = logging.getLogger(__name__)
@@ -66,6 +68,10 @@ class AgentRuntimeState:
         self.restore_options: Optional["WorkingContextSnapshotBootstrapOptions"] = None
         
         self.processed_system_prompt: Optional[str] = None
+        # Line indexes for read_file range reads, validated against each file's stat.
+        self.file_line_index_cache: FileLineIndexCache = FileLineIndexCache()
+        # Streaming-apply staging for write_file (only set when enabled).
+        self.write_file_stager: Optional["WriteFileStager"] = None
         # self.final_llm_config_for_creation removed
         
         self.status_manager_ref: Optional['AgentStatusManager'] = None 
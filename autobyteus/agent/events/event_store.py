@@ -3,11 +3,11 @@ from __future__ import annotations
 
 import logging
 import time
-import uuid
 from dataclasses import dataclass
 from typing import List, Optional
 
 from autobyteus.agent.events.agent_events import BaseEvent
+from autobyteus.utils.monotonic_id import id_generator_for
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +30,7 @@ class AgentEventStore:
     """
     def __init__(self, agent_id: str):
         self._agent_id = agent_id
+        self._id_generator = id_generator_for(agent_id)
         self._events: List[EventEnvelope] = []
         self._sequence: int = 0
         logger.debug(f"AgentEventStore initialized for agent_id '{agent_id}'.")
@@ -39,7 +40,7 @@ class AgentEventStore:
                correlation_id: Optional[str] = None,
                caused_by_event_id: Optional[str] = None) -> EventEnvelope:
         envelope = EventEnvelope(
-            event_id=str(uuid.uuid4()),
+            event_id=self._id_generator.next_id("ev_"),
             event_type=type(event).__name__,
             timestamp=time.time(),
             agent_id=self._agent_id,
@@ -55,3 +56,6 @@ class AgentEventStore:
 
     def all_events(self) -> List[EventEnvelope]:
         return list(self._events)
+
+    def latest_timestamp(self) -> Optional[float]:
+        return self._events[-1].timestamp if self._events else None
@@ -1,6 +1,9 @@
 # file: autobyteus/autobyteus/agent/factory/agent_factory.py
+import asyncio
+import functools
 import logging
 import random
+import time
 from typing import Optional, TYPE_CHECKING, Dict, List
 
 # LLMFactory is no longer needed here.
@@ -8,18 +11,28 @@ from autobyteus.agent.agent import Agent
 from autobyteus.agent.context.agent_config import AgentConfig
 from autobyteus.agent.context.agent_runtime_state import AgentRuntimeState 
 from autobyteus.agent.context.agent_context import AgentContext 
+from autobyteus.agent.context.agent_memory_footprint import AgentMemoryFootprint, measure_agent_memory
+from autobyteus.agent.status.status_enum import AgentStatus
 from autobyteus.agent.events import *
 from autobyteus.agent.workspace.base_workspace import BaseAgentWorkspace 
 from autobyteus.agent.handlers import *
 from autobyteus.utils.singleton import SingletonMeta
 from autobyteus.tools.base_tool import BaseTool
-from autobyteus.memory import FileMemoryStore, MemoryManager, resolve_memory_base_dir
+from autobyteus.memory import (
+    FileMemoryStore,
+    MemoryManager,
+    SqliteMemoryStore,
+    resolve_memory_backend,
+    resolve_memory_base_dir,
+)
+from autobyteus.memory.store.tool_result_spill_store import ToolResultSpillStore
 from autobyteus.memory.store.working_context_snapshot_store import WorkingContextSnapshotStore
 from autobyteus.memory.restore.working_context_snapshot_bootstrapper import WorkingContextSnapshotBootstrapOptions
 from autobyteus.agent.input_processor.memory_ingest_input_processor import MemoryIngestInputProcessor
 from autobyteus.agent.tool_execution_result_processor.memory_ingest_tool_result_processor import (
     MemoryIngestToolResultProcessor,
 )
+from autobyteus.agent.tool_execution_result_processor.tool_result_size_governor import ToolResultSizeGovernor
 
 if TYPE_CHECKING:
     from autobyteus.agent.runtime.agent_runtime import AgentRuntime
@@ -35,6 +48,7 @@ class AgentFactory(metaclass=SingletonMeta):
 
     def __init__(self):
         self._active_agents: Dict[str, Agent] = {}
+        self._idle_hibernation_task: Optional[asyncio.Task] = None
         logger.info("AgentFactory (Singleton) initialized.")
 
     def _get_default_event_handler_registry(self) -> EventHandlerRegistry:
@@ -123,11 +137,18 @@ class AgentFactory(metaclass=SingletonMeta):
             custom_data=config.initial_custom_data
         )
 
-        # Memory manager (file-backed) initialization
+        # Memory manager initialization (JSONL files by default, SQLite via AUTOBYTEUS_MEMORY_BACKEND)
         memory_dir = resolve_memory_base_dir(override_dir=memory_dir_override or config.memory_dir)
-        memory_store = FileMemoryStore(base_dir=memory_dir, agent_id=agent_id)
+        if resolve_memory_backend() == "sqlite":
+            memory_store = SqliteMemoryStore(base_dir=memory_dir, agent_id=agent_id)
+        else:
+            memory_store = FileMemoryStore(base_dir=memory_dir, agent_id=agent_id)
         working_context_snapshot_store = WorkingContextSnapshotStore(base_dir=memory_dir, agent_id=agent_id)
-        runtime_state.memory_manager = MemoryManager(store=memory_store, working_context_snapshot_store=working_context_snapshot_store)
+        runtime_state.memory_manager = MemoryManager(
+            store=memory_store,
+            working_context_snapshot_store=working_context_snapshot_store,
+            tool_result_spill_store=ToolResultSpillStore(base_dir=memory_dir, agent_id=agent_id),
+        )
         runtime_state.restore_options = restore_options
 
         # Ensure memory ingest processors are present
@@ -135,6 +156,8 @@ class AgentFactory(metaclass=SingletonMeta):
             config.input_processors.append(MemoryIngestInputProcessor())
         if not any(isinstance(p, MemoryIngestToolResultProcessor) for p in config.tool_execution_result_processors):
             config.tool_execution_result_processors.append(MemoryIngestToolResultProcessor())
+        if not any(isinstance(p, ToolResultSizeGovernor) for p in config.tool_execution_result_processors):
+            config.tool_execution_result_processors.append(ToolResultSizeGovernor())
         
         # --- Set pre-initialized instances on the state ---
         runtime_state.llm_instance = config.llm_instance
@@ -173,7 +196,7 @@ class AgentFactory(metaclass=SingletonMeta):
             config=config,
         )
 
-        agent = Agent(runtime=runtime)
+        agent = Agent(runtime=runtime, rehydrate=functools.partial(self._rehydrate_runtime, agent_id, config, None))
         self._active_agents[agent_id] = agent
         logger.info(f"Agent '{agent_id}' created and stored successfully.")
         return agent
@@ -196,11 +219,20 @@ class AgentFactory(metaclass=SingletonMeta):
             memory_dir_override=memory_dir,
             restore_options=restore_options,
         )
-        agent = Agent(runtime=runtime)
+        agent = Agent(runtime=runtime, rehydrate=functools.partial(self._rehydrate_runtime, agent_id, config, memory_dir))
         self._active_agents[agent_id] = agent
         logger.info(f"Agent '{agent_id}' restored and stored successfully.")
         return agent
 
+    def _rehydrate_runtime(self, agent_id: str, config: AgentConfig, memory_dir: Optional[str]) -> 'AgentRuntime':
+        """Builds a runtime for a hibernated agent that restores its persisted working context."""
+        return self._create_runtime_with_id(
+            agent_id=agent_id,
+            config=config,
+            memory_dir_override=memory_dir,
+            restore_options=WorkingContextSnapshotBootstrapOptions(),
+        )
+
     def get_agent(self, agent_id: str) -> Optional[Agent]:
         """Retrieves an active agent instance by its ID."""
         return self._active_agents.get(agent_id)
@@ -220,3 +252,90 @@ class AgentFactory(metaclass=SingletonMeta):
     def list_active_agent_ids(self) -> List[str]:
         """Returns a list of IDs of all active agents managed by this factory."""
         return list(self._active_agents.keys())
+
+    def get_memory_footprints(self) -> Dict[str, AgentMemoryFootprint]:
+        """Approximate memory held by each resident (not hibernated) agent, by component."""
+        return {
+            agent_id: measure_agent_memory(agent.context)
+            for agent_id, agent in list(self._active_agents.items())
+            if not agent.is_hibernated
+        }
+
+    async def hibernate_agent(self, agent_id: str, timeout: float = 10.0) -> bool:
+        """
+        Hibernates an idle agent, releasing its runtime until its next message.
+        Returns False if the agent is unknown or busy.
+        """
+        agent = self._active_agents.get(agent_id)
+        if agent is None:
+            logger.warning(f"Agent with ID '{agent_id}' not found for hibernation.")
+            return False
+        return await agent.hibernate(timeout=timeout)
+
+    async def hibernate_idle_agents(self,
+                                    idle_seconds: float,
+                                    max_resident_bytes: Optional[int] = None,
+                                    timeout: float = 10.0) -> List[str]:
+        """
+        Hibernates agents that have been idle for at least `idle_seconds`, least recently
+        active first. With `max_resident_bytes`, stops once the measured footprint of the
+        resident agents is within it.
+
+        Returns:
+            The IDs of the agents hibernated.
+        """
+        now = time.time()
+        candidates = []
+        for agent_id, agent in list(self._active_agents.items()):
+            if agent.is_hibernated or agent.get_current_status() != AgentStatus.IDLE:
+                continue
+            last_activity = agent.last_activity_time
+            if last_activity is not None and now - last_activity >= idle_seconds:
+                candidates.append((last_activity, agent_id))
+        candidates.sort()
+
+        footprints: Dict[str, AgentMemoryFootprint] = {}
+        resident_bytes = 0
+        if max_resident_bytes is not None:
+            footprints = self.get_memory_footprints()
+            resident_bytes = sum(footprint.total_bytes for footprint in footprints.values())
+
+        hibernated: List[str] = []
+        for _, agent_id in candidates:
+            if max_resident_bytes is not None and resident_bytes <= max_resident_bytes:
+                break
+            if await self.hibernate_agent(agent_id, timeout=timeout):
+                hibernated.append(agent_id)
+                footprint = footprints.get(agent_id)
+                resident_bytes -= footprint.total_bytes if footprint else 0
+
+        if hibernated:
+            logger.info(f"Hibernated {len(hibernated)} idle agents: {hibernated}")
+        return hibernated
+
+    def start_idle_hibernation(self,
+                               idle_seconds: float,
+                               interval: float = 60.0,
+                               max_resident_bytes: Optional[int] = None) -> None:
+        """
+        Runs `hibernate_idle_agents` every `interval` seconds on the running event loop
+        until `stop_idle_hibernation` is called.
+        """
+        self.stop_idle_hibernation()
+
+        async def _sweep() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.hibernate_idle_agents(idle_seconds, max_resident_bytes=max_resident_bytes)
+                except Exception as e:
+                    logger.error(f"Idle agent hibernation sweep failed: {e}", exc_info=True)
+
+        self._idle_hibernation_task = asyncio.get_running_loop().create_task(_sweep())
+        logger.info(f"Idle agent hibernation started (idle_seconds={idle_seconds}, interval={interval}s).")
+
+    def stop_idle_hibernation(self) -> None:
+        if self._idle_hibernation_task is not None:
+            self._idle_hibernation_task.cancel()
+            self._idle_hibernation_task = None
+            logger.info("Idle agent hibernation stopped.")
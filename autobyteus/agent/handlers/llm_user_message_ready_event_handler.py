@@ -12,6 +12,11 @@ from autobyteus.llm.utils.token_usage import TokenUsage
 from autobyteus.agent.streaming.streaming_response_handler import StreamingResponseHandler
 from autobyteus.agent.streaming.streaming_handler_factory import StreamingResponseHandlerFactory
 from autobyteus.agent.streaming.parser.events import SegmentEvent, SegmentType
+from autobyteus.agent.streaming.utils.write_file_stager import (
+    WriteFileStager,
+    is_stream_write_file_enabled,
+    workspace_path_resolver,
+)
 from autobyteus.agent.tool_invocation import ToolInvocationTurn
 from autobyteus.agent.llm_request_assembler import LLMRequestAssembler
 from autobyteus.agent.token_budget import apply_compaction_policy, resolve_token_budget
@@ -79,6 +84,8 @@ class LLMUserMessageReadyEventHandler(AgentEventHandler):
 
         # Callback for segment events from streaming parser
         def emit_segment_event(event: SegmentEvent):
+            if write_file_stager:
+                write_file_stager.on_segment_event(event)
             if notifier:
                 try:
                     notifier.notify_agent_segment_event(event.to_dict())
@@ -108,6 +115,13 @@ class LLMUserMessageReadyEventHandler(AgentEventHandler):
                         agent_id,
                         type(tool),
                     )
+
+        # Opt-in streaming-apply: stage write_file content on disk while it is generated.
+        write_file_stager: Optional[WriteFileStager] = None
+        if "write_file" in tool_names and is_stream_write_file_enabled():
+            if context.state.write_file_stager is None:
+                context.state.write_file_stager = WriteFileStager(workspace_path_resolver(context))
+            write_file_stager = context.state.write_file_stager
         
         # Get provider from LLM instance
         provider = context.state.llm_instance.model.provider if context.state.llm_instance else None
@@ -221,6 +235,9 @@ class LLMUserMessageReadyEventHandler(AgentEventHandler):
             # After finalization, enqueue any parsed tool invocations.
             if tool_names:
                 tool_invocations = streaming_handler.get_all_invocations()
+                if write_file_stager:
+                    # Staged segments that did not parse into an invocation are never executed.
+                    write_file_stager.discard_unclaimed(invocation.id for invocation in tool_invocations)
                 if tool_invocations:
                     context.state.active_multi_tool_call_turn = ToolInvocationTurn(
                         invocations=tool_invocations
@@ -250,6 +267,8 @@ class LLMUserMessageReadyEventHandler(AgentEventHandler):
             
         except Exception as e:
             logger.error(f"Agent '{agent_id}' error during LLM stream: {e}", exc_info=True)
+            if write_file_stager:
+                write_file_stager.discard_all()
             error_message_for_output = f"Error processing your request with the LLM: {str(e)}"
             
             logger.warning(f"Agent '{agent_id}' LLM stream error. Error message for output: {error_message_for_output}")
@@ -291,11 +310,12 @@ class LLMUserMessageReadyEventHandler(AgentEventHandler):
                 budget = resolve_token_budget(llm_model, llm_config, memory_manager.compaction_policy)
                 if budget:
                     apply_compaction_policy(memory_manager.compaction_policy, budget)
-                    if memory_manager.compactor and memory_manager.compaction_policy.should_compact(
+                    memory_manager.schedule_compaction(
                         token_usage.prompt_tokens,
                         budget.input_budget,
-                    ):
-                        memory_manager.request_compaction()
+                        sent_messages=request.messages,
+                        current_turn_id=active_turn_id,
+                    )
         llm_complete_event = LLMCompleteResponseReceivedEvent(
             complete_response=complete_response_obj
         )
@@ -69,6 +69,10 @@ class ToolExecutionApprovalEventHandler(AgentEventHandler):
 
         denial_reason = event.reason or "Tool execution was denied by user/system."
 
+        write_file_stager = getattr(context.state, "write_file_stager", None)
+        if write_file_stager:
+            write_file_stager.discard(retrieved_invocation.id)
+
         if notifier:
             try:
                 notifier.notify_agent_tool_denied(
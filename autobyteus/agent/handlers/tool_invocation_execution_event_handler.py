@@ -221,4 +221,9 @@ class ToolInvocationExecutionEventHandler(AgentEventHandler):
                             exc_info=True,
                         )
 
+        # Content staged during streaming is either committed by now or no longer needed.
+        write_file_stager = getattr(context.state, "write_file_stager", None)
+        if write_file_stager:
+            write_file_stager.discard(invocation_id)
+
         await context.input_event_queues.enqueue_tool_result(result_event)
@@ -44,9 +44,12 @@ class LLMRequestAssembler:
         compactor = self.memory_manager.compactor
 
         if self.memory_manager.compaction_required and policy and compactor:
+            # Turns already summarized by a background compaction are out of the window.
+            precompacted = await self.memory_manager.wait_for_background_compaction()
             turn_ids = compactor.select_compaction_window()
             if turn_ids:
-                compactor.compact(turn_ids)
+                await compactor.compact_async(turn_ids)
+            if turn_ids or precompacted:
                 bundle = self.memory_manager.retriever.retrieve(
                     max_episodic=self.max_episodic,
                     max_semantic=self.max_semantic,
@@ -13,6 +13,7 @@ from autobyteus.agent.events import BaseEvent, AgentErrorEvent, AgentStoppedEven
 from autobyteus.agent.status.status_update_utils import apply_event_and_derive_status
 from autobyteus.agent.handlers import EventHandlerRegistry
 from autobyteus.agent.runtime.agent_worker import AgentWorker
+from autobyteus.agent.shutdown_steps import MemoryCleanupStep, McpServerCleanupStep, StagedWriteCleanupStep
 
 if TYPE_CHECKING:
     pass
@@ -138,6 +139,26 @@ class AgentRuntime:
         await self._apply_event_and_derive_status(AgentStoppedEvent()) 
         logger.info(f"AgentRuntime for '{agent_id}' stop() method completed.")
 
+    async def hibernate(self, timeout: float = 10.0) -> AgentExternalEventNotifier:
+        """
+        Stops the worker so the agent can be rebuilt later from its persisted state.
+        Subscribers do not see the shutdown. Only a running background compaction, per-agent
+        MCP server instances and staged write_file content are cleaned up: the LLM and tool instances belong to the config
+        and are reused by the runtime that rehydrates the agent. Returns the notifier to
+        hand to that runtime.
+        """
+        notifier = self.replace_external_event_notifier(AgentExternalEventNotifier(agent_id=self.context.agent_id))
+        self._worker.shutdown_steps = [MemoryCleanupStep(), McpServerCleanupStep(), StagedWriteCleanupStep()]
+        await self.stop(timeout=timeout)
+        return notifier
+
+    def replace_external_event_notifier(self, notifier: AgentExternalEventNotifier) -> AgentExternalEventNotifier:
+        """Routes status and data events to `notifier`; returns the notifier it replaces."""
+        previous = self.external_event_notifier
+        self.external_event_notifier = notifier
+        self.status_manager.notifier = notifier
+        return previous
+
     async def _apply_event_and_derive_status(self, event: BaseEvent) -> None:
         await apply_event_and_derive_status(event, self.context)
 
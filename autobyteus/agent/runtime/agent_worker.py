@@ -17,7 +17,7 @@ from autobyteus.agent.events import (
 )
 from autobyteus.agent.events import WorkerEventDispatcher
 from autobyteus.agent.runtime.agent_thread_pool_manager import AgentThreadPoolManager 
-from autobyteus.agent.shutdown_steps import AgentShutdownOrchestrator
+from autobyteus.agent.shutdown_steps import AgentShutdownOrchestrator, BaseShutdownStep
 from autobyteus.agent.status.status_deriver import AgentStatusDeriver
 from autobyteus.agent.status.status_update_utils import apply_event_and_derive_status
 
@@ -54,6 +54,8 @@ class AgentWorker:
         
         self._is_active: bool = False 
         self._stop_initiated: bool = False 
+        # Cleanup run when the loop exits; None runs the orchestrator's default steps.
+        self.shutdown_steps: Optional[List[BaseShutdownStep]] = None
 
         self._done_callbacks: list[Callable[[concurrent.futures.Future], None]] = []
 
@@ -252,7 +254,7 @@ class AgentWorker:
             logger.info(f"AgentWorker '{agent_id}' async_run() loop has finished.")
             # --- Shutdown sequence moved here, inside the original task's finally block ---
             logger.info(f"AgentWorker '{agent_id}': Running shutdown sequence on worker loop.")
-            orchestrator = AgentShutdownOrchestrator()
+            orchestrator = AgentShutdownOrchestrator(steps=self.shutdown_steps)
             cleanup_successful = await orchestrator.run(self.context)
 
             if not cleanup_successful:
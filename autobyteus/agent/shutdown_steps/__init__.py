@@ -8,6 +8,8 @@ from .base_shutdown_step import BaseShutdownStep
 from .llm_instance_cleanup_step import LLMInstanceCleanupStep
 from .mcp_server_cleanup_step import McpServerCleanupStep
 from .tool_cleanup_step import ToolCleanupStep
+from .staged_write_cleanup_step import StagedWriteCleanupStep
+from .memory_cleanup_step import MemoryCleanupStep
 from .agent_shutdown_orchestrator import AgentShutdownOrchestrator
 
 __all__ = [
@@ -15,5 +17,7 @@ __all__ = [
     "LLMInstanceCleanupStep",
     "McpServerCleanupStep",
     "ToolCleanupStep",
+    "StagedWriteCleanupStep",
+    "MemoryCleanupStep",
     "AgentShutdownOrchestrator",
 ]
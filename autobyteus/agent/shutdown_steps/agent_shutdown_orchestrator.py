@@ -6,6 +6,8 @@ from .base_shutdown_step import BaseShutdownStep
 from .llm_instance_cleanup_step import LLMInstanceCleanupStep
 from .mcp_server_cleanup_step import McpServerCleanupStep
 from .tool_cleanup_step import ToolCleanupStep
+from .staged_write_cleanup_step import StagedWriteCleanupStep
+from .memory_cleanup_step import MemoryCleanupStep
 
 if TYPE_CHECKING:
     from autobyteus.agent.context import AgentContext
@@ -27,8 +29,11 @@ class AgentShutdownOrchestrator:
         """
         if steps is None:
             self.shutdown_steps: List[BaseShutdownStep] = [
+                # First: a running compaction still uses the LLM and the memory store.
+                MemoryCleanupStep(),
                 LLMInstanceCleanupStep(),
                 ToolCleanupStep(),
+                StagedWriteCleanupStep(),
                 McpServerCleanupStep(),
             ]
             logger.debug("AgentShutdownOrchestrator initialized with default steps.")
@@ -0,0 +1,32 @@
+# file: autobyteus/autobyteus/agent/shutdown_steps/memory_cleanup_step.py
+import logging
+from typing import TYPE_CHECKING
+
+from .base_shutdown_step import BaseShutdownStep
+
+if TYPE_CHECKING:
+    from autobyteus.agent.context import AgentContext
+
+logger = logging.getLogger(__name__)
+
+class MemoryCleanupStep(BaseShutdownStep):
+    """
+    Shutdown step that cancels a background compaction still running in the agent's
+    memory manager, so it cannot write to the memory store after the agent stopped.
+    """
+    def __init__(self):
+        logger.debug("MemoryCleanupStep initialized.")
+
+    async def execute(self, context: 'AgentContext') -> bool:
+        agent_id = context.agent_id
+        memory_manager = getattr(context.state, "memory_manager", None)
+        if memory_manager is None:
+            logger.debug(f"Agent '{agent_id}': No memory manager found. Skipping MemoryCleanupStep.")
+            return True
+
+        try:
+            await memory_manager.close()
+        except Exception as e:  # pragma: no cover - defensive logging
+            # The remaining steps must still release the LLM and tools; do not halt the shutdown.
+            logger.error(f"Agent '{agent_id}': Error stopping background compaction: {e}", exc_info=True)
+        return True
@@ -0,0 +1,36 @@
+# file: autobyteus/autobyteus/agent/shutdown_steps/staged_write_cleanup_step.py
+import logging
+from typing import TYPE_CHECKING
+
+from .base_shutdown_step import BaseShutdownStep
+
+if TYPE_CHECKING:
+    from autobyteus.agent.context import AgentContext
+
+logger = logging.getLogger(__name__)
+
+class StagedWriteCleanupStep(BaseShutdownStep):
+    """
+    Shutdown step that removes write_file content still staged on disk for invocations
+    that never executed.
+    """
+    def __init__(self):
+        logger.debug("StagedWriteCleanupStep initialized.")
+
+    async def execute(self, context: 'AgentContext') -> bool:
+        agent_id = context.agent_id
+        write_file_stager = getattr(context.state, "write_file_stager", None)
+        if write_file_stager is None:
+            logger.debug(f"Agent '{agent_id}': No write_file stager found. Skipping StagedWriteCleanupStep.")
+            return True
+
+        pending = write_file_stager.staged_invocation_ids
+        try:
+            await write_file_stager.close()
+        except Exception as e:  # pragma: no cover - defensive logging
+            # Leftover staged files are harmless to the agent; do not halt the shutdown.
+            logger.error(f"Agent '{agent_id}': Error removing staged write_file content: {e}", exc_info=True)
+            return True
+        if pending:
+            logger.info(f"Agent '{agent_id}': Removed staged write_file content of {len(pending)} unexecuted invocation(s).")
+        return True
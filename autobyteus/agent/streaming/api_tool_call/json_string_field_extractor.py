@@ -7,7 +7,7 @@ fields (e.g., path/content/patch) from a JSON object as deltas arrive.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, List, Optional
 
 
 @dataclass
@@ -41,8 +41,9 @@ class JsonStringFieldExtractor:
         self._current_key: Optional[str] = None
         self._current_value_key: Optional[str] = None
         self._string_buffer: str = ""
-        self._values: Dict[str, str] = {}
-        self._pending_delta: Dict[str, str] = {}
+        # Values are kept as chunk lists: repeated string concatenation is quadratic.
+        self._values: Dict[str, List[str]] = {}
+        self._pending_delta: Dict[str, List[str]] = {}
 
     def feed(self, chunk: str) -> FieldExtractionResult:
         """Process a chunk and return any new deltas or completed values."""
@@ -52,10 +53,28 @@ class JsonStringFieldExtractor:
         self._pending_delta = {}
         completed: Dict[str, str] = {}
 
-        for char in chunk:
-            self._step(char, completed)
-
-        return FieldExtractionResult(deltas=self._pending_delta.copy(), completed=completed)
+        index = 0
+        length = len(chunk)
+        while index < length:
+            if self._mode == "value" and not self._escape:
+                # Plain string content runs until the next quote or backslash; take it in one slice.
+                end = self._next_special(chunk, index)
+                if end > index:
+                    self._append_value(chunk[index:end], completed)
+                    index = end
+                    continue
+            self._step(chunk[index], completed)
+            index += 1
+
+        deltas = {key: "".join(parts) for key, parts in self._pending_delta.items()}
+        return FieldExtractionResult(deltas=deltas, completed=completed)
+
+    @staticmethod
+    def _next_special(chunk: str, start: int) -> int:
+        quote = chunk.find('"', start)
+        backslash = chunk.find("\\", start)
+        candidates = [pos for pos in (quote, backslash) if pos != -1]
+        return min(candidates) if candidates else len(chunk)
 
     def _step(self, char: str, completed: Dict[str, str]) -> None:
         if self._mode == "scan":
@@ -123,13 +142,13 @@ class JsonStringFieldExtractor:
             return
         if key in self._targets:
             if key in self._stream_fields:
-                self._pending_delta[key] = self._pending_delta.get(key, "") + decoded_char
-            self._values[key] = self._values.get(key, "") + decoded_char
+                self._pending_delta.setdefault(key, []).append(decoded_char)
+            self._values.setdefault(key, []).append(decoded_char)
 
     def _finalize_value(self, completed: Dict[str, str]) -> None:
         key = self._current_value_key
         if key in self._final_fields and key in self._values:
-            completed[key] = self._values[key]
+            completed[key] = "".join(self._values[key])
         self._current_key = None
         self._current_value_key = None
         self._string_buffer = ""
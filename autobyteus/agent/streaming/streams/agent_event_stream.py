@@ -62,9 +62,9 @@ class AgentEventStream(EventEmitter):
             standard_queue.Queue()
         )
 
-        self._notifier: Optional["AgentExternalEventNotifier"] = None
-        if agent.context and agent.context.status_manager:
-            self._notifier = agent.context.status_manager.notifier
+        # From the agent rather than its context: a hibernated agent keeps its notifier
+        # but has no runtime context until it is rehydrated.
+        self._notifier: Optional["AgentExternalEventNotifier"] = agent.external_event_notifier
 
         if not self._notifier:
             logger.error("AgentEventStream for '%s': Notifier not available. No events will be streamed.", self.agent_id)
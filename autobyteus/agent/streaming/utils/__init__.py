@@ -1,5 +1,6 @@
 """Streaming utilities."""
 
 from .queue_streamer import stream_queue_items
+from .write_file_stager import WriteFileStager, is_stream_write_file_enabled
 
-__all__ = ["stream_queue_items"]
+__all__ = ["stream_queue_items", "WriteFileStager", "is_stream_write_file_enabled"]
@@ -0,0 +1,229 @@
+"""
+Streaming-apply for write_file: stage file content on disk while the LLM is still generating it.
+
+When `AUTOBYTEUS_STREAM_WRITE_FILE` is enabled, each WRITE_FILE segment with a known path is
+written into a temporary file next to its target as content deltas arrive. Disk writes run on
+a single background thread, so their order is kept and the event loop never blocks. When the
+write_file tool runs, it looks up a staged file for the same path whose content hash matches
+its `content` argument. On a match, the staged file is renamed into place and the content is
+not written again. A rejected or failed invocation discards its staged file. Without a match
+the tool falls back to its normal write. When the LLM response ends, staged files that no
+parsed invocation will claim are discarded, and `StagedWriteCleanupStep` removes whatever
+is still staged when the agent stops, so no `.streaming` files are left in the workspace.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+from autobyteus.agent.streaming.segments.segment_events import SegmentEvent, SegmentEventType, SegmentType
+from autobyteus.utils.atomic_write import FileDurability, replace_with_temp_file, resolve_file_durability
+
+logger = logging.getLogger(__name__)
+
+ENV_STREAM_WRITE_FILE = "AUTOBYTEUS_STREAM_WRITE_FILE"
+FLUSH_THRESHOLD_CHARS = 64 * 1024
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def is_stream_write_file_enabled() -> bool:
+    return os.getenv(ENV_STREAM_WRITE_FILE, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    # One worker keeps every staged file's chunks in submission order.
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="write_file_stager")
+    return _executor
+
+
+def _staging_dir_for(target: str) -> str:
+    """Nearest existing ancestor of the target, so the final rename stays on one filesystem."""
+    directory = os.path.dirname(target) or "."
+    while not os.path.isdir(directory):
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    return directory
+
+
+def workspace_path_resolver(context) -> Callable[[str], Optional[str]]:
+    """Resolves write_file paths the way the tool does: absolute, or relative to the workspace."""
+    def resolve(path: str) -> Optional[str]:
+        if os.path.isabs(path):
+            return os.path.normpath(path)
+        workspace = getattr(context, "workspace", None)
+        base_path = workspace.get_base_path() if workspace else None
+        if not base_path or not isinstance(base_path, str):
+            return None
+        return os.path.normpath(os.path.join(base_path, path))
+    return resolve
+
+
+@dataclass
+class StagedWrite:
+    invocation_id: str
+    target_path: str
+    tmp_path: str
+    handle: object
+    hasher: "hashlib._Hash" = field(default_factory=hashlib.sha256)
+    buffer: List[str] = field(default_factory=list)
+    buffered_chars: int = 0
+    last_write: Optional[Future] = None
+    complete: bool = False
+    failed: bool = False
+
+
+class WriteFileStager:
+    """Per-agent staging area fed by the segment events of the streaming handler."""
+
+    def __init__(
+        self,
+        resolve_path: Callable[[str], Optional[str]],
+        durability: Optional[FileDurability] = None,
+    ):
+        self._resolve_path = resolve_path
+        self._durability = durability or resolve_file_durability()
+        self._staged: Dict[str, StagedWrite] = {}
+
+    # --- Streaming side (called synchronously from the segment callback) -----------
+
+    def on_segment_event(self, event: SegmentEvent) -> None:
+        try:
+            if event.event_type == SegmentEventType.START:
+                if event.segment_type == SegmentType.WRITE_FILE:
+                    self._start(event)
+            elif event.segment_id in self._staged:
+                if event.event_type == SegmentEventType.CONTENT:
+                    self._append(self._staged[event.segment_id], event.payload.get("delta", ""))
+                elif event.event_type == SegmentEventType.END:
+                    self._finish(self._staged[event.segment_id])
+        except Exception as e:
+            # Staging is an optimization only; the tool still writes the file itself.
+            logger.warning(f"write_file staging failed for segment {event.segment_id}: {e}")
+            self.discard(event.segment_id)
+
+    def _start(self, event: SegmentEvent) -> None:
+        path = event.payload.get("metadata", {}).get("path")
+        target = self._resolve_path(path) if path else None
+        if not target:
+            return
+        target = os.path.realpath(target)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{os.path.basename(target)}.", suffix=".streaming", dir=_staging_dir_for(target)
+        )
+        handle = os.fdopen(fd, "w", encoding="utf-8")
+        self._staged[event.segment_id] = StagedWrite(
+            invocation_id=event.segment_id, target_path=target, tmp_path=tmp_path, handle=handle
+        )
+        logger.debug(f"Staging write_file content for '{target}' in '{tmp_path}'.")
+
+    def _append(self, staged: StagedWrite, delta: str) -> None:
+        if not delta or staged.failed:
+            return
+        staged.buffer.append(delta)
+        staged.buffered_chars += len(delta)
+        if staged.buffered_chars >= FLUSH_THRESHOLD_CHARS:
+            self._submit(staged, close=False)
+
+    def _finish(self, staged: StagedWrite) -> None:
+        self._submit(staged, close=True)
+        staged.complete = True
+
+    def _submit(self, staged: StagedWrite, close: bool) -> None:
+        chunks, staged.buffer, staged.buffered_chars = staged.buffer, [], 0
+        durability = self._durability
+
+        def write() -> None:
+            if staged.failed:
+                return
+            try:
+                for chunk in chunks:
+                    staged.handle.write(chunk)
+                    staged.hasher.update(chunk.encode("utf-8"))
+                if close:
+                    staged.handle.flush()
+                    if durability is not FileDurability.NONE:
+                        os.fsync(staged.handle.fileno())
+                    staged.handle.close()
+            except Exception as e:
+                staged.failed = True
+                logger.warning(f"Writing staged content to '{staged.tmp_path}' failed: {e}")
+
+        staged.last_write = _get_executor().submit(write)
+
+    # --- Tool side ------------------------------------------------------------------
+
+    async def commit(self, target_path: str, content: str) -> bool:
+        """
+        Renames a completed staged file into place if one exists for `target_path` with
+        exactly `content`. Returns False (and leaves the write to the caller) otherwise.
+        """
+        target = os.path.realpath(target_path)
+        candidates = [s for s in self._staged.values() if s.complete and s.target_path == target]
+        if not candidates:
+            return False
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        for staged in candidates:
+            if staged.last_write is not None:
+                await asyncio.wrap_future(staged.last_write)
+            if staged.failed or staged.hasher.hexdigest() != digest:
+                continue
+            del self._staged[staged.invocation_id]
+            try:
+                await asyncio.to_thread(replace_with_temp_file, staged.tmp_path, target, self._durability)
+            except OSError as e:
+                logger.warning(f"Committing staged content to '{target}' failed, writing normally: {e}")
+                return False
+            logger.info(f"Committed streamed write_file content to '{target}'.")
+            return True
+        return False
+
+    def discard(self, invocation_id: str) -> Optional[Future]:
+        staged = self._staged.pop(invocation_id, None)
+        if staged is None:
+            return None
+
+        def remove() -> None:
+            try:
+                if not staged.handle.closed:
+                    staged.handle.close()
+            except OSError:
+                pass
+            try:
+                os.unlink(staged.tmp_path)
+            except OSError:
+                pass
+
+        # Queued behind any pending writes of the same file.
+        staged.failed = True
+        removal = _get_executor().submit(remove)
+        logger.debug(f"Discarded staged write_file content for invocation '{invocation_id}'.")
+        return removal
+
+    def discard_all(self) -> List[Future]:
+        removals = [self.discard(invocation_id) for invocation_id in list(self._staged)]
+        return [removal for removal in removals if removal is not None]
+
+    def discard_unclaimed(self, invocation_ids: Iterable[str]) -> None:
+        """Discards staged files of segments that did not become one of `invocation_ids`."""
+        keep = set(invocation_ids)
+        for invocation_id in list(self._staged):
+            if invocation_id not in keep:
+                self.discard(invocation_id)
+
+    async def close(self) -> None:
+        """Discards everything still staged and waits until the files are removed."""
+        for removal in self.discard_all():
+            await asyncio.wrap_future(removal)
+
+    @property
+    def staged_invocation_ids(self) -> List[str]:
+        return list(self._staged)
@@ -0,0 +1,104 @@
+import asyncio
+import dataclasses
+import logging
+import os
+from typing import TYPE_CHECKING, Dict, Optional
+
+from autobyteus.agent.message.context_file import ContextFile
+from autobyteus.agent.tool_execution_result_processor.base_processor import BaseToolExecutionResultProcessor
+from autobyteus.utils.llm_output_formatter import format_to_clean_string
+
+if TYPE_CHECKING:
+    from autobyteus.agent.context import AgentContext
+    from autobyteus.agent.events import ToolResultEvent
+
+logger = logging.getLogger(__name__)
+
+ENV_TOOL_RESULT_MAX_CHARS = "AUTOBYTEUS_TOOL_RESULT_MAX_CHARS"
+DEFAULT_TOOL_RESULT_MAX_CHARS = 20_000
+PAGING_TOOL_NAME = "read_tool_result"
+
+
+def resolve_tool_result_max_chars() -> int:
+    try:
+        return int(os.getenv(ENV_TOOL_RESULT_MAX_CHARS, DEFAULT_TOOL_RESULT_MAX_CHARS))
+    except ValueError:
+        logger.warning(f"Invalid {ENV_TOOL_RESULT_MAX_CHARS}; using {DEFAULT_TOOL_RESULT_MAX_CHARS}.")
+        return DEFAULT_TOOL_RESULT_MAX_CHARS
+
+
+class ToolResultSizeGovernor(BaseToolExecutionResultProcessor):
+    """
+    Replaces tool results longer than their budget with a head/tail preview.
+
+    The full text is written to the memory manager's `tool_result_spill_store` and the
+    preview names its ref, which `read_tool_result` pages through. Runs before memory
+    ingest, so raw traces, the working context and tool events all carry the preview.
+    Budgets are in characters: `tool_max_chars` per tool name, otherwise `max_chars`
+    (AUTOBYTEUS_TOOL_RESULT_MAX_CHARS, default 20000); 0 disables the governor.
+    Pages returned by `read_tool_result` itself are never spilled again.
+    """
+
+    def __init__(self, max_chars: Optional[int] = None, tool_max_chars: Optional[Dict[str, int]] = None):
+        self.max_chars = resolve_tool_result_max_chars() if max_chars is None else max_chars
+        self.tool_max_chars: Dict[str, int] = dict(tool_max_chars or {})
+
+    @classmethod
+    def get_order(cls) -> int:
+        # Before MemoryIngestToolResultProcessor (900).
+        return 800
+
+    def budget_for(self, tool_name: str) -> int:
+        if tool_name == PAGING_TOOL_NAME:
+            return 0
+        return self.tool_max_chars.get(tool_name, self.max_chars)
+
+    async def process(self, event: "ToolResultEvent", context: "AgentContext") -> "ToolResultEvent":
+        budget = self.budget_for(event.tool_name)
+        result = event.result
+        if budget <= 0 or event.is_denied or result is None or isinstance(result, ContextFile):
+            return event
+        if isinstance(result, list) and result and all(isinstance(item, ContextFile) for item in result):
+            return event
+
+        text = result if isinstance(result, str) else format_to_clean_string(result)
+        if len(text) <= budget:
+            return event
+
+        memory_manager = getattr(context.state, "memory_manager", None)
+        spill_store = getattr(memory_manager, "tool_result_spill_store", None)
+        if spill_store is None:
+            logger.debug(f"No tool result spill store; keeping {len(text)}-char result of '{event.tool_name}'.")
+            return event
+
+        ref = await asyncio.to_thread(spill_store.write, text)
+        paging_available = PAGING_TOOL_NAME in (getattr(context.state, "tool_instances", None) or {})
+        preview = self.build_preview(text, ref, budget, str(spill_store.path(ref)), paging_available)
+        logger.info(
+            f"Agent '{context.agent_id}': '{event.tool_name}' result of {len(text)} chars "
+            f"spilled to ref {ref[:12]}; {len(preview)} chars kept in context."
+        )
+        return dataclasses.replace(event, result=preview)
+
+    @staticmethod
+    def build_preview(text: str, ref: str, budget: int, path: str, paging_available: bool = True) -> str:
+        head_chars, tail_chars = budget // 2, budget // 4
+        head = text[:head_chars]
+        cut = head.rfind("\n")
+        if cut >= head_chars // 2:
+            head = head[:cut + 1]
+        tail = text[len(text) - tail_chars:] if tail_chars else ""
+        cut = tail.find("\n")
+        if 0 <= cut < tail_chars // 2:
+            tail = tail[cut + 1:]
+        omitted_end = len(text) - len(tail)
+
+        if paging_available:
+            how = f'{PAGING_TOOL_NAME}(ref="{ref}", offset={len(head)}, length={budget})'
+        else:
+            how = f"read_file(path=\"{path}\")"
+        note = (
+            f"[tool result truncated: {len(text)} chars in total; characters {len(head)}-{omitted_end} "
+            f"are omitted. Full output stored as ref {ref} at {path}. Read it with {how}.]"
+        )
+        return f"{head}\n{note}\n{tail}"
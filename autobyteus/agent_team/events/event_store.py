@@ -3,11 +3,11 @@ from __future__ import annotations
 
 import logging
 import time
-import uuid
 from dataclasses import dataclass
 from typing import List, Optional
 
 from autobyteus.agent_team.events.agent_team_events import BaseAgentTeamEvent
+from autobyteus.utils.monotonic_id import id_generator_for
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +30,7 @@ class AgentTeamEventStore:
     """
     def __init__(self, team_id: str):
         self._team_id = team_id
+        self._id_generator = id_generator_for(team_id)
         self._events: List[EventEnvelope] = []
         self._sequence: int = 0
         logger.debug(f"AgentTeamEventStore initialized for team_id '{team_id}'.")
@@ -39,7 +40,7 @@ class AgentTeamEventStore:
                correlation_id: Optional[str] = None,
                caused_by_event_id: Optional[str] = None) -> EventEnvelope:
         envelope = EventEnvelope(
-            event_id=str(uuid.uuid4()),
+            event_id=self._id_generator.next_id("ev_"),
             event_type=type(event).__name__,
             timestamp=time.time(),
             team_id=self._team_id,
@@ -8,9 +8,11 @@ from autobyteus.llm.base_llm import BaseLLM
 from autobyteus.llm.utils.llm_config import LLMConfig
 from autobyteus.llm.utils.messages import MessageRole, Message
 from autobyteus.llm.utils.token_usage import TokenUsage
+from autobyteus.llm.utils.http_client_pool import get_http_client_pool
 from autobyteus.llm.utils.response_types import CompleteResponse, ChunkResponse
 from autobyteus.llm.converters import convert_anthropic_tool_call
 from autobyteus.llm.prompt_renderers.anthropic_prompt_renderer import AnthropicPromptRenderer
+from autobyteus.llm.prompt_renderers.anthropic_cache_planner import PromptCachePolicy
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,15 @@ def _build_thinking_param(extra_params: Dict) -> Optional[Dict]:
     return {"type": "enabled", "budget_tokens": budget_int}
 
 
+def _build_prompt_cache_policy(extra_params: Dict) -> PromptCachePolicy:
+    enabled = extra_params.get("prompt_cache_enabled", True)
+    ttl = extra_params.get("prompt_cache_ttl")
+    return PromptCachePolicy(
+        enabled=enabled if isinstance(enabled, bool) else True,
+        ttl=ttl if isinstance(ttl, str) and ttl else None,
+    )
+
+
 def _split_claude_content_blocks(blocks: List) -> Tuple[str, str]:
     """Split Claude content blocks into visible text and thinking summaries."""
     content_segments: List[str] = []
@@ -76,7 +87,9 @@ class ClaudeLLM(BaseLLM):
             
         super().__init__(model=model, llm_config=llm_config)
         self.client = self.initialize()
-        self._renderer = AnthropicPromptRenderer()
+        self._renderer = AnthropicPromptRenderer(
+            cache_policy=_build_prompt_cache_policy(llm_config.extra_params)
+        )
         # Claude Sonnet 4.5 currently allows up to ~8k output tokens; let config override.
         self.max_tokens = llm_config.max_tokens if llm_config.max_tokens is not None else 8192
     
@@ -89,30 +102,38 @@ class ClaudeLLM(BaseLLM):
                 "Please set this variable in your environment."
             )
         try:
-            return anthropic.Anthropic(api_key=anthropic_api_key)
+            return anthropic.Anthropic(
+                api_key=anthropic_api_key,
+                http_client=get_http_client_pool().get_sync_client("anthropic"),
+            )
         except Exception as e:
             raise ValueError(f"Failed to initialize Anthropic client: {str(e)}")
     
-    def _create_token_usage(self, input_tokens: int, output_tokens: int) -> TokenUsage:
+    def _create_token_usage(self, usage) -> TokenUsage:
+        # Anthropic reports cache reads/writes separately from uncached input tokens;
+        # prompt_tokens stays the full prompt size so token budgeting is unaffected.
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_creation = getattr(usage, "cache_creation_input_tokens", None) or 0
+        prompt_tokens = usage.input_tokens + cache_read + cache_creation
         return TokenUsage(
-            prompt_tokens=input_tokens,
-            completion_tokens=output_tokens,
-            total_tokens=input_tokens + output_tokens
+            prompt_tokens=prompt_tokens,
+            completion_tokens=usage.output_tokens,
+            total_tokens=prompt_tokens + usage.output_tokens,
+            cached_prompt_tokens=cache_read,
+            cache_creation_tokens=cache_creation,
         )
     
     async def _send_messages_to_llm(self, messages: List[Message], **kwargs) -> CompleteResponse:
         try:
             system_prompt, non_system = _split_system_message(messages)
-            formatted_messages = await self._renderer.render(non_system)
+            rendered_request = await self._renderer.render_request(system_prompt, non_system)
             thinking_param = _build_thinking_param(self.config.extra_params)
 
             request_kwargs = {
                 "model": self.model.value,
                 "max_tokens": self.max_tokens,
-                "messages": formatted_messages,
+                **rendered_request,
             }
-            if system_prompt:
-                request_kwargs["system"] = system_prompt
             if thinking_param:
                 # Extended thinking is not compatible with temperature modifications
                 request_kwargs["thinking"] = thinking_param
@@ -132,12 +153,10 @@ class ClaudeLLM(BaseLLM):
                 if parsed_thinking:
                     reasoning_summary = parsed_thinking
 
-            token_usage = self._create_token_usage(
-                response.usage.input_tokens,
-                response.usage.output_tokens
-            )
+            token_usage = self._create_token_usage(response.usage)
             
-            logger.info(f"Token usage - Input: {response.usage.input_tokens}, Output: {response.usage.output_tokens}")
+            logger.info(f"Token usage - Input: {token_usage.prompt_tokens} (cached: {token_usage.cached_prompt_tokens}), "
+                        f"Output: {token_usage.completion_tokens}")
             
             return CompleteResponse(
                 content=assistant_message,
@@ -161,23 +180,18 @@ class ClaudeLLM(BaseLLM):
         try:
             # Prepare arguments for stream
             system_prompt, non_system = _split_system_message(messages)
-            formatted_messages = await self._renderer.render(non_system)
+            rendered_request = await self._renderer.render_request(system_prompt, non_system, tools)
             thinking_param = _build_thinking_param(self.config.extra_params)
             stream_kwargs = {
                 "model": self.model.value,
                 "max_tokens": self.max_tokens,
-                "messages": formatted_messages,
+                **rendered_request,
             }
-            if system_prompt:
-                stream_kwargs["system"] = system_prompt
             if thinking_param:
                 # Extended thinking is not compatible with temperature modifications
                 stream_kwargs["thinking"] = thinking_param
             else:
                 stream_kwargs["temperature"] = 0
-            
-            if tools:
-                stream_kwargs["tools"] = tools
 
             with self.client.messages.stream(**stream_kwargs) as stream:
                 for event in stream:
@@ -212,12 +226,10 @@ class ClaudeLLM(BaseLLM):
                     
                 final_message = stream.get_final_message()
                 if final_message:
-                    token_usage = self._create_token_usage(
-                        final_message.usage.input_tokens,
-                        final_message.usage.output_tokens
-                    )
-                    logger.info(f"Final token usage - Input: {final_message.usage.input_tokens}, "
-                               f"Output: {final_message.usage.output_tokens}")
+                    token_usage = self._create_token_usage(final_message.usage)
+                    logger.info(f"Final token usage - Input: {token_usage.prompt_tokens} "
+                               f"(cached: {token_usage.cached_prompt_tokens}), "
+                               f"Output: {token_usage.completion_tokens}")
                     yield ChunkResponse(
                         content="",
                         is_complete=True,
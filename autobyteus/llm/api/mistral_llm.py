@@ -1,7 +1,6 @@
 from typing import List, Any, AsyncGenerator
 import os
 import logging
-import httpx
 from autobyteus.llm.models import LLMModel
 from autobyteus.llm.base_llm import BaseLLM
 from mistralai import Mistral
@@ -9,11 +8,14 @@ from autobyteus.llm.utils.messages import Message
 from autobyteus.llm.utils.llm_config import LLMConfig
 from autobyteus.llm.utils.token_usage import TokenUsage
 from autobyteus.llm.utils.response_types import CompleteResponse, ChunkResponse
+from autobyteus.llm.utils.http_client_pool import get_http_client_pool
 from autobyteus.llm.prompt_renderers.mistral_prompt_renderer import MistralPromptRenderer
 
 logger = logging.getLogger(__name__)
 
 class MistralLLM(BaseLLM):
+    CHAT_COMPLETIONS_URL = "https://api.mistral.ai/v1/chat/completions"
+
     def __init__(self, model: LLMModel = None, llm_config: LLMConfig = None):
         if model is None:
             model = LLMModel['mistral-large']
@@ -110,74 +112,73 @@ class MistralLLM(BaseLLM):
                 payload["tools"] = kwargs.get("tools")
                 payload["tool_choice"] = "auto"
 
-            # Use internal httpx client logic or create new one context
-            async with httpx.AsyncClient() as client:
-                req = client.build_request("POST", "https://api.mistral.ai/v1/chat/completions", headers=headers, json=payload, timeout=60.0)
-                # Do not set stream=True for python client, let it buffer content automatically.
-                # The API will still stream SSE but client reads until close.
-                response = await client.send(req)
-                
-                try:
-                    if response.status_code != 200:
-                        # response.read() is not needed if stream=False, it's already read
-                        error_text = response.text
-                        raise ValueError(f"Mistral API error: {response.status_code} - {error_text}")
+            # Pooled keep-alive client shared by all Mistral instances on this event loop.
+            client = get_http_client_pool().get_async_client("mistral")
+            req = client.build_request("POST", self.CHAT_COMPLETIONS_URL, headers=headers, json=payload, timeout=60.0)
+            # Do not set stream=True for python client, let it buffer content automatically.
+            # The API will still stream SSE but client reads until close.
+            response = await client.send(req)
+            try:
+                if response.status_code != 200:
+                    # response.read() is not needed if stream=False, it's already read
+                    error_text = response.text
+                    raise ValueError(f"Mistral API error: {response.status_code} - {error_text}")
 
-                    buffer = ""
-                    # Content is already in response.text
-                    buffer = response.text
+                buffer = ""
+                # Content is already in response.text
+                buffer = response.text
+                
+                # Split buffer into lines and process like stream
+                lines = buffer.split('\n')
+                for line in lines:
+                    line = line.strip()
+                    if not line or line == "":
+                        continue
                     
-                    # Split buffer into lines and process like stream
-                    lines = buffer.split('\n')
-                    for line in lines:
-                        line = line.strip()
-                        if not line or line == "":
-                            continue
+                    if line.startswith("data: "):
+                        data_str = line[6:]
+                        if data_str.strip() == "[DONE]":
+                            break
                         
-                        if line.startswith("data: "):
-                            data_str = line[6:]
-                            if data_str.strip() == "[DONE]":
-                                break
+                        try:
+                            import json
+                            chunk_data = json.loads(data_str)
                             
-                            try:
-                                import json
-                                chunk_data = json.loads(data_str)
+                            if "choices" in chunk_data and chunk_data["choices"]:
+                                choice = chunk_data["choices"][0]
+                                delta = choice.get("delta", {})
                                 
-                                if "choices" in chunk_data and chunk_data["choices"]:
-                                    choice = chunk_data["choices"][0]
-                                    delta = choice.get("delta", {})
-                                    
-                                    if "tool_calls" in delta and delta["tool_calls"]:
-                                        from autobyteus.llm.converters.mistral_tool_call_converter import convert_mistral_tool_calls
-                                        tool_calls = convert_mistral_tool_calls(delta["tool_calls"])
-                                        if tool_calls:
-                                            yield ChunkResponse(
-                                                content="",
-                                                tool_calls=tool_calls,
-                                                is_complete=False
-                                            )
+                                if "tool_calls" in delta and delta["tool_calls"]:
+                                    from autobyteus.llm.converters.mistral_tool_call_converter import convert_mistral_tool_calls
+                                    tool_calls = convert_mistral_tool_calls(delta["tool_calls"])
+                                    if tool_calls:
+                                        yield ChunkResponse(
+                                            content="",
+                                            tool_calls=tool_calls,
+                                            is_complete=False
+                                        )
 
-                                    content = delta.get("content")
-                                    if content:
-                                         accumulated_message += content
-                                         yield ChunkResponse(content=content, is_complete=False)
-                                
-                                if chunk_data.get("usage"):
-                                     final_usage_data = chunk_data.get("usage")
-                                     from collections import namedtuple
-                                     UsageObj = namedtuple('UsageObj', ['prompt_tokens', 'completion_tokens', 'total_tokens'])
-                                     usage_obj = UsageObj(
-                                        prompt_tokens=final_usage_data.get('prompt_tokens', 0),
-                                        completion_tokens=final_usage_data.get('completion_tokens', 0),
-                                        total_tokens=final_usage_data.get('total_tokens', 0)
-                                     )
-                                     final_usage = self._create_token_usage(usage_obj)
+                                content = delta.get("content")
+                                if content:
+                                     accumulated_message += content
+                                     yield ChunkResponse(content=content, is_complete=False)
+                            
+                            if chunk_data.get("usage"):
+                                 final_usage_data = chunk_data.get("usage")
+                                 from collections import namedtuple
+                                 UsageObj = namedtuple('UsageObj', ['prompt_tokens', 'completion_tokens', 'total_tokens'])
+                                 usage_obj = UsageObj(
+                                    prompt_tokens=final_usage_data.get('prompt_tokens', 0),
+                                    completion_tokens=final_usage_data.get('completion_tokens', 0),
+                                    total_tokens=final_usage_data.get('total_tokens', 0)
+                                 )
+                                 final_usage = self._create_token_usage(usage_obj)
 
-                            except json.JSONDecodeError:
-                                logger.warning(f"Failed to decode Mistral stream line: {line}")
-                                continue
-                finally:
-                    await response.aclose()
+                        except json.JSONDecodeError:
+                            logger.warning(f"Failed to decode Mistral stream line: {line}")
+                            continue
+            finally:
+                await response.aclose()
 
             # Yield the final chunk
             yield ChunkResponse(
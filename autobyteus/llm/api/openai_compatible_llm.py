@@ -13,6 +13,7 @@ from autobyteus.llm.utils.llm_config import LLMConfig
 from autobyteus.llm.utils.token_usage import TokenUsage
 from autobyteus.llm.utils.response_types import CompleteResponse, ChunkResponse
 from autobyteus.llm.utils.messages import Message
+from autobyteus.llm.utils.http_client_pool import get_http_client_pool
 from autobyteus.llm.prompt_renderers.openai_chat_renderer import OpenAIChatRenderer
 
 logger = logging.getLogger(__name__)
@@ -47,7 +48,12 @@ class OpenAICompatibleLLM(BaseLLM, ABC):
              logger.error(f"{api_key_env_var} environment variable is not set and no default provided.")
              raise ValueError(f"{api_key_env_var} environment variable is not set. Default was: {api_key_default}")
 
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        # Instances pointing at the same endpoint share one keep-alive connection pool.
+        self.client = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=get_http_client_pool().get_sync_client(f"openai-compatible:{base_url}"),
+        )
         logger.info(f"Initialized OpenAI compatible client with base_url: {base_url}")
         
         super().__init__(model=model, llm_config=effective_config)
@@ -58,10 +64,14 @@ class OpenAICompatibleLLM(BaseLLM, ABC):
     def _create_token_usage(self, usage_data: Optional[CompletionUsage]) -> Optional[TokenUsage]:
         if not usage_data:
             return None
+        # OpenAI-compatible APIs cache prompt prefixes automatically and report hits here.
+        prompt_details = getattr(usage_data, "prompt_tokens_details", None)
+        cached_tokens = getattr(prompt_details, "cached_tokens", None) if prompt_details else None
         return TokenUsage(
             prompt_tokens=usage_data.prompt_tokens,
             completion_tokens=usage_data.completion_tokens,
-            total_tokens=usage_data.total_tokens
+            total_tokens=usage_data.total_tokens,
+            cached_prompt_tokens=cached_tokens if isinstance(cached_tokens, int) else None,
         )
 
     async def _send_messages_to_llm(
@@ -51,10 +51,13 @@ class OpenAIResponsesLLM(BaseLLM):
     def _create_token_usage(self, usage_data) -> Optional[TokenUsage]:
         if not usage_data:
             return None
+        input_details = getattr(usage_data, "input_tokens_details", None)
+        cached_tokens = getattr(input_details, "cached_tokens", None) if input_details else None
         return TokenUsage(
             prompt_tokens=usage_data.input_tokens,
             completion_tokens=usage_data.output_tokens,
             total_tokens=usage_data.total_tokens,
+            cached_prompt_tokens=cached_tokens if isinstance(cached_tokens, int) else None,
         )
 
     @staticmethod
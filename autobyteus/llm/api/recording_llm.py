@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import AsyncGenerator, List, Union
+
+from autobyteus.llm.base_llm import BaseLLM
+from autobyteus.llm.utils.messages import Message
+from autobyteus.llm.utils.response_types import ChunkResponse, CompleteResponse
+from autobyteus.llm.utils.stream_recording import RecordedChunk, RecordedExchange, StreamRecording
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingLLM(BaseLLM):
+    """
+    Wraps a real provider LLM and records every chunk stream it produces.
+
+    Exchanges are appended to `recording_path` as they finish, so a partially
+    completed session still leaves a usable recording for `ReplayLLM`.
+    """
+
+    def __init__(self, delegate: BaseLLM, recording_path: Union[str, Path]):
+        self.delegate = delegate
+        self.recording_path = Path(recording_path)
+        self.recording = StreamRecording(
+            provider=delegate.model.provider.value,
+            model=delegate.model.value,
+        )
+        super().__init__(model=delegate.model, llm_config=delegate.config)
+        # Reuse the delegate's renderer so request assembly matches the provider.
+        self._renderer = getattr(delegate, "_renderer", None)
+
+    def configure_system_prompt(self, new_system_prompt: str):
+        super().configure_system_prompt(new_system_prompt)
+        self.delegate.configure_system_prompt(new_system_prompt)
+
+    def _tool_names(self, kwargs) -> List[str]:
+        names = []
+        for schema in kwargs.get("tools") or []:
+            if isinstance(schema, dict):
+                function = schema.get("function") if isinstance(schema.get("function"), dict) else schema
+                name = function.get("name")
+                if name:
+                    names.append(name)
+        return names
+
+    async def _send_messages_to_llm(self, messages: List[Message], **kwargs) -> CompleteResponse:
+        started_at = time.perf_counter()
+        response = await self.delegate._send_messages_to_llm(messages, **kwargs)
+        chunk = ChunkResponse(
+            content=response.content,
+            reasoning=response.reasoning,
+            is_complete=True,
+            usage=response.usage,
+            image_urls=list(response.image_urls),
+            audio_urls=list(response.audio_urls),
+            video_urls=list(response.video_urls),
+        )
+        exchange = RecordedExchange(
+            chunks=[RecordedChunk.from_chunk(chunk, time.perf_counter() - started_at)],
+            tool_names=self._tool_names(kwargs),
+        )
+        await asyncio.to_thread(self.recording.append_exchange, self.recording_path, exchange)
+        return response
+
+    async def _stream_messages_to_llm(
+        self, messages: List[Message], **kwargs
+    ) -> AsyncGenerator[ChunkResponse, None]:
+        exchange = RecordedExchange(tool_names=self._tool_names(kwargs))
+        # Delays only cover time spent waiting on the provider, not time the consumer
+        # spends handling each chunk, so replays do not double-count agent overhead.
+        waiting_since = time.perf_counter()
+        try:
+            async for chunk in self.delegate._stream_messages_to_llm(messages, **kwargs):
+                exchange.chunks.append(RecordedChunk.from_chunk(chunk, time.perf_counter() - waiting_since))
+                yield chunk
+                waiting_since = time.perf_counter()
+        finally:
+            if exchange.chunks:
+                await asyncio.to_thread(self.recording.append_exchange, self.recording_path, exchange)
+                logger.debug(
+                    f"Recorded exchange with {len(exchange.chunks)} chunks to '{self.recording_path}'."
+                )
+
+    async def cleanup(self):
+        await self.delegate.cleanup()
+        await super().cleanup()
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import math
+import time
+from pathlib import Path
+from typing import AsyncGenerator, List, Optional, Union
+
+from autobyteus.llm.base_llm import BaseLLM
+from autobyteus.llm.models import LLMModel
+from autobyteus.llm.providers import LLMProvider
+from autobyteus.llm.utils.llm_config import LLMConfig, TokenPricingConfig
+from autobyteus.llm.utils.messages import Message
+from autobyteus.llm.utils.response_types import ChunkResponse, CompleteResponse
+from autobyteus.llm.utils.stream_recording import RecordedExchange, StreamRecording
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayLLM(BaseLLM):
+    """
+    Deterministic, offline LLM that replays a `StreamRecording`.
+
+    Each call consumes the next recorded exchange and yields its chunks with the
+    recorded inter-chunk delays divided by `speed`. A `speed` of 0 (or infinity)
+    replays as fast as possible, only yielding control to the event loop between
+    chunks. With `loop=True` the exchanges restart from the beginning once exhausted.
+    """
+
+    def __init__(
+        self,
+        recording: Union[StreamRecording, str, Path],
+        model: Optional[LLMModel] = None,
+        llm_config: Optional[LLMConfig] = None,
+        speed: float = 1.0,
+        loop: bool = False,
+    ):
+        if not isinstance(recording, StreamRecording):
+            recording = StreamRecording.load(recording)
+        if speed < 0:
+            raise ValueError(f"Replay speed must be >= 0; got {speed}.")
+
+        self.recording = recording
+        self.speed = speed
+        self.loop = loop
+        self._cursor = 0
+        model = model or self._default_model(recording)
+        super().__init__(model=model, llm_config=llm_config or LLMConfig())
+
+    @staticmethod
+    def _default_model(recording: StreamRecording) -> LLMModel:
+        provider = LLMProvider.OPENAI
+        if recording.provider:
+            try:
+                provider = LLMProvider(recording.provider)
+            except ValueError:
+                logger.warning(f"Unknown provider '{recording.provider}' in recording; replaying as OPENAI.")
+        name = f"replay-{recording.model or 'model'}"
+        return LLMModel(
+            name=name,
+            value=name,
+            provider=provider,
+            llm_class=ReplayLLM,
+            canonical_name=name,
+            default_config=LLMConfig(pricing_config=TokenPricingConfig(0.0, 0.0)),
+        )
+
+    @property
+    def as_fast_as_possible(self) -> bool:
+        return self.speed == 0 or math.isinf(self.speed)
+
+    @property
+    def exchanges_replayed(self) -> int:
+        return self._cursor
+
+    def reset(self) -> None:
+        self._cursor = 0
+
+    def _next_exchange(self) -> RecordedExchange:
+        exchanges = self.recording.exchanges
+        if not exchanges:
+            raise RuntimeError("ReplayLLM recording contains no exchanges.")
+        if self._cursor >= len(exchanges):
+            if not self.loop:
+                raise RuntimeError(
+                    f"ReplayLLM recording exhausted after {len(exchanges)} exchanges."
+                )
+        exchange = exchanges[self._cursor % len(exchanges)]
+        self._cursor += 1
+        return exchange
+
+    async def _send_messages_to_llm(self, messages: List[Message], **kwargs) -> CompleteResponse:
+        content = ""
+        reasoning = ""
+        final_chunk: Optional[ChunkResponse] = None
+        async for chunk in self._stream_messages_to_llm(messages, **kwargs):
+            content += chunk.content or ""
+            reasoning += chunk.reasoning or ""
+            if chunk.is_complete:
+                final_chunk = chunk
+        return CompleteResponse(
+            content=content,
+            reasoning=reasoning or None,
+            usage=final_chunk.usage if final_chunk else None,
+            image_urls=final_chunk.image_urls if final_chunk else [],
+            audio_urls=final_chunk.audio_urls if final_chunk else [],
+            video_urls=final_chunk.video_urls if final_chunk else [],
+        )
+
+    async def _stream_messages_to_llm(
+        self, messages: List[Message], **kwargs
+    ) -> AsyncGenerator[ChunkResponse, None]:
+        exchange = self._next_exchange()
+        started_at = time.perf_counter()
+        elapsed_recorded = 0.0
+        for recorded_chunk in exchange.chunks:
+            if self.as_fast_as_possible:
+                await asyncio.sleep(0)
+            else:
+                # Sleep towards the cumulative schedule so per-chunk timer overshoot does not accumulate.
+                elapsed_recorded += recorded_chunk.delay
+                remaining = started_at + elapsed_recorded / self.speed - time.perf_counter()
+                await asyncio.sleep(max(0.0, remaining))
+            yield recorded_chunk.to_chunk()
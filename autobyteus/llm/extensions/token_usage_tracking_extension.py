@@ -71,6 +71,8 @@ class TokenUsageTrackingExtension(LLMExtension):
             latest_usage.prompt_tokens = response.usage.prompt_tokens
             latest_usage.completion_tokens = response.usage.completion_tokens
             latest_usage.total_tokens = response.usage.total_tokens
+            latest_usage.cached_prompt_tokens = response.usage.cached_prompt_tokens
+            latest_usage.cache_creation_tokens = response.usage.cache_creation_tokens
         elif isinstance(response, CompleteResponse) and response.content:
             # Fallback: estimate completion tokens from response content
             assistant_message = Message(
@@ -82,8 +84,8 @@ class TokenUsageTrackingExtension(LLMExtension):
             latest_usage.total_tokens = latest_usage.prompt_tokens + latest_usage.completion_tokens
 
         # Always calculate costs using current token counts
-        latest_usage.prompt_cost = self.usage_tracker.calculate_cost(
-            latest_usage.prompt_tokens, True)
+        latest_usage.prompt_cost = self.usage_tracker.calculate_prompt_cost(
+            latest_usage.prompt_tokens, latest_usage.cached_prompt_tokens, latest_usage.cache_creation_tokens)
         latest_usage.completion_cost = self.usage_tracker.calculate_cost(
             latest_usage.completion_tokens, False)
         latest_usage.total_cost = latest_usage.prompt_cost + latest_usage.completion_cost
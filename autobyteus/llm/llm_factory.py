@@ -1,6 +1,7 @@
 from typing import List, Set, Optional, Dict
 import logging
 import inspect
+import threading
 
 from autobyteus.llm.autobyteus_provider import AutobyteusModelProvider
 from autobyteus.llm.models import LLMModel, ModelInfo, ProviderModelGroup
@@ -26,10 +27,20 @@ from autobyteus.utils.singleton import SingletonMeta
 
 logger = logging.getLogger(__name__)
 
+# Shared by the Anthropic models, whose requests carry prompt-cache breakpoints.
+PROMPT_CACHE_ENABLED_PARAMETER = ParameterDefinition(
+    name="prompt_cache_enabled",
+    param_type=ParameterType.BOOLEAN,
+    description="Place prompt-cache breakpoints on stable prefixes (system, summary, history)",
+    required=False,
+    default_value=True
+)
+
 class LLMFactory(metaclass=SingletonMeta):
     _models_by_provider: Dict[LLMProvider, List[LLMModel]] = {}
     _models_by_identifier: Dict[str, LLMModel] = {}
     _initialized = False
+    _registry_lock = threading.RLock()
 
     @staticmethod
     def ensure_initialized():
@@ -61,7 +72,7 @@ class LLMFactory(metaclass=SingletonMeta):
                 llm_class=OpenAILLM,
                 canonical_name="gpt-5.2",
                 default_config=LLMConfig(
-                    pricing_config=TokenPricingConfig(1.75, 14.00)
+                    pricing_config=TokenPricingConfig(1.75, 14.00, cached_input_token_pricing=0.175)
                 ),
                 config_schema=ParameterSchema(parameters=[
                     ParameterDefinition(
@@ -89,7 +100,7 @@ class LLMFactory(metaclass=SingletonMeta):
                 llm_class=OpenAILLM,
                 canonical_name="gpt-5.2-chat-latest",
                 default_config=LLMConfig(
-                    pricing_config=TokenPricingConfig(1.75, 14.00)
+                    pricing_config=TokenPricingConfig(1.75, 14.00, cached_input_token_pricing=0.175)
                 ),
                 config_schema=ParameterSchema(parameters=[
                     ParameterDefinition(
@@ -140,7 +151,7 @@ class LLMFactory(metaclass=SingletonMeta):
                 llm_class=GrokLLM,
                 canonical_name="grok-4",
                 default_config=LLMConfig(
-                    pricing_config=TokenPricingConfig(3.00, 15.00)
+                    pricing_config=TokenPricingConfig(3.00, 15.00, cached_input_token_pricing=0.75)
                 )
             ),
             LLMModel(
@@ -150,7 +161,7 @@ class LLMFactory(metaclass=SingletonMeta):
                 llm_class=GrokLLM,
                 canonical_name="grok-4-1-fast-reasoning",
                 default_config=LLMConfig(
-                    pricing_config=TokenPricingConfig(0.20, 0.50)
+                    pricing_config=TokenPricingConfig(0.20, 0.50, cached_input_token_pricing=0.05)
                 )
             ),
             LLMModel(
@@ -160,7 +171,7 @@ class LLMFactory(metaclass=SingletonMeta):
                 llm_class=GrokLLM,
                 canonical_name="grok-4-1-fast-non-reasoning",
                 default_config=LLMConfig(
-                    pricing_config=TokenPricingConfig(0.20, 0.50)
+                    pricing_config=TokenPricingConfig(0.20, 0.50, cached_input_token_pricing=0.05)
                 )
             ),
             LLMModel(
@@ -170,7 +181,7 @@ class LLMFactory(metaclass=SingletonMeta):
                 llm_class=GrokLLM,
                 canonical_name="grok-code-fast-1",
                 default_config=LLMConfig(
-                    pricing_config=TokenPricingConfig(0.20, 1.50)
+                    pricing_config=TokenPricingConfig(0.20, 1.50, cached_input_token_pricing=0.02)
                 )
             ),
             # ANTHROPIC Provider Models
@@ -181,7 +192,7 @@ class LLMFactory(metaclass=SingletonMeta):
                 llm_class=ClaudeLLM,
                 canonical_name="claude-4.5-opus",
                 default_config=LLMConfig(
-                    pricing_config=TokenPricingConfig(5.00, 25.00)
+                    pricing_config=TokenPricingConfig(5.00, 25.00, cached_input_token_pricing=0.50, cache_write_token_pricing=6.25)
                 ),
                 config_schema=ParameterSchema(parameters=[
                     ParameterDefinition(
@@ -198,7 +209,8 @@ class LLMFactory(metaclass=SingletonMeta):
                         required=False,
                         default_value=1024,
                         min_value=1024
-                    )
+                    ),
+                    PROMPT_CACHE_ENABLED_PARAMETER
                 ])
             ),
             LLMModel(
@@ -208,7 +220,7 @@ class LLMFactory(metaclass=SingletonMeta):
                 llm_class=ClaudeLLM,
                 canonical_name="claude-4.5-sonnet",
                 default_config=LLMConfig(
-                    pricing_config=TokenPricingConfig(3.00, 15.00)
+                    pricing_config=TokenPricingConfig(3.00, 15.00, cached_input_token_pricing=0.30, cache_write_token_pricing=3.75)
                 ),
                 config_schema=ParameterSchema(parameters=[
                     ParameterDefinition(
@@ -225,7 +237,8 @@ class LLMFactory(metaclass=SingletonMeta):
                         required=False,
                         default_value=1024,
                         min_value=1024
-                    )
+                    ),
+                    PROMPT_CACHE_ENABLED_PARAMETER
                 ])
             ),
             LLMModel(
@@ -235,7 +248,7 @@ class LLMFactory(metaclass=SingletonMeta):
                 llm_class=ClaudeLLM,
                 canonical_name="claude-4.5-haiku",
                 default_config=LLMConfig(
-                    pricing_config=TokenPricingConfig(1.00, 5.00)
+                    pricing_config=TokenPricingConfig(1.00, 5.00, cached_input_token_pricing=0.10, cache_write_token_pricing=1.25)
                 ),
                 config_schema=ParameterSchema(parameters=[
                     ParameterDefinition(
@@ -252,7 +265,8 @@ class LLMFactory(metaclass=SingletonMeta):
                         required=False,
                         default_value=1024,
                         min_value=1024
-                    )
+                    ),
+                    PROMPT_CACHE_ENABLED_PARAMETER
                 ])
             ),
             # DEEPSEEK Provider Models
@@ -448,18 +462,39 @@ class LLMFactory(metaclass=SingletonMeta):
     @staticmethod
     def register_model(model: LLMModel):
         """Registers a new LLM model."""
-        identifier = model.model_identifier
-        if identifier in LLMFactory._models_by_identifier:
-            logger.debug(f"Redefining model with identifier '{identifier}'.")
-            # Remove old model from provider group to replace it
-            old_model = LLMFactory._models_by_identifier[identifier]
-            if old_model.provider in LLMFactory._models_by_provider:
-                # This check is needed because a model might be in _models_by_identifier but not yet in _models_by_provider if re-registering
-                if old_model in LLMFactory._models_by_provider[old_model.provider]:
-                    LLMFactory._models_by_provider[old_model.provider].remove(old_model)
-
-        LLMFactory._models_by_identifier[identifier] = model
-        LLMFactory._models_by_provider.setdefault(model.provider, []).append(model)
+        with LLMFactory._registry_lock:
+            identifier = model.model_identifier
+            if identifier in LLMFactory._models_by_identifier:
+                logger.debug(f"Redefining model with identifier '{identifier}'.")
+                # Remove old model from provider group to replace it
+                old_model = LLMFactory._models_by_identifier[identifier]
+                if old_model.provider in LLMFactory._models_by_provider:
+                    # This check is needed because a model might be in _models_by_identifier but not yet in _models_by_provider if re-registering
+                    if old_model in LLMFactory._models_by_provider[old_model.provider]:
+                        LLMFactory._models_by_provider[old_model.provider].remove(old_model)
+
+            LLMFactory._models_by_identifier[identifier] = model
+            LLMFactory._models_by_provider.setdefault(model.provider, []).append(model)
+
+    @staticmethod
+    def replace_host_models(runtime: LLMRuntime, host_url: str, models: List[LLMModel]) -> None:
+        """
+        Replaces every registered model served by `host_url` on `runtime` with `models`.
+        Used by background discovery refreshes of local runtimes.
+        """
+        with LLMFactory._registry_lock:
+            stale_models = [
+                m for m in LLMFactory._models_by_identifier.values()
+                if m.runtime == runtime and m.host_url == host_url
+            ]
+            for old_model in stale_models:
+                del LLMFactory._models_by_identifier[old_model.model_identifier]
+                provider_models = LLMFactory._models_by_provider.get(old_model.provider, [])
+                if old_model in provider_models:
+                    provider_models.remove(old_model)
+            for model in models:
+                LLMFactory.register_model(model)
+        logger.info(f"Refreshed {len(models)} {runtime.value} models from host {host_url}.")
 
     @staticmethod
     def create_llm(model_identifier: str, llm_config: Optional[LLMConfig] = None) -> BaseLLM:
@@ -3,19 +3,18 @@ from autobyteus.llm.api.lmstudio_llm import LMStudioLLM
 from autobyteus.llm.providers import LLMProvider
 from autobyteus.llm.runtimes import LLMRuntime
 from autobyteus.llm.utils.llm_config import LLMConfig, TokenPricingConfig
-from typing import TYPE_CHECKING, List
+from autobyteus.llm.utils.local_model_discovery import LocalModelDiscovery
+from typing import Dict, List, Optional
 import os
 import logging
 from openai import OpenAI, APIConnectionError, OpenAIError
 from urllib.parse import urlparse
 
-if TYPE_CHECKING:
-    from autobyteus.llm.llm_factory import LLMFactory
-
 logger = logging.getLogger(__name__)
 
 class LMStudioModelProvider:
     DEFAULT_LMSTUDIO_HOST = 'http://localhost:1234'
+    CONNECTION_TIMEOUT = 5.0
 
     @staticmethod
     def _get_hosts() -> List[str]:
@@ -26,6 +25,16 @@ class LMStudioModelProvider:
 
         return [LMStudioModelProvider.DEFAULT_LMSTUDIO_HOST]
 
+    @staticmethod
+    def _get_valid_hosts() -> List[str]:
+        valid_hosts = []
+        for host_url in LMStudioModelProvider._get_hosts():
+            if not LMStudioModelProvider.is_valid_url(host_url):
+                logger.error(f"Invalid LM Studio host URL: {host_url}, skipping.")
+                continue
+            valid_hosts.append(host_url)
+        return valid_hosts
+
     @staticmethod
     def is_valid_url(url: str) -> bool:
         """Validate if the provided URL is properly formatted."""
@@ -36,65 +45,95 @@ class LMStudioModelProvider:
             return False
 
     @staticmethod
-    def get_models() -> List[LLMModel]:
-        """
-        Fetches models from all configured LM Studio instances and returns them as LLMModel objects.
-        """
-        hosts = LMStudioModelProvider._get_hosts()
-        all_models = []
+    def _create_discovery() -> LocalModelDiscovery:
+        return LocalModelDiscovery(
+            runtime_name=LLMRuntime.LMSTUDIO.value,
+            fetch_host_models=LMStudioModelProvider._fetch_model_names,
+            timeout=LMStudioModelProvider.CONNECTION_TIMEOUT,
+        )
 
-        for host_url in hosts:
-            if not LMStudioModelProvider.is_valid_url(host_url):
-                logger.error(f"Invalid LM Studio host URL: {host_url}, skipping.")
-                continue
+    @staticmethod
+    def _fetch_model_names(host_url: str, timeout: float) -> List[str]:
+        """Lists the model ids served by a single LM Studio instance."""
+        logger.info(f"Discovering LM Studio models from host: {host_url}")
+        base_url = f"{host_url}/v1"
+        client = OpenAI(base_url=base_url, api_key="lm-studio", timeout=timeout, max_retries=0) # Dummy key
 
-            logger.info(f"Discovering LM Studio models from host: {host_url}")
-            base_url = f"{host_url}/v1"
-            client = OpenAI(base_url=base_url, api_key="lm-studio") # Dummy key
+        try:
+            response = client.models.list()
+        except APIConnectionError:
+            logger.warning(f"Could not connect to LM Studio at {host_url}. Please ensure the server is running.")
+            raise
+        except OpenAIError as e:
+            logger.error(f"An error occurred fetching models from LM Studio at {host_url}: {e}")
+            raise
+        finally:
+            client.close()
+
+        return [model_info.id for model_info in response.data if model_info.id]
 
+    @staticmethod
+    def _build_models(host_url: str, model_ids: List[str]) -> List[LLMModel]:
+        models = []
+        for model_id in model_ids:
             try:
-                response = client.models.list()
-                models = response.data
-            except APIConnectionError:
-                logger.warning(f"Could not connect to LM Studio at {host_url}. Please ensure the server is running.")
-                continue
-            except OpenAIError as e:
-                logger.error(f"An error occurred fetching models from LM Studio at {host_url}: {e}")
-                continue
-
-            for model_info in models:
-                model_id = model_info.id
-                if not model_id:
-                    continue
-                
-                try:
-                    llm_model = LLMModel(
-                        name=model_id,
-                        value=model_id,
-                        provider=LLMProvider.LMSTUDIO, # LMStudio is both provider and runtime
-                        llm_class=LMStudioLLM,
-                        canonical_name=model_id,
-                        runtime=LLMRuntime.LMSTUDIO,
-                        host_url=host_url,
-                        default_config=LLMConfig(
-                            pricing_config=TokenPricingConfig(0.0, 0.0) # Local models are free
-                        )
+                llm_model = LLMModel(
+                    name=model_id,
+                    value=model_id,
+                    provider=LLMProvider.LMSTUDIO, # LMStudio is both provider and runtime
+                    llm_class=LMStudioLLM,
+                    canonical_name=model_id,
+                    runtime=LLMRuntime.LMSTUDIO,
+                    host_url=host_url,
+                    default_config=LLMConfig(
+                        pricing_config=TokenPricingConfig(0.0, 0.0) # Local models are free
                     )
-                    all_models.append(llm_model)
-                except Exception as e:
-                    logger.warning(f"Failed to create LLMModel for '{model_id}' from {host_url}: {e}")
+                )
+                models.append(llm_model)
+            except Exception as e:
+                logger.warning(f"Failed to create LLMModel for '{model_id}' from {host_url}: {e}")
+        return models
 
+    @staticmethod
+    def _models_from_host_map(host_models: Dict[str, List[str]]) -> List[LLMModel]:
+        all_models = []
+        for host_url, model_ids in host_models.items():
+            all_models.extend(LMStudioModelProvider._build_models(host_url, model_ids))
         return all_models
 
     @staticmethod
-    def discover_and_register():
+    def get_models() -> List[LLMModel]:
+        """
+        Fetches models from all configured LM Studio instances concurrently and returns them as LLMModel objects.
+        Always queries the hosts; the discovery cache is refreshed with the results.
+        """
+        hosts = LMStudioModelProvider._get_valid_hosts()
+        host_models = LMStudioModelProvider._create_discovery().fetch(hosts)
+        return LMStudioModelProvider._models_from_host_map(host_models)
+
+    @staticmethod
+    def _on_background_refresh(host_models: Dict[str, List[str]]) -> None:
+        from autobyteus.llm.llm_factory import LLMFactory
+
+        for host_url, model_ids in host_models.items():
+            models = LMStudioModelProvider._build_models(host_url, model_ids)
+            LLMFactory.replace_host_models(LLMRuntime.LMSTUDIO, host_url, models)
+
+    @staticmethod
+    def discover_and_register(discovery: Optional[LocalModelDiscovery] = None):
         """
         Discovers models from all configured LM Studio instances and registers them.
+        Cached results are registered immediately; stale hosts are refreshed in the background.
         """
         try:
             from autobyteus.llm.llm_factory import LLMFactory
             
-            discovered_models = LMStudioModelProvider.get_models()
+            discovery = discovery or LMStudioModelProvider._create_discovery()
+            host_models = discovery.discover(
+                LMStudioModelProvider._get_valid_hosts(),
+                on_refresh=LMStudioModelProvider._on_background_refresh,
+            )
+            discovered_models = LMStudioModelProvider._models_from_host_map(host_models)
             registered_count = 0
 
             for model in discovered_models:
@@ -3,17 +3,15 @@ from autobyteus.llm.api.ollama_llm import OllamaLLM
 from autobyteus.llm.providers import LLMProvider
 from autobyteus.llm.runtimes import LLMRuntime
 from autobyteus.llm.utils.llm_config import LLMConfig, TokenPricingConfig
+from autobyteus.llm.utils.local_model_discovery import LocalModelDiscovery
 from autobyteus.llm.ollama_provider_resolver import OllamaProviderResolver
-from typing import TYPE_CHECKING, List
+from typing import Dict, List, Optional
 import os
 import logging
 from ollama import Client
 import httpx
 from urllib.parse import urlparse
 
-if TYPE_CHECKING:
-    from autobyteus.llm.llm_factory import LLMFactory
-
 logger = logging.getLogger(__name__)
 
 class OllamaModelProvider:
@@ -29,6 +27,16 @@ class OllamaModelProvider:
 
         return [OllamaModelProvider.DEFAULT_OLLAMA_HOST]
 
+    @staticmethod
+    def _get_valid_hosts() -> List[str]:
+        valid_hosts = []
+        for host_url in OllamaModelProvider._get_hosts():
+            if not OllamaModelProvider.is_valid_url(host_url):
+                logger.error(f"Invalid Ollama host URL provided: '{host_url}', skipping.")
+                continue
+            valid_hosts.append(host_url)
+        return valid_hosts
+
     @staticmethod
     def is_valid_url(url: str) -> bool:
         """Validate if the provided URL is properly formatted."""
@@ -39,66 +47,98 @@ class OllamaModelProvider:
             return False
 
     @staticmethod
-    def get_models() -> List[LLMModel]:
-        """
-        Fetches models from all configured Ollama hosts and returns them as LLMModel objects.
-        """
-        hosts = OllamaModelProvider._get_hosts()
-        all_models = []
+    def _create_discovery() -> LocalModelDiscovery:
+        return LocalModelDiscovery(
+            runtime_name=LLMRuntime.OLLAMA.value,
+            fetch_host_models=OllamaModelProvider._fetch_model_names,
+            timeout=OllamaModelProvider.CONNECTION_TIMEOUT,
+        )
 
-        for host_url in hosts:
-            if not OllamaModelProvider.is_valid_url(host_url):
-                logger.error(f"Invalid Ollama host URL provided: '{host_url}', skipping.")
-                continue
-            
-            logger.info(f"Discovering Ollama models from host: {host_url}")
-            client = Client(host=host_url)
-            
-            try:
-                response = client.list()
-                models = response.get('models', [])
-            except httpx.ConnectError:
-                logger.warning(f"Could not connect to Ollama server at {host_url}. Please ensure it's running.")
-                continue
-            except Exception as e:
-                logger.error(f"Failed to fetch models from {host_url}: {e}")
-                continue
+    @staticmethod
+    def _fetch_model_names(host_url: str, timeout: float) -> List[str]:
+        """Lists the model names served by a single Ollama host."""
+        logger.info(f"Discovering Ollama models from host: {host_url}")
+        client = Client(host=host_url, timeout=timeout)
+        try:
+            response = client.list()
+        except httpx.ConnectError:
+            logger.warning(f"Could not connect to Ollama server at {host_url}. Please ensure it's running.")
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch models from {host_url}: {e}")
+            raise
 
-            for model_info in models:
-                model_name = model_info.get('model')
-                if not model_name:
-                    continue
+        model_names = []
+        for model_info in response.get('models', []):
+            model_name = model_info.get('model')
+            if model_name:
+                model_names.append(model_name)
+        return model_names
 
-                try:
-                    provider = OllamaProviderResolver.resolve(model_name)
-                    
-                    llm_model = LLMModel(
-                        name=model_name,
-                        value=model_name,
-                        provider=provider,
-                        llm_class=OllamaLLM,
-                        canonical_name=model_name,
-                        runtime=LLMRuntime.OLLAMA,
-                        host_url=host_url,
-                        default_config=LLMConfig(
-                            pricing_config=TokenPricingConfig(0.0, 0.0) # Local models are free
-                        )
+    @staticmethod
+    def _build_models(host_url: str, model_names: List[str]) -> List[LLMModel]:
+        models = []
+        for model_name in model_names:
+            try:
+                provider = OllamaProviderResolver.resolve(model_name)
+
+                llm_model = LLMModel(
+                    name=model_name,
+                    value=model_name,
+                    provider=provider,
+                    llm_class=OllamaLLM,
+                    canonical_name=model_name,
+                    runtime=LLMRuntime.OLLAMA,
+                    host_url=host_url,
+                    default_config=LLMConfig(
+                        pricing_config=TokenPricingConfig(0.0, 0.0) # Local models are free
                     )
-                    all_models.append(llm_model)
-                except Exception as e:
-                    logger.warning(f"Failed to create LLMModel for '{model_name}' from host {host_url}: {e}")
-        
+                )
+                models.append(llm_model)
+            except Exception as e:
+                logger.warning(f"Failed to create LLMModel for '{model_name}' from host {host_url}: {e}")
+        return models
+
+    @staticmethod
+    def _models_from_host_map(host_models: Dict[str, List[str]]) -> List[LLMModel]:
+        all_models = []
+        for host_url, model_names in host_models.items():
+            all_models.extend(OllamaModelProvider._build_models(host_url, model_names))
         return all_models
 
     @staticmethod
-    def discover_and_register():
+    def get_models() -> List[LLMModel]:
+        """
+        Fetches models from all configured Ollama hosts concurrently and returns them as LLMModel objects.
+        Always queries the hosts; the discovery cache is refreshed with the results.
+        """
+        hosts = OllamaModelProvider._get_valid_hosts()
+        host_models = OllamaModelProvider._create_discovery().fetch(hosts)
+        return OllamaModelProvider._models_from_host_map(host_models)
+
+    @staticmethod
+    def _on_background_refresh(host_models: Dict[str, List[str]]) -> None:
+        from autobyteus.llm.llm_factory import LLMFactory
+
+        for host_url, model_names in host_models.items():
+            models = OllamaModelProvider._build_models(host_url, model_names)
+            LLMFactory.replace_host_models(LLMRuntime.OLLAMA, host_url, models)
+
+    @staticmethod
+    def discover_and_register(discovery: Optional[LocalModelDiscovery] = None):
         """
         Discovers all models from all configured Ollama hosts and registers them.
+        Cached results are registered immediately; stale hosts are refreshed in the background.
         """
         try:
             from autobyteus.llm.llm_factory import LLMFactory
 
-            discovered_models = OllamaModelProvider.get_models()
+            discovery = discovery or OllamaModelProvider._create_discovery()
+            host_models = discovery.discover(
+                OllamaModelProvider._get_valid_hosts(),
+                on_refresh=OllamaModelProvider._on_background_refresh,
+            )
+            discovered_models = OllamaModelProvider._models_from_host_map(host_models)
             registered_count = 0
 
             for model in discovered_models:
@@ -0,0 +1,195 @@
+"""
+Prompt-cache breakpoint placement for Anthropic-style message requests.
+
+Anthropic caches the request prefix (tools -> system -> messages) up to each block
+marked with `cache_control`, and a request may carry at most four such markers.
+The planner only marks prefixes that stay identical from turn to turn:
+
+1. The system prompt. Tools render before the system prompt, so this one marker
+   covers both. Tools are marked on their own only when there is no system prompt.
+2. The compacted memory summary. After compaction the working context is rebuilt
+   as `[system, summary, ...new turns]`. The summary is stable for the whole
+   compaction epoch and is replaced wholesale in the next one, so its marker never
+   points at content that is edited in place.
+3. Rolling history boundaries. The latest message is marked so the next turn can
+   read the whole conversation so far from cache. Remaining slots go to earlier
+   user-message boundaries, spaced `history_boundary_interval` user messages apart,
+   so long tool loops stay within the provider's block lookback window.
+"""
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+MAX_CACHE_BREAKPOINTS = 4
+COMPACTED_SUMMARY_MARKERS = ("[MEMORY:EPISODIC]", "[MEMORY:SEMANTIC]", "[RECENT TURNS]")
+
+SystemPrompt = Union[str, List[Dict[str, Any]], None]
+
+
+@dataclass
+class PromptCachePolicy:
+    enabled: bool = True
+    cache_system: bool = True
+    cache_tools: bool = True
+    cache_summary: bool = True
+    history_breakpoints: int = 2
+    history_boundary_interval: int = 4
+    ttl: Optional[str] = None  # e.g. "1h"; None uses the provider default (5 minutes).
+
+    def cache_control(self) -> Dict[str, str]:
+        control = {"type": "ephemeral"}
+        if self.ttl:
+            control["ttl"] = self.ttl
+        return control
+
+
+@dataclass
+class CacheBreakpointPlan:
+    system: bool = False
+    tool_index: Optional[int] = None
+    message_indices: List[int] = field(default_factory=list)
+    labels: Dict[str, Union[int, str]] = field(default_factory=dict)
+
+    @property
+    def count(self) -> int:
+        return int(self.system) + int(self.tool_index is not None) + len(self.message_indices)
+
+
+class AnthropicCachePlanner:
+    def __init__(self, policy: Optional[PromptCachePolicy] = None):
+        self.policy = policy or PromptCachePolicy()
+
+    def plan(
+        self,
+        system: SystemPrompt,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> CacheBreakpointPlan:
+        plan = CacheBreakpointPlan()
+        policy = self.policy
+        if not policy.enabled:
+            return plan
+
+        budget = MAX_CACHE_BREAKPOINTS
+        if policy.cache_system and _has_text(system):
+            plan.system = True
+            plan.labels["system"] = "system"
+            budget -= 1
+        elif policy.cache_tools and tools:
+            plan.tool_index = len(tools) - 1
+            plan.labels["tools"] = plan.tool_index
+            budget -= 1
+
+        summary_index = self._find_summary_index(messages) if policy.cache_summary else None
+        if summary_index is not None and budget > 0:
+            plan.message_indices.append(summary_index)
+            plan.labels["summary"] = summary_index
+            budget -= 1
+
+        history_slots = min(budget, max(0, policy.history_breakpoints))
+        for index in self._history_boundaries(messages, summary_index, history_slots):
+            plan.message_indices.append(index)
+            plan.labels.setdefault("history", index)
+
+        plan.message_indices.sort()
+        return plan
+
+    def apply(
+        self,
+        system: SystemPrompt,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[SystemPrompt, List[Dict[str, Any]], Optional[List[Dict[str, Any]]], CacheBreakpointPlan]:
+        """Return copies of system/messages/tools with `cache_control` markers applied."""
+        plan = self.plan(system, messages, tools)
+        if plan.count == 0:
+            return system, messages, tools, plan
+
+        control = self.policy.cache_control()
+        if plan.system:
+            system = _mark_content(system, control)
+        if plan.tool_index is not None and tools:
+            tools = list(tools)
+            tools[plan.tool_index] = {**tools[plan.tool_index], "cache_control": dict(control)}
+        if plan.message_indices:
+            messages = list(messages)
+            for index in plan.message_indices:
+                message = messages[index]
+                messages[index] = {**message, "content": _mark_content(message.get("content"), control)}
+        return system, messages, tools, plan
+
+    @staticmethod
+    def _find_summary_index(messages: List[Dict[str, Any]]) -> Optional[int]:
+        if not messages:
+            return None
+        first = messages[0]
+        if first.get("role") != "user":
+            return None
+        text = _first_text(first.get("content"))
+        if text and text.lstrip().startswith(COMPACTED_SUMMARY_MARKERS):
+            return 0
+        return None
+
+    def _history_boundaries(
+        self,
+        messages: List[Dict[str, Any]],
+        summary_index: Optional[int],
+        slots: int,
+    ) -> List[int]:
+        if slots <= 0 or not messages:
+            return []
+
+        first_candidate = 0 if summary_index is None else summary_index + 1
+        candidates = [
+            index for index in range(first_candidate, len(messages))
+            if _has_text(messages[index].get("content"))
+        ]
+        if not candidates:
+            return []
+
+        chosen = [candidates[-1]]
+        user_boundaries = [
+            index for index in candidates[:-1]
+            if messages[index].get("role") == "user"
+        ]
+        interval = max(1, self.policy.history_boundary_interval)
+        position = len(user_boundaries) - interval
+        while len(chosen) < slots and position >= 0:
+            chosen.append(user_boundaries[position])
+            position -= interval
+        return chosen
+
+
+def _has_text(content: Any) -> bool:
+    if isinstance(content, str):
+        return bool(content)
+    if isinstance(content, list):
+        return any(
+            isinstance(block, dict) and (block.get("type") != "text" or block.get("text"))
+            for block in content
+        )
+    return False
+
+
+def _first_text(content: Any) -> Optional[str]:
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "text":
+                return block.get("text")
+    return None
+
+
+def _mark_content(content: Any, control: Dict[str, str]) -> List[Dict[str, Any]]:
+    if isinstance(content, str):
+        return [{"type": "text", "text": content, "cache_control": dict(control)}]
+    blocks = copy.copy(content)
+    for position in range(len(blocks) - 1, -1, -1):
+        block = blocks[position]
+        if isinstance(block, dict) and (block.get("type") != "text" or block.get("text")):
+            blocks[position] = {**block, "cache_control": dict(control)}
+            break
+    return blocks
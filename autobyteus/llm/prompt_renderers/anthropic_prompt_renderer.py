@@ -1,8 +1,9 @@
 import asyncio
 import json
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
+from autobyteus.llm.prompt_renderers.anthropic_cache_planner import AnthropicCachePlanner, PromptCachePolicy
 from autobyteus.llm.prompt_renderers.base_prompt_renderer import BasePromptRenderer
 from autobyteus.llm.utils.media_payload_formatter import (
     media_source_to_base64,
@@ -15,6 +16,30 @@ logger = logging.getLogger(__name__)
 
 
 class AnthropicPromptRenderer(BasePromptRenderer):
+    def __init__(self, cache_policy: Optional[PromptCachePolicy] = None):
+        self.cache_planner = AnthropicCachePlanner(cache_policy)
+
+    async def render_request(
+        self,
+        system_prompt: Optional[str],
+        messages: List[Message],
+        tools: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Render the system/messages/tools request fields with prompt-cache breakpoints applied."""
+        formatted_messages = await self.render(messages)
+        system, formatted_messages, tools, plan = self.cache_planner.apply(
+            system_prompt, formatted_messages, tools
+        )
+        if plan.count:
+            logger.debug("Anthropic prompt-cache breakpoints: %s", plan.labels)
+
+        request: Dict[str, Any] = {"messages": formatted_messages}
+        if system:
+            request["system"] = system
+        if tools:
+            request["tools"] = tools
+        return request
+
     async def render(self, messages: List[Message]) -> List[Dict[str, Any]]:
         formatted_messages: List[Dict[str, Any]] = []
         valid_image_mimes = {"image/jpeg", "image/png", "image/gif", "image/webp"}
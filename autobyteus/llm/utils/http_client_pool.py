@@ -0,0 +1,167 @@
+"""
+Process-wide, provider-keyed pool of httpx clients.
+
+Creating an HTTP client per call (or per LLM instance) means every request pays
+TCP/TLS setup again and many agents on the same provider each hold an independent
+connection pool. The pool hands out one shared client per key instead:
+
+- Sync clients (used by the OpenAI/Anthropic SDK clients) are shared process-wide.
+  httpx.Client is thread-safe, so agents running on different worker threads can
+  share one pool of keep-alive connections.
+- Async clients are bound to the event loop that created their connections, so
+  one client is kept per (key, event loop). Clients of closed loops are dropped.
+
+Limits come from the environment:
+`AUTOBYTEUS_HTTP_MAX_CONNECTIONS`, `AUTOBYTEUS_HTTP_MAX_KEEPALIVE_CONNECTIONS`,
+`AUTOBYTEUS_HTTP_KEEPALIVE_EXPIRY` (seconds) and `AUTOBYTEUS_HTTP2` (HTTP/2 is used
+when enabled and the optional `h2` package is installed).
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+ENV_HTTP_MAX_CONNECTIONS = "AUTOBYTEUS_HTTP_MAX_CONNECTIONS"
+ENV_HTTP_MAX_KEEPALIVE_CONNECTIONS = "AUTOBYTEUS_HTTP_MAX_KEEPALIVE_CONNECTIONS"
+ENV_HTTP_KEEPALIVE_EXPIRY = "AUTOBYTEUS_HTTP_KEEPALIVE_EXPIRY"
+ENV_HTTP2 = "AUTOBYTEUS_HTTP2"
+
+
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+@dataclass
+class HttpClientPoolConfig:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+
+    @classmethod
+    def from_env(cls) -> "HttpClientPoolConfig":
+        config = cls()
+        try:
+            config.max_connections = int(os.getenv(ENV_HTTP_MAX_CONNECTIONS, config.max_connections))
+            config.max_keepalive_connections = int(
+                os.getenv(ENV_HTTP_MAX_KEEPALIVE_CONNECTIONS, config.max_keepalive_connections)
+            )
+            config.keepalive_expiry = float(os.getenv(ENV_HTTP_KEEPALIVE_EXPIRY, config.keepalive_expiry))
+        except ValueError as e:
+            logger.warning(f"Invalid HTTP pool setting, using defaults: {e}")
+            config = cls()
+        config.http2 = os.getenv(ENV_HTTP2, "true").strip().lower() not in ("0", "false", "no")
+        return config
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def use_http2(self) -> bool:
+        return self.http2 and _h2_available()
+
+
+class HttpClientPool:
+    def __init__(self, config: Optional[HttpClientPoolConfig] = None):
+        self.config = config or HttpClientPoolConfig.from_env()
+        self._sync_clients: Dict[str, httpx.Client] = {}
+        self._async_clients: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+        self._lock = threading.Lock()
+
+    def _client_kwargs(self) -> dict:
+        return {
+            "limits": self.config.limits(),
+            "http2": self.config.use_http2(),
+            "follow_redirects": True,
+        }
+
+    def get_sync_client(self, key: str) -> httpx.Client:
+        """Return the shared sync client for `key`, creating it on first use."""
+        with self._lock:
+            client = self._sync_clients.get(key)
+            if client is None or client.is_closed:
+                client = httpx.Client(**self._client_kwargs())
+                self._sync_clients[key] = client
+                logger.debug(f"Created pooled HTTP client for '{key}'.")
+            return client
+
+    def get_async_client(self, key: str) -> httpx.AsyncClient:
+        """Return the shared async client for `key` on the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._drop_closed_loops()
+            entry = self._async_clients.get((key, id(loop)))
+            if entry is not None and entry[0] is loop and not entry[1].is_closed:
+                return entry[1]
+            client = httpx.AsyncClient(**self._client_kwargs())
+            self._async_clients[(key, id(loop))] = (loop, client)
+            logger.debug(f"Created pooled async HTTP client for '{key}'.")
+            return client
+
+    def _drop_closed_loops(self) -> None:
+        stale = [pool_key for pool_key, (loop, _) in self._async_clients.items() if loop.is_closed()]
+        for pool_key in stale:
+            del self._async_clients[pool_key]
+
+    async def aclose(self) -> None:
+        """Close the async clients owned by the running loop and all sync clients."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            owned = [
+                pool_key for pool_key, (client_loop, _) in self._async_clients.items()
+                if client_loop is loop
+            ]
+            clients = [self._async_clients.pop(pool_key)[1] for pool_key in owned]
+        for client in clients:
+            await client.aclose()
+        self.close()
+
+    def close(self) -> None:
+        """Close all sync clients. Async clients are released with their event loops."""
+        with self._lock:
+            clients = list(self._sync_clients.values())
+            self._sync_clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"Error closing pooled HTTP client: {e}")
+
+
+_default_pool: Optional[HttpClientPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_http_client_pool() -> HttpClientPool:
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = HttpClientPool()
+        return _default_pool
+
+
+async def shutdown_http_client_pool() -> None:
+    """Close pooled clients; intended for application shutdown hooks."""
+    await get_http_client_pool().aclose()
+
+
+@atexit.register
+def _close_pool_at_exit() -> None:
+    if _default_pool is not None:
+        _default_pool.close()
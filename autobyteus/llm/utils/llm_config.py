@@ -9,20 +9,30 @@ logger = logging.getLogger(__name__)
 class TokenPricingConfig:
     input_token_pricing: float = 0.0
     output_token_pricing: float = 0.0
+    # Rates for prompt tokens read from and written to the provider's prompt cache.
+    # Unset rates bill those tokens at input_token_pricing.
+    cached_input_token_pricing: Optional[float] = None
+    cache_write_token_pricing: Optional[float] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert TokenPricingConfig to dictionary"""
-        return {
+        data = {
             'input_token_pricing': self.input_token_pricing,
             'output_token_pricing': self.output_token_pricing
         }
+        for key in ('cached_input_token_pricing', 'cache_write_token_pricing'):
+            if getattr(self, key) is not None:
+                data[key] = getattr(self, key)
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TokenPricingConfig':
         """Create TokenPricingConfig from dictionary"""
         return cls(
             input_token_pricing=data.get('input_token_pricing', 0.0),
-            output_token_pricing=data.get('output_token_pricing', 0.0)
+            output_token_pricing=data.get('output_token_pricing', 0.0),
+            cached_input_token_pricing=data.get('cached_input_token_pricing'),
+            cache_write_token_pricing=data.get('cache_write_token_pricing')
         )
 
     def merge_with(self, override_pricing_config: Optional['TokenPricingConfig']) -> None:
@@ -36,10 +46,10 @@ class TokenPricingConfig:
 
         for f_info in fields(override_pricing_config):
             override_value = getattr(override_pricing_config, f_info.name)
-            # For TokenPricingConfig, fields are floats, not optional, so direct assignment is fine.
-            # If they were Optional[float], a `if override_value is not None:` check would be needed.
-            # Here, any value from override_config takes precedence.
-            # Default values (0.0) from an override will replace existing values.
+            # Default values (0.0) from an override replace existing values; the optional
+            # cache rates are only applied when the override sets them.
+            if override_value is None:
+                continue
             setattr(self, f_info.name, override_value)
         logger.debug(f"TokenPricingConfig merged. Current state: {self.to_dict()}")
 
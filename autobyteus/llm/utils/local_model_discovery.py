@@ -0,0 +1,244 @@
+"""
+Concurrent, cached model discovery for local LLM runtimes (Ollama, LM Studio).
+
+Each configured host is queried on its own worker thread with a per-host timeout, so
+a host that is down costs at most one timeout instead of adding to the total.
+Results are cached on disk per runtime and host. At startup, cached entries are
+served immediately and stale entries are refreshed in the background.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ENV_DISCOVERY_CACHE_DIR = "AUTOBYTEUS_MODEL_DISCOVERY_CACHE_DIR"
+ENV_DISCOVERY_CACHE_TTL = "AUTOBYTEUS_MODEL_DISCOVERY_CACHE_TTL"
+DEFAULT_CACHE_TTL_SECONDS = 600.0
+
+HostFetcher = Callable[[str, float], List[str]]
+RefreshCallback = Callable[[Dict[str, List[str]]], None]
+
+
+def resolve_discovery_cache_dir() -> Path:
+    """Resolve the directory holding discovery cache files."""
+    env_value = os.getenv(ENV_DISCOVERY_CACHE_DIR, "").strip()
+    if env_value:
+        return Path(env_value)
+    return Path.home() / ".cache" / "autobyteus"
+
+
+def resolve_discovery_cache_ttl() -> float:
+    """Resolve the cache TTL in seconds. A value of 0 disables the cache."""
+    raw_value = os.getenv(ENV_DISCOVERY_CACHE_TTL)
+    if not raw_value:
+        return DEFAULT_CACHE_TTL_SECONDS
+    try:
+        return max(0.0, float(raw_value))
+    except ValueError:
+        logger.warning(f"Invalid {ENV_DISCOVERY_CACHE_TTL} value '{raw_value}', using default.")
+        return DEFAULT_CACHE_TTL_SECONDS
+
+
+@dataclass
+class HostDiscoveryResult:
+    host_url: str
+    model_names: List[str]
+    ok: bool
+    fetched_at: float
+
+
+class DiscoveryCache:
+    """JSON file cache of discovered model names, keyed by host URL."""
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, HostDiscoveryResult]:
+        with self._lock:
+            return self._load_unlocked()
+
+    def update(self, results: List[HostDiscoveryResult]) -> None:
+        if not results:
+            return
+        with self._lock:
+            entries = self._load_unlocked()
+            for result in results:
+                entries[result.host_url] = result
+            payload = {
+                host: {"models": entry.model_names, "ok": entry.ok, "fetched_at": entry.fetched_at}
+                for host, entry in entries.items()
+            }
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+                with tmp_path.open("w", encoding="utf-8") as handle:
+                    json.dump(payload, handle)
+                os.replace(tmp_path, self.cache_path)
+            except OSError as e:
+                logger.warning(f"Failed to write model discovery cache '{self.cache_path}': {e}")
+
+    def _load_unlocked(self) -> Dict[str, HostDiscoveryResult]:
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with self.cache_path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable model discovery cache '{self.cache_path}': {e}")
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+
+        entries: Dict[str, HostDiscoveryResult] = {}
+        for host, data in payload.items():
+            if not isinstance(data, dict) or not isinstance(data.get("models"), list):
+                continue
+            entries[host] = HostDiscoveryResult(
+                host_url=host,
+                model_names=[str(name) for name in data["models"]],
+                ok=bool(data.get("ok", True)),
+                fetched_at=float(data.get("fetched_at", 0.0)),
+            )
+        return entries
+
+
+class LocalModelDiscovery:
+    """
+    Discovers model names from a set of hosts for one local runtime.
+
+    `fetch_host_models(host_url, timeout)` must return the model names served by a
+    host or raise on failure. Failed hosts are cached as empty, so a host that is
+    down does not stall the next startup either; it is retried once the entry
+    goes stale.
+    """
+
+    def __init__(
+        self,
+        runtime_name: str,
+        fetch_host_models: HostFetcher,
+        timeout: float,
+        ttl_seconds: Optional[float] = None,
+        cache_dir: Optional[Path] = None,
+    ):
+        self.runtime_name = runtime_name
+        self.fetch_host_models = fetch_host_models
+        self.timeout = timeout
+        self.ttl_seconds = resolve_discovery_cache_ttl() if ttl_seconds is None else ttl_seconds
+        cache_root = cache_dir if cache_dir is not None else resolve_discovery_cache_dir()
+        self.cache = DiscoveryCache(cache_root / f"{runtime_name}_models.json")
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @property
+    def cache_enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def fetch(self, hosts: List[str]) -> Dict[str, List[str]]:
+        """Fetch all hosts concurrently, bypassing (but updating) the cache."""
+        results = self._fetch_concurrently(hosts)
+        if self.cache_enabled:
+            self.cache.update(results)
+        return {result.host_url: result.model_names for result in results if result.ok}
+
+    def discover(
+        self,
+        hosts: List[str],
+        on_refresh: Optional[RefreshCallback] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Return model names per host, serving cached entries where available.
+
+        Hosts with no cache entry are fetched before returning. Hosts whose entry is
+        older than the TTL are returned from cache and refreshed on a background
+        thread; `on_refresh` receives the refreshed host results when it finishes.
+        """
+        if not self.cache_enabled:
+            return self.fetch(hosts)
+
+        cached = self.cache.load()
+        now = time.time()
+        missing = [host for host in hosts if host not in cached]
+        stale = [
+            host for host in hosts
+            if host in cached and now - cached[host].fetched_at >= self.ttl_seconds
+        ]
+
+        discovered: Dict[str, List[str]] = {
+            host: cached[host].model_names
+            for host in hosts
+            if host in cached and cached[host].ok
+        }
+        if missing:
+            discovered.update(self.fetch(missing))
+        if stale:
+            self.refresh_in_background(stale, on_refresh)
+        return discovered
+
+    def refresh_in_background(
+        self,
+        hosts: List[str],
+        on_refresh: Optional[RefreshCallback] = None,
+    ) -> threading.Thread:
+        """Refresh the given hosts on a daemon thread and return the thread."""
+        def _run() -> None:
+            try:
+                results = self._fetch_concurrently(hosts)
+                self.cache.update(results)
+                if on_refresh:
+                    on_refresh({result.host_url: result.model_names for result in results if result.ok})
+            except Exception as e:
+                logger.error(f"Background {self.runtime_name} model refresh failed: {e}", exc_info=True)
+
+        thread = threading.Thread(
+            target=_run,
+            name=f"{self.runtime_name}-model-discovery-refresh",
+            daemon=True,
+        )
+        self._refresh_thread = thread
+        thread.start()
+        return thread
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> None:
+        """Block until the last background refresh (if any) finishes."""
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _fetch_concurrently(self, hosts: List[str]) -> List[HostDiscoveryResult]:
+        if not hosts:
+            return []
+
+        executor = ThreadPoolExecutor(
+            max_workers=len(hosts),
+            thread_name_prefix=f"{self.runtime_name}-discovery",
+        )
+        try:
+            futures = {executor.submit(self.fetch_host_models, host, self.timeout): host for host in hosts}
+            # The fetcher applies its own timeout; the grace period only guards against
+            # clients that ignore it, so a hung host can never block discovery.
+            done, _ = wait(futures, timeout=self.timeout + 1.0)
+            fetched_at = time.time()
+            results: List[HostDiscoveryResult] = []
+            for future, host in futures.items():
+                if future not in done:
+                    logger.warning(f"Timed out discovering {self.runtime_name} models from {host}.")
+                    results.append(HostDiscoveryResult(host, [], ok=False, fetched_at=fetched_at))
+                    continue
+                try:
+                    names = future.result()
+                    results.append(HostDiscoveryResult(host, list(names), ok=True, fetched_at=fetched_at))
+                except Exception as e:
+                    logger.warning(f"Could not discover {self.runtime_name} models from {host}: {e}")
+                    results.append(HostDiscoveryResult(host, [], ok=False, fetched_at=fetched_at))
+            return results
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,401 @@
+"""
+Content-addressed cache of base64-encoded media for prompt rendering.
+
+Every render of a conversation re-encodes each image or audio file it references.
+This cache keys local files by path + mtime + size and URLs by their HTTP validators
+(ETag / Last-Modified, plus Cache-Control max-age freshness). Encoded payloads are
+stored once per content hash, so the same bytes reached through different paths
+or URLs are encoded and held only once.
+
+Payloads live in a byte-capped in-memory LRU. An optional on-disk tier
+(`AUTOBYTEUS_MEDIA_CACHE_DIR`) keeps them across processes, evicting least recently
+used payloads past its byte cap. File reads, base64 encoding and all disk-tier I/O
+run in worker threads so the agent's event loop is not blocked.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+ENV_MEDIA_CACHE_MAX_BYTES = "AUTOBYTEUS_MEDIA_CACHE_MAX_BYTES"
+ENV_MEDIA_CACHE_DIR = "AUTOBYTEUS_MEDIA_CACHE_DIR"
+ENV_MEDIA_CACHE_DISK_MAX_BYTES = "AUTOBYTEUS_MEDIA_CACHE_DISK_MAX_BYTES"
+DEFAULT_MEMORY_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_DISK_MAX_BYTES = 2 * 1024 * 1024 * 1024
+DEFAULT_MAX_INDEX_ENTRIES = 10_000
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+@dataclass
+class EncodedMedia:
+    digest: str
+    base64_data: str
+    mime_type: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.base64_data)
+
+
+@dataclass
+class _UrlEntry:
+    digest: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh_until: float
+
+
+def _read_and_encode(path: str) -> Tuple[str, str]:
+    with open(path, "rb") as f:
+        raw = f.read()
+    return hashlib.sha256(raw).hexdigest(), base64.b64encode(raw).decode("utf-8")
+
+
+def _encode_bytes(raw: bytes) -> Tuple[str, str]:
+    return hashlib.sha256(raw).hexdigest(), base64.b64encode(raw).decode("utf-8")
+
+
+class MediaEncodingCache:
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MEMORY_MAX_BYTES,
+        disk_dir: Optional[Path] = None,
+        max_disk_bytes: int = DEFAULT_DISK_MAX_BYTES,
+        max_index_entries: int = DEFAULT_MAX_INDEX_ENTRIES,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self.max_index_entries = max_index_entries
+        self._payloads: "OrderedDict[str, EncodedMedia]" = OrderedDict()
+        self._memory_bytes = 0
+        # File keys and URL entries point at payloads; both are LRU-bounded.
+        self._file_keys: "OrderedDict[str, str]" = OrderedDict()
+        self._url_entries: "OrderedDict[str, _UrlEntry]" = OrderedDict()
+        # Payloads on disk by digest, least recently used first, with their running size.
+        self._disk_entries: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._scan_disk()
+            self._load_disk_index()
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory_bytes
+
+    @property
+    def disk_bytes(self) -> int:
+        return self._disk_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._payloads.clear()
+            self._memory_bytes = 0
+            self._file_keys.clear()
+            self._url_entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    # --- Local files -----------------------------------------------------
+
+    async def encode_file(self, path: str) -> EncodedMedia:
+        stat = await asyncio.to_thread(os.stat, path)
+        key = f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+        cached = await self._lookup(self._recall(self._file_keys, key))
+        if cached:
+            return cached
+
+        self.misses += 1
+        digest, encoded = await asyncio.to_thread(_read_and_encode, path)
+        media = await self._store(EncodedMedia(digest=digest, base64_data=encoded))
+        self._remember(self._file_keys, key, digest)
+        await self._persist_index()
+        return media
+
+    # --- URLs --------------------------------------------------------------
+
+    async def encode_url(self, url: str, client: httpx.AsyncClient) -> EncodedMedia:
+        entry = self._recall(self._url_entries, url)
+        if entry and entry.fresh_until > time.time():
+            cached = await self._lookup(entry.digest)
+            if cached:
+                return cached
+
+        headers = {}
+        if entry and self._peek(entry.digest):
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        response = await client.get(url, headers=headers)
+        if response.status_code == 304:
+            cached = await self._lookup(entry.digest) if entry else None
+            if cached:
+                entry.fresh_until = self._fresh_until(response)
+                return cached
+            # The payload was evicted after the validators were sent: a 304 has no body to
+            # fall back on, so drop the validators and fetch the content unconditionally.
+            logger.debug(f"Cached payload for {url} is gone; refetching without validators.")
+            self._forget(self._url_entries, url)
+            response = await client.get(url)
+        response.raise_for_status()
+
+        self.misses += 1
+        digest, encoded = await asyncio.to_thread(_encode_bytes, response.content)
+        mime_type = response.headers.get("content-type", "").split(";")[0].strip() or None
+        media = await self._store(EncodedMedia(digest=digest, base64_data=encoded, mime_type=mime_type))
+
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        fresh_until = self._fresh_until(response)
+        if etag or last_modified or fresh_until > time.time():
+            self._remember(self._url_entries, url, _UrlEntry(digest, etag, last_modified, fresh_until))
+            await self._persist_index()
+        return media
+
+    @staticmethod
+    def _fresh_until(response: httpx.Response) -> float:
+        cache_control = response.headers.get("cache-control", "").lower()
+        if "no-cache" in cache_control or "no-store" in cache_control:
+            return 0.0
+        match = _MAX_AGE_PATTERN.search(cache_control)
+        if match:
+            return time.time() + int(match.group(1))
+        return 0.0
+
+    def _recall(self, mapping: "OrderedDict", key: str):
+        with self._lock:
+            value = mapping.get(key)
+            if value is not None:
+                mapping.move_to_end(key)
+            return value
+
+    def _forget(self, mapping: "OrderedDict", key: str) -> None:
+        with self._lock:
+            mapping.pop(key, None)
+
+    def _remember(self, mapping: "OrderedDict", key: str, value) -> None:
+        with self._lock:
+            mapping[key] = value
+            mapping.move_to_end(key)
+            while len(mapping) > self.max_index_entries:
+                mapping.popitem(last=False)
+
+    # --- Payload store ------------------------------------------------------
+
+    def _peek(self, digest: Optional[str]) -> bool:
+        if not digest:
+            return False
+        with self._lock:
+            return digest in self._payloads or digest in self._disk_entries
+
+    async def _lookup(self, digest: Optional[str]) -> Optional[EncodedMedia]:
+        if not digest:
+            return None
+        with self._lock:
+            media = self._payloads.get(digest)
+            if media is not None:
+                self._payloads.move_to_end(digest)
+                self.hits += 1
+                return media
+            on_disk = digest in self._disk_entries
+
+        if not on_disk:
+            return None
+        media = await asyncio.to_thread(self._read_disk, digest)
+        if media is None:
+            return None
+        self.hits += 1
+        return await self._store(media, write_disk=False)
+
+    async def _store(self, media: EncodedMedia, write_disk: bool = True) -> EncodedMedia:
+        if media.size <= self.max_memory_bytes:
+            with self._lock:
+                existing = self._payloads.pop(media.digest, None)
+                if existing is not None:
+                    self._memory_bytes -= existing.size
+                    if media.mime_type is None:
+                        media.mime_type = existing.mime_type
+                self._payloads[media.digest] = media
+                self._memory_bytes += media.size
+                while self._memory_bytes > self.max_memory_bytes and self._payloads:
+                    _, evicted = self._payloads.popitem(last=False)
+                    self._memory_bytes -= evicted.size
+        if write_disk and self.disk_dir:
+            await asyncio.to_thread(self._write_disk, media)
+        return media
+
+    # --- Disk tier (called in worker threads, except at construction) ---------
+
+    def _disk_path(self, digest: str) -> Optional[Path]:
+        if not self.disk_dir:
+            return None
+        return self.disk_dir / f"{digest}.b64"
+
+    def _scan_disk(self) -> None:
+        entries = []
+        for path in self.disk_dir.glob("*.b64"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, digest, size in sorted(entries):
+            self._disk_entries[digest] = size
+            self._disk_bytes += size
+
+    def _read_disk(self, digest: str) -> Optional[EncodedMedia]:
+        path = self._disk_path(digest)
+        try:
+            encoded = path.read_text(encoding="utf-8")
+            os.utime(path)  # Keeps recency across processes.
+        except OSError as e:
+            logger.warning(f"Failed to read cached media '{path}': {e}")
+            with self._lock:
+                size = self._disk_entries.pop(digest, None)
+                if size is not None:
+                    self._disk_bytes -= size
+            return None
+        with self._lock:
+            if digest in self._disk_entries:
+                self._disk_entries.move_to_end(digest)
+        return EncodedMedia(digest=digest, base64_data=encoded)
+
+    def _write_disk(self, media: EncodedMedia) -> None:
+        path = self._disk_path(media.digest)
+        with self._lock:
+            if media.digest in self._disk_entries:
+                self._disk_entries.move_to_end(media.digest)
+                return
+        try:
+            self._atomic_write(path, media.base64_data)
+        except OSError as e:
+            logger.warning(f"Failed to write cached media '{path}': {e}")
+            return
+
+        evicted = []
+        with self._lock:
+            if media.digest not in self._disk_entries:
+                self._disk_entries[media.digest] = media.size
+                self._disk_bytes += media.size
+            while self._disk_bytes > self.max_disk_bytes and len(self._disk_entries) > 1:
+                digest, size = self._disk_entries.popitem(last=False)
+                self._disk_bytes -= size
+                evicted.append(digest)
+        for digest in evicted:
+            try:
+                self._disk_path(digest).unlink()
+            except OSError:
+                continue
+
+    def _atomic_write(self, path: Path, text: str) -> None:
+        # A unique temp file per write, so concurrent writers never share one.
+        fd, tmp_name = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _index_path(self) -> Optional[Path]:
+        return self.disk_dir / "index.json" if self.disk_dir else None
+
+    def _load_disk_index(self) -> None:
+        index_path = self._index_path()
+        if not index_path.exists():
+            return
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable media cache index '{index_path}': {e}")
+            return
+        for key, digest in data.get("files", {}).items():
+            self._remember(self._file_keys, key, digest)
+        for url, entry in data.get("urls", {}).items():
+            self._remember(self._url_entries, url, _UrlEntry(
+                digest=entry["digest"],
+                etag=entry.get("etag"),
+                last_modified=entry.get("last_modified"),
+                fresh_until=float(entry.get("fresh_until", 0.0)),
+            ))
+
+    async def _persist_index(self) -> None:
+        if self.disk_dir:
+            await asyncio.to_thread(self._write_index)
+
+    def _write_index(self) -> None:
+        index_path = self._index_path()
+        with self._lock:
+            data = {
+                "files": dict(self._file_keys),
+                "urls": {
+                    url: {
+                        "digest": entry.digest,
+                        "etag": entry.etag,
+                        "last_modified": entry.last_modified,
+                        "fresh_until": entry.fresh_until,
+                    }
+                    for url, entry in self._url_entries.items()
+                },
+            }
+        try:
+            self._atomic_write(index_path, json.dumps(data))
+        except OSError as e:
+            logger.warning(f"Failed to write media cache index '{index_path}': {e}")
+
+
+_default_cache: Optional[MediaEncodingCache] = None
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Invalid {name} value '{value}', using default {default}.")
+        return default
+
+
+def get_media_encoding_cache() -> MediaEncodingCache:
+    """Return the process-wide cache, configured from environment on first use."""
+    global _default_cache
+    if _default_cache is None:
+        disk_dir = os.getenv(ENV_MEDIA_CACHE_DIR, "").strip() or None
+        _default_cache = MediaEncodingCache(
+            max_memory_bytes=_env_int(ENV_MEDIA_CACHE_MAX_BYTES, DEFAULT_MEMORY_MAX_BYTES),
+            disk_dir=Path(disk_dir) if disk_dir else None,
+            max_disk_bytes=_env_int(ENV_MEDIA_CACHE_DISK_MAX_BYTES, DEFAULT_DISK_MAX_BYTES),
+        )
+    return _default_cache
+
+
+def set_media_encoding_cache(cache: Optional[MediaEncodingCache]) -> None:
+    """Replace the process-wide cache (None re-reads the environment on next use)."""
+    global _default_cache
+    _default_cache = cache
@@ -6,6 +6,8 @@ import httpx
 import logging
 from urllib.parse import urlparse
 
+from autobyteus.llm.utils.media_encoding_cache import get_media_encoding_cache
+
 logger = logging.getLogger(__name__)
 
 # FIX: Instantiate the client with verify=False to allow for self-signed certificates
@@ -93,12 +95,27 @@ def file_to_base64(path: str) -> str:
         logger.error(f"Failed to read and encode file at {path}: {e}")
         raise
 
+async def cached_file_to_base64(path: str) -> str:
+    """
+    Async, cached variant of file_to_base64. Re-renders of the same unchanged file
+    (same path, mtime and size) reuse the encoded payload; reads and encoding run off
+    the event loop.
+    """
+    try:
+        media = await get_media_encoding_cache().encode_file(path)
+        return media.base64_data
+    except Exception as e:
+        logger.error(f"Failed to read and encode file at {path}: {e}")
+        raise
+
 async def url_to_base64(url: str) -> str:
-    """Downloads content from a URL and returns it as a base64 encoded string."""
+    """
+    Downloads content from a URL and returns it as a base64 encoded string.
+    Responses carrying ETag/Last-Modified or max-age are revalidated instead of re-downloaded.
+    """
     try:
-        response = await _http_client.get(url)
-        response.raise_for_status()
-        return base64.b64encode(response.content).decode("utf-8")
+        media = await get_media_encoding_cache().encode_url(url, _http_client)
+        return media.base64_data
     except httpx.HTTPError as e:
         logger.error(f"Failed to download from URL {url}: {e}")
         raise
@@ -109,7 +126,7 @@ async def media_source_to_base64(media_source: str) -> str:
     into a base64 encoded string by delegating to specialized functions.
     """
     if is_valid_media_path(media_source):
-        return file_to_base64(media_source)
+        return await cached_file_to_base64(media_source)
     
     if media_source.startswith(("http://", "https://")):
         return await url_to_base64(media_source)
@@ -130,22 +147,18 @@ async def media_source_to_data_uri(media_source: str) -> str:
 
     if media_source.startswith(("http://", "https://")):
         try:
-            response = await _http_client.get(media_source)
-            response.raise_for_status()
+            media = await get_media_encoding_cache().encode_url(media_source, _http_client)
         except httpx.HTTPError as e:
             logger.error(f"Failed to convert URL to data URI {media_source}: {e}")
             raise
 
-        header_content_type = response.headers.get("content-type", "")
-        mime_type_from_header = header_content_type.split(";")[0].strip() if header_content_type else ""
         parsed_path = urlparse(media_source).path
         mime_type_from_path = get_mime_type(parsed_path)
-        mime_type = mime_type_from_header or mime_type_from_path or "application/octet-stream"
-        base64_data = base64.b64encode(response.content).decode("utf-8")
-        return f"data:{mime_type};base64,{base64_data}"
+        mime_type = media.mime_type or mime_type_from_path or "application/octet-stream"
+        return f"data:{mime_type};base64,{media.base64_data}"
 
     if _is_existing_file_path(media_source):
-        base64_data = file_to_base64(media_source)
+        base64_data = await cached_file_to_base64(media_source)
         mime_type = get_mime_type(media_source)
         return f"data:{mime_type};base64,{base64_data}"
 
@@ -0,0 +1,180 @@
+"""
+File format for recorded LLM chunk streams.
+
+A recording is a JSONL file. The first line is a header and each following line is
+one exchange (a single LLM call). Every recorded chunk keeps its content, reasoning,
+tool-call deltas, usage, completion flag and the delay since the previous chunk (or
+since the request was issued, for the first chunk), so a replay reproduces both the
+payload and the streaming timing of the original call.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from autobyteus.llm.utils.response_types import ChunkResponse
+from autobyteus.llm.utils.token_usage import TokenUsage
+from autobyteus.llm.utils.tool_call_delta import ToolCallDelta
+
+RECORDING_FORMAT_VERSION = 1
+
+
+@dataclass
+class RecordedChunk:
+    delay: float
+    content: str = ""
+    reasoning: Optional[str] = None
+    is_complete: bool = False
+    usage: Optional[Dict[str, Any]] = None
+    tool_calls: Optional[List[Dict[str, Any]]] = None
+    image_urls: List[str] = field(default_factory=list)
+    audio_urls: List[str] = field(default_factory=list)
+    video_urls: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_chunk(cls, chunk: ChunkResponse, delay: float) -> "RecordedChunk":
+        tool_calls = None
+        if chunk.tool_calls:
+            tool_calls = [
+                {
+                    "index": delta.index,
+                    "call_id": delta.call_id,
+                    "name": delta.name,
+                    "arguments_delta": delta.arguments_delta,
+                }
+                for delta in chunk.tool_calls
+            ]
+        return cls(
+            delay=delay,
+            content=chunk.content or "",
+            reasoning=chunk.reasoning,
+            is_complete=chunk.is_complete,
+            usage=chunk.usage.model_dump() if chunk.usage else None,
+            tool_calls=tool_calls,
+            image_urls=list(chunk.image_urls),
+            audio_urls=list(chunk.audio_urls),
+            video_urls=list(chunk.video_urls),
+        )
+
+    def to_chunk(self) -> ChunkResponse:
+        return ChunkResponse(
+            content=self.content,
+            reasoning=self.reasoning,
+            is_complete=self.is_complete,
+            usage=TokenUsage(**self.usage) if self.usage else None,
+            image_urls=list(self.image_urls),
+            audio_urls=list(self.audio_urls),
+            video_urls=list(self.video_urls),
+            tool_calls=[ToolCallDelta(**delta) for delta in self.tool_calls] if self.tool_calls else None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"delay": round(self.delay, 6), "content": self.content}
+        if self.reasoning is not None:
+            data["reasoning"] = self.reasoning
+        if self.is_complete:
+            data["is_complete"] = True
+        if self.usage is not None:
+            data["usage"] = self.usage
+        if self.tool_calls:
+            data["tool_calls"] = self.tool_calls
+        for key in ("image_urls", "audio_urls", "video_urls"):
+            if getattr(self, key):
+                data[key] = getattr(self, key)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RecordedChunk":
+        return cls(
+            delay=float(data.get("delay", 0.0)),
+            content=data.get("content", ""),
+            reasoning=data.get("reasoning"),
+            is_complete=bool(data.get("is_complete", False)),
+            usage=data.get("usage"),
+            tool_calls=data.get("tool_calls"),
+            image_urls=list(data.get("image_urls", [])),
+            audio_urls=list(data.get("audio_urls", [])),
+            video_urls=list(data.get("video_urls", [])),
+        )
+
+
+@dataclass
+class RecordedExchange:
+    chunks: List[RecordedChunk] = field(default_factory=list)
+    tool_names: List[str] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return sum(chunk.delay for chunk in self.chunks)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"chunks": [chunk.to_dict() for chunk in self.chunks]}
+        if self.tool_names:
+            data["tool_names"] = self.tool_names
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RecordedExchange":
+        return cls(
+            chunks=[RecordedChunk.from_dict(chunk) for chunk in data.get("chunks", [])],
+            tool_names=list(data.get("tool_names", [])),
+        )
+
+
+@dataclass
+class StreamRecording:
+    provider: Optional[str] = None
+    model: Optional[str] = None
+    exchanges: List[RecordedExchange] = field(default_factory=list)
+    # Serializes appends made from worker threads, so concurrent calls write one header.
+    _append_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    def save(self, path: Union[str, Path]) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            handle.write(json.dumps(self._header(), ensure_ascii=False) + "\n")
+            for exchange in self.exchanges:
+                handle.write(json.dumps(exchange.to_dict(), ensure_ascii=False) + "\n")
+
+    def append_exchange(self, path: Union[str, Path], exchange: RecordedExchange) -> None:
+        """Append one exchange to `path`, writing the header first if the file is new."""
+        path = Path(path)
+        with self._append_lock:
+            self.exchanges.append(exchange)
+            is_new = not path.exists() or path.stat().st_size == 0
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as handle:
+                if is_new:
+                    handle.write(json.dumps(self._header(), ensure_ascii=False) + "\n")
+                handle.write(json.dumps(exchange.to_dict(), ensure_ascii=False) + "\n")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "StreamRecording":
+        recording = cls()
+        with Path(path).open("r", encoding="utf-8") as handle:
+            for line_number, line in enumerate(handle):
+                line = line.strip()
+                if not line:
+                    continue
+                data = json.loads(line)
+                if line_number == 0 and data.get("type") == "header":
+                    version = data.get("version", RECORDING_FORMAT_VERSION)
+                    if version != RECORDING_FORMAT_VERSION:
+                        raise ValueError(f"Unsupported LLM recording version {version} in '{path}'.")
+                    recording.provider = data.get("provider")
+                    recording.model = data.get("model")
+                    continue
+                recording.exchanges.append(RecordedExchange.from_dict(data))
+        return recording
+
+    def _header(self) -> Dict[str, Any]:
+        return {
+            "type": "header",
+            "version": RECORDING_FORMAT_VERSION,
+            "provider": self.provider,
+            "model": self.model,
+        }
@@ -10,6 +10,9 @@ class TokenUsage(BaseModel):
     prompt_cost: Optional[float] = None
     completion_cost: Optional[float] = None
     total_cost: Optional[float] = None
+    # Prompt-cache accounting. Both are included in prompt_tokens when reported.
+    cached_prompt_tokens: Optional[int] = None
+    cache_creation_tokens: Optional[int] = None
 
     # FIX: Use model_config with ConfigDict for Pydantic v2 compatibility
     model_config = ConfigDict(
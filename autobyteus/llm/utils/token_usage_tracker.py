@@ -40,6 +40,28 @@ class TokenUsageTracker:
                            else self.pricing_config.output_token_pricing)
         return (token_count / 1_000_000) * price_per_million
 
+    def calculate_prompt_cost(self,
+                              prompt_tokens: int,
+                              cached_prompt_tokens: Optional[int] = None,
+                              cache_creation_tokens: Optional[int] = None) -> float:
+        """
+        Calculate the cost of a prompt whose `prompt_tokens` include tokens read from
+        (`cached_prompt_tokens`) and written to (`cache_creation_tokens`) the provider's
+        prompt cache, billing those at the cache rates when the pricing config sets them.
+        """
+        cached = cached_prompt_tokens or 0
+        written = cache_creation_tokens or 0
+        uncached = max(prompt_tokens - cached - written, 0)
+        cost = self.calculate_cost(uncached, True)
+        for token_count, price_per_million in (
+            (cached, getattr(self.pricing_config, "cached_input_token_pricing", None)),
+            (written, getattr(self.pricing_config, "cache_write_token_pricing", None)),
+        ):
+            if not isinstance(price_per_million, (int, float)):
+                price_per_million = self.pricing_config.input_token_pricing
+            cost += (token_count / 1_000_000) * price_per_million
+        return cost
+
     def calculate_input_messages(self, messages: List[Message]) -> None:
         """Calculate token usage for input messages and initialize current usage"""
         prompt_tokens = self.token_counter.count_input_tokens(messages)
@@ -4,15 +4,16 @@ from autobyteus.memory.models.episodic_item import EpisodicItem
 from autobyteus.memory.models.semantic_item import SemanticItem
 from autobyteus.memory.models.tool_interaction import ToolInteraction, ToolInteractionStatus
 from autobyteus.memory.store.file_store import FileMemoryStore
+from autobyteus.memory.store.sqlite_store import SqliteMemoryStore
 from autobyteus.memory.turn_tracker import TurnTracker
 from autobyteus.memory.memory_manager import MemoryManager
 from autobyteus.memory.policies.compaction_policy import CompactionPolicy
 from autobyteus.memory.compaction.compactor import Compactor
 from autobyteus.memory.compaction.compaction_result import CompactionResult
-from autobyteus.memory.compaction.summarizer import Summarizer
+from autobyteus.memory.compaction.summarizer import AsyncSummarizer, Summarizer
 from autobyteus.memory.retrieval.memory_bundle import MemoryBundle
 from autobyteus.memory.retrieval.retriever import Retriever
-from autobyteus.memory.path_resolver import resolve_memory_base_dir, resolve_agent_memory_dir
+from autobyteus.memory.path_resolver import resolve_memory_base_dir, resolve_agent_memory_dir, resolve_memory_backend
 
 __all__ = [
     "MemoryType",
@@ -22,14 +23,17 @@ __all__ = [
     "ToolInteraction",
     "ToolInteractionStatus",
     "FileMemoryStore",
+    "SqliteMemoryStore",
     "TurnTracker",
     "MemoryManager",
     "CompactionPolicy",
     "Compactor",
     "CompactionResult",
     "Summarizer",
+    "AsyncSummarizer",
     "MemoryBundle",
     "Retriever",
     "resolve_memory_base_dir",
     "resolve_agent_memory_dir",
+    "resolve_memory_backend",
 ]
@@ -1,9 +1,10 @@
 from autobyteus.memory.compaction.compactor import Compactor
 from autobyteus.memory.compaction.compaction_result import CompactionResult
-from autobyteus.memory.compaction.summarizer import Summarizer
+from autobyteus.memory.compaction.summarizer import AsyncSummarizer, Summarizer
 
 __all__ = [
     "Compactor",
     "CompactionResult",
     "Summarizer",
+    "AsyncSummarizer",
 ]
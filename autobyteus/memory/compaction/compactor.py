@@ -1,22 +1,49 @@
+import asyncio
+import logging
 import time
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from autobyteus.memory.models.memory_types import MemoryType
 from autobyteus.memory.models.raw_trace_item import RawTraceItem
 from autobyteus.memory.models.episodic_item import EpisodicItem
 from autobyteus.memory.models.semantic_item import SemanticItem
 from autobyteus.memory.compaction.compaction_result import CompactionResult
-from autobyteus.memory.compaction.summarizer import Summarizer
+from autobyteus.memory.compaction.summarizer import Summarizer, fold_summaries, summary_trace
 from autobyteus.memory.policies.compaction_policy import CompactionPolicy
 from autobyteus.memory.store.base_store import MemoryStore
+from autobyteus.utils.monotonic_id import MonotonicIdGenerator, id_generator_for
+
+logger = logging.getLogger(__name__)
+
+# Episodic items carrying the rolling summary of every compacted turn up to theirs.
+ROLLING_TAG = "rolling"
+# Rolling items whose summary was re-consolidated rather than only folded.
+CONSOLIDATED_TAG = "consolidated"
 
 
 class Compactor:
-    def __init__(self, store: MemoryStore, policy: CompactionPolicy, summarizer: Summarizer):
+    """
+    Compacts old turns into a rolling episodic summary.
+
+    Each compaction summarizes only the turns no episodic item covers yet and folds
+    them into the latest rolling summary, so summarizer input is bounded by the
+    window plus the rolling summary, not by the session length. The rolling summary
+    is re-consolidated every `policy.consolidate_every` folds, or once it exceeds
+    `policy.max_summary_chars`.
+    """
+
+    def __init__(
+        self,
+        store: MemoryStore,
+        policy: CompactionPolicy,
+        summarizer: Summarizer,
+        id_generator: Optional[MonotonicIdGenerator] = None,
+    ):
         self.store = store
         self.policy = policy
         self.summarizer = summarizer
         self.memory_types = MemoryType
+        self.id_generator = id_generator or id_generator_for(getattr(store, "agent_id", None))
 
     def select_compaction_window(self) -> List[str]:
         raw_items = self.store.list(MemoryType.RAW_TRACE)
@@ -45,18 +72,44 @@ class Compactor:
         ]
 
     def compact(self, turn_ids: List[str]) -> Optional[CompactionResult]:
+        """Blocking wrapper around `compact_async` for callers outside an event loop."""
+        return asyncio.run(self.compact_async(turn_ids))
+
+    async def compact_async(self, turn_ids: List[str]) -> Optional[CompactionResult]:
         if not turn_ids:
             return None
 
-        traces = self.get_traces_for_turns(turn_ids)
-        result = self.summarizer.summarize(traces)
+        previous, folds_since_consolidation, covered = self._rolling_state()
+        new_turn_ids = [turn_id for turn_id in turn_ids if turn_id not in covered]
+        if not new_turn_ids:
+            # Already summarized (e.g. by a run whose pruning failed); only prune.
+            self._prune_raw_traces(turn_ids)
+            return None
+
+        traces = self.get_traces_for_turns(new_turn_ids)
+        previous_summary = previous.summary if previous else None
+        result = await self._summarize(traces, previous_summary)
+
+        consolidated = False
+        if previous_summary is not None and (
+            folds_since_consolidation + 1 >= self.policy.consolidate_every
+            or len(result.episodic_summary) > self.policy.max_summary_chars
+        ):
+            result.episodic_summary = await self._consolidate(result.episodic_summary)
+            consolidated = True
+        if len(result.episodic_summary) > self.policy.max_summary_chars:
+            logger.warning(
+                f"Rolling summary is {len(result.episodic_summary)} chars after consolidation; "
+                f"keeping the most recent {self.policy.max_summary_chars}."
+            )
+            result.episodic_summary = result.episodic_summary[-self.policy.max_summary_chars:]
 
         episodic_item = EpisodicItem(
-            id=f"ep_{int(time.time() * 1000)}",
+            id=self.id_generator.next_id("ep_"),
             ts=time.time(),
-            turn_ids=turn_ids,
+            turn_ids=new_turn_ids,
             summary=result.episodic_summary,
-            tags=[],
+            tags=[ROLLING_TAG, CONSOLIDATED_TAG] if consolidated else [ROLLING_TAG],
             salience=0.0,
         )
 
@@ -64,7 +117,7 @@ class Compactor:
         for idx, fact_data in enumerate(result.semantic_facts, start=1):
             semantic_items.append(
                 SemanticItem(
-                    id=f"sem_{int(time.time() * 1000)}_{idx}",
+                    id=self.id_generator.next_id("sem_"),
                     ts=time.time(),
                     fact=fact_data.get("fact", ""),
                     tags=fact_data.get("tags", []),
@@ -77,6 +130,36 @@ class Compactor:
         self._prune_raw_traces(turn_ids)
         return result
 
+    def _rolling_state(self) -> Tuple[Optional[EpisodicItem], int, set]:
+        """Latest rolling item, folds since its chain was last consolidated, and covered turn ids."""
+        episodic_items = [item for item in self.store.list(MemoryType.EPISODIC) if isinstance(item, EpisodicItem)]
+        covered = {turn_id for item in episodic_items for turn_id in item.turn_ids}
+        latest = None
+        folds = 0
+        for item in reversed(episodic_items):
+            if ROLLING_TAG not in item.tags:
+                continue
+            if latest is None:
+                latest = item
+            if CONSOLIDATED_TAG in item.tags:
+                break
+            folds += 1
+        return latest, folds, covered
+
+    async def _summarize(self, traces: List[RawTraceItem], previous_summary: Optional[str]) -> CompactionResult:
+        if isinstance(self.summarizer, Summarizer):
+            return await self.summarizer.summarize_async(traces, previous_summary=previous_summary)
+        # Duck-typed summarizers only provide the synchronous `summarize`.
+        result = await asyncio.to_thread(self.summarizer.summarize, traces)
+        result.episodic_summary = fold_summaries(previous_summary, result.episodic_summary)
+        return result
+
+    async def _consolidate(self, summary: str) -> str:
+        if isinstance(self.summarizer, Summarizer):
+            return await self.summarizer.consolidate_async(summary)
+        result = await asyncio.to_thread(self.summarizer.summarize, [summary_trace(summary)])
+        return result.episodic_summary or summary
+
     def _prune_raw_traces(self, compacted_turn_ids: List[str]) -> None:
         raw_items = self.store.list(MemoryType.RAW_TRACE)
         remaining_turns = {
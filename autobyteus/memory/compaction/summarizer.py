@@ -1,11 +1,83 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from autobyteus.memory.models.raw_trace_item import RawTraceItem
 from autobyteus.memory.compaction.compaction_result import CompactionResult
+from autobyteus.utils.monotonic_id import MonotonicIdGenerator
+
+# Summary traces are transient, so they do not use an agent's generator.
+_summary_ids = MonotonicIdGenerator()
+
+
+def fold_summaries(previous_summary: Optional[str], new_summary: str) -> str:
+    """Appends a window summary to the rolling summary it follows."""
+    if not previous_summary:
+        return new_summary
+    if not new_summary:
+        return previous_summary
+    return f"{previous_summary}\n{new_summary}"
+
+
+def summary_trace(summary: str) -> RawTraceItem:
+    """Wraps a summary as a trace so trace-based summarizers can re-summarize it."""
+    return RawTraceItem(
+        id=_summary_ids.next_id("rt_summary_"),
+        ts=time.time(),
+        turn_id="summary",
+        seq=1,
+        trace_type="summary",
+        content=summary,
+        source_event="Compactor",
+    )
 
 
 class Summarizer(ABC):
+    """
+    Turns raw traces into an episodic summary and semantic facts.
+
+    The Compactor uses the async methods. Their defaults run `summarize` in a worker
+    thread, so existing synchronous summarizers keep working without blocking the
+    agent loop. Summarizers that can fold new traces into an existing summary in one
+    call should override `summarize_async`.
+    """
+
     @abstractmethod
     def summarize(self, traces: List[RawTraceItem]) -> CompactionResult:
         raise NotImplementedError
+
+    async def summarize_async(
+        self, traces: List[RawTraceItem], previous_summary: Optional[str] = None
+    ) -> CompactionResult:
+        """
+        Summarizes `traces` and folds them into `previous_summary`, the current rolling
+        episodic summary (None when there is none). The returned `episodic_summary`
+        replaces the rolling summary.
+        """
+        result = await asyncio.to_thread(self.summarize, traces)
+        result.episodic_summary = fold_summaries(previous_summary, result.episodic_summary)
+        return result
+
+    async def consolidate_async(self, summary: str) -> str:
+        """Re-compresses a rolling summary that has grown through repeated folds."""
+        result = await asyncio.to_thread(self.summarize, [summary_trace(summary)])
+        return result.episodic_summary or summary
+
+
+class AsyncSummarizer(Summarizer):
+    """Base for summarizers whose natural interface is async (e.g. LLM-backed)."""
+
+    @abstractmethod
+    async def summarize_async(
+        self, traces: List[RawTraceItem], previous_summary: Optional[str] = None
+    ) -> CompactionResult:
+        raise NotImplementedError
+
+    async def consolidate_async(self, summary: str) -> str:
+        result = await self.summarize_async([summary_trace(summary)])
+        return result.episodic_summary or summary
+
+    def summarize(self, traces: List[RawTraceItem]) -> CompactionResult:
+        """Blocking entry point; only usable outside a running event loop."""
+        return asyncio.run(self.summarize_async(traces))
@@ -1,23 +1,30 @@
+import asyncio
+import logging
 import time
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 
 from autobyteus.agent.events.agent_events import ToolResultEvent
 from autobyteus.agent.tool_invocation import ToolInvocation
 from autobyteus.llm.user_message import LLMUserMessage
-from autobyteus.llm.utils.messages import ToolCallSpec
+from autobyteus.llm.utils.messages import Message, ToolCallSpec
 from autobyteus.llm.utils.response_types import CompleteResponse
 from autobyteus.memory.models.raw_trace_item import RawTraceItem
 from autobyteus.memory.models.memory_types import MemoryType
 from autobyteus.memory.policies.compaction_policy import CompactionPolicy
+from autobyteus.memory.policies.compaction_predictor import CompactionPredictor
 from autobyteus.memory.compaction.compactor import Compactor
 from autobyteus.memory.retrieval.retriever import Retriever
 from autobyteus.memory.store.base_store import MemoryStore
 from autobyteus.memory.turn_tracker import TurnTracker
 from autobyteus.memory.working_context_snapshot import WorkingContextSnapshot
 from autobyteus.memory.tool_interaction_builder import build_tool_interactions
+from autobyteus.memory.tool_interaction_index import ToolInteractionIndex
 from autobyteus.memory.working_context_snapshot_serializer import WorkingContextSnapshotSerializer
+from autobyteus.memory.store.tool_result_spill_store import ToolResultSpillStore
 from autobyteus.memory.store.working_context_snapshot_store import WorkingContextSnapshotStore
+from autobyteus.utils.monotonic_id import id_generator_for
 
+logger = logging.getLogger(__name__)
 
 class MemoryManager:
     def __init__(
@@ -29,6 +36,7 @@ class MemoryManager:
         retriever: Optional[Retriever] = None,
         working_context_snapshot: Optional[WorkingContextSnapshot] = None,
         working_context_snapshot_store: Optional[WorkingContextSnapshotStore] = None,
+        tool_result_spill_store: Optional[ToolResultSpillStore] = None,
     ):
         self.store = store
         self.turn_tracker = turn_tracker or TurnTracker()
@@ -36,10 +44,19 @@ class MemoryManager:
         self.compactor = compactor
         self.retriever = retriever or Retriever(store=store)
         self.memory_types = MemoryType
+        self.id_generator = id_generator_for(getattr(store, "agent_id", None))
         self._seq_by_turn: dict[str, int] = {}
         self.working_context_snapshot = working_context_snapshot or WorkingContextSnapshot()
         self.compaction_required: bool = False
         self.working_context_snapshot_store = working_context_snapshot_store
+        self.tool_result_spill_store = tool_result_spill_store
+        self._tool_interaction_index: Optional[ToolInteractionIndex] = None
+        self.compaction_predictor = CompactionPredictor(
+            default_tool_result_tokens=self.compaction_policy.default_tool_result_tokens
+        )
+        # Tool calls whose results have not been ingested yet: invocation id -> tool name.
+        self._pending_tool_calls: Dict[str, Optional[str]] = {}
+        self._background_compaction: Optional[asyncio.Task] = None
 
     def start_turn(self) -> str:
         return self.turn_tracker.next_turn_id()
@@ -50,6 +67,82 @@ class MemoryManager:
     def clear_compaction_request(self) -> None:
         self.compaction_required = False
 
+    def predict_next_prompt_tokens(self) -> int:
+        """Predicted prompt size of the next request: the working context plus pending tool results."""
+        pending = list(self._pending_tool_calls.values())
+        # Results arrive as tool messages and again in the aggregated message that resumes the turn.
+        incoming = sum(self.compaction_predictor.expected_tool_result_tokens(name) for name in pending)
+        return self.compaction_predictor.predict_prompt_tokens(
+            self.working_context_snapshot.build_messages(),
+            pending_tool_names=pending,
+            incoming_tokens=incoming,
+        )
+
+    def schedule_compaction(
+        self,
+        prompt_tokens: int,
+        input_budget: int,
+        sent_messages: Optional[Iterable[Message]] = None,
+        current_turn_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Called with the provider-reported prompt size of the request that just completed.
+        Requests compaction when that request crossed the policy trigger or, with
+        `policy.predictive`, when the next one is predicted to. Summarization of the
+        turns before `current_turn_id` then starts in the background, so the next
+        request usually only has to swap in the summary.
+        """
+        if not self.compactor:
+            return False
+        if sent_messages is not None:
+            self.compaction_predictor.observe_prompt(list(sent_messages), prompt_tokens)
+        policy = self.compaction_policy
+        if policy.should_compact(prompt_tokens, input_budget):
+            reason = f"last prompt used {prompt_tokens} tokens"
+        else:
+            predicted = self.predict_next_prompt_tokens() if policy.predictive else 0
+            if not policy.should_compact(predicted, input_budget):
+                return False
+            reason = f"next prompt predicted at {predicted} tokens"
+        logger.info(f"Scheduling compaction ({reason}; input budget {input_budget}).")
+        self.request_compaction()
+        if policy.predictive:
+            self._start_background_compaction(current_turn_id)
+        return True
+
+    def _start_background_compaction(self, current_turn_id: Optional[str]) -> None:
+        if not self.compactor or self._background_compaction is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        turn_ids = [turn_id for turn_id in self.compactor.select_compaction_window() if turn_id != current_turn_id]
+        if turn_ids:
+            self._background_compaction = loop.create_task(self.compactor.compact_async(turn_ids))
+
+    async def wait_for_background_compaction(self) -> bool:
+        """Waits for a compaction started by `schedule_compaction`; True if it completed."""
+        task, self._background_compaction = self._background_compaction, None
+        if task is None:
+            return False
+        try:
+            await task
+        except Exception as exc:
+            logger.warning(f"Background compaction failed; compacting in the foreground instead: {exc}")
+            return False
+        return True
+
+    async def close(self) -> None:
+        """Cancels a background compaction that is still running, so nothing writes to the store afterwards."""
+        task, self._background_compaction = self._background_compaction, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        # gather: the cancelled task's CancelledError is returned rather than raised here.
+        await asyncio.gather(task, return_exceptions=True)
+        logger.info("Cancelled a background compaction that was still running.")
+
     def _next_seq(self, turn_id: str) -> int:
         current = self._seq_by_turn.get(turn_id, 0) + 1
         self._seq_by_turn[turn_id] = current
@@ -57,7 +150,7 @@ class MemoryManager:
 
     def ingest_user_message(self, llm_user_message: LLMUserMessage, turn_id: str, source_event: str) -> None:
         trace = RawTraceItem(
-            id=f"rt_{int(time.time() * 1000)}",
+            id=self.id_generator.next_id("rt_"),
             ts=time.time(),
             turn_id=turn_id,
             seq=self._next_seq(turn_id),
@@ -78,7 +171,7 @@ class MemoryManager:
         if not effective_turn_id:
             raise ValueError("turn_id is required to ingest tool intent")
         trace = RawTraceItem(
-            id=f"rt_{int(time.time() * 1000)}",
+            id=self.id_generator.next_id("rt_"),
             ts=time.time(),
             turn_id=effective_turn_id,
             seq=self._next_seq(effective_turn_id),
@@ -90,6 +183,8 @@ class MemoryManager:
             tool_args=tool_invocation.arguments,
         )
         self.store.add([trace])
+        self._sync_tool_interaction_index()
+        self._pending_tool_calls[tool_invocation.id] = tool_invocation.name
         self.working_context_snapshot.append_tool_calls(
             [ToolCallSpec(id=tool_invocation.id, name=tool_invocation.name, arguments=tool_invocation.arguments)]
         )
@@ -99,7 +194,7 @@ class MemoryManager:
         if not effective_turn_id:
             raise ValueError("turn_id is required to ingest tool result")
         trace = RawTraceItem(
-            id=f"rt_{int(time.time() * 1000)}",
+            id=self.id_generator.next_id("rt_"),
             ts=time.time(),
             turn_id=effective_turn_id,
             seq=self._next_seq(effective_turn_id),
@@ -113,6 +208,9 @@ class MemoryManager:
             tool_error=event.error,
         )
         self.store.add([trace])
+        self._sync_tool_interaction_index()
+        self._pending_tool_calls.pop(event.tool_invocation_id, None)
+        self.compaction_predictor.observe_tool_result(event.tool_name, event.result)
         self.working_context_snapshot.append_tool_result(
             tool_call_id=event.tool_invocation_id or "",
             tool_name=event.tool_name,
@@ -122,7 +220,7 @@ class MemoryManager:
 
     def ingest_assistant_response(self, response: CompleteResponse, turn_id: str, source_event: str) -> None:
         trace = RawTraceItem(
-            id=f"rt_{int(time.time() * 1000)}",
+            id=self.id_generator.next_id("rt_"),
             ts=time.time(),
             turn_id=turn_id,
             seq=self._next_seq(turn_id),
@@ -191,11 +289,16 @@ class MemoryManager:
             "epoch_id": self.working_context_snapshot.epoch_id,
             "last_compaction_ts": self.working_context_snapshot.last_compaction_ts,
         }
-        payload = WorkingContextSnapshotSerializer.serialize(self.working_context_snapshot, metadata)
-        self.working_context_snapshot_store.write(agent_id, payload)
+        encoded = WorkingContextSnapshotSerializer.encode(self.working_context_snapshot, metadata)
+        self.working_context_snapshot_store.write_encoded(agent_id, encoded)
 
 
     def get_tool_interactions(self, turn_id: Optional[str] = None):
+        index = self._sync_tool_interaction_index()
+        if index is not None:
+            return index.interactions(turn_id)
+
+        # The store cannot report what changed since the last call: pair from a full scan.
         raw_items = self.store.list(MemoryType.RAW_TRACE)
         if turn_id:
             raw_items = [
@@ -203,3 +306,48 @@ class MemoryManager:
                 if isinstance(item, RawTraceItem) and item.turn_id == turn_id
             ]
         return build_tool_interactions([item for item in raw_items if isinstance(item, RawTraceItem)])
+
+    def _sync_tool_interaction_index(self) -> Optional[ToolInteractionIndex]:
+        """
+        Brings the tool interaction index up to date with the raw traces and returns it,
+        or None when the store does not support incremental reads.
+
+        Only traces appended since the index's cursor are read. When raw traces were
+        pruned in the meantime, the index is rebuilt from the (now short) raw trace list.
+        """
+        read_after = getattr(self.store, "read_raw_traces_after", None)
+        if not callable(read_after):
+            return None
+        if self._tool_interaction_index is None:
+            read_log = getattr(self.store, "read_tool_interaction_log", None)
+            records = read_log() if callable(read_log) else []
+            self._tool_interaction_index = ToolInteractionIndex.from_records(records)
+            superseded = len(records) - len(self._tool_interaction_index)
+            write_log = getattr(self.store, "write_tool_interaction_log", None)
+            if superseded > max(len(self._tool_interaction_index), 100) // 2 and callable(write_log):
+                # Most interactions were logged twice (intent, then result): keep only the latest records.
+                write_log(self._tool_interaction_index.records() + [{"cursor": self._tool_interaction_index.cursor}])
+
+        index = self._tool_interaction_index
+        appended = read_after(index.cursor) if index.cursor is not None else None
+        if appended is None:
+            return self._rebuild_tool_interaction_index()
+
+        traces, cursor = appended
+        changed = index.apply(traces)
+        index.cursor = cursor
+        append_log = getattr(self.store, "append_tool_interaction_log", None)
+        if changed and callable(append_log):
+            append_log([ToolInteractionIndex.to_record(interaction, cursor) for interaction in changed])
+        return index
+
+    def _rebuild_tool_interaction_index(self) -> ToolInteractionIndex:
+        index = ToolInteractionIndex()
+        # Taken before listing: traces appended meanwhile are applied again later, which is harmless.
+        index.cursor = self.store.raw_trace_cursor()
+        index.apply(item for item in self.store.list(MemoryType.RAW_TRACE) if isinstance(item, RawTraceItem))
+        write_log = getattr(self.store, "write_tool_interaction_log", None)
+        if callable(write_log):
+            write_log(index.records() + [{"cursor": index.cursor}])
+        self._tool_interaction_index = index
+        return index
@@ -23,5 +23,12 @@ def resolve_memory_base_dir(
     return str(Path.cwd() / "memory")
 
 
+def resolve_memory_backend(env: Optional[Mapping[str, str]] = None) -> str:
+    """`file` (JSONL per agent, the default) or `sqlite` (one shared database), from AUTOBYTEUS_MEMORY_BACKEND."""
+    env_values = env if env is not None else os.environ
+    backend = env_values.get("AUTOBYTEUS_MEMORY_BACKEND", "").strip().lower()
+    return backend if backend in ("file", "sqlite") else "file"
+
+
 def resolve_agent_memory_dir(base_dir: Union[str, Path], agent_id: str) -> str:
     return str(Path(base_dir) / "agents" / agent_id)
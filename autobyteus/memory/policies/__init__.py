@@ -1,5 +1,7 @@
 from autobyteus.memory.policies.compaction_policy import CompactionPolicy
+from autobyteus.memory.policies.compaction_predictor import CompactionPredictor
 
 __all__ = [
     "CompactionPolicy",
+    "CompactionPredictor",
 ]
@@ -7,6 +7,15 @@ class CompactionPolicy:
     raw_tail_turns: int = 4
     max_item_chars: int = 2000
     safety_margin_tokens: int = 256
+    # Rolling episodic summary: re-consolidate after this many folds, or sooner once
+    # the summary grows past max_summary_chars.
+    consolidate_every: int = 8
+    max_summary_chars: int = 8000
+    # Proactive compaction: also compact when the next request is predicted to cross the
+    # trigger, counting the results of tool calls still running. Compaction then starts
+    # in the background, while tools run or the agent waits for input.
+    predictive: bool = True
+    default_tool_result_tokens: int = 2000
 
     def should_compact(self, prompt_tokens: int, input_budget: int) -> bool:
         if input_budget <= 0:
@@ -0,0 +1,84 @@
+import math
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from autobyteus.llm.utils.messages import Message
+
+# Rough per-message framing cost (role markers, separators) in chat templates.
+MESSAGE_OVERHEAD_TOKENS = 4
+# Flat estimate per image/audio/video attachment.
+MEDIA_TOKENS = 256
+
+
+class CompactionPredictor:
+    """
+    Estimates the next request's prompt tokens locally, between provider usage reports.
+
+    Message sizes are estimated from their characters and cached per message. Every
+    provider-reported prompt size recalibrates an additive offset, which absorbs tool
+    schemas, chat template tokens and estimation error for the prefix the provider
+    already counted. Tool results still running are reserved for at the largest size
+    recently seen from that tool, or `default_tool_result_tokens` for a tool not seen yet.
+    """
+
+    def __init__(
+        self,
+        chars_per_token: float = 4.0,
+        default_tool_result_tokens: int = 2000,
+        tool_history: int = 8,
+    ):
+        self.chars_per_token = chars_per_token
+        self.default_tool_result_tokens = default_tool_result_tokens
+        self.tool_history = tool_history
+        self.offset_tokens: int = 0
+        self._message_tokens: "weakref.WeakKeyDictionary[Message, Tuple[tuple, int]]" = weakref.WeakKeyDictionary()
+        self._tool_result_tokens: Dict[str, Deque[int]] = {}
+
+    def estimate_text_tokens(self, value: Any) -> int:
+        if value is None:
+            return 0
+        text = value if isinstance(value, str) else str(value)
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def estimate_message_tokens(self, message: Message) -> int:
+        fingerprint = (message.content, message.reasoning_content, message.tool_payload)
+        cached = self._message_tokens.get(message)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        tokens = (
+            MESSAGE_OVERHEAD_TOKENS
+            + self.estimate_text_tokens(message.content)
+            + self.estimate_text_tokens(message.reasoning_content)
+            + self.estimate_text_tokens(message.to_dict()["tool_payload"] if message.tool_payload else None)
+            + MEDIA_TOKENS * (len(message.image_urls) + len(message.audio_urls) + len(message.video_urls))
+        )
+        self._message_tokens[message] = (fingerprint, tokens)
+        return tokens
+
+    def estimate_tokens(self, messages: Iterable[Message]) -> int:
+        return sum(self.estimate_message_tokens(message) for message in messages)
+
+    def observe_prompt(self, messages: List[Message], prompt_tokens: int) -> None:
+        """Calibrates against the provider-reported prompt size of the request that sent `messages`."""
+        self.offset_tokens = prompt_tokens - self.estimate_tokens(messages)
+
+    def observe_tool_result(self, tool_name: Optional[str], result: Any) -> None:
+        history = self._tool_result_tokens.setdefault(tool_name or "", deque(maxlen=self.tool_history))
+        history.append(self.estimate_text_tokens(result))
+
+    def expected_tool_result_tokens(self, tool_name: Optional[str]) -> int:
+        history = self._tool_result_tokens.get(tool_name or "")
+        return max(history) if history else self.default_tool_result_tokens
+
+    def predict_prompt_tokens(
+        self,
+        messages: List[Message],
+        pending_tool_names: Iterable[Optional[str]] = (),
+        incoming_tokens: int = 0,
+    ) -> int:
+        """Prompt size of a request sending `messages` plus the results of the pending tool calls."""
+        pending = sum(
+            MESSAGE_OVERHEAD_TOKENS + self.expected_tool_result_tokens(name) for name in pending_tool_names
+        )
+        return max(0, self.estimate_tokens(messages) + self.offset_tokens) + pending + incoming_tokens
@@ -1,10 +1,17 @@
+import logging
 from dataclasses import dataclass
 from typing import Optional
 
-from autobyteus.memory.working_context_snapshot_serializer import WorkingContextSnapshotSerializer
+from autobyteus.memory.working_context_snapshot import WorkingContextSnapshot
+from autobyteus.memory.working_context_snapshot_serializer import (
+    DEFAULT_LAZY_MESSAGE_BYTES,
+    WorkingContextSnapshotSerializer,
+)
 from autobyteus.memory.compaction_snapshot_builder import CompactionSnapshotBuilder
 from autobyteus.memory.store.working_context_snapshot_store import WorkingContextSnapshotStore
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class WorkingContextSnapshotBootstrapOptions:
@@ -18,18 +25,19 @@ class WorkingContextSnapshotBootstrapper:
         self,
         working_context_snapshot_store: Optional[WorkingContextSnapshotStore] = None,
         snapshot_builder: Optional[CompactionSnapshotBuilder] = None,
+        lazy_message_bytes: int = DEFAULT_LAZY_MESSAGE_BYTES,
     ) -> None:
         self.working_context_snapshot_store = working_context_snapshot_store
         self.snapshot_builder = snapshot_builder or CompactionSnapshotBuilder()
+        self.lazy_message_bytes = lazy_message_bytes
 
     def bootstrap(self, memory_manager, system_prompt: str, options: WorkingContextSnapshotBootstrapOptions) -> None:
         store = self._resolve_store(memory_manager)
         agent_id = self._resolve_agent_id(memory_manager, store)
 
         if store and agent_id and store.exists(agent_id):
-            payload = store.read(agent_id)
-            if payload and WorkingContextSnapshotSerializer.validate(payload):
-                snapshot, _meta = WorkingContextSnapshotSerializer.deserialize(payload)
+            snapshot = self._read_snapshot(store, agent_id)
+            if snapshot is not None:
                 memory_manager.reset_working_context_snapshot(snapshot.build_messages())
                 return
 
@@ -49,6 +57,25 @@ class WorkingContextSnapshotBootstrapper:
         )
         memory_manager.reset_working_context_snapshot(snapshot_messages)
 
+    def _read_snapshot(self, store: WorkingContextSnapshotStore, agent_id: str) -> Optional[WorkingContextSnapshot]:
+        # Streamed, with large messages decoded lazily; snapshots in the older
+        # single-line layout are loaded whole.
+        open_binary = getattr(store, "open_binary", None)
+        handle = open_binary(agent_id) if callable(open_binary) else None
+        if handle is not None:
+            with handle:
+                decoded = WorkingContextSnapshotSerializer.decode_stream(handle, self.lazy_message_bytes)
+            if decoded is not None:
+                return decoded[0]
+        try:
+            payload = store.read(agent_id)
+        except ValueError as exc:
+            logger.warning(f"Unreadable working context snapshot for agent '{agent_id}'; rebuilding: {exc}")
+            return None
+        if payload and WorkingContextSnapshotSerializer.validate(payload):
+            return WorkingContextSnapshotSerializer.deserialize(payload)[0]
+        return None
+
     def _resolve_store(self, memory_manager) -> Optional[WorkingContextSnapshotStore]:
         if self.working_context_snapshot_store is not None:
             return self.working_context_snapshot_store
@@ -1,3 +1,4 @@
+from autobyteus.memory.compaction.compactor import ROLLING_TAG
 from autobyteus.memory.models.memory_types import MemoryType
 from autobyteus.memory.retrieval.memory_bundle import MemoryBundle
 from autobyteus.memory.store.base_store import MemoryStore
@@ -9,5 +10,10 @@ class Retriever:
 
     def retrieve(self, max_episodic: int, max_semantic: int) -> MemoryBundle:
         episodic = self.store.list(MemoryType.EPISODIC, limit=max_episodic)
+        # A rolling summary already folds in every episode before it.
+        for idx in range(len(episodic) - 1, -1, -1):
+            if ROLLING_TAG in getattr(episodic[idx], "tags", []):
+                episodic = episodic[idx:]
+                break
         semantic = self.store.list(MemoryType.SEMANTIC, limit=max_semantic)
         return MemoryBundle(episodic=episodic, semantic=semantic)
@@ -1,9 +1,15 @@
 from autobyteus.memory.store.base_store import MemoryStore
 from autobyteus.memory.store.file_store import FileMemoryStore
+from autobyteus.memory.store.raw_trace_archive import RawTraceArchive
+from autobyteus.memory.store.sqlite_store import SqliteMemoryStore
+from autobyteus.memory.store.tool_result_spill_store import ToolResultSpillStore
 from autobyteus.memory.store.working_context_snapshot_store import WorkingContextSnapshotStore
 
 __all__ = [
     "MemoryStore",
     "FileMemoryStore",
+    "RawTraceArchive",
+    "SqliteMemoryStore",
+    "ToolResultSpillStore",
     "WorkingContextSnapshotStore",
 ]
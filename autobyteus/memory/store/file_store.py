@@ -1,12 +1,15 @@
 import json
+import os
 from pathlib import Path
-from typing import Iterable, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from autobyteus.memory.models.memory_types import MemoryType
 from autobyteus.memory.models.raw_trace_item import RawTraceItem
 from autobyteus.memory.models.episodic_item import EpisodicItem
 from autobyteus.memory.models.semantic_item import SemanticItem
 from autobyteus.memory.store.base_store import MemoryStore
+from autobyteus.memory.store.raw_trace_archive import RawTraceArchive
+from autobyteus.utils.json_codec import loads
 
 
 class FileMemoryStore(MemoryStore):
@@ -15,6 +18,16 @@ class FileMemoryStore(MemoryStore):
         self.agent_id = agent_id
         self.agent_dir = self.base_dir / "agents" / agent_id
         self.agent_dir.mkdir(parents=True, exist_ok=True)
+        self._archive: Optional[RawTraceArchive] = None
+
+    @property
+    def archive(self) -> RawTraceArchive:
+        if self._archive is None:
+            self._archive = RawTraceArchive(
+                self.agent_dir / "raw_traces_archive",
+                legacy_file=self._get_archive_path(),
+            )
+        return self._archive
 
     def add(self, items: Iterable[object]) -> None:
         for item in items:
@@ -43,12 +56,64 @@ class FileMemoryStore(MemoryStore):
         with path.open("r", encoding="utf-8") as handle:
             return [json.loads(line) for line in handle if line.strip()]
 
-    def read_archive_raw_traces(self) -> List[dict]:
-        path = self._get_archive_path()
+    def raw_trace_cursor(self) -> Dict[str, Any]:
+        """Position after the last raw trace; pruning rewrites the file and invalidates it."""
+        try:
+            stat = self._get_file_path(MemoryType.RAW_TRACE).stat()
+        except FileNotFoundError:
+            return {"inode": None, "offset": 0}
+        return {"inode": stat.st_ino, "offset": stat.st_size}
+
+    def read_raw_traces_after(self, cursor: Dict[str, Any]) -> Optional[Tuple[List[RawTraceItem], Dict[str, Any]]]:
+        """
+        Raw traces appended after `cursor` and the cursor after them, or None when the
+        raw trace file has been rewritten since `cursor` was taken.
+        """
+        current = self.raw_trace_cursor()
+        offset = cursor.get("offset", 0)
+        if cursor.get("inode") != current["inode"] or offset > current["offset"]:
+            return None
+        if offset == current["offset"]:
+            return [], cursor
+        with self._get_file_path(MemoryType.RAW_TRACE).open("rb") as handle:
+            handle.seek(offset)
+            data = handle.read(current["offset"] - offset)
+        # Stop at the last complete line; a concurrent append may be half written.
+        complete = data[: data.rfind(b"\n") + 1]
+        traces = [RawTraceItem.from_dict(json.loads(line)) for line in complete.splitlines() if line.strip()]
+        return traces, {"inode": current["inode"], "offset": offset + len(complete)}
+
+    def read_tool_interaction_log(self) -> List[dict]:
+        path = self._get_tool_interaction_log_path()
         if not path.exists():
             return []
-        with path.open("r", encoding="utf-8") as handle:
-            return [json.loads(line) for line in handle if line.strip()]
+        with path.open("rb") as handle:
+            return [loads(line) for line in handle if line.strip()]
+
+    def append_tool_interaction_log(self, records: Iterable[dict]) -> None:
+        with self._get_tool_interaction_log_path().open("a", encoding="utf-8") as handle:
+            for record in records:
+                handle.write(json.dumps(record) + "\n")
+
+    def write_tool_interaction_log(self, records: Iterable[dict]) -> None:
+        path = self._get_tool_interaction_log_path()
+        tmp_path = path.with_suffix(".jsonl.tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            for record in records:
+                handle.write(json.dumps(record) + "\n")
+        os.replace(tmp_path, path)
+
+    def read_archive_raw_traces(self) -> List[dict]:
+        return self.archive.read_all()
+
+    def read_archived_traces(
+        self,
+        turn_ids: Optional[Iterable[str]] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> List[dict]:
+        """Archived traces for `turn_ids` and/or `since` <= ts <= `until`; reads only matching segments."""
+        return list(self.archive.iter_records(turn_ids=turn_ids, since=since, until=until))
 
     def prune_raw_traces(self, keep_turn_ids: set[str], archive: bool = True) -> None:
         raw_items = self.list_raw_trace_dicts()
@@ -63,6 +128,11 @@ class FileMemoryStore(MemoryStore):
             else:
                 removed.append(item)
 
+        if archive and removed:
+            # Archived before the rewrite: if the archive write fails, the traces stay put.
+            self.archive.append(removed)
+            self.archive.flush()
+
         raw_path = self._get_file_path(MemoryType.RAW_TRACE)
         tmp_path = raw_path.with_suffix(".jsonl.tmp")
         with tmp_path.open("w", encoding="utf-8") as handle:
@@ -70,12 +140,6 @@ class FileMemoryStore(MemoryStore):
                 handle.write(json.dumps(item) + "\n")
         tmp_path.replace(raw_path)
 
-        if archive and removed:
-            archive_path = self._get_archive_path()
-            with archive_path.open("a", encoding="utf-8") as handle:
-                for item in removed:
-                    handle.write(json.dumps(item) + "\n")
-
     def _get_file_path(self, memory_type: MemoryType) -> Path:
         if memory_type == MemoryType.RAW_TRACE:
             return self.agent_dir / "raw_traces.jsonl"
@@ -94,5 +158,9 @@ class FileMemoryStore(MemoryStore):
             return SemanticItem.from_dict(data)
         raise ValueError(f"Unknown memory type: {memory_type}")
 
+    def _get_tool_interaction_log_path(self) -> Path:
+        return self.agent_dir / "tool_interactions.jsonl"
+
     def _get_archive_path(self) -> Path:
+        """Single-file archive written before segmented archives; migrated on first use."""
         return self.agent_dir / "raw_traces_archive.jsonl"
@@ -0,0 +1,357 @@
+"""
+Segmented archive of pruned raw traces.
+
+Layout under the archive directory (`<agent_dir>/raw_traces_archive/`):
+
+- `segment-000001.jsonl.gz` (or `.zst`): sealed, compressed segments.
+- `segment-000007.jsonl`: the active segment; plain JSONL, appended to until it
+  reaches `AUTOBYTEUS_TRACE_ARCHIVE_SEGMENT_BYTES` (default 16 MiB) and is sealed.
+- `manifest.json`: per segment, the trace count, sizes, and turn-id and timestamp
+  ranges. Lookups by turn or time read only segments whose ranges match.
+
+Writes run on a single background worker, in submission order; every read waits for
+pending writes first. A failed write is logged when it happens and re-raised by the
+next `flush`. Sealed segments use zstd when `zstandard` is installed and gzip
+otherwise (`AUTOBYTEUS_TRACE_ARCHIVE_CODEC` overrides). A legacy single-file
+`raw_traces_archive.jsonl` is migrated into segments on first use.
+"""
+import gzip
+import io
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # Optional; sealed segments fall back to gzip.
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ENV_TRACE_ARCHIVE_SEGMENT_BYTES = "AUTOBYTEUS_TRACE_ARCHIVE_SEGMENT_BYTES"
+ENV_TRACE_ARCHIVE_CODEC = "AUTOBYTEUS_TRACE_ARCHIVE_CODEC"
+DEFAULT_SEGMENT_BYTES = 16 * 1024 * 1024
+MANIFEST_NAME = "manifest.json"
+SCHEMA_VERSION = 1
+_CODEC_SUFFIX = {"none": ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+_TURN_NUMBER = re.compile(r"(\d+)$")
+
+# One worker for every archive: writes stay ordered and never compete with each other.
+# Pending work is completed at interpreter exit (concurrent.futures joins its workers).
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trace-archive")
+
+
+def resolve_segment_bytes() -> int:
+    try:
+        return max(1, int(os.getenv(ENV_TRACE_ARCHIVE_SEGMENT_BYTES, DEFAULT_SEGMENT_BYTES)))
+    except ValueError:
+        logger.warning(f"Invalid {ENV_TRACE_ARCHIVE_SEGMENT_BYTES}; using {DEFAULT_SEGMENT_BYTES}.")
+        return DEFAULT_SEGMENT_BYTES
+
+
+def resolve_codec() -> str:
+    codec = os.getenv(ENV_TRACE_ARCHIVE_CODEC, "").strip().lower()
+    if codec == "zstd" and zstandard is None:
+        logger.warning("zstd archive codec requested but 'zstandard' is not installed; using gzip.")
+        return "gzip"
+    if codec in ("gzip", "zstd"):
+        return codec
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def turn_sort_key(turn_id: str) -> Tuple[int, str]:
+    """Orders `turn_0999` before `turn_10000`; ids without a number sort after numbered ones."""
+    match = _TURN_NUMBER.search(turn_id or "")
+    return (int(match.group(1)), turn_id) if match else (1 << 62, turn_id or "")
+
+
+@dataclass
+class SegmentInfo:
+    file: str
+    codec: str
+    count: int = 0
+    raw_bytes: int = 0
+    stored_bytes: int = 0
+    min_ts: Optional[float] = None
+    max_ts: Optional[float] = None
+    min_turn: Optional[str] = None
+    max_turn: Optional[str] = None
+
+    @property
+    def sealed(self) -> bool:
+        return self.codec != "none"
+
+    def include(self, record: Dict[str, Any], size: int) -> None:
+        self.count += 1
+        self.raw_bytes += size
+        ts = record.get("ts")
+        if isinstance(ts, (int, float)):
+            self.min_ts = ts if self.min_ts is None else min(self.min_ts, ts)
+            self.max_ts = ts if self.max_ts is None else max(self.max_ts, ts)
+        turn_id = record.get("turn_id")
+        if turn_id:
+            if self.min_turn is None or turn_sort_key(turn_id) < turn_sort_key(self.min_turn):
+                self.min_turn = turn_id
+            if self.max_turn is None or turn_sort_key(turn_id) > turn_sort_key(self.max_turn):
+                self.max_turn = turn_id
+
+    def may_contain_turn(self, key: Tuple[int, str]) -> bool:
+        if self.min_turn is None:
+            return False
+        return turn_sort_key(self.min_turn) <= key <= turn_sort_key(self.max_turn)
+
+    def overlaps(self, since: Optional[float], until: Optional[float]) -> bool:
+        if self.min_ts is None:
+            return since is None and until is None
+        if since is not None and self.max_ts < since:
+            return False
+        if until is not None and self.min_ts > until:
+            return False
+        return True
+
+
+def _open_reader(path: Path, codec: str) -> IO[str]:
+    if codec == "gzip":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if codec == "zstd":
+        raw = path.open("rb")
+        return io.TextIOWrapper(zstandard.ZstdDecompressor().stream_reader(raw, closefd=True), encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def _compress_file(source: Path, target: Path, codec: str) -> None:
+    tmp_path = target.with_name(target.name + ".tmp")
+    with source.open("rb") as src, tmp_path.open("wb") as dst:
+        if codec == "zstd":
+            with zstandard.ZstdCompressor(level=6).stream_writer(dst, closefd=False) as writer:
+                shutil.copyfileobj(src, writer, 1024 * 1024)
+        else:
+            with gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=6) as writer:
+                shutil.copyfileobj(src, writer, 1024 * 1024)
+        dst.flush()
+        os.fsync(dst.fileno())
+    os.replace(tmp_path, target)
+
+
+class RawTraceArchive:
+    """Append-only, segmented store for raw traces pruned from the working set."""
+
+    def __init__(
+        self,
+        directory: Path,
+        legacy_file: Optional[Path] = None,
+        segment_bytes: Optional[int] = None,
+        codec: Optional[str] = None,
+    ):
+        self.directory = Path(directory)
+        self.legacy_file = legacy_file
+        self.segment_bytes = segment_bytes or resolve_segment_bytes()
+        self.codec = codec or resolve_codec()
+        self._segments: Optional[List[SegmentInfo]] = None
+        self._lock = threading.Lock()
+        self._pending: List[Future] = []
+        self._failure: Optional[BaseException] = None
+
+    # --- Public API ----------------------------------------------------------------
+
+    def append(self, records: Iterable[Dict[str, Any]]) -> Future:
+        """Queues `records` for archiving and returns immediately."""
+        batch = list(records)
+        with self._lock:
+            future = _executor.submit(self._write_batch, batch)
+            self._pending.append(future)
+        future.add_done_callback(self._on_write_done)
+        return future
+
+    def flush(self) -> None:
+        """Waits for queued writes; re-raises the first write that failed since the last flush."""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            try:
+                future.result()
+            except Exception:
+                pass
+        with self._lock:
+            failure, self._failure = self._failure, None
+        if failure is not None:
+            raise failure
+
+    def _on_write_done(self, future: Future) -> None:
+        with self._lock:
+            self._pending.remove(future)
+            error = None if future.cancelled() else future.exception()
+            if error is not None and self._failure is None:
+                self._failure = error
+        if error is not None:
+            logger.error(f"Writing to trace archive '{self.directory}' failed: {error}", exc_info=error)
+
+    def read_all(self) -> List[Dict[str, Any]]:
+        return list(self.iter_records())
+
+    def iter_records(
+        self,
+        turn_ids: Optional[Iterable[str]] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yields archived traces, optionally only for `turn_ids` and/or `since` <= ts <= `until`."""
+        wanted = set(turn_ids) if turn_ids is not None else None
+        wanted_keys = sorted(turn_sort_key(turn_id) for turn_id in wanted) if wanted is not None else None
+        for segment in self.segments():
+            if wanted_keys is not None and not any(segment.may_contain_turn(key) for key in wanted_keys):
+                continue
+            if not segment.overlaps(since, until):
+                continue
+            for line in self._segment_lines(segment):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if wanted is not None and record.get("turn_id") not in wanted:
+                    continue
+                ts = record.get("ts")
+                if since is not None and (ts is None or ts < since):
+                    continue
+                if until is not None and (ts is None or ts > until):
+                    continue
+                yield record
+
+    def _segment_lines(self, segment: SegmentInfo) -> Iterator[str]:
+        if segment.sealed:
+            with _open_reader(self.directory / segment.file, segment.codec) as handle:
+                yield from handle
+            return
+        # The active segment may be appended to (or sealed) while we read it: read only
+        # the bytes the snapshot covers, from the sealed file if it has been sealed since.
+        path = self.directory / segment.file
+        try:
+            with path.open("rb") as handle:
+                data = handle.read(segment.stored_bytes)
+        except FileNotFoundError:
+            sealed = path.name[: -len(_CODEC_SUFFIX["none"])] + _CODEC_SUFFIX[self.codec]
+            with _open_reader(self.directory / sealed, self.codec) as handle:
+                data = handle.read().encode("utf-8")[: segment.stored_bytes]
+        yield from data.decode("utf-8").splitlines()
+
+    def segments(self) -> List[SegmentInfo]:
+        if self.legacy_file is not None and self.legacy_file.exists():
+            self.append([])
+        self.flush()
+        # Snapshot on the worker, so it is ordered after pending writes and never torn.
+        return _executor.submit(lambda: [replace(segment) for segment in self._load_segments()]).result()
+
+    # --- Worker side -----------------------------------------------------------------
+
+    def _load_segments(self) -> List[SegmentInfo]:
+        if self._segments is None:
+            manifest_path = self.directory / MANIFEST_NAME
+            if manifest_path.exists():
+                data = json.loads(manifest_path.read_text(encoding="utf-8"))
+                self._segments = [SegmentInfo(**segment) for segment in data.get("segments", [])]
+            else:
+                self._segments = []
+            if self._segments and not self._segments[-1].sealed:
+                self._recover_active_segment(self._segments[-1])
+        return self._segments
+
+    def _recover_active_segment(self, segment: SegmentInfo) -> None:
+        """
+        Re-indexes the active segment if it changed after the manifest was written (e.g. a
+        crash). A torn last line from an interrupted append is truncated away.
+        """
+        path = self.directory / segment.file
+        size = path.stat().st_size if path.exists() else 0
+        if size == segment.stored_bytes:
+            return
+        logger.warning(f"Trace archive manifest is stale for {segment.file}; re-indexing it.")
+        rebuilt = SegmentInfo(file=segment.file, codec=segment.codec)
+        if size:
+            with path.open("rb+") as handle:
+                good_bytes = 0
+                for line in handle:
+                    if line.strip():
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            if good_bytes + len(line) < size:
+                                raise
+                            logger.warning(f"Dropping a torn last line ({len(line)} bytes) from {segment.file}.")
+                            handle.truncate(good_bytes)
+                            break
+                        rebuilt.include(record, len(line.decode("utf-8")))
+                    good_bytes += len(line)
+        rebuilt.stored_bytes = path.stat().st_size if size else 0
+        self._segments[-1] = rebuilt
+
+    def _write_manifest(self) -> None:
+        path = self.directory / MANIFEST_NAME
+        tmp_path = path.with_name(MANIFEST_NAME + ".tmp")
+        payload = {"schema_version": SCHEMA_VERSION, "segments": [asdict(segment) for segment in self._segments]}
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _active_segment(self) -> SegmentInfo:
+        segments = self._load_segments()
+        if segments and not segments[-1].sealed:
+            return segments[-1]
+        segment = SegmentInfo(file=f"segment-{len(segments) + 1:06d}{_CODEC_SUFFIX['none']}", codec="none")
+        segments.append(segment)
+        return segment
+
+    def _write_batch(self, records: List[Dict[str, Any]]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._migrate_legacy_file()
+        self._append_records(records)
+        self._write_manifest()
+
+    def _append_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        segment = self._active_segment()
+        handle = (self.directory / segment.file).open("a", encoding="utf-8")
+        try:
+            for record in records:
+                line = json.dumps(record) + "\n"
+                handle.write(line)
+                segment.include(record, len(line))
+                if segment.raw_bytes >= self.segment_bytes:
+                    handle.close()
+                    self._seal(segment)
+                    segment = self._active_segment()
+                    handle = (self.directory / segment.file).open("a", encoding="utf-8")
+        finally:
+            handle.close()
+        segment.stored_bytes = (self.directory / segment.file).stat().st_size
+
+    def _seal(self, segment: SegmentInfo) -> None:
+        plain_path = self.directory / segment.file
+        sealed_name = plain_path.name[: -len(_CODEC_SUFFIX["none"])] + _CODEC_SUFFIX[self.codec]
+        _compress_file(plain_path, self.directory / sealed_name, self.codec)
+        segment.file = sealed_name
+        segment.codec = self.codec
+        segment.stored_bytes = (self.directory / sealed_name).stat().st_size
+        # The manifest must name the sealed file before the plain one disappears.
+        self._write_manifest()
+        plain_path.unlink()
+        logger.debug(f"Sealed trace archive segment {sealed_name}: {segment.count} traces, {segment.stored_bytes} bytes.")
+
+    def _migrate_legacy_file(self) -> None:
+        legacy = self.legacy_file
+        if legacy is None or not legacy.exists():
+            return
+
+        def legacy_records() -> Iterator[Dict[str, Any]]:
+            with legacy.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        yield json.loads(line)
+
+        self._append_records(legacy_records())
+        self._write_manifest()
+        legacy.unlink()
+        logger.info(f"Migrated legacy raw trace archive '{legacy}' into segments.")
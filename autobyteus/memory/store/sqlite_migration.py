@@ -0,0 +1,100 @@
+"""
+Copies JSONL memory directories (FileMemoryStore) into the SQLite store.
+
+Run with: python -m autobyteus.memory.store.sqlite_migration <memory_base_dir> [--db PATH]
+
+Every agent under `<memory_base_dir>/agents/` is imported in its original order,
+including archived raw traces, in a single transaction per agent. An agent that
+already has rows in the database is skipped; an agent whose import failed has none,
+so re-running the migration finishes it. The source directory is only read, so it
+stays usable by FileMemoryStore.
+"""
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from autobyteus.memory.models.memory_types import MemoryType
+from autobyteus.memory.store.file_store import FileMemoryStore
+from autobyteus.memory.store.raw_trace_archive import RawTraceArchive
+from autobyteus.memory.store.sqlite_store import SqliteMemoryStore
+
+logger = logging.getLogger(__name__)
+
+
+def _read_jsonl(path: Path) -> Iterator[dict]:
+    if not path.exists():
+        return
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _read_archived_raw_traces(file_store: FileMemoryStore) -> Iterator[dict]:
+    # Not through FileMemoryStore.archive: it moves a legacy single-file archive into
+    # segments and deletes it. The legacy file predates every segment.
+    yield from _read_jsonl(file_store._get_archive_path())
+    archive_dir = file_store.agent_dir / "raw_traces_archive"
+    if archive_dir.exists():
+        yield from RawTraceArchive(archive_dir).iter_records()
+
+
+def migrate_agent(file_store: FileMemoryStore, sqlite_store: SqliteMemoryStore) -> Optional[Dict[str, int]]:
+    """
+    Imports one agent's JSONL memory in one transaction; returns the number of records
+    per kind, or None if the agent already has memory in the database.
+    """
+    batches: List[Tuple[str, MemoryType, Iterator[dict], bool]] = [
+        (memory_type.value, memory_type, _read_jsonl(file_store._get_file_path(memory_type)), False)
+        for memory_type in (MemoryType.RAW_TRACE, MemoryType.EPISODIC, MemoryType.SEMANTIC)
+    ]
+    if (file_store.agent_dir / "raw_traces_archive").exists() or file_store._get_archive_path().exists():
+        batches.append(("archived_raw_trace", MemoryType.RAW_TRACE, _read_archived_raw_traces(file_store), True))
+    counts = sqlite_store.import_records((memory_type, records, archived) for _, memory_type, records, archived in batches)
+    if counts is None:
+        return None
+    return {kind: count for (kind, *_), count in zip(batches, counts)}
+
+
+def migrate_file_store_to_sqlite(
+    base_dir: Union[str, Path],
+    db_path: Optional[Union[str, Path]] = None,
+    agent_ids: Optional[Iterable[str]] = None,
+) -> Dict[str, Dict[str, int]]:
+    """Migrates every agent (or only `agent_ids`) under `base_dir`; returns counts per migrated agent."""
+    base_dir = Path(base_dir)
+    agents_dir = base_dir / "agents"
+    if agent_ids is None:
+        agent_ids = sorted(path.name for path in agents_dir.iterdir() if path.is_dir()) if agents_dir.exists() else []
+
+    migrated: Dict[str, Dict[str, int]] = {}
+    for agent_id in agent_ids:
+        sqlite_store = SqliteMemoryStore(base_dir=base_dir, agent_id=agent_id, db_path=db_path)
+        try:
+            counts = migrate_agent(FileMemoryStore(base_dir=base_dir, agent_id=agent_id), sqlite_store)
+        finally:
+            sqlite_store.close()
+        if counts is None:
+            logger.info(f"Agent '{agent_id}' already has memory in {sqlite_store.db_path}; skipping.")
+            continue
+        migrated[agent_id] = counts
+        logger.info(f"Migrated memory for agent '{agent_id}': {counts}")
+    return migrated
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Migrate JSONL agent memory into SQLite.")
+    parser.add_argument("base_dir", help="Memory base directory (contains agents/).")
+    parser.add_argument("--db", help="Database path (default: <base_dir>/memory.sqlite3).")
+    parser.add_argument("--agent", action="append", dest="agent_ids", help="Only migrate this agent (repeatable).")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    migrated = migrate_file_store_to_sqlite(args.base_dir, db_path=args.db, agent_ids=args.agent_ids)
+    print(f"Migrated {len(migrated)} agent(s).")
+
+
+if __name__ == "__main__":
+    main()
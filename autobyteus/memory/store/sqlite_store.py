@@ -0,0 +1,307 @@
+"""
+SQLite-backed MemoryStore.
+
+All agents under one memory base dir share `<base_dir>/memory.sqlite3`. The database
+runs in WAL mode, so readers never block the writer. Every `add` and `prune_raw_traces`
+call is a single transaction. Items are stored as their `to_dict()` JSON, next to the
+indexed agent_id, memory_type, turn_id and ts columns.
+"""
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from autobyteus.memory.models.memory_types import MemoryType
+from autobyteus.memory.models.raw_trace_item import RawTraceItem
+from autobyteus.memory.models.episodic_item import EpisodicItem
+from autobyteus.memory.models.semantic_item import SemanticItem
+from autobyteus.memory.store.base_store import MemoryStore
+
+logger = logging.getLogger(__name__)
+
+DB_FILE_NAME = "memory.sqlite3"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory_items (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    agent_id TEXT NOT NULL,
+    memory_type TEXT NOT NULL,
+    item_id TEXT,
+    turn_id TEXT,
+    ts REAL,
+    archived INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_memory_items_agent_type ON memory_items (agent_id, memory_type, archived, seq);
+CREATE INDEX IF NOT EXISTS idx_memory_items_agent_turn ON memory_items (agent_id, turn_id);
+CREATE INDEX IF NOT EXISTS idx_memory_items_agent_ts ON memory_items (agent_id, ts);
+CREATE TABLE IF NOT EXISTS tool_interaction_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    agent_id TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tool_interaction_log_agent ON tool_interaction_log (agent_id, seq);
+"""
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE.
+    connection = sqlite3.connect(str(db_path), timeout=30.0, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute("PRAGMA busy_timeout=30000")
+    connection.executescript(_SCHEMA)
+    connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    return connection
+
+
+class SqliteMemoryStore(MemoryStore):
+    def __init__(self, base_dir: Union[str, Path], agent_id: str, db_path: Optional[Union[str, Path]] = None):
+        self.base_dir = Path(base_dir)
+        self.agent_id = agent_id
+        self.db_path = Path(db_path) if db_path is not None else self.base_dir / DB_FILE_NAME
+        # sqlite3 connections are bound to the thread that opened them.
+        self._local = threading.local()
+        self._connection()
+
+    # --- MemoryStore -----------------------------------------------------------------
+
+    def add(self, items: Iterable[object]) -> None:
+        rows = []
+        for item in items:
+            memory_type = getattr(item, "memory_type", None)
+            if memory_type is None:
+                raise ValueError("Memory item missing memory_type")
+            record = item.to_dict() if hasattr(item, "to_dict") else item
+            rows.append(self._row(memory_type, record))
+        if not rows:
+            return
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT INTO memory_items (agent_id, memory_type, item_id, turn_id, ts, data) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def list(self, memory_type: MemoryType, limit: Optional[int] = None) -> List[object]:
+        return [self._deserialize(memory_type, record) for record in self._records(memory_type, limit=limit)]
+
+    # --- FileMemoryStore-compatible extras -------------------------------------------
+
+    def list_raw_trace_dicts(self) -> List[dict]:
+        return self._records(MemoryType.RAW_TRACE)
+
+    def read_archive_raw_traces(self) -> List[dict]:
+        return self._records(MemoryType.RAW_TRACE, archived=True)
+
+    def read_archived_traces(
+        self,
+        turn_ids: Optional[Iterable[str]] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> List[dict]:
+        return [
+            record
+            for _, record in self._query(
+                MemoryType.RAW_TRACE, [self.agent_id], turn_ids, since, until, archived=True
+            )
+        ]
+
+    def prune_raw_traces(self, keep_turn_ids: set[str], archive: bool = True) -> None:
+        keep = list(keep_turn_ids)
+        placeholders = ",".join("?" * len(keep))
+        condition = f"AND (turn_id IS NULL OR turn_id NOT IN ({placeholders}))" if keep else ""
+        action = "UPDATE memory_items SET archived = 1" if archive else "DELETE FROM memory_items"
+        with self._transaction() as connection:
+            connection.execute(
+                f"{action} WHERE agent_id = ? AND memory_type = ? AND archived = 0 {condition}",
+                [self.agent_id, MemoryType.RAW_TRACE.value, *keep],
+            )
+
+    def raw_trace_cursor(self) -> Dict[str, int]:
+        """Last live raw trace row and the live row count; pruning changes the count."""
+        count, max_seq = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(MAX(seq), 0) FROM memory_items "
+            "WHERE agent_id = ? AND memory_type = ? AND archived = 0",
+            [self.agent_id, MemoryType.RAW_TRACE.value],
+        ).fetchone()
+        return {"max_seq": max_seq, "count": count}
+
+    def read_raw_traces_after(self, cursor: Dict[str, int]) -> Optional[Tuple[List[RawTraceItem], Dict[str, int]]]:
+        """Raw traces added after `cursor` and the cursor after them, or None if traces were pruned since."""
+        last_seq = cursor.get("max_seq", 0)
+        connection = self._connection()
+        # One read transaction, so the rows and the count come from the same snapshot.
+        connection.execute("BEGIN")
+        try:
+            rows = connection.execute(
+                "SELECT seq, data FROM memory_items "
+                "WHERE agent_id = ? AND memory_type = ? AND archived = 0 AND seq > ? ORDER BY seq",
+                [self.agent_id, MemoryType.RAW_TRACE.value, last_seq],
+            ).fetchall()
+            current = self.raw_trace_cursor()
+        finally:
+            connection.execute("COMMIT")
+        # Rows only ever get larger seqs, so any other difference in the count is a prune.
+        if current["count"] != cursor.get("count", 0) + len(rows):
+            return None
+        traces = [RawTraceItem.from_dict(json.loads(data)) for _, data in rows]
+        return traces, {"max_seq": rows[-1][0] if rows else last_seq, "count": current["count"]}
+
+    def read_tool_interaction_log(self) -> List[dict]:
+        rows = self._connection().execute(
+            "SELECT data FROM tool_interaction_log WHERE agent_id = ? ORDER BY seq", [self.agent_id]
+        )
+        return [json.loads(row[0]) for row in rows]
+
+    def append_tool_interaction_log(self, records: Iterable[dict]) -> None:
+        rows = [(self.agent_id, json.dumps(record)) for record in records]
+        if rows:
+            with self._transaction() as connection:
+                connection.executemany("INSERT INTO tool_interaction_log (agent_id, data) VALUES (?, ?)", rows)
+
+    def write_tool_interaction_log(self, records: Iterable[dict]) -> None:
+        rows = [(self.agent_id, json.dumps(record)) for record in records]
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM tool_interaction_log WHERE agent_id = ?", [self.agent_id])
+            connection.executemany("INSERT INTO tool_interaction_log (agent_id, data) VALUES (?, ?)", rows)
+
+    def import_records(
+        self, batches: Iterable[Tuple[MemoryType, Iterable[Dict[str, Any]], bool]]
+    ) -> Optional[List[int]]:
+        """
+        Inserts already-serialized `(memory_type, records, archived)` batches in one
+        transaction (used by the JSONL migration); returns the record count per batch.
+        Returns None without inserting anything if the agent already has items.
+        """
+        counts: List[int] = []
+        with self._transaction() as connection:
+            if self.has_items():
+                return None
+            for memory_type, records, archived in batches:
+                rows = [(*self._row(memory_type, record), int(archived)) for record in records]
+                connection.executemany(
+                    "INSERT INTO memory_items (agent_id, memory_type, item_id, turn_id, ts, data, archived) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                counts.append(len(rows))
+        return counts
+
+    def has_items(self) -> bool:
+        row = self._connection().execute("SELECT 1 FROM memory_items WHERE agent_id = ? LIMIT 1", [self.agent_id])
+        return row.fetchone() is not None
+
+    # --- Cross-agent queries ------------------------------------------------------------
+
+    def list_agent_ids(self) -> List[str]:
+        rows = self._connection().execute("SELECT DISTINCT agent_id FROM memory_items ORDER BY agent_id")
+        return [row[0] for row in rows]
+
+    def query(
+        self,
+        memory_type: MemoryType,
+        agent_ids: Optional[Sequence[str]] = None,
+        turn_ids: Optional[Iterable[str]] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        include_archived: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Items of `memory_type` across agents (all agents when `agent_ids` is None), oldest
+        first. Each record is the item's dict plus its `agent_id`.
+        """
+        archived = None if include_archived else False
+        return [
+            {**record, "agent_id": agent_id}
+            for agent_id, record in self._query(memory_type, agent_ids, turn_ids, since, until, archived)
+        ]
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    # --- Internals ------------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = _connect(self.db_path)
+            self._local.connection = connection
+        return connection
+
+    def _transaction(self):
+        return _Transaction(self._connection())
+
+    def _row(self, memory_type: MemoryType, record: Dict[str, Any]) -> tuple:
+        return (
+            self.agent_id,
+            memory_type.value,
+            record.get("id"),
+            record.get("turn_id"),
+            record.get("ts"),
+            json.dumps(record),
+        )
+
+    def _records(self, memory_type: MemoryType, limit: Optional[int] = None, archived: bool = False) -> List[dict]:
+        sql = "SELECT data FROM memory_items WHERE agent_id = ? AND memory_type = ? AND archived = ?"
+        params: List[Any] = [self.agent_id, memory_type.value, int(archived)]
+        if limit is not None:
+            rows = self._connection().execute(f"{sql} ORDER BY seq DESC LIMIT ?", [*params, limit]).fetchall()
+            rows.reverse()
+        else:
+            rows = self._connection().execute(f"{sql} ORDER BY seq", params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def _query(self, memory_type, agent_ids, turn_ids, since, until, archived: Optional[bool]):
+        clauses = ["memory_type = ?"]
+        params: List[Any] = [memory_type.value]
+        if agent_ids is not None:
+            agent_ids = list(agent_ids)
+            clauses.append(f"agent_id IN ({','.join('?' * len(agent_ids))})")
+            params.extend(agent_ids)
+        if turn_ids is not None:
+            turn_ids = list(turn_ids)
+            clauses.append(f"turn_id IN ({','.join('?' * len(turn_ids))})")
+            params.extend(turn_ids)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts <= ?")
+            params.append(until)
+        if archived is not None:
+            clauses.append("archived = ?")
+            params.append(int(archived))
+        rows = self._connection().execute(
+            f"SELECT agent_id, data FROM memory_items WHERE {' AND '.join(clauses)} ORDER BY seq", params
+        )
+        return [(agent_id, json.loads(data)) for agent_id, data in rows]
+
+    def _deserialize(self, memory_type: MemoryType, data: dict) -> object:
+        if memory_type == MemoryType.RAW_TRACE:
+            return RawTraceItem.from_dict(data)
+        if memory_type == MemoryType.EPISODIC:
+            return EpisodicItem.from_dict(data)
+        if memory_type == MemoryType.SEMANTIC:
+            return SemanticItem.from_dict(data)
+        raise ValueError(f"Unknown memory type: {memory_type}")
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back on error."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.connection.execute("ROLLBACK" if exc_type is not None else "COMMIT")
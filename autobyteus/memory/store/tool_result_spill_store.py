@@ -0,0 +1,71 @@
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+_REF_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+class ToolResultSpillStore:
+    """
+    Full payloads of oversized tool results, content-addressed by their SHA-256.
+
+    Files live in `<base_dir>/agents/<agent_id>/tool_results/<sha256>.txt`. Identical
+    payloads share one file, and files are written atomically, so a ref always names a
+    complete payload.
+    """
+
+    def __init__(self, base_dir: Union[str, Path], agent_id: str) -> None:
+        self.base_dir = Path(base_dir)
+        self.agent_id = agent_id
+        self.dir = self.base_dir / "agents" / agent_id / "tool_results"
+
+    def write(self, text: str) -> str:
+        """Stores `text`; returns its ref."""
+        data = text.encode("utf-8")
+        ref = hashlib.sha256(data).hexdigest()
+        path = self.path(ref)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per write: concurrent writes of one payload must not share it.
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{ref}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(data)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        return ref
+
+    def path(self, ref: str) -> Path:
+        if not _REF_PATTERN.match(ref or ""):
+            raise ValueError(f"Invalid tool result ref '{ref}'.")
+        return self.dir / f"{ref}.txt"
+
+    def exists(self, ref: str) -> bool:
+        return self.path(ref).exists()
+
+    def read(self, ref: str, offset: int = 0, length: Optional[int] = None) -> Tuple[str, bool]:
+        """
+        Characters `offset` to `offset + length` of a stored payload, and whether more
+        follow. Decoding streams through the file, so pages never load the whole payload.
+        """
+        if offset < 0:
+            raise ValueError(f"offset must be >= 0; got {offset}.")
+        path = self.path(ref)
+        if not path.exists():
+            raise FileNotFoundError(f"No stored tool result with ref '{ref}'.")
+        with path.open("r", encoding="utf-8", newline="") as handle:
+            skipped = 0
+            while skipped < offset:
+                chunk = handle.read(min(offset - skipped, 1 << 20))
+                if not chunk:
+                    break
+                skipped += len(chunk)
+            if length is None:
+                return handle.read(), False
+            text = handle.read(length)
+            return text, bool(handle.read(1))
@@ -1,6 +1,10 @@
 import json
+import os
+import tempfile
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Any, BinaryIO, Dict, Optional, Union
+
+from autobyteus.utils.json_codec import loads
 
 
 class WorkingContextSnapshotStore:
@@ -15,8 +19,14 @@ class WorkingContextSnapshotStore:
         path = self._get_path(agent_id)
         if not path.exists():
             return None
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return loads(path.read_bytes())
+
+    def open_binary(self, agent_id: str) -> Optional[BinaryIO]:
+        """The snapshot file opened for streaming reads, or None if there is none."""
+        try:
+            return self._get_path(agent_id).open("rb")
+        except FileNotFoundError:
+            return None
 
     def write(self, agent_id: str, payload: Dict[str, Any]) -> None:
         path = self._get_path(agent_id)
@@ -24,5 +34,19 @@ class WorkingContextSnapshotStore:
         with path.open("w", encoding="utf-8") as handle:
             json.dump(payload, handle)
 
+    def write_encoded(self, agent_id: str, data: bytes) -> None:
+        """Writes an already-encoded snapshot; readers never see a partial file."""
+        path = self._get_path(agent_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per write, so concurrent writers never share one.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
     def _get_path(self, agent_id: str) -> Path:
         return self.base_dir / "agents" / agent_id / "working_context_snapshot.json"
@@ -0,0 +1,83 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from autobyteus.memory.models.raw_trace_item import RawTraceItem
+from autobyteus.memory.models.tool_interaction import ToolInteraction, ToolInteractionStatus
+from autobyteus.memory.tool_interaction_builder import apply_tool_trace
+
+
+class ToolInteractionIndex:
+    """
+    Tool interactions paired from raw traces, indexed by invocation id and by turn id.
+
+    `cursor` is the store's raw trace cursor (see `FileMemoryStore.raw_trace_cursor`)
+    up to which traces have been applied. The index is persisted as an append-only log
+    of interaction records, each tagged with the cursor after it, so a restart replays
+    the log and then applies only the traces appended after that cursor.
+    """
+
+    def __init__(self) -> None:
+        self._by_id: Dict[str, ToolInteraction] = {}
+        self._ids_by_turn: Dict[Optional[str], Dict[str, None]] = {}
+        self.cursor: Optional[Any] = None
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def get(self, tool_call_id: str) -> Optional[ToolInteraction]:
+        return self._by_id.get(tool_call_id)
+
+    def interactions(self, turn_id: Optional[str] = None) -> List[ToolInteraction]:
+        """Copies, so callers cannot change the index."""
+        if not turn_id:
+            return [ToolInteraction(**vars(interaction)) for interaction in self._by_id.values()]
+        return [ToolInteraction(**vars(self._by_id[tool_call_id])) for tool_call_id in self._ids_by_turn.get(turn_id, ())]
+
+    def apply(self, traces: Iterable[RawTraceItem]) -> List[ToolInteraction]:
+        """Folds `traces` in; returns the interactions that changed, in order."""
+        changed: Dict[str, ToolInteraction] = {}
+        for trace in traces:
+            interaction = apply_tool_trace(self._by_id, trace)
+            if interaction is None:
+                continue
+            self._ids_by_turn.setdefault(trace.turn_id, {})[interaction.tool_call_id] = None
+            changed[interaction.tool_call_id] = interaction
+        return list(changed.values())
+
+    # --- Log records ----------------------------------------------------------------
+
+    @staticmethod
+    def to_record(interaction: ToolInteraction, cursor: Any) -> Dict[str, Any]:
+        return {
+            "tool_call_id": interaction.tool_call_id,
+            "turn_id": interaction.turn_id,
+            "tool_name": interaction.tool_name,
+            "arguments": interaction.arguments,
+            "result": interaction.result,
+            "error": interaction.error,
+            "status": interaction.status.value,
+            "cursor": cursor,
+        }
+
+    def records(self) -> List[Dict[str, Any]]:
+        return [self.to_record(interaction, self.cursor) for interaction in self._by_id.values()]
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "ToolInteractionIndex":
+        index = cls()
+        for record in records:
+            index.cursor = record.get("cursor")
+            tool_call_id = record.get("tool_call_id")
+            if tool_call_id is None:
+                # Cursor-only marker written after a rebuild.
+                continue
+            index._by_id[tool_call_id] = ToolInteraction(
+                tool_call_id=tool_call_id,
+                turn_id=record.get("turn_id"),
+                tool_name=record.get("tool_name"),
+                arguments=record.get("arguments"),
+                result=record.get("result"),
+                error=record.get("error"),
+                status=ToolInteractionStatus(record.get("status", ToolInteractionStatus.PENDING.value)),
+            )
+            index._ids_by_turn.setdefault(record.get("turn_id"), {})[tool_call_id] = None
+        return index
@@ -1,5 +1,7 @@
 import json
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import re
+import weakref
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
 
 from autobyteus.llm.utils.messages import (
     Message,
@@ -9,6 +11,36 @@ from autobyteus.llm.utils.messages import (
     ToolResultPayload,
 )
 from autobyteus.memory.working_context_snapshot import WorkingContextSnapshot
+from autobyteus.utils.json_codec import dumps_bytes, loads
+
+# Encoded JSON per message, reused while the message's fields are unchanged. Snapshot
+# messages are replaced rather than edited, so unchanged messages are never re-encoded.
+_FRAGMENT_CACHE: "weakref.WeakKeyDictionary[Message, Tuple[tuple, bytes]]" = weakref.WeakKeyDictionary()
+
+# Restored messages whose encoded JSON is longer than this are decoded on first use.
+DEFAULT_LAZY_MESSAGE_BYTES = 4096
+_MESSAGES_LINE_END = b'"messages":[\n'
+_ROLE_PREFIX = re.compile(rb'^\{"role":\s*"([a-z_]+)"')
+
+
+class _LazyMessage(Message):
+    """
+    A restored message holding only its role and encoded JSON. The other fields are
+    decoded when first read (normally when the request is rendered); until then the
+    encoder writes the JSON back unchanged.
+    """
+
+    def __init__(self, role: MessageRole, fragment: bytes):
+        self.role = role
+        self._fragment = fragment
+
+    def __getattr__(self, name: str) -> Any:
+        fragment = self.__dict__.pop("_fragment", None)
+        if fragment is None:
+            raise AttributeError(name)
+        decoded = WorkingContextSnapshotSerializer._deserialize_message(loads(fragment))
+        self.__dict__.update(vars(decoded))
+        return getattr(self, name)
 
 
 class WorkingContextSnapshotSerializer:
@@ -23,6 +55,79 @@ class WorkingContextSnapshotSerializer:
         }
         return payload
 
+    @staticmethod
+    def encode(
+        working_context_snapshot: WorkingContextSnapshot,
+        metadata: Dict[str, Any],
+        backend: Optional[str] = None,
+    ) -> bytes:
+        """
+        Encodes the same document as `serialize` straight to JSON bytes, in one pass.
+        Values that are not JSON become their `str()`, and a message the encoder
+        rejects (e.g. a tool result with tuple keys) is normalised as in `serialize`
+        first; messages encoded before are taken from the fragment cache.
+        """
+        header = {
+            "schema_version": metadata.get("schema_version", 1),
+            "agent_id": metadata.get("agent_id"),
+            "epoch_id": metadata.get("epoch_id", working_context_snapshot.epoch_id),
+            "last_compaction_ts": metadata.get("last_compaction_ts", working_context_snapshot.last_compaction_ts),
+        }
+        fragments = [
+            WorkingContextSnapshotSerializer._encode_message(msg, backend)
+            for msg in working_context_snapshot.build_messages()
+        ]
+        # One message per line: JSON strings never contain a raw newline, so
+        # `decode_stream` can split messages without parsing them.
+        return dumps_bytes(header, backend)[:-1] + b',"messages":[\n' + b",\n".join(fragments) + b"\n]}"
+
+    @staticmethod
+    def decode_stream(
+        handle: BinaryIO,
+        lazy_message_bytes: int = DEFAULT_LAZY_MESSAGE_BYTES,
+    ) -> Optional[Tuple[WorkingContextSnapshot, Dict[str, Any]]]:
+        """
+        Reads a snapshot written by `encode` line by line, without holding the whole
+        document. Messages longer than `lazy_message_bytes` stay encoded until first
+        used. Returns None for documents in another layout (e.g. written by `json.dump`)
+        or that fail validation; callers then fall back to `deserialize`.
+        """
+        first = handle.readline()
+        if not isinstance(first, bytes) or not first.endswith(_MESSAGES_LINE_END):
+            return None
+        try:
+            header = loads(first[:-1] + b"]}")
+        except ValueError:
+            return None
+        if not WorkingContextSnapshotSerializer.validate(header):
+            return None
+
+        messages: List[Message] = []
+        for line in handle:
+            line = line.rstrip(b"\n")
+            if line == b"]}":
+                break
+            if line.endswith(b","):
+                line = line[:-1]
+            if not line:
+                continue
+            try:
+                role_match = _ROLE_PREFIX.match(line) if len(line) > lazy_message_bytes else None
+                if role_match is not None:
+                    messages.append(_LazyMessage(MessageRole(role_match.group(1).decode()), line))
+                    continue
+                data = loads(line)
+                if not isinstance(data, dict) or not isinstance(data.get("role"), str):
+                    return None
+                messages.append(WorkingContextSnapshotSerializer._deserialize_message(data))
+            except ValueError:
+                return None
+        else:
+            # Truncated document.
+            return None
+
+        return WorkingContextSnapshotSerializer._build_snapshot(messages, header)
+
     @staticmethod
     def deserialize(payload: Dict[str, Any]) -> Tuple[WorkingContextSnapshot, Dict[str, Any]]:
         messages = [
@@ -30,6 +135,10 @@ class WorkingContextSnapshotSerializer:
             for msg in payload.get("messages", [])
             if isinstance(msg, dict)
         ]
+        return WorkingContextSnapshotSerializer._build_snapshot(messages, payload)
+
+    @staticmethod
+    def _build_snapshot(messages: List[Message], payload: Dict[str, Any]) -> Tuple[WorkingContextSnapshot, Dict[str, Any]]:
         snapshot = WorkingContextSnapshot(initial_messages=messages)
         metadata = {
             "schema_version": payload.get("schema_version"),
@@ -68,6 +177,32 @@ class WorkingContextSnapshotSerializer:
             base["tool_payload"] = WorkingContextSnapshotSerializer._normalize_tool_payload(base["tool_payload"])
         return base
 
+    @staticmethod
+    def _encode_message(message: Message, backend: Optional[str]) -> bytes:
+        fragment = message.__dict__.get("_fragment") if isinstance(message, _LazyMessage) else None
+        if fragment is not None:
+            return fragment
+        fingerprint = (
+            backend,
+            message.role,
+            message.content,
+            message.reasoning_content,
+            tuple(message.image_urls),
+            tuple(message.audio_urls),
+            tuple(message.video_urls),
+            # Held, not just its id, so a replaced payload can never match by address reuse.
+            message.tool_payload,
+        )
+        cached = _FRAGMENT_CACHE.get(message)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        try:
+            fragment = dumps_bytes(message.to_dict(), backend)
+        except (TypeError, ValueError):
+            fragment = dumps_bytes(WorkingContextSnapshotSerializer._serialize_message(message), backend)
+        _FRAGMENT_CACHE[message] = (fingerprint, fragment)
+        return fragment
+
     @staticmethod
     def _deserialize_message(data: Dict[str, Any]) -> Message:
         role = MessageRole(data.get("role"))
@@ -131,5 +266,5 @@ class WorkingContextSnapshotSerializer:
         try:
             json.dumps(value)
             return value
-        except TypeError:
+        except (TypeError, ValueError):
             return str(value)
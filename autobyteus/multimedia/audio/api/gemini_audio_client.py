@@ -1,10 +1,10 @@
+import asyncio
 import logging
 import os
 import base64
 import uuid
 import wave
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
-from google import genai
+from typing import Optional, Dict, Any, TYPE_CHECKING
 from google.genai import types as genai_types
 
 from autobyteus.multimedia.audio.base_audio_client import BaseAudioClient
@@ -31,10 +31,13 @@ _AUDIO_MIME_EXTENSION_MAP = {
 }
 
 
-def _save_audio_bytes_to_wav(pcm_bytes: bytes, channels=1, rate=24000, sample_width=2) -> str:
-    """Saves PCM audio bytes to a temporary WAV file and returns the path."""
-    os.makedirs(_AUDIO_TEMP_DIR, exist_ok=True)
-    file_path = os.path.join(_AUDIO_TEMP_DIR, f"{uuid.uuid4()}.wav")
+def _save_audio_bytes_to_wav(
+    pcm_bytes: bytes, channels=1, rate=24000, sample_width=2, output_dir: Optional[str] = None
+) -> str:
+    """Saves PCM audio bytes to a WAV file (in `output_dir` or a temp dir) and returns the path."""
+    target_dir = output_dir or _AUDIO_TEMP_DIR
+    os.makedirs(target_dir, exist_ok=True)
+    file_path = os.path.join(target_dir, f"{uuid.uuid4()}.wav")
     
     try:
         with wave.open(file_path, "wb") as wf:
@@ -49,11 +52,12 @@ def _save_audio_bytes_to_wav(pcm_bytes: bytes, channels=1, rate=24000, sample_wi
         raise
 
 
-def _save_audio_bytes(audio_bytes: bytes, extension: Optional[str]) -> str:
-    """Saves audio bytes to a temporary file and returns the path."""
-    os.makedirs(_AUDIO_TEMP_DIR, exist_ok=True)
+def _save_audio_bytes(audio_bytes: bytes, extension: Optional[str], output_dir: Optional[str] = None) -> str:
+    """Saves audio bytes to a file (in `output_dir` or a temp dir) and returns the path."""
+    target_dir = output_dir or _AUDIO_TEMP_DIR
+    os.makedirs(target_dir, exist_ok=True)
     suffix = (extension or "bin").lstrip(".")
-    file_path = os.path.join(_AUDIO_TEMP_DIR, f"{uuid.uuid4()}.{suffix}")
+    file_path = os.path.join(target_dir, f"{uuid.uuid4()}.{suffix}")
     try:
         with open(file_path, "wb") as audio_file:
             audio_file.write(audio_bytes)
@@ -177,7 +181,6 @@ class GeminiAudioClient(BaseAudioClient):
                     )
                 )
 
-            # The google-genai library's TTS endpoint uses a synchronous call.
             # FIX: Ensure no 'models/' prefix is used here.
             runtime_adjusted_model = resolve_model_for_runtime(
                 self.model.value,
@@ -189,7 +192,7 @@ class GeminiAudioClient(BaseAudioClient):
                 runtime_adjusted_model,
                 self.model.value,
                 )
-            resp = self.client.models.generate_content(
+            resp = await self.async_client.models.generate_content(
                 model=runtime_adjusted_model,
                 contents=final_prompt,
                 config=genai_types.GenerateContentConfig(
@@ -228,10 +231,17 @@ class GeminiAudioClient(BaseAudioClient):
                     except ValueError:
                         logger.warning("Invalid channel count in mime_type '%s'; using default 1.", inline_data.mime_type)
 
-                audio_path = _save_audio_bytes_to_wav(audio_bytes, channels=channels, rate=rate, sample_width=2)
+                audio_path = await asyncio.to_thread(
+                    _save_audio_bytes_to_wav,
+                    audio_bytes,
+                    channels=channels,
+                    rate=rate,
+                    sample_width=2,
+                    output_dir=kwargs.get("output_dir"),
+                )
             else:
                 extension = _AUDIO_MIME_EXTENSION_MAP.get(mime_type, "bin")
-                audio_path = _save_audio_bytes(audio_bytes, extension)
+                audio_path = await asyncio.to_thread(_save_audio_bytes, audio_bytes, extension, kwargs.get("output_dir"))
 
             return SpeechGenerationResponse(audio_urls=[audio_path])
 
@@ -1,14 +1,13 @@
-import asyncio
 import logging
 import os
-import uuid
 from pathlib import Path
 from typing import Optional, Dict, Any, TYPE_CHECKING
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from autobyteus.multimedia.audio.base_audio_client import BaseAudioClient
 from autobyteus.multimedia.utils.response_types import SpeechGenerationResponse
+from autobyteus.multimedia.utils.media_output import new_media_path
 
 if TYPE_CHECKING:
     from autobyteus.multimedia.audio.audio_model import AudioModel
@@ -19,20 +18,14 @@ logger = logging.getLogger(__name__)
 _AUDIO_TEMP_DIR = Path("/tmp/autobyteus_audio")
 
 
-def _save_audio_bytes(audio_bytes: bytes, file_extension: Optional[str]) -> str:
-    """Saves audio bytes to disk with a random file name."""
-    _AUDIO_TEMP_DIR.mkdir(parents=True, exist_ok=True)
-    suffix = (file_extension or "mp3").lstrip(".")
-    file_path = _AUDIO_TEMP_DIR / f"{uuid.uuid4()}.{suffix}"
-    file_path.write_bytes(audio_bytes)
-    logger.info(f"Successfully saved generated audio to {file_path}")
-    return str(file_path)
-
-
 class OpenAIAudioClient(BaseAudioClient):
     """
     An audio client that uses OpenAI's Text-to-Speech (Speech) API.
 
+    Audio is streamed from the async SDK client straight into a file (in `output_dir`
+    when given, otherwise a temp directory), so neither the event loop nor memory holds
+    the whole payload.
+
     **Setup Requirements:**
     1. Set the `OPENAI_API_KEY` environment variable with your OpenAI API key.
     """
@@ -45,7 +38,7 @@ class OpenAIAudioClient(BaseAudioClient):
             raise ValueError("OPENAI_API_KEY environment variable is not set.")
 
         try:
-            self.client = OpenAI(api_key=api_key, base_url="https://api.openai.com/v1")
+            self.client = AsyncOpenAI(api_key=api_key, base_url="https://api.openai.com/v1")
             logger.info(f"OpenAIAudioClient initialized for model '{self.model.name}'.")
         except Exception as exc:
             logger.error(f"Failed to configure OpenAI client: {exc}")
@@ -92,17 +85,16 @@ class OpenAIAudioClient(BaseAudioClient):
             if response_format:
                 request_kwargs["response_format"] = response_format
 
-            response = await asyncio.to_thread(
-                self.client.audio.speech.create,
-                **request_kwargs,
-            )
+            audio_path = new_media_path(kwargs.get("output_dir") or _AUDIO_TEMP_DIR, response_format)
+            async with self.client.audio.speech.with_streaming_response.create(**request_kwargs) as response:
+                await response.stream_to_file(audio_path)
 
-            audio_bytes = getattr(response, "content", None)
-            if not audio_bytes:
+            if not audio_path.exists() or audio_path.stat().st_size == 0:
+                audio_path.unlink(missing_ok=True)
                 raise ValueError("OpenAI Speech API returned an empty response.")
 
-            audio_path = _save_audio_bytes(audio_bytes, response_format)
-            return SpeechGenerationResponse(audio_urls=[audio_path])
+            logger.info(f"Successfully saved generated audio to {audio_path}")
+            return SpeechGenerationResponse(audio_urls=[str(audio_path)])
 
         except Exception as exc:
             logger.error("Error during OpenAI speech generation: %s", exc)
@@ -110,3 +102,4 @@ class OpenAIAudioClient(BaseAudioClient):
 
     async def cleanup(self):
         logger.debug("OpenAIAudioClient cleanup called.")
+        await self.client.close()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from typing import Optional, Dict, Any, TYPE_CHECKING
 from autobyteus.multimedia.utils.response_types import SpeechGenerationResponse
 
 if TYPE_CHECKING:
@@ -30,7 +30,8 @@ class BaseAudioClient(ABC):
             prompt (str): The text to be converted to speech.
             generation_config (Optional[Dict[str, Any]]): Provider-specific parameters
                                                         (e.g., voice_name, speaker_mapping).
-            **kwargs: Additional keyword arguments for extensibility.
+            **kwargs: Additional keyword arguments for extensibility. `output_dir` asks the client
+                      to write generated audio to files there and return their paths.
 
         Returns:
             SpeechGenerationResponse: An object containing URLs or paths to the generated audio files.
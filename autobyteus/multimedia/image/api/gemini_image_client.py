@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import base64
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
@@ -6,6 +7,7 @@ from google.genai import types as genai_types
 from autobyteus.multimedia.image.base_image_client import BaseImageClient
 from autobyteus.multimedia.utils.response_types import ImageGenerationResponse
 from autobyteus.multimedia.utils.api_utils import load_image_from_url
+from autobyteus.multimedia.utils.media_output import extension_for_mime_type, write_media_file
 from autobyteus.utils.gemini_helper import initialize_gemini_client_with_runtime
 from autobyteus.utils.gemini_model_mapping import resolve_model_for_runtime
 
@@ -54,7 +56,7 @@ class GeminiImageClient(BaseImageClient):
                 logger.info(f"Loading {len(input_image_urls)} input image(s) for generation.")
                 for url in input_image_urls:
                     try:
-                        content.append(load_image_from_url(url))
+                        content.append(await asyncio.to_thread(load_image_from_url, url))
                     except Exception as e:
                         logger.error(f"Skipping image at '{url}' due to loading error: {e}")
 
@@ -89,10 +91,15 @@ class GeminiImageClient(BaseImageClient):
             )
 
 
+            output_dir = kwargs.get("output_dir")
             image_urls = []
             for part in response.parts or []:
                 if part.inline_data and part.inline_data.mime_type and "image" in part.inline_data.mime_type:
                     image_bytes = part.inline_data.data
+                    if output_dir:
+                        extension = extension_for_mime_type(part.inline_data.mime_type, default="png")
+                        image_urls.append(await write_media_file(image_bytes, output_dir, extension))
+                        continue
                     base64_image = base64.b64encode(image_bytes).decode("utf-8")
                     data_uri = f"data:{part.inline_data.mime_type};base64,{base64_image}"
                     image_urls.append(data_uri)
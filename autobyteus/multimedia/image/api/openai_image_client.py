@@ -1,13 +1,15 @@
+import asyncio
 import logging
 import os
 import tempfile
 from pathlib import Path
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from autobyteus.multimedia.image.base_image_client import BaseImageClient
 from autobyteus.multimedia.utils.response_types import ImageGenerationResponse
+from autobyteus.multimedia.utils.media_output import new_media_path, write_media_file
 from autobyteus.utils.download_utils import download_file_from_url
 
 if TYPE_CHECKING:
@@ -29,6 +31,9 @@ def _mime_type_from_format(output_format: str) -> str:
 class OpenAIImageClient(BaseImageClient):
     """
     An image client that uses OpenAI's gpt-image series via the images API.
+
+    Requests go through the async SDK client so generation does not block the event loop.
+    Pass `output_dir` to write results to files and get file paths back instead of data URIs.
     """
 
     def __init__(self, model: "ImageModel", config: "MultimediaConfig"):
@@ -38,7 +43,7 @@ class OpenAIImageClient(BaseImageClient):
             logger.error("OPENAI_API_KEY environment variable is not set.")
             raise ValueError("OPENAI_API_KEY environment variable is not set.")
 
-        self.client = OpenAI(api_key=api_key, base_url="https://api.openai.com/v1")
+        self.client = AsyncOpenAI(api_key=api_key, base_url="https://api.openai.com/v1")
         logger.info(f"OpenAIImageClient initialized for model '{self.model.name}'.")
 
     async def generate_image(
@@ -83,16 +88,10 @@ class OpenAIImageClient(BaseImageClient):
             if "output_compression" in final_config:
                 request_kwargs["output_compression"] = final_config["output_compression"]
 
-            response = self.client.images.generate(**request_kwargs)
+            response = await self.client.images.generate(**request_kwargs)
 
             output_format = final_config.get("output_format", "png")
-            mime_type = _mime_type_from_format(output_format)
-            image_urls_list: List[str] = []
-            for img in response.data:
-                if getattr(img, "url", None):
-                    image_urls_list.append(img.url)
-                elif getattr(img, "b64_json", None):
-                    image_urls_list.append(f"data:{mime_type};base64,{img.b64_json}")
+            image_urls_list = await self._collect_results(response, output_format, kwargs.get("output_dir"))
 
             revised_prompt: Optional[str] = (
                 response.data[0].revised_prompt
@@ -165,35 +164,25 @@ class OpenAIImageClient(BaseImageClient):
             else:
                 mask_path = None
 
-            with open(source_path, "rb") as image_file:
-                mask_file = open(mask_path, "rb") if mask_path else None
-                try:
-                    request_kwargs = {
-                        "image": image_file,
-                        "prompt": prompt,
-                        "model": self.model.value,
-                        "n": final_config.get("n", 1),
-                        "size": final_config.get("size", "1024x1024"),
-                    }
-                    if mask_file:
-                        request_kwargs["mask"] = mask_file
-                    if "output_format" in final_config:
-                        request_kwargs["output_format"] = final_config["output_format"]
-                    if "output_compression" in final_config:
-                        request_kwargs["output_compression"] = final_config["output_compression"]
-                    response = self.client.images.edit(**request_kwargs)
-                finally:
-                    if mask_file:
-                        mask_file.close()
+            image_bytes = await asyncio.to_thread(source_path.read_bytes)
+            request_kwargs = {
+                "image": (source_path.name, image_bytes),
+                "prompt": prompt,
+                "model": self.model.value,
+                "n": final_config.get("n", 1),
+                "size": final_config.get("size", "1024x1024"),
+            }
+            if mask_path:
+                mask_bytes = await asyncio.to_thread(mask_path.read_bytes)
+                request_kwargs["mask"] = (mask_path.name, mask_bytes)
+            if "output_format" in final_config:
+                request_kwargs["output_format"] = final_config["output_format"]
+            if "output_compression" in final_config:
+                request_kwargs["output_compression"] = final_config["output_compression"]
+            response = await self.client.images.edit(**request_kwargs)
 
             output_format = final_config.get("output_format", "png")
-            mime_type = _mime_type_from_format(output_format)
-            image_urls_list: List[str] = []
-            for img in response.data:
-                if getattr(img, "url", None):
-                    image_urls_list.append(img.url)
-                elif getattr(img, "b64_json", None):
-                    image_urls_list.append(f"data:{mime_type};base64,{img.b64_json}")
+            image_urls_list = await self._collect_results(response, output_format, kwargs.get("output_dir"))
 
             if not image_urls_list:
                 raise ValueError("OpenAI API did not return any edited image data.")
@@ -221,6 +210,29 @@ class OpenAIImageClient(BaseImageClient):
                 except OSError:
                     logger.warning("Failed to clean up temp mask file: %s", temp_mask_path)
 
+    async def _collect_results(self, response, output_format: str, output_dir: Optional[str]) -> List[str]:
+        """
+        Converts response images to data URIs, or to files under `output_dir` when given.
+        Hosted URLs are streamed to disk rather than buffered in memory.
+        """
+        mime_type = _mime_type_from_format(output_format)
+        extension = "jpg" if mime_type == "image/jpeg" else mime_type.split("/")[1]
+        image_urls_list: List[str] = []
+        for img in response.data:
+            if getattr(img, "url", None):
+                if output_dir:
+                    file_path = new_media_path(output_dir, extension)
+                    await download_file_from_url(img.url, file_path)
+                    image_urls_list.append(str(file_path))
+                else:
+                    image_urls_list.append(img.url)
+            elif getattr(img, "b64_json", None):
+                if output_dir:
+                    image_urls_list.append(await write_media_file(img.b64_json, output_dir, extension))
+                else:
+                    image_urls_list.append(f"data:{mime_type};base64,{img.b64_json}")
+        return image_urls_list
+
     async def cleanup(self):
-        # The OpenAI client does not require explicit cleanup of a session.
         logger.debug("OpenAIImageClient cleanup called.")
+        await self.client.close()
@@ -34,7 +34,8 @@ class BaseImageClient(ABC):
             generation_config (Optional[Dict[str, Any]]): Provider-specific parameters for image generation
                                                         to override defaults.
                                                         (e.g., n, size, quality, style).
-            **kwargs: Additional keyword arguments for extensibility.
+            **kwargs: Additional keyword arguments for extensibility. `output_dir` asks the client
+                      to write generated images to files there and return their paths.
 
         Returns:
             ImageGenerationResponse: An object containing URLs to the generated images.
@@ -59,7 +60,8 @@ class BaseImageClient(ABC):
             mask_url (Optional[str]): The path to a mask image. The transparent areas of the mask
                                        indicate where the image should be edited.
             generation_config (Optional[Dict[str, Any]]): Provider-specific parameters.
-            **kwargs: Additional keyword arguments for extensibility.
+            **kwargs: Additional keyword arguments for extensibility. `output_dir` asks the client
+                      to write generated images to files there and return their paths.
 
         Returns:
             ImageGenerationResponse: An object containing URLs to the edited images.
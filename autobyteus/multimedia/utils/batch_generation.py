@@ -0,0 +1,172 @@
+"""
+Concurrent fan-out for batch image/audio generation.
+
+A batch tool call runs one generation per item. The items run concurrently, but every
+provider has a process-wide concurrency cap, so a large storyboard cannot flood the
+provider's rate limits. Results are collected in completion order. One failed item
+is reported without failing the rest of the batch. Every item gets its own client
+(`BatchItemClients`): clients may keep conversation or session state, so concurrent
+items must never share one.
+
+Caps come from `AUTOBYTEUS_MULTIMEDIA_MAX_CONCURRENCY` (default 4). A single provider
+can be overridden with `AUTOBYTEUS_MULTIMEDIA_MAX_CONCURRENCY_<PROVIDER>`, e.g.
+`AUTOBYTEUS_MULTIMEDIA_MAX_CONCURRENCY_OPENAI=2`.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+ENV_MAX_CONCURRENCY = "AUTOBYTEUS_MULTIMEDIA_MAX_CONCURRENCY"
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def get_provider_concurrency(provider: str) -> int:
+    """Returns the configured concurrency cap for `provider`."""
+    for env_var in (f"{ENV_MAX_CONCURRENCY}_{provider.upper()}", ENV_MAX_CONCURRENCY):
+        value = os.getenv(env_var)
+        if value:
+            try:
+                return max(1, int(value))
+            except ValueError:
+                logger.warning(f"Invalid {env_var} value '{value}'; ignoring.")
+    return DEFAULT_MAX_CONCURRENCY
+
+
+def provider_key_for(client: Any) -> str:
+    """Returns the concurrency key (provider name) for an image or audio client."""
+    provider = getattr(getattr(client, "model", None), "provider", None)
+    return str(getattr(provider, "value", provider) or "default")
+
+
+class BatchItemClients:
+    """
+    Creates one client per batch item and cleans them all up in `close`. The first
+    client is created early so its provider can pick the concurrency cap; it then
+    serves the first item that asks for a client.
+    """
+
+    def __init__(self, create_client: Callable[[], Any]):
+        self._create_client = create_client
+        self._clients: List[Any] = []
+        self._spare: List[Any] = []
+
+    def _new(self) -> Any:
+        client = self._create_client()
+        self._clients.append(client)
+        return client
+
+    def provider_key(self) -> str:
+        if not self._spare:
+            self._spare.append(self._new())
+        return provider_key_for(self._spare[0])
+
+    def take(self) -> Any:
+        return self._spare.pop() if self._spare else self._new()
+
+    async def close(self) -> None:
+        clients, self._clients, self._spare = self._clients, [], []
+        results = await asyncio.gather(*(client.cleanup() for client in clients), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Cleaning up a batch item client failed: {result}")
+
+
+class ProviderConcurrencyLimiter:
+    """
+    Hands out one semaphore per (provider, event loop). All batch tools for a provider
+    share the same cap. Semaphores are kept per loop because asyncio primitives cannot be
+    shared across event loops.
+    """
+    _semaphores: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_semaphore(cls, provider: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        key = (provider, id(loop))
+        with cls._lock:
+            for stale_key in [k for k, (l, _) in cls._semaphores.items() if l.is_closed()]:
+                del cls._semaphores[stale_key]
+            entry = cls._semaphores.get(key)
+            if entry is None or entry[0] is not loop:
+                entry = (loop, asyncio.Semaphore(get_provider_concurrency(provider)))
+                cls._semaphores[key] = entry
+            return entry[1]
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._semaphores.clear()
+
+
+@dataclass
+class BatchItemResult:
+    index: int
+    success: bool
+    file_path: Optional[str] = None
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"index": self.index, "status": "success" if self.success else "error"}
+        if self.file_path:
+            data["file_path"] = self.file_path
+        if self.error:
+            data["error"] = self.error
+        data["elapsed_seconds"] = round(self.elapsed_seconds, 3)
+        return data
+
+
+async def run_batch(
+    items: Sequence[Any],
+    worker: Callable[[int, Any], Awaitable[str]],
+    semaphore: asyncio.Semaphore,
+    on_result: Optional[Callable[[BatchItemResult], None]] = None,
+) -> List[BatchItemResult]:
+    """
+    Runs `worker(index, item)` for every item under `semaphore`. The worker returns the
+    file path it produced. Results are returned (and passed to `on_result`) in completion
+    order. Exceptions are captured per item.
+    """
+    async def run_one(index: int, item: Any) -> BatchItemResult:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                file_path = await worker(index, item)
+                return BatchItemResult(index=index, success=True, file_path=file_path,
+                                       elapsed_seconds=time.perf_counter() - started)
+            except Exception as e:
+                logger.error(f"Batch item {index} failed: {e}")
+                return BatchItemResult(index=index, success=False, error=str(e),
+                                       elapsed_seconds=time.perf_counter() - started)
+
+    tasks = [asyncio.create_task(run_one(index, item)) for index, item in enumerate(items)]
+    results: List[BatchItemResult] = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            results.append(result)
+            if on_result:
+                on_result(result)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    return results
+
+
+def summarize_batch(results: List[BatchItemResult]) -> Dict[str, Any]:
+    """Builds the tool result payload: counts plus per-item results in completion order."""
+    succeeded = sum(1 for result in results if result.success)
+    return {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": [result.to_dict() for result in results],
+    }
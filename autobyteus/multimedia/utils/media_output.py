@@ -0,0 +1,110 @@
+"""
+Helpers for writing generated media to files instead of passing it around as data URIs.
+
+Generation clients accept an optional `output_dir` keyword. When it is given,
+generated payloads are decoded and written there in a worker thread, and the
+client returns the file path. Tool results, events and memory then carry a short
+path instead of a multi-megabyte base64 string. Tools point `output_dir` at a
+private staging directory (`generated_media_dir`) and move only the result they
+keep into the workspace, so partial and extra outputs never land there.
+"""
+import asyncio
+import base64
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional, Union
+
+from autobyteus.utils.download_utils import download_file_from_url
+
+logger = logging.getLogger(__name__)
+
+MIME_EXTENSIONS = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/webp": "webp",
+    "image/gif": "gif",
+    "audio/wav": "wav",
+    "audio/x-wav": "wav",
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+    "audio/ogg": "ogg",
+    "audio/webm": "webm",
+    "audio/flac": "flac",
+    "audio/aac": "aac",
+}
+
+
+def extension_for_mime_type(mime_type: Optional[str], default: str = "bin") -> str:
+    if not mime_type:
+        return default
+    return MIME_EXTENSIONS.get(mime_type.split(";")[0].strip().lower(), default)
+
+
+def new_media_path(output_dir: Union[str, Path], extension: str) -> Path:
+    """Returns a fresh, uniquely named path under `output_dir` (created if needed)."""
+    directory = Path(output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{uuid.uuid4()}.{extension.lstrip('.')}"
+
+
+def _write_bytes(data: Union[bytes, str], file_path: Path) -> None:
+    payload = base64.b64decode(data) if isinstance(data, str) else data
+    temp_path = file_path.with_name(f".{file_path.name}.part")
+    try:
+        with open(temp_path, "wb") as handle:
+            handle.write(payload)
+        os.replace(temp_path, file_path)
+    except Exception:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+
+
+async def write_media_file(data: Union[bytes, str], output_dir: Union[str, Path], extension: str) -> str:
+    """
+    Writes media bytes (or a base64 string, decoded on the worker thread) to a new file
+    under `output_dir` without blocking the event loop. Returns the file path.
+    """
+    file_path = new_media_path(output_dir, extension)
+    await asyncio.to_thread(_write_bytes, data, file_path)
+    logger.info(f"Saved generated media to {file_path}")
+    return str(file_path)
+
+
+@asynccontextmanager
+async def generated_media_dir() -> AsyncIterator[str]:
+    """A private staging directory for a client's `output_dir`, removed with anything left in it."""
+    directory = await asyncio.to_thread(tempfile.mkdtemp, prefix="autobyteus_media_")
+    try:
+        yield directory
+    finally:
+        await asyncio.to_thread(shutil.rmtree, directory, True)
+
+
+def _move_file(source_path: Path, target_path: Path) -> None:
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.move(str(source_path), str(target_path))
+
+
+async def move_generated_media(source: str, target_path: Path, staging_dir: Optional[str] = None) -> None:
+    """
+    Places a generated result at `target_path`. A file the client wrote to `staging_dir`
+    is moved into place; anything else (URL, data URI, file elsewhere) goes through
+    `download_file_from_url`.
+    """
+    source_path = Path(source) if not source.startswith(("data:", "http://", "https://")) else None
+    if (
+        staging_dir
+        and source_path
+        and source_path.is_file()
+        and source_path.parent.resolve() == Path(staging_dir).resolve()
+    ):
+        await asyncio.to_thread(_move_file, source_path, target_path)
+        return
+    await download_file_from_url(source, target_path)
@@ -31,6 +31,7 @@ from .file.read_file import read_file
 from .file.write_file import write_file
 from .file.patch_file import patch_file
 from .skill.load_skill import load_skill
+from .memory.read_tool_result import read_tool_result
 
 # Terminal tools (PTY-based stateful terminal)
 from .terminal.tools.run_bash import run_bash
@@ -91,6 +92,7 @@ __all__ = [
     "write_file",
     "patch_file",
     "load_skill",
+    "read_tool_result",
 
     # Re-exported general class-based tools
     "Search",
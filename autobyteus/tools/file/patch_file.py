@@ -1,3 +1,4 @@
+import asyncio
 import os
 import logging
 from typing import TYPE_CHECKING, List
@@ -6,13 +7,18 @@ from pydantic import Field
 
 from autobyteus.tools.functional_tool import tool
 from autobyteus.tools.tool_category import ToolCategory
-from autobyteus.utils.diff_utils import apply_unified_diff, PatchApplicationError
+from autobyteus.utils.atomic_write import atomic_write_text_async
+from autobyteus.utils.diff_utils import apply_unified_diff_async, PatchApplicationError
 
 if TYPE_CHECKING:
     from autobyteus.agent.context import AgentContext
 
 logger = logging.getLogger(__name__)
 
+# Last retry for patches whose line numbers went stale: hunks may move this far, but
+# only when their context matches exactly one place in that window.
+STALE_LINE_FUZZ = 1000
+
 
 def _resolve_file_path(context: 'AgentContext', path: str) -> str:
     """Resolves an absolute path for the given input, using the agent workspace when needed."""
@@ -39,6 +45,11 @@ def _resolve_file_path(context: 'AgentContext', path: str) -> str:
     return normalized_path
 
 
+def _read_lines(path: str) -> List[str]:
+    with open(path, 'r', encoding='utf-8') as source:
+        return source.read().splitlines(keepends=True)
+
+
 @tool(name="patch_file", category=ToolCategory.FILE_SYSTEM)
 async def patch_file(
     context: 'AgentContext',
@@ -90,16 +101,16 @@ async def patch_file(
     try:
         original_lines: List[str]
         if file_exists:
-            with open(final_path, 'r', encoding='utf-8') as source:
-                original_lines = source.read().splitlines(keepends=True)
+            original_lines = await asyncio.to_thread(_read_lines, final_path)
         else:
             original_lines = []
 
-        # Log original file content for comparison
-        logger.info("patch_file: ===== ORIGINAL FILE DEBUG START =====")
-        for i, line in enumerate(original_lines, 1):
-            logger.info("patch_file: original line %d: %r", i, line)
-        logger.info("patch_file: ===== ORIGINAL FILE DEBUG END =====")
+        # Log original file content for comparison (one record per line, so debug only)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("patch_file: ===== ORIGINAL FILE DEBUG START =====")
+            for i, line in enumerate(original_lines, 1):
+                logger.debug("patch_file: original line %d: %r", i, line)
+            logger.debug("patch_file: ===== ORIGINAL FILE DEBUG END =====")
 
         patched_lines = None
         patch_error = None
@@ -108,14 +119,16 @@ async def patch_file(
             (1, False),
             (1, True),
             (2, True),
+            (STALE_LINE_FUZZ, False),
         ]
         for fuzz_factor, ignore_whitespace in retry_strategies:
             try:
-                patched_lines = apply_unified_diff(
+                patched_lines = await apply_unified_diff_async(
                     original_lines,
                     patch,
                     fuzz_factor=fuzz_factor,
                     ignore_whitespace=ignore_whitespace,
+                    reject_ambiguous=fuzz_factor == STALE_LINE_FUZZ,
                 )
                 if (fuzz_factor, ignore_whitespace) != (0, False):
                     logger.info(
@@ -136,8 +149,7 @@ async def patch_file(
         if patched_lines is None:
             raise patch_error or PatchApplicationError("Patch could not be applied.")
 
-        with open(final_path, 'w', encoding='utf-8') as destination:
-            destination.writelines(patched_lines)
+        await atomic_write_text_async(final_path, patched_lines)
 
         logger.info("patch_file: successfully applied patch to '%s'.", final_path)
         return f"File patched successfully at {return_path}"
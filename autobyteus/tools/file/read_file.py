@@ -1,3 +1,4 @@
+import asyncio
 import os
 import logging
 from typing import TYPE_CHECKING, Optional
@@ -6,12 +7,37 @@ from pydantic import Field
 
 from autobyteus.tools import tool
 from autobyteus.tools.tool_category import ToolCategory
+from autobyteus.utils.file_line_index import FileLineIndexCache, LineRange, read_line_range
 
 if TYPE_CHECKING:
     from autobyteus.agent.context import AgentContext
 
 logger = logging.getLogger(__name__)
 
+
+def _line_index_cache(context: 'AgentContext') -> Optional[FileLineIndexCache]:
+    cache = getattr(getattr(context, "state", None), "file_line_index_cache", None)
+    return cache if isinstance(cache, FileLineIndexCache) else None
+
+
+def _format_lines(line_range: LineRange, include_line_numbers: bool) -> str:
+    content = line_range.text
+    if include_line_numbers and content:
+        pieces = content.split('\n')
+        numbered = [f"{line_no}: {piece}\n" for line_no, piece in enumerate(pieces[:-1], start=line_range.first_line)]
+        if pieces[-1]:
+            numbered.append(f"{line_range.first_line + len(pieces) - 1}: {pieces[-1]}")
+        content = ''.join(numbered)
+    if line_range.truncated:
+        if content and not content.endswith('\n'):
+            content += '\n'
+        content += (
+            f"[read_file: output truncated after line {line_range.last_line} of {line_range.total_lines} "
+            f"(size limit); call again with start_line={line_range.last_line + 1} to continue]"
+        )
+    return content
+
+
 @tool(name="read_file", category=ToolCategory.FILE_SYSTEM)
 async def read_file(
     context: 'AgentContext',
@@ -27,6 +53,7 @@ async def read_file(
     Reads content from a specified file. Supports optional 1-based inclusive line ranges via start_line/end_line.
     Each returned line is prefixed with its line number when include_line_numbers is true.
     'path' is the path to the file. If relative, it must be resolved against a configured agent workspace.
+    Large outputs are truncated at a line boundary with a note saying where to continue.
     Raises ValueError if a relative path is given without a valid workspace or if line range arguments are invalid.
     Raises FileNotFoundError if the file does not exist.
     Raises IOError if file reading fails for other reasons.
@@ -66,20 +93,11 @@ async def read_file(
         raise FileNotFoundError(f"The file at resolved path {final_path} does not exist.")
         
     try:
-        with open(final_path, 'r', encoding='utf-8') as file:
-            selected_lines = []
-            for line_no, line in enumerate(file, start=1):
-                if start_line is not None and line_no < start_line:
-                    continue
-                if end_line is not None and line_no > end_line:
-                    break
-                if include_line_numbers:
-                    line_text = line.rstrip('\n')
-                    line_suffix = '\n' if line.endswith('\n') else ''
-                    selected_lines.append(f"{line_no}: {line_text}{line_suffix}")
-                else:
-                    selected_lines.append(line)
-            content = ''.join(selected_lines)
+        # Index lookup, range read and decoding all run in a worker thread.
+        line_range = await asyncio.to_thread(
+            read_line_range, final_path, start_line, end_line, None, _line_index_cache(context)
+        )
+        content = _format_lines(line_range, include_line_numbers)
         logger.info(f"File successfully read from '{final_path}' for agent '{context.agent_id}'.")
         return content
     except Exception as e:
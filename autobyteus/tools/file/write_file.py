@@ -4,12 +4,25 @@ from typing import TYPE_CHECKING
 
 from autobyteus.tools import tool
 from autobyteus.tools.tool_category import ToolCategory
+from autobyteus.utils.atomic_write import atomic_write_text_async
 
 if TYPE_CHECKING:
     from autobyteus.agent.context import AgentContext
 
 logger = logging.getLogger(__name__)
 
+
+async def _commit_streamed_content(context: 'AgentContext', final_path: str, content: str) -> bool:
+    """Renames content staged while the LLM streamed this call into place, if it matches."""
+    # Imported lazily: the agent streaming package imports the tool registry.
+    from autobyteus.agent.streaming.utils.write_file_stager import WriteFileStager
+
+    stager = getattr(getattr(context, "state", None), "write_file_stager", None)
+    if not isinstance(stager, WriteFileStager):
+        return False
+    return await stager.commit(final_path, content)
+
+
 @tool(name="write_file", category=ToolCategory.FILE_SYSTEM)
 async def write_file(context: 'AgentContext', path: str, content: str) -> str:
     """
@@ -48,13 +61,13 @@ async def write_file(context: 'AgentContext', path: str, content: str) -> str:
         # It's good practice to normalize the path to handle things like '..'
         final_path = os.path.normpath(final_path)
         
-        dir_path = os.path.dirname(final_path)
-        if dir_path:
-            os.makedirs(dir_path, exist_ok=True)
-            
-        with open(final_path, 'w', encoding='utf-8') as file:
-            file.write(content)
-            
+        if await _commit_streamed_content(context, final_path, content):
+            logger.info(f"File '{final_path}' written from content staged during streaming for agent '{context.agent_id}'.")
+            return f"File created/updated at {return_path}"
+
+        # Temp file + atomic rename in a worker thread; parent directories are created there.
+        await atomic_write_text_async(final_path, content)
+
         logger.info(f"File successfully written to '{final_path}' for agent '{context.agent_id}'.")
         return f"File created/updated at {return_path}"
     except Exception as e:
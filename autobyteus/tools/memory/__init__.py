@@ -0,0 +1,5 @@
+from .read_tool_result import read_tool_result
+
+__all__ = [
+    "read_tool_result",
+]
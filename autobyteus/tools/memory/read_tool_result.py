@@ -0,0 +1,42 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from autobyteus.tools import tool
+from autobyteus.tools.tool_category import ToolCategory
+
+if TYPE_CHECKING:
+    from autobyteus.agent.context import AgentContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_CHARS = 20_000
+
+
+@tool(name="read_tool_result", category=ToolCategory.UTILITY)
+async def read_tool_result(
+    context: 'AgentContext',
+    ref: str,
+    offset: int = 0,
+    length: int = DEFAULT_PAGE_CHARS,
+) -> str:
+    """
+    Reads a range of a stored tool result that was too large to keep in context.
+    'ref' is the reference given in the truncated result. 'offset' is the character offset to start from (default 0)
+    and 'length' the maximum number of characters to return (default 20000).
+    When more output remains, a note with the offset to continue from follows the returned text.
+    Raises ValueError if the agent has no stored tool results or the range is invalid.
+    Raises FileNotFoundError if no result is stored under 'ref'.
+    """
+    memory_manager = getattr(context.state, "memory_manager", None)
+    spill_store = getattr(memory_manager, "tool_result_spill_store", None)
+    if spill_store is None:
+        raise ValueError(f"Agent '{context.agent_id}' has no stored tool results.")
+    if length < 1:
+        raise ValueError(f"length must be >= 1; got {length}.")
+
+    text, has_more = await asyncio.to_thread(spill_store.read, ref, offset, length)
+    logger.debug(f"read_tool_result for agent {context.agent_id}: ref {ref[:12]}, {len(text)} chars from {offset}.")
+    if has_more:
+        text += f"\n[read_tool_result: more output follows; call again with offset={offset + len(text)} to continue]"
+    return text
@@ -1,11 +1,13 @@
-from .image_tools import GenerateImageTool, EditImageTool
-from .audio_tools import GenerateSpeechTool
+from .image_tools import GenerateImageTool, EditImageTool, GenerateImageBatchTool
+from .audio_tools import GenerateSpeechTool, GenerateSpeechBatchTool
 from .media_reader_tool import ReadMediaFile
 from .download_media_tool import DownloadMediaTool
 __all__ = [
     "GenerateImageTool",
     "EditImageTool",
+    "GenerateImageBatchTool",
     "GenerateSpeechTool",
+    "GenerateSpeechBatchTool",
     "ReadMediaFile",
     "DownloadMediaTool",
 ]
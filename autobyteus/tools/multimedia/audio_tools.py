@@ -1,14 +1,19 @@
 import os
 import logging
-from typing import Optional, List, Any
-from pathlib import Path
+from typing import Optional, List, Dict, Any
 
 from autobyteus.tools.base_tool import BaseTool
 from autobyteus.utils.parameter_schema import ParameterSchema, ParameterDefinition, ParameterType
 from autobyteus.tools.tool_category import ToolCategory
 from autobyteus.multimedia.audio import audio_client_factory, AudioModel, AudioClientFactory
 from autobyteus.multimedia.audio.base_audio_client import BaseAudioClient
-from autobyteus.utils.download_utils import download_file_from_url
+from autobyteus.multimedia.utils.media_output import generated_media_dir, move_generated_media
+from autobyteus.multimedia.utils.batch_generation import (
+    BatchItemClients,
+    ProviderConcurrencyLimiter,
+    run_batch,
+    summarize_batch,
+)
 from autobyteus.utils.file_utils import resolve_safe_path
 
 logger = logging.getLogger(__name__)
@@ -137,19 +142,24 @@ class GenerateSpeechTool(BaseTool):
         if self._client is None:
             self._client = audio_client_factory.create_audio_client(model_identifier=model_identifier)
 
-        response = await self._client.generate_speech(prompt=prompt, generation_config=generation_config)
+        if not output_file_path:
+            raise ValueError("output_file_path is required but was not provided.")
+        resolved_path = resolve_safe_path(output_file_path, _get_workspace_root(context))
 
-        if not response.audio_urls:
-            raise ValueError("Speech generation failed to return any audio file paths.")
+        async with generated_media_dir() as staging_dir:
+            response = await self._client.generate_speech(
+                prompt=prompt,
+                generation_config=generation_config,
+                output_dir=staging_dir,
+            )
 
-        first_url = response.audio_urls[0]
+            if not response.audio_urls:
+                raise ValueError("Speech generation failed to return any audio file paths.")
 
-        if not output_file_path:
-            raise ValueError("output_file_path is required but was not provided.")
+            first_url = response.audio_urls[0]
 
-        # Save to File
-        resolved_path = resolve_safe_path(output_file_path, _get_workspace_root(context))
-        await download_file_from_url(first_url, resolved_path)
+            # Save to File
+            await move_generated_media(first_url, resolved_path, staging_dir)
 
         return {"file_path": str(resolved_path)}
 
@@ -157,3 +167,97 @@ class GenerateSpeechTool(BaseTool):
         if self._client:
             await self._client.cleanup()
             self._client = None
+
+
+class GenerateSpeechBatchTool(BaseTool):
+    """
+    An agent tool that generates several audio clips in one call, running the generations
+    concurrently under the provider's concurrency cap. Each item uses a client of its
+    own, so concurrent items never share session state.
+    """
+    CATEGORY = ToolCategory.MULTIMEDIA
+    MODEL_ENV_VAR = "DEFAULT_SPEECH_GENERATION_MODEL"
+    DEFAULT_MODEL = "gemini-2.5-flash-tts"
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "generate_speech_batch"
+
+    @classmethod
+    def get_description(cls) -> str:
+        return (
+            "Generates several spoken audio clips in a single call, e.g. all narration lines of a video. "
+            "Each item has its own text prompt and output file path. Items are generated in parallel and each "
+            "file is saved as soon as it is ready. Returns per-item results in completion order, with an "
+            "error message for any item that failed."
+        )
+
+    @classmethod
+    def get_argument_schema(cls) -> Optional[ParameterSchema]:
+        base_params = [
+            ParameterDefinition(
+                name="items",
+                param_type=ParameterType.ARRAY,
+                description=(
+                    "The clips to generate. Each item is an object with 'prompt' (the text to speak) and "
+                    "'output_file_path' (relative to workspace), both required."
+                ),
+                required=True,
+                array_item_schema={
+                    "type": "object",
+                    "properties": {
+                        "prompt": {"type": "string", "description": "The text to convert to speech."},
+                        "output_file_path": {"type": "string", "description": "Where to save the audio."},
+                    },
+                    "required": ["prompt", "output_file_path"],
+                },
+            ),
+        ]
+        return _build_dynamic_audio_schema(base_params, cls.MODEL_ENV_VAR, cls.DEFAULT_MODEL)
+
+    async def _execute(
+        self,
+        context,
+        items: List[Dict[str, Any]],
+        generation_config: Optional[dict] = None,
+    ) -> Any:
+        if not items:
+            raise ValueError("'items' must contain at least one clip to generate.")
+
+        model_identifier = _get_configured_model_identifier(self.MODEL_ENV_VAR, self.DEFAULT_MODEL)
+
+        workspace_root = _get_workspace_root(context)
+        for index, item in enumerate(items):
+            if not isinstance(item, dict) or not item.get("prompt") or not item.get("output_file_path"):
+                raise ValueError(f"Item {index} must be an object with 'prompt' and 'output_file_path'.")
+
+        logger.info(f"generate_speech_batch executing {len(items)} item(s) with model '{model_identifier}'.")
+
+        async def generate_one(index: int, item: Dict[str, Any]) -> str:
+            resolved_path = resolve_safe_path(item["output_file_path"], workspace_root)
+            async with generated_media_dir() as staging_dir:
+                response = await clients.take().generate_speech(
+                    prompt=item["prompt"],
+                    generation_config=generation_config,
+                    output_dir=staging_dir,
+                )
+                if not response.audio_urls:
+                    raise ValueError("Speech generation failed to return any audio file paths.")
+                await move_generated_media(response.audio_urls[0], resolved_path, staging_dir)
+            return str(resolved_path)
+
+        def log_progress(result) -> None:
+            status = f"saved {result.file_path}" if result.success else f"failed: {result.error}"
+            logger.info(f"generate_speech_batch item {result.index} {status} ({result.elapsed_seconds:.2f}s).")
+
+        clients = BatchItemClients(lambda: audio_client_factory.create_audio_client(model_identifier=model_identifier))
+        try:
+            results = await run_batch(
+                items,
+                generate_one,
+                ProviderConcurrencyLimiter.get_semaphore(clients.provider_key()),
+                on_result=log_progress,
+            )
+        finally:
+            await clients.close()
+        return summarize_batch(results)
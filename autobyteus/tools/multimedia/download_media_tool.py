@@ -1,12 +1,15 @@
+import asyncio
 import os
 import logging
 import mimetypes
 import aiohttp
+from pathlib import Path
 from typing import Optional, TYPE_CHECKING
 from urllib.parse import urlparse
 
 from autobyteus.tools.base_tool import BaseTool
 from autobyteus.tools.tool_category import ToolCategory
+from autobyteus.utils.download_cache import get_download_cache
 from autobyteus.utils.file_utils import get_default_download_folder
 from autobyteus.utils.parameter_schema import ParameterSchema, ParameterDefinition, ParameterType
 
@@ -57,6 +60,41 @@ class DownloadMediaTool(BaseTool):
         ))
         return schema
 
+    @staticmethod
+    def _unique_save_path(destination_dir: str, filename: str, url: str, content_type: Optional[str]) -> str:
+        # Intelligently determine file extension from Content-Type header
+        correct_ext = ''
+        if content_type:
+            mime_type = content_type.split(';')[0].strip()
+            guess = mimetypes.guess_extension(mime_type)
+            if guess:
+                correct_ext = guess
+                logger.debug(f"Determined extension '{correct_ext}' from Content-Type: '{mime_type}'")
+
+        # Fallback to URL extension if Content-Type is generic or missing
+        if not correct_ext or correct_ext == '.bin':
+            url_path = urlparse(url).path
+            _, ext_from_url = os.path.splitext(os.path.basename(url_path))
+            if ext_from_url and len(ext_from_url) > 1: # Ensure it's not just a dot
+                logger.debug(f"Using fallback extension '{ext_from_url}' from URL.")
+                correct_ext = ext_from_url
+
+        if not correct_ext:
+            logger.warning("Could not determine a file extension. The file will be saved without one.")
+
+        # Construct final filename and path
+        base_filename, _ = os.path.splitext(filename)
+        final_filename = f"{base_filename}{correct_ext}"
+        save_path = os.path.join(destination_dir, final_filename)
+
+        # Ensure filename is unique to avoid overwriting
+        counter = 1
+        while os.path.exists(save_path):
+            final_filename = f"{base_filename}_{counter}{correct_ext}"
+            save_path = os.path.join(destination_dir, final_filename)
+            counter += 1
+        return save_path
+
     async def _execute(self, context: 'AgentContext', url: str, filename: str, folder: Optional[str] = None) -> str:
         # 1. Determine download directory
         try:
@@ -94,50 +132,25 @@ class DownloadMediaTool(BaseTool):
 
         # 3. Download and process file asynchronously
         try:
+            cache = get_download_cache()
             async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=60) as response:
-                    response.raise_for_status()
-
-                    # 4. Intelligently determine file extension from Content-Type header
-                    content_type = response.headers.get('Content-Type')
-                    correct_ext = ''
-                    if content_type:
-                        mime_type = content_type.split(';')[0].strip()
-                        guess = mimetypes.guess_extension(mime_type)
-                        if guess:
-                            correct_ext = guess
-                            logger.debug(f"Determined extension '{correct_ext}' from Content-Type: '{mime_type}'")
-
-                    # Fallback to URL extension if Content-Type is generic or missing
-                    if not correct_ext or correct_ext == '.bin':
-                        url_path = urlparse(url).path
-                        _, ext_from_url = os.path.splitext(os.path.basename(url_path))
-                        if ext_from_url and len(ext_from_url) > 1: # Ensure it's not just a dot
-                            logger.debug(f"Using fallback extension '{ext_from_url}' from URL.")
-                            correct_ext = ext_from_url
-                    
-                    if not correct_ext:
-                        logger.warning("Could not determine a file extension. The file will be saved without one.")
-                    
-                    # 5. Construct final filename and path
-                    base_filename, _ = os.path.splitext(filename)
-                    final_filename = f"{base_filename}{correct_ext}"
-                    save_path = os.path.join(destination_dir, final_filename)
-                    
-                    # Ensure filename is unique to avoid overwriting
-                    counter = 1
-                    while os.path.exists(save_path):
-                        final_filename = f"{base_filename}_{counter}{correct_ext}"
-                        save_path = os.path.join(destination_dir, final_filename)
-                        counter += 1
-                    
-                    # 6. Stream file content to disk
-                    with open(save_path, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            f.write(chunk)
-
-                    logger.info(f"Successfully downloaded and saved file to: {save_path}")
-                    return f"Successfully downloaded file to: {save_path}"
+                if cache is not None:
+                    # Fetch into the shared cache (revalidated/resumed), then hard-link into place.
+                    download = await cache.fetch(url, session, timeout=60)
+                    save_path = self._unique_save_path(destination_dir, filename, url, download.content_type)
+                    await cache.place(download, Path(save_path))
+                else:
+                    async with session.get(url, timeout=60) as response:
+                        response.raise_for_status()
+                        save_path = self._unique_save_path(
+                            destination_dir, filename, url, response.headers.get('Content-Type')
+                        )
+                        with open(save_path, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(64 * 1024):
+                                await asyncio.to_thread(f.write, chunk)
+
+                logger.info(f"Successfully downloaded and saved file to: {save_path}")
+                return f"Successfully downloaded file to: {save_path}"
 
         except aiohttp.ClientError as e:
             logger.error(f"Network error while downloading from {url}: {e}", exc_info=True)
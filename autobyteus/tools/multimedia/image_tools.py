@@ -1,14 +1,19 @@
 import os
 import logging
 from typing import Optional, List, Dict, Tuple, Any
-from pathlib import Path
 
 from autobyteus.tools.base_tool import BaseTool
 from autobyteus.utils.parameter_schema import ParameterSchema, ParameterDefinition, ParameterType
 from autobyteus.tools.tool_category import ToolCategory
 from autobyteus.multimedia.image import image_client_factory, ImageModel, ImageClientFactory
 from autobyteus.multimedia.image.base_image_client import BaseImageClient
-from autobyteus.utils.download_utils import download_file_from_url
+from autobyteus.multimedia.utils.media_output import generated_media_dir, move_generated_media
+from autobyteus.multimedia.utils.batch_generation import (
+    BatchItemClients,
+    ProviderConcurrencyLimiter,
+    run_batch,
+    summarize_batch,
+)
 from autobyteus.utils.file_utils import resolve_safe_path
 
 logger = logging.getLogger(__name__)
@@ -218,24 +223,27 @@ class GenerateImageTool(BaseTool):
         if input_images:
             urls_list = [url.strip() for url in input_images.split(',') if url.strip()]
 
-        # 4. Execute Generation (client enforces single image where applicable)
-        response = await self._client.generate_image(
-            prompt=prompt, 
-            input_image_urls=urls_list,
-            generation_config=generation_config
-        )
+        if not output_file_path:
+            raise ValueError("output_file_path is required but was not provided.")
+        resolved_path = resolve_safe_path(output_file_path, _get_workspace_root(context))
 
-        if not response.image_urls:
-            raise ValueError("Image generation failed to return any image URLs.")
+        # 4. Execute Generation (client enforces single image where applicable).
+        # The client writes results to a staging directory, so only a path comes back.
+        async with generated_media_dir() as staging_dir:
+            response = await self._client.generate_image(
+                prompt=prompt,
+                input_image_urls=urls_list,
+                generation_config=generation_config,
+                output_dir=staging_dir,
+            )
 
-        first_url = response.image_urls[0]
+            if not response.image_urls:
+                raise ValueError("Image generation failed to return any image URLs.")
 
-        if not output_file_path:
-            raise ValueError("output_file_path is required but was not provided.")
+            first_url = response.image_urls[0]
 
-        # 5. Save to File
-        resolved_path = resolve_safe_path(output_file_path, _get_workspace_root(context))
-        await download_file_from_url(first_url, resolved_path)
+            # 5. Save to File
+            await move_generated_media(first_url, resolved_path, staging_dir)
 
         return {"file_path": str(resolved_path)}
 
@@ -342,24 +350,26 @@ class EditImageTool(BaseTool):
         # Note: If urls_list is empty, we still call edit_image.
         # Conversational clients will interpret this as a text-only follow-up.
         # Stateless API clients may throw an error if they enforce input images, which is expected behavior.
-        response = await self._client.edit_image(
-            prompt=prompt,
-            input_image_urls=urls_list,
-            mask_url=mask_image,
-            generation_config=generation_config
-        )
-
-        if not response.image_urls:
-            raise ValueError("Image editing failed to return any image URLs.")
-
         if not output_file_path:
             raise ValueError("output_file_path is required but was not provided.")
-
-        first_url = response.image_urls[0]
-        
-        # 5. Save to File
         resolved_path = resolve_safe_path(output_file_path, _get_workspace_root(context))
-        await download_file_from_url(first_url, resolved_path)
+
+        async with generated_media_dir() as staging_dir:
+            response = await self._client.edit_image(
+                prompt=prompt,
+                input_image_urls=urls_list,
+                mask_url=mask_image,
+                generation_config=generation_config,
+                output_dir=staging_dir,
+            )
+
+            if not response.image_urls:
+                raise ValueError("Image editing failed to return any image URLs.")
+
+            first_url = response.image_urls[0]
+
+            # 5. Save to File
+            await move_generated_media(first_url, resolved_path, staging_dir)
 
         return {"file_path": str(resolved_path)}
 
@@ -367,3 +377,115 @@ class EditImageTool(BaseTool):
         if self._client and self._model_identifier and self.agent_id:
             await _SharedImageClientManager.release_client(self.agent_id, self._model_identifier)
             self._client = None
+
+
+class GenerateImageBatchTool(BaseTool):
+    """
+    An agent tool that generates several images in one call, running the generations
+    concurrently under the provider's concurrency cap. Each item uses a client of its
+    own rather than the agent's shared one, so conversational clients never mix the
+    session state of concurrent items.
+    """
+    CATEGORY = ToolCategory.MULTIMEDIA
+    MODEL_ENV_VAR = "DEFAULT_IMAGE_GENERATION_MODEL"
+    DEFAULT_MODEL = "gpt-image-1.5"
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self._model_identifier: Optional[str] = None
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "generate_images"
+
+    @classmethod
+    def get_description(cls) -> str:
+        base_desc = (
+            "Generates several images in a single call, e.g. all frames of a storyboard or a set of variations. "
+            "Each item has its own prompt and output file path (and optional input images). "
+            "Items are generated in parallel; each image is saved as soon as it is ready. "
+            "Returns per-item results in completion order, with an error message for any item that failed, "
+            "so only the failed items need to be retried."
+        )
+        suffix = _get_model_description_suffix(cls.MODEL_ENV_VAR, cls.DEFAULT_MODEL)
+        return f"{base_desc}{suffix}"
+
+    @classmethod
+    def get_argument_schema(cls) -> Optional[ParameterSchema]:
+        base_params = [
+            ParameterDefinition(
+                name="items",
+                param_type=ParameterType.ARRAY,
+                description=(
+                    "The images to generate. Each item is an object with 'prompt' (required), "
+                    "'output_file_path' (required, relative to workspace) and optional 'input_images' "
+                    "(comma-separated image locations)."
+                ),
+                required=True,
+                array_item_schema={
+                    "type": "object",
+                    "properties": {
+                        "prompt": {"type": "string", "description": "Description of the image to generate."},
+                        "output_file_path": {"type": "string", "description": "Where to save the image."},
+                        "input_images": {"type": "string", "description": "Optional comma-separated image locations."},
+                    },
+                    "required": ["prompt", "output_file_path"],
+                },
+            ),
+        ]
+        return _build_dynamic_image_schema(base_params, cls.MODEL_ENV_VAR, cls.DEFAULT_MODEL)
+
+    async def _execute(
+        self,
+        context,
+        items: List[Dict[str, Any]],
+        generation_config: Optional[dict] = None,
+    ) -> Any:
+        if not items:
+            raise ValueError("'items' must contain at least one image to generate.")
+
+        if not self._model_identifier:
+            self._model_identifier = _get_configured_model_identifier(self.MODEL_ENV_VAR, self.DEFAULT_MODEL)
+        model_identifier = self._model_identifier
+
+        workspace_root = _get_workspace_root(context)
+        for index, item in enumerate(items):
+            if not isinstance(item, dict) or not item.get("prompt") or not item.get("output_file_path"):
+                raise ValueError(f"Item {index} must be an object with 'prompt' and 'output_file_path'.")
+
+        logger.info(
+            f"generate_images executing {len(items)} item(s) with model '{self._model_identifier}' "
+            f"for agent '{context.agent_id}'."
+        )
+
+        async def generate_one(index: int, item: Dict[str, Any]) -> str:
+            resolved_path = resolve_safe_path(item["output_file_path"], workspace_root)
+            input_images = item.get("input_images")
+            urls_list = [url.strip() for url in input_images.split(",") if url.strip()] if input_images else None
+            async with generated_media_dir() as staging_dir:
+                response = await clients.take().generate_image(
+                    prompt=item["prompt"],
+                    input_image_urls=urls_list,
+                    generation_config=generation_config,
+                    output_dir=staging_dir,
+                )
+                if not response.image_urls:
+                    raise ValueError("Image generation failed to return any image URLs.")
+                await move_generated_media(response.image_urls[0], resolved_path, staging_dir)
+            return str(resolved_path)
+
+        def log_progress(result) -> None:
+            status = f"saved {result.file_path}" if result.success else f"failed: {result.error}"
+            logger.info(f"generate_images item {result.index} {status} ({result.elapsed_seconds:.2f}s).")
+
+        clients = BatchItemClients(lambda: image_client_factory.create_image_client(model_identifier=model_identifier))
+        try:
+            results = await run_batch(
+                items,
+                generate_one,
+                ProviderConcurrencyLimiter.get_semaphore(clients.provider_key()),
+                on_result=log_progress,
+            )
+        finally:
+            await clients.close()
+        return summarize_batch(results)
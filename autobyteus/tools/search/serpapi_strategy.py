@@ -3,6 +3,7 @@ import logging
 import aiohttp
 from typing import Dict, Any, Optional
 
+from autobyteus.utils.aiohttp_session_pool import get_aiohttp_session_pool
 from .base_strategy import SearchStrategy
 
 logger = logging.getLogger(__name__)
@@ -45,18 +46,18 @@ class SerpApiSearchStrategy(SearchStrategy):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.API_URL, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._format_results(data)
-                    else:
-                        error_text = await response.text()
-                        logger.error(
-                            f"SerpApi API returned a non-200 status code: {response.status}. "
-                            f"Response: {error_text}"
-                        )
-                        raise RuntimeError(f"SerpApi API request failed with status {response.status}: {error_text}")
+            session = get_aiohttp_session_pool().get_session("search")
+            async with session.get(self.API_URL, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return self._format_results(data)
+                else:
+                    error_text = await response.text()
+                    logger.error(
+                        f"SerpApi API returned a non-200 status code: {response.status}. "
+                        f"Response: {error_text}"
+                    )
+                    raise RuntimeError(f"SerpApi API request failed with status {response.status}: {error_text}")
         except aiohttp.ClientError as e:
             logger.error(f"Network error during SerpApi API call: {e}", exc_info=True)
             raise RuntimeError(f"A network error occurred during SerpApi search: {e}")
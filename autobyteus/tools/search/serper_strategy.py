@@ -4,6 +4,7 @@ import logging
 import aiohttp
 from typing import Dict, Any, Optional
 
+from autobyteus.utils.aiohttp_session_pool import get_aiohttp_session_pool
 from .base_strategy import SearchStrategy
 
 logger = logging.getLogger(__name__)
@@ -67,18 +68,18 @@ class SerperSearchStrategy(SearchStrategy):
         })
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.API_URL, headers=headers, data=payload) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._format_results(data)
-                    else:
-                        error_text = await response.text()
-                        logger.error(
-                            f"Serper API returned a non-200 status code: {response.status}. "
-                            f"Response: {error_text}"
-                        )
-                        raise RuntimeError(f"Serper API request failed with status {response.status}: {error_text}")
+            session = get_aiohttp_session_pool().get_session("search")
+            async with session.post(self.API_URL, headers=headers, data=payload) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return self._format_results(data)
+                else:
+                    error_text = await response.text()
+                    logger.error(
+                        f"Serper API returned a non-200 status code: {response.status}. "
+                        f"Response: {error_text}"
+                    )
+                    raise RuntimeError(f"Serper API request failed with status {response.status}: {error_text}")
         except aiohttp.ClientError as e:
             logger.error(f"Network error during Serper API call: {e}", exc_info=True)
             raise RuntimeError(f"A network error occurred during Serper search: {e}")
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional, Sequence, Union
 
 import aiohttp
 
+from autobyteus.utils.aiohttp_session_pool import get_aiohttp_session_pool
 from .base_strategy import SearchStrategy
 
 logger = logging.getLogger(__name__)
@@ -125,21 +126,21 @@ class VertexAISearchStrategy(SearchStrategy):
         payload = {"query": query, "pageSize": num_results}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, params={"key": self.api_key}, json=payload) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._format_results(data)
-
-                    error_text = await response.text()
-                    logger.error(
-                        "Vertex AI Search API returned a non-200 status code: %s. Response: %s",
-                        response.status,
-                        error_text,
-                    )
-                    raise RuntimeError(
-                        f"Vertex AI Search API request failed with status {response.status}: {error_text}"
-                    )
+            session = get_aiohttp_session_pool().get_session("search")
+            async with session.post(url, params={"key": self.api_key}, json=payload) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return self._format_results(data)
+
+                error_text = await response.text()
+                logger.error(
+                    "Vertex AI Search API returned a non-200 status code: %s. Response: %s",
+                    response.status,
+                    error_text,
+                )
+                raise RuntimeError(
+                    f"Vertex AI Search API request failed with status {response.status}: {error_text}"
+                )
         except aiohttp.ClientError as exc:
             logger.error("Network error during Vertex AI Search API call: %s", exc, exc_info=True)
             raise RuntimeError(f"A network error occurred during Vertex AI Search: {exc}") from exc
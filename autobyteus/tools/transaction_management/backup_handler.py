@@ -4,21 +4,188 @@ File: tools/coordinator/backup_handler.py
 Module for handling backups of files during transactional operations.
 
 This module provides functionalities to create backups before file
-operations and restore them if needed. The BackupHandler class interacts
-with the BackupLogger to log backup activities.
+operations and restore them if needed.
+
+Backups live in a content-addressed store (`AUTOBYTEUS_BACKUP_DIR`, default
+`~/.cache/autobyteus/backups`). `objects/` holds each distinct revision once,
+`transactions/<transaction_id>.json` maps the files of a transaction to their
+revision, and `refs/<object_id>/` holds one marker per transaction using the object,
+so discarding a transaction only looks at its own objects. Objects are keyed by a fingerprint of the file size and sampled blocks, so
+large files are not hashed in full on every edit. A revision is shared with an
+existing object only after a byte-for-byte comparison confirms it is identical.
+
+A revision is placed into the store with the cheapest safe method:
+
+- reflink (copy-on-write clone) when the filesystem supports it;
+- hard link, only with `allow_hard_links=True`. A hard link shares the inode with
+  the live file, so this is only safe when every writer replaces files with an
+  atomic rename rather than rewriting them in place;
+- full copy otherwise.
+
+The manifest records each object's size and mtime. A backup changed in place
+through a hard link is detected and is not restored.
 """
 
+import errno
+import filecmp
+import hashlib
+import json
+import logging
 import os
 import shutil
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no reflink support, fall back to links/copies.
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+ENV_BACKUP_DIR = "AUTOBYTEUS_BACKUP_DIR"
+FICLONE = 0x40049409  # Linux ioctl: share extents between two files (btrfs, XFS, ...).
+SAMPLE_SIZE = 64 * 1024
+
+
+def resolve_backup_dir() -> Path:
+    env_value = os.getenv(ENV_BACKUP_DIR, "").strip()
+    if env_value:
+        return Path(env_value)
+    return Path.home() / ".cache" / "autobyteus" / "backups"
+
+
+def _reflink(source: str, target: str) -> None:
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "reflink is not supported on this platform")
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            os.unlink(target)
+            raise
+
+
+def _fingerprint(path: str, size: int) -> str:
+    """Hashes the size plus the first, middle and last blocks of the file."""
+    hasher = hashlib.sha256(str(size).encode("ascii"))
+    with open(path, "rb") as handle:
+        for offset in sorted({0, max(0, size // 2 - SAMPLE_SIZE // 2), max(0, size - SAMPLE_SIZE)}):
+            handle.seek(offset)
+            hasher.update(handle.read(SAMPLE_SIZE))
+    return hasher.hexdigest()[:32]
 
 
 class BackupHandler:
-    
-    def _backup_filename(self, transaction_id: str, filepath: str) -> str:
-        """Generate a backup filename based on transaction_id and original filename."""
-        dir_name, file_name = os.path.split(filepath)
-        backup_name = f"{transaction_id}_backup_{file_name}"
-        return os.path.join(dir_name, backup_name)
+
+    def __init__(self, store_dir: Optional[str] = None, allow_hard_links: bool = False):
+        self.store_dir = Path(store_dir) if store_dir else resolve_backup_dir()
+        self.objects_dir = self.store_dir / "objects"
+        self.transactions_dir = self.store_dir / "transactions"
+        self.refs_dir = self.store_dir / "refs"
+        self.allow_hard_links = allow_hard_links
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.transactions_dir.mkdir(parents=True, exist_ok=True)
+        if not self.refs_dir.exists():
+            self._rebuild_refs()
+        # (device, inode, size, mtime_ns) -> object id, so an unchanged file is not compared again.
+        self._object_by_signature: Dict[tuple, str] = {}
+        self._reflink_supported: Optional[bool] = None
+
+    # --- Placement ---------------------------------------------------------------
+
+    def _clone(self, source: str, target: str, allow_link: bool = True) -> str:
+        """Places `source` at `target` and returns the method used: reflink, link or copy."""
+        if self._reflink_supported is not False:
+            try:
+                _reflink(source, target)
+                self._reflink_supported = True
+                return "reflink"
+            except OSError:
+                self._reflink_supported = False
+        if allow_link:
+            try:
+                os.link(source, target)
+                return "link"
+            except OSError as e:
+                if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP):
+                    raise
+        shutil.copy2(source, target)
+        return "copy"
+
+    def _store_object(self, filepath: str, size: int) -> tuple:
+        """Returns (object_id, method), reusing an identical stored revision when there is one."""
+        fingerprint = _fingerprint(filepath, size)
+        suffix = 0
+        while True:
+            object_id = fingerprint if suffix == 0 else f"{fingerprint}-{suffix}"
+            object_path = self.objects_dir / object_id
+            if not object_path.exists():
+                break
+            if filecmp.cmp(filepath, object_path, shallow=False):
+                return object_id, "dedupe"
+            suffix += 1
+        tmp_object = self.objects_dir / f".{object_id}.{os.getpid()}.tmp"
+        method = self._clone(filepath, str(tmp_object), allow_link=self.allow_hard_links)
+        os.replace(tmp_object, object_path)
+        return object_id, method
+
+    # --- Manifests ---------------------------------------------------------------
+
+    def _manifest_path(self, transaction_id: str) -> Path:
+        return self.transactions_dir / f"{transaction_id}.json"
+
+    def _load_manifest(self, transaction_id: str) -> Dict[str, Dict]:
+        try:
+            return json.loads(self._manifest_path(transaction_id).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+
+    def _save_manifest(self, transaction_id: str, manifest: Dict[str, Dict]) -> None:
+        path = self._manifest_path(transaction_id)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    # --- References ----------------------------------------------------------------
+
+    def _add_ref(self, object_id: str, transaction_id: str) -> None:
+        ref_dir = self.refs_dir / object_id
+        ref_dir.mkdir(parents=True, exist_ok=True)
+        (ref_dir / transaction_id).touch()
+
+    def _drop_ref(self, object_id: str, transaction_id: str) -> bool:
+        """Removes one reference; returns True if the object is no longer referenced."""
+        ref_dir = self.refs_dir / object_id
+        (ref_dir / transaction_id).unlink(missing_ok=True)
+        try:
+            ref_dir.rmdir()
+        except FileNotFoundError:
+            return True
+        except OSError:
+            return False
+        return True
+
+    def _rebuild_refs(self) -> None:
+        """Builds the reference markers from the manifests of a store created before they existed."""
+        for manifest_path in self.transactions_dir.glob("*.json"):
+            try:
+                manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            for entry in manifest.values():
+                self._add_ref(entry["object"], manifest_path.stem)
+        self.refs_dir.mkdir(parents=True, exist_ok=True)
+
+    def _object_is_intact(self, object_id: str, record: Dict) -> bool:
+        try:
+            stat = (self.objects_dir / object_id).stat()
+        except FileNotFoundError:
+            return False
+        return stat.st_size == record["size"] and stat.st_mtime_ns == record["mtime_ns"]
+
+    # --- Public API --------------------------------------------------------------
 
     def create_backup(self, transaction_id: str, filepath: str) -> None:
         """
@@ -28,21 +195,70 @@ class BackupHandler:
             transaction_id (str): The ID of the current transaction.
             filepath (str): Path to the file that needs to be backed up.
         """
-        backup_path = self._backup_filename(transaction_id, filepath)
-        shutil.copy2(filepath, backup_path)  # Copying file to its backup location.
-        self.logger.log_backup_activity(f"Backup created for {filepath} at {backup_path}")
+        filepath = os.path.abspath(filepath)
+        manifest = self._load_manifest(transaction_id)
+        if filepath in manifest:
+            # The first backup in a transaction is the state to roll back to.
+            return
+
+        stat = os.stat(filepath)
+        signature = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        object_id = self._object_by_signature.get(signature)
+        if object_id is not None and (self.objects_dir / object_id).exists():
+            method = "unchanged"
+        else:
+            object_id, method = self._store_object(filepath, stat.st_size)
+            self._object_by_signature[signature] = object_id
+        self._add_ref(object_id, transaction_id)
+
+        object_stat = (self.objects_dir / object_id).stat()
+        manifest[filepath] = {
+            "object": object_id,
+            "mode": stat.st_mode,
+            "size": object_stat.st_size,
+            "mtime_ns": object_stat.st_mtime_ns,
+        }
+        self._save_manifest(transaction_id, manifest)
+        logger.debug(f"Backup created for {filepath} as object {object_id} ({method})")
 
-    def restore_backup(self, transaction_id: str, filepath: str) -> None:
+    def restore_backup(self, transaction_id: str, filepath: Optional[str] = None) -> None:
         """
         Restore a file from its backup for the given transaction_id.
 
         Args:
             transaction_id (str): The ID of the current transaction.
-            filepath (str): Path to the original file that needs to be restored.
+            filepath (Optional[str]): Path to the original file that needs to be restored.
+                Restores every file backed up in the transaction when omitted.
         """
-        backup_path = self._backup_filename(transaction_id, filepath)
-        if os.path.exists(backup_path):
-            shutil.move(backup_path, filepath)  # Restoring original file from backup.
-            self.logger.log_backup_activity(f"Backup at {backup_path} restored to {filepath}")
-        else:
-            self.logger.log_backup_activity(f"No backup found for {filepath} for transaction {transaction_id}")
+        manifest = self._load_manifest(transaction_id)
+        targets = [os.path.abspath(filepath)] if filepath else list(manifest)
+        for target in targets:
+            entry = manifest.get(target)
+            if entry is None:
+                logger.info(f"No backup found for {target} for transaction {transaction_id}")
+                continue
+            if not self._object_is_intact(entry["object"], entry):
+                raise IOError(f"Backup of {target} for transaction {transaction_id} was modified after it was taken.")
+            tmp_target = os.path.join(os.path.dirname(target), f".{os.path.basename(target)}.{transaction_id}.restore")
+            # No hard link here: later in-place edits of the restored file must not reach the store.
+            method = self._clone(str(self.objects_dir / entry["object"]), tmp_target, allow_link=False)
+            os.chmod(tmp_target, entry["mode"] & 0o7777)
+            os.replace(tmp_target, target)
+            logger.info(f"Backup object {entry['object']} restored to {target} ({method})")
+
+    def discard_backups(self, transaction_id: str) -> None:
+        """Drops the transaction's manifest and those of its objects no other transaction references."""
+        manifest = self._load_manifest(transaction_id)
+        self._manifest_path(transaction_id).unlink(missing_ok=True)
+        dropped = set()
+        for entry in manifest.values():
+            object_id = entry["object"]
+            if object_id not in dropped and self._drop_ref(object_id, transaction_id):
+                (self.objects_dir / object_id).unlink(missing_ok=True)
+                dropped.add(object_id)
+        if dropped:
+            self._object_by_signature = {
+                signature: object_id
+                for signature, object_id in self._object_by_signature.items()
+                if object_id not in dropped
+            }
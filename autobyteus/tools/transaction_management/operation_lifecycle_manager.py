@@ -41,6 +41,7 @@ class OperationLifecycleManager:
         """
         try:
             self.journal_manager.finalize_journal(transaction_id, status="committed")
+            self.backup_handler.discard_backups(transaction_id)
             self.event_producer.emit_event(f"Transaction {transaction_id} committed.")
         except Exception as e:
             self.journal_manager.log_error(transaction_id, str(e))
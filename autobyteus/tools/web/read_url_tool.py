@@ -4,7 +4,9 @@ from typing import Optional, TYPE_CHECKING
 from autobyteus.tools.base_tool import BaseTool
 from autobyteus.tools.tool_category import ToolCategory
 from autobyteus.utils.parameter_schema import ParameterSchema, ParameterDefinition, ParameterType
-from autobyteus.utils.html_cleaner import clean, CleaningMode
+from autobyteus.utils.html_cleaner import clean_async, CleaningMode, resolve_html_clean_max_chars
+from autobyteus.utils.aiohttp_session_pool import get_aiohttp_session_pool
+from autobyteus.utils.http_response_cache import fetch_http_response
 
 if TYPE_CHECKING:
     from autobyteus.agent.context import AgentContext
@@ -53,22 +55,28 @@ class ReadUrl(BaseTool):
         logger.info(f"Executing read_url for agent {context.agent_id} with URL: '{url}'")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                # aiohttp handles redirects by default (up to 10)
-                async with session.get(url, timeout=30) as response:
-                    if response.status != 200:
-                        error_msg = f"Failed to fetch content from {url}. Status code: {response.status}"
-                        logger.error(error_msg)
-                        return error_msg
-                    
-                    html_content = await response.text()
+            # Pooled keep-alive session; GETs go through the local HTTP cache.
+            # aiohttp handles redirects by default (up to 10)
+            session = get_aiohttp_session_pool().get_session("web")
+            response = await fetch_http_response(session, url, timeout=aiohttp.ClientTimeout(total=30))
+            if response.status != 200:
+                error_msg = f"Failed to fetch content from {url}. Status code: {response.status}"
+                logger.error(error_msg)
+                return error_msg
+
+            html_content = response.text()
             
             # Use appropriate cleaning mode based on requested format
             mode = CleaningMode.TEXT_CONTENT_FOCUSED if output_format == "text" else CleaningMode.THOROUGH
-            cleaned_content = clean(html_content, mode=mode)
+            max_chars = resolve_html_clean_max_chars()
+            cleaned = await clean_async(html_content, mode=mode, max_chars=max_chars)
+            cleaned_content = cleaned.text
             
             if not cleaned_content.strip():
                 return f"Successfully fetched content from {url}, but the cleaned result was empty."
+
+            if cleaned.truncated:
+                cleaned_content += f"\n\n[read_url: content truncated at about {max_chars} characters]"
                 
             return cleaned_content
 
@@ -0,0 +1,114 @@
+"""
+Process-wide pool of aiohttp sessions for the web and search tools.
+
+Opening a `ClientSession` per call pays DNS, TCP and TLS setup on every request and
+throws the keep-alive connections away afterwards. The pool keeps one session per
+(key, event loop) instead. aiohttp sessions are bound to the loop they were created
+on, and agents run on their own loops, so each loop gets its own session. Sessions
+of closed loops are dropped.
+
+Connector limits come from the environment: `AUTOBYTEUS_WEB_MAX_CONNECTIONS` (total,
+default 100), `AUTOBYTEUS_WEB_MAX_CONNECTIONS_PER_HOST` (default 8) and
+`AUTOBYTEUS_WEB_KEEPALIVE_TIMEOUT` (seconds, default 30).
+"""
+import asyncio
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+ENV_WEB_MAX_CONNECTIONS = "AUTOBYTEUS_WEB_MAX_CONNECTIONS"
+ENV_WEB_MAX_CONNECTIONS_PER_HOST = "AUTOBYTEUS_WEB_MAX_CONNECTIONS_PER_HOST"
+ENV_WEB_KEEPALIVE_TIMEOUT = "AUTOBYTEUS_WEB_KEEPALIVE_TIMEOUT"
+
+
+@dataclass
+class AiohttpSessionPoolConfig:
+    max_connections: int = 100
+    max_connections_per_host: int = 8
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+
+    @classmethod
+    def from_env(cls) -> "AiohttpSessionPoolConfig":
+        config = cls()
+        try:
+            config.max_connections = int(os.getenv(ENV_WEB_MAX_CONNECTIONS, config.max_connections))
+            config.max_connections_per_host = int(
+                os.getenv(ENV_WEB_MAX_CONNECTIONS_PER_HOST, config.max_connections_per_host)
+            )
+            config.keepalive_timeout = float(os.getenv(ENV_WEB_KEEPALIVE_TIMEOUT, config.keepalive_timeout))
+        except ValueError as e:
+            logger.warning(f"Invalid web session pool setting, using defaults: {e}")
+            config = cls()
+        return config
+
+
+class AiohttpSessionPool:
+    def __init__(self, config: Optional[AiohttpSessionPoolConfig] = None):
+        self.config = config or AiohttpSessionPoolConfig.from_env()
+        self._sessions: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+        self._lock = threading.Lock()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.config.max_connections,
+            limit_per_host=self.config.max_connections_per_host,
+            keepalive_timeout=self.config.keepalive_timeout,
+            ttl_dns_cache=self.config.dns_cache_ttl,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    def get_session(self, key: str) -> aiohttp.ClientSession:
+        """Return the shared session for `key` on the running event loop. Do not close it."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._drop_closed_loops()
+            entry = self._sessions.get((key, id(loop)))
+            if entry is not None and entry[0] is loop and not entry[1].closed:
+                return entry[1]
+            session = self._create_session()
+            self._sessions[(key, id(loop))] = (loop, session)
+            logger.debug(f"Created pooled aiohttp session for '{key}'.")
+            return session
+
+    def _drop_closed_loops(self) -> None:
+        stale = [pool_key for pool_key, (loop, _) in self._sessions.items() if loop.is_closed()]
+        for pool_key in stale:
+            _, session = self._sessions.pop(pool_key)
+            # The loop is gone, so the session cannot be awaited closed. Marking the
+            # connector closed releases its bookkeeping and the unclosed-session warning.
+            connector = session.connector
+            if connector is not None and not connector.closed:
+                connector._close()
+
+    async def aclose(self) -> None:
+        """Close the sessions owned by the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            owned = [pool_key for pool_key, (session_loop, _) in self._sessions.items() if session_loop is loop]
+            sessions = [self._sessions.pop(pool_key)[1] for pool_key in owned]
+        for session in sessions:
+            await session.close()
+
+
+_default_pool: Optional[AiohttpSessionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_aiohttp_session_pool() -> AiohttpSessionPool:
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = AiohttpSessionPool()
+        return _default_pool
+
+
+async def shutdown_aiohttp_session_pool() -> None:
+    """Close the running loop's pooled sessions; intended for application shutdown hooks."""
+    await get_aiohttp_session_pool().aclose()
@@ -0,0 +1,135 @@
+"""
+Crash-safe file writes shared by the file tools.
+
+Content is written to a temporary file in the destination directory and then
+renamed over the destination. Readers therefore see either the old file or the
+new one, never a truncated mix. The async variant runs the whole write in a worker
+thread, so large files do not stall the agent's event loop.
+
+Durability is configurable through `AUTOBYTEUS_FILE_WRITE_DURABILITY`:
+
+- `none`: no fsync. Fastest; the rename is atomic, but a power loss may lose the write.
+- `file` (default): fsync the temporary file before the rename.
+- `dir`: additionally fsync the directory, so the rename itself is durable.
+
+The destination's permission bits are kept, and symlinks are written through
+rather than replaced. Hard links to the old file keep the old content; the
+transactional BackupHandler relies on this.
+"""
+import asyncio
+import logging
+import os
+import tempfile
+from enum import Enum
+from typing import Iterable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+ENV_FILE_WRITE_DURABILITY = "AUTOBYTEUS_FILE_WRITE_DURABILITY"
+
+
+class FileDurability(str, Enum):
+    NONE = "none"
+    FILE = "file"
+    DIR = "dir"
+
+
+def resolve_file_durability() -> FileDurability:
+    value = os.getenv(ENV_FILE_WRITE_DURABILITY, FileDurability.FILE.value).strip().lower()
+    try:
+        return FileDurability(value)
+    except ValueError:
+        logger.warning(f"Invalid {ENV_FILE_WRITE_DURABILITY} value '{value}'; using '{FileDurability.FILE.value}'.")
+        return FileDurability.FILE
+
+
+def _read_umask() -> int:
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Read once at import: os.umask() briefly changes process state and is not thread-safe.
+_DEFAULT_MODE = 0o666 & ~_read_umask()
+
+
+def _fsync_dir(dir_path: str) -> None:
+    try:
+        fd = os.open(dir_path, os.O_RDONLY)
+    except OSError:  # Directories cannot be opened on Windows.
+        return
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def replace_with_temp_file(tmp_path: str, path: str, durability: Optional[FileDurability] = None) -> None:
+    """
+    Renames a fully written (and, per durability, fsynced) temporary file over `path`,
+    keeping the destination's permission bits. Removes the temporary file on failure.
+    """
+    durability = durability or resolve_file_durability()
+    target = os.path.realpath(path)
+    dir_path = os.path.dirname(target) or "."
+    try:
+        os.makedirs(dir_path, exist_ok=True)
+        try:
+            mode = os.stat(target).st_mode & 0o7777
+        except FileNotFoundError:
+            mode = _DEFAULT_MODE
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if durability is FileDurability.DIR:
+        _fsync_dir(dir_path)
+
+
+def atomic_write_text(
+    path: str,
+    content: Union[str, Iterable[str]],
+    encoding: str = "utf-8",
+    durability: Optional[FileDurability] = None,
+) -> None:
+    """
+    Atomically replaces `path` with `content` (a string or an iterable of lines).
+    Creates missing parent directories. The temporary file is removed on failure.
+    """
+    durability = durability or resolve_file_durability()
+    target = os.path.realpath(path)
+    dir_path = os.path.dirname(target) or "."
+    os.makedirs(dir_path, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(target)}.", suffix=".tmp", dir=dir_path)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as handle:
+            if isinstance(content, str):
+                handle.write(content)
+            else:
+                handle.writelines(content)
+            handle.flush()
+            if durability is not FileDurability.NONE:
+                os.fsync(handle.fileno())
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    replace_with_temp_file(tmp_path, target, durability)
+
+
+async def atomic_write_text_async(
+    path: str,
+    content: Union[str, Iterable[str]],
+    encoding: str = "utf-8",
+    durability: Optional[FileDurability] = None,
+) -> None:
+    """Runs `atomic_write_text` in a worker thread."""
+    await asyncio.to_thread(atomic_write_text, path, content, encoding, durability)
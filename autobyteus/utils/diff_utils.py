@@ -1,9 +1,11 @@
 """
 Unified diff utilities for applying patches to text content.
 """
+import asyncio
 import re
 import logging
-from typing import List
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +27,148 @@ _GIT_HEADER_PREFIXES = (
 )
 
 
+# Up to this fuzz, candidate positions are compared one by one; beyond it hunks are
+# anchored through a line index, so the cost no longer grows with the search window.
+_SCAN_MAX_FUZZ = 8
+# Patches against files with at least this many lines are applied in a worker thread.
+OFFLOAD_MIN_LINES = 5000
+
+
 class PatchApplicationError(ValueError):
     """Raised when a unified diff patch cannot be applied to the target content."""
 
 
+def _lines_match(l1: str, l2: str, ignore_whitespace: bool, allow_eof_newline_mismatch: bool = False) -> bool:
+    if ignore_whitespace:
+        return l1.strip() == l2.strip()
+    if l1 == l2:
+        return True
+    if allow_eof_newline_mismatch:
+        return l1.rstrip('\n') == l2.rstrip('\n')
+    return False
+
+
+def _hunk_matches_at(original_lines: List[str], expected: List[str], start: int, ignore_whitespace: bool) -> bool:
+    count = len(expected)
+    if start + count > len(original_lines):
+        return False
+    at_eof = start + count == len(original_lines)
+    for k in range(count):
+        if not _lines_match(
+            original_lines[start + k],
+            expected[k],
+            ignore_whitespace,
+            allow_eof_newline_mismatch=at_eof and k == count - 1,
+        ):
+            return False
+    return True
+
+
+def _search_order(fuzz_factor: int) -> Iterator[int]:
+    """Candidate offsets nearest first, the earlier position first on ties: 0, -1, 1, -2, 2, ..."""
+    yield 0
+    for f in range(1, fuzz_factor + 1):
+        yield -f
+        yield f
+
+
+def _scan_for_hunk(
+    original_lines: List[str],
+    expected: List[str],
+    target: int,
+    fuzz_factor: int,
+    min_start: int,
+    ignore_whitespace: bool,
+) -> int:
+    for offset in _search_order(fuzz_factor):
+        candidate = target + offset
+        # Hunks apply in order, so a match may not start before the previous hunk's end.
+        if candidate < min_start:
+            continue
+        if _hunk_matches_at(original_lines, expected, candidate, ignore_whitespace):
+            return candidate
+    return -1
+
+
+class _LineIndex:
+    """
+    Maps the lines of the original content that the patch refers to onto their
+    sorted positions.
+
+    A hunk is anchored on its rarest expected line. Only the start positions that
+    line implies are verified, each in O(hunk), nearest to the target first, so
+    the result is the same as scanning the whole fuzz window. With `unique`, a hunk
+    that matches at more than one position in the window is rejected instead.
+    """
+
+    def __init__(self, original_lines: List[str], ignore_whitespace: bool, patch_lines: List[str]):
+        self._lines = original_lines
+        self._ignore_whitespace = ignore_whitespace
+        # Only lines that occur as context or removals in the patch can anchor a hunk.
+        wanted = set()
+        for patch_line in patch_lines:
+            if patch_line[:1] in (' ', '-'):
+                wanted.update(self._keys(patch_line[1:]))
+        self._positions: Dict[str, List[int]] = {}
+        keys = map(str.strip, original_lines) if ignore_whitespace else original_lines
+        for position, key in enumerate(keys):
+            if key in wanted:
+                self._positions.setdefault(key, []).append(position)
+
+    def _keys(self, line: str) -> tuple:
+        # Every original line that _lines_match accepts for `line` has one of these keys.
+        if self._ignore_whitespace:
+            return (line.strip(),)
+        base = line.rstrip('\n')
+        return (base, base + '\n')
+
+    def _lookup(self, line: str) -> List[int]:
+        found = [self._positions.get(key, []) for key in self._keys(line)]
+        found = [positions for positions in found if positions]
+        if len(found) > 1:
+            return sorted(found[0] + found[1])
+        return found[0] if found else []
+
+    def find(self, expected: List[str], target: int, fuzz_factor: int, min_start: int, unique: bool = False) -> int:
+        anchor_offset = -1
+        anchor_positions: List[int] = []
+        for k, line in enumerate(expected):
+            positions = self._lookup(line)
+            if not positions:
+                return -1
+            if anchor_offset == -1 or len(positions) < len(anchor_positions):
+                anchor_offset, anchor_positions = k, positions
+
+        low = max(min_start, target - fuzz_factor)
+        high = min(target + fuzz_factor, len(self._lines) - len(expected))
+        if low > high:
+            return -1
+        first = bisect_left(anchor_positions, low + anchor_offset)
+        last = bisect_right(anchor_positions, high + anchor_offset)
+        candidates = sorted(
+            (position - anchor_offset for position in anchor_positions[first:last]),
+            key=lambda start: (abs(start - target), start > target),
+        )
+        found = -1
+        for start in candidates:
+            if _hunk_matches_at(self._lines, expected, start, self._ignore_whitespace):
+                if not unique:
+                    return start
+                if found != -1:
+                    raise PatchApplicationError(
+                        f"Context for hunk starting at {target + 1} matches at lines {found + 1} and {start + 1} "
+                        f"(fuzz={fuzz_factor}); refusing to guess."
+                    )
+                found = start
+        return found
+
+
 def apply_unified_diff(
     original_lines: List[str], 
     patch: str, 
     fuzz_factor: int = 0, 
-    ignore_whitespace: bool = False
+    ignore_whitespace: bool = False,
+    reject_ambiguous: bool = False,
 ) -> List[str]:
     """Applies a unified diff patch to the provided original lines and returns the patched lines.
     
@@ -42,6 +177,8 @@ def apply_unified_diff(
         patch: Unified diff patch string describing the edits to apply.
         fuzz_factor: Number of lines to search up/down if exact line number match fails.
         ignore_whitespace: If True, ignores leading/trailing whitespace when matching context.
+        reject_ambiguous: If True, a hunk whose context matches at more than one position within
+            the fuzz window raises instead of applying at the nearest one.
         
     Returns:
         List of strings representing the patched content lines.
@@ -57,14 +194,8 @@ def apply_unified_diff(
     patch_lines = patch.splitlines(keepends=True)
     line_idx = 0
 
-    def lines_match(l1: str, l2: str, *, allow_eof_newline_mismatch: bool = False) -> bool:
-        if ignore_whitespace:
-            return l1.strip() == l2.strip()
-        if l1 == l2:
-            return True
-        if allow_eof_newline_mismatch:
-            return l1.rstrip('\n') == l2.rstrip('\n')
-        return False
+    # Built on the first hunk that needs a wide search, then reused for the rest of the patch.
+    line_index = None
 
     while line_idx < len(patch_lines):
         line = patch_lines[line_idx]
@@ -143,54 +274,19 @@ def apply_unified_diff(
             h_i += 1
 
         expected_count = len(refined_expected_orig)
-
-        # Fuzzy Search for Match
         # Ideally target is old_start - 1 (converting 1-based old_start to 0-based index)
         target_idx_base = old_start - 1 if old_start > 0 else 0
-        
-        found_idx = -1
-        
-        # Generate search offsets: 0, -1, 1, -2, 2, ...
-        offsets = [0]
-        for f in range(1, fuzz_factor + 1):
-            offsets.append(-f)
-            offsets.append(f)
-            
-        for offset in offsets:
-            candidate_idx = target_idx_base + offset
-            
-            # Constraints:
-            # 1. Must proceed forward from where we left off (orig_idx)
-            # 2. Must not go beyond EOF (handled by slicing)
-            if candidate_idx < orig_idx:
-                continue 
-            
-            # Check if this candidate location matches expected_orig
-            # We need to verify that original_lines[candidate_idx : candidate_idx + expected_count] matches refined_expected_orig
-            
-            if candidate_idx + expected_count > len(original_lines):
-                # Ensure we don't go out of bounds (though partial match at EOF might be a thing? No, hunk must match fully)
-                continue
+        if (fuzz_factor > _SCAN_MAX_FUZZ or reject_ambiguous) and refined_expected_orig:
+            if line_index is None:
+                line_index = _LineIndex(original_lines, ignore_whitespace, patch_lines)
+            found_idx = line_index.find(
+                refined_expected_orig, target_idx_base, fuzz_factor, orig_idx, unique=reject_ambiguous
+            )
+        else:
+            found_idx = _scan_for_hunk(
+                original_lines, refined_expected_orig, target_idx_base, fuzz_factor, orig_idx, ignore_whitespace
+            )
 
-            match_success = True
-            for k in range(expected_count):
-                # Note: lines_match handles whitespace if needed.
-                is_eof_line = (
-                    candidate_idx + expected_count == len(original_lines)
-                    and k == expected_count - 1
-                )
-                if not lines_match(
-                    original_lines[candidate_idx + k],
-                    refined_expected_orig[k],
-                    allow_eof_newline_mismatch=is_eof_line,
-                ):
-                    match_success = False
-                    break
-            
-            if match_success:
-                found_idx = candidate_idx
-                break
-                
         if found_idx == -1:
              raise PatchApplicationError(f"Could not find context for hunk starting at {old_start} (fuzz={fuzz_factor}).")
              
@@ -269,3 +365,18 @@ def apply_unified_diff(
 
     patched_lines.extend(original_lines[orig_idx:])
     return patched_lines
+
+
+async def apply_unified_diff_async(
+    original_lines: List[str],
+    patch: str,
+    fuzz_factor: int = 0,
+    ignore_whitespace: bool = False,
+    reject_ambiguous: bool = False,
+) -> List[str]:
+    """Runs `apply_unified_diff`, in a worker thread when the original content is large."""
+    if len(original_lines) < OFFLOAD_MIN_LINES:
+        return apply_unified_diff(original_lines, patch, fuzz_factor, ignore_whitespace, reject_ambiguous)
+    return await asyncio.to_thread(
+        apply_unified_diff, original_lines, patch, fuzz_factor, ignore_whitespace, reject_ambiguous
+    )
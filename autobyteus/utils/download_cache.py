@@ -0,0 +1,419 @@
+"""
+Shared on-disk cache for HTTP media downloads.
+
+Layout under the cache root (`AUTOBYTEUS_DOWNLOAD_CACHE_DIR`, default
+`~/.cache/autobyteus/downloads`):
+
+- `blobs/<sha256>`: completed downloads, stored once per content hash.
+- `entries/<url-hash>.json`: URL -> blob digest, plus the response validators
+  (ETag / Last-Modified) and the blob's size/mtime at the time it was stored.
+- `partial/<url-hash>.part` (+ `.json`): interrupted downloads, resumed with
+  `Range` / `If-Range` on the next request for the same URL.
+
+A cached URL is revalidated with a conditional GET. A 304 response reuses the blob
+without transferring the body. URLs without validators are downloaded again, but a
+body whose hash matches an existing blob is deduplicated. Disk writes and hashing
+run in a worker thread, in batches of about 1 MB.
+
+Blobs are placed into their destination with a hard link when possible (copy
+otherwise). An in-place edit of a linked workspace file would also change the blob,
+so a blob whose size or mtime no longer matches its entry is discarded, not served.
+
+Concurrent fetches of one URL (from any agent's event loop) join the download in
+flight instead of sharing its partial file. Blobs are capped at
+`AUTOBYTEUS_DOWNLOAD_CACHE_MAX_BYTES` (default 5 GB), evicting the least recently
+used; recency is kept in the blob's access time, since its mtime guards integrity.
+Set `AUTOBYTEUS_DOWNLOAD_CACHE_ENABLED=false` to bypass the cache.
+"""
+import asyncio
+import concurrent.futures
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+ENV_DOWNLOAD_CACHE_DIR = "AUTOBYTEUS_DOWNLOAD_CACHE_DIR"
+ENV_DOWNLOAD_CACHE_ENABLED = "AUTOBYTEUS_DOWNLOAD_CACHE_ENABLED"
+ENV_DOWNLOAD_CACHE_MAX_BYTES = "AUTOBYTEUS_DOWNLOAD_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024 * 1024
+WRITE_BATCH_BYTES = 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+def resolve_download_cache_dir() -> Path:
+    env_value = os.getenv(ENV_DOWNLOAD_CACHE_DIR, "").strip()
+    if env_value:
+        return Path(env_value)
+    return Path.home() / ".cache" / "autobyteus" / "downloads"
+
+
+def is_download_cache_enabled() -> bool:
+    return os.getenv(ENV_DOWNLOAD_CACHE_ENABLED, "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def resolve_download_cache_max_bytes() -> int:
+    value = os.getenv(ENV_DOWNLOAD_CACHE_MAX_BYTES, "").strip()
+    if not value:
+        return DEFAULT_MAX_BYTES
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Invalid {ENV_DOWNLOAD_CACHE_MAX_BYTES} value '{value}', using default {DEFAULT_MAX_BYTES}.")
+        return DEFAULT_MAX_BYTES
+
+
+@dataclass
+class CachedDownload:
+    blob_path: Path
+    content_type: Optional[str]
+    digest: str
+    size: int
+    from_cache: bool = False
+    resumed: bool = False
+
+
+class _BlobWriter:
+    """Appends to a file and feeds a running hash, one worker-thread hop per batch."""
+
+    def __init__(self, path: Path, hasher: "hashlib._Hash", append: bool):
+        self.path = path
+        self.hasher = hasher
+        self._handle = open(path, "ab" if append else "wb")
+        self._pending: list = []
+        self._pending_bytes = 0
+        self.written = self._handle.tell()
+
+    def _flush_sync(self, chunks) -> None:
+        for chunk in chunks:
+            self._handle.write(chunk)
+            self.hasher.update(chunk)
+        self._handle.flush()
+
+    async def write(self, chunk: bytes) -> None:
+        self._pending.append(chunk)
+        self._pending_bytes += len(chunk)
+        self.written += len(chunk)
+        if self._pending_bytes >= WRITE_BATCH_BYTES:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        chunks, self._pending, self._pending_bytes = self._pending, [], 0
+        await asyncio.to_thread(self._flush_sync, chunks)
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class _FetchAbandoned(Exception):
+    """The leading fetch of a URL was cancelled; a joined fetch takes over."""
+
+
+def _hash_file(path: Path) -> "hashlib._Hash":
+    hasher = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(WRITE_BATCH_BYTES), b""):
+            hasher.update(block)
+    return hasher
+
+
+class DownloadCache:
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None):
+        self.root = Path(root) if root else resolve_download_cache_dir()
+        self.max_bytes = max_bytes if max_bytes is not None else resolve_download_cache_max_bytes()
+        self.blobs_dir = self.root / "blobs"
+        self.entries_dir = self.root / "entries"
+        self.partial_dir = self.root / "partial"
+        for directory in (self.blobs_dir, self.entries_dir, self.partial_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        # Fetches in flight by URL key; thread-safe futures, as agents run separate loops.
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Blob sizes by digest, least recently used first; loaded on first use.
+        self._blobs: "Optional[OrderedDict[str, int]]" = None
+        self._blob_bytes = 0
+        self._blob_lock = threading.Lock()
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    @property
+    def blob_bytes(self) -> int:
+        return self._blob_bytes
+
+    # --- Metadata -----------------------------------------------------------
+
+    def _read_json(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable download cache metadata '{path}': {e}")
+            return None
+
+    def _write_json(self, path: Path, data: Dict[str, Any]) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(json.dumps(data))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def _valid_entry(self, url_key: str) -> Optional[Dict[str, Any]]:
+        entry = self._read_json(self.entries_dir / f"{url_key}.json")
+        if not entry:
+            return None
+        blob_path = self.blobs_dir / entry["digest"]
+        try:
+            stat = blob_path.stat()
+        except FileNotFoundError:
+            # Evicted; the entry goes with it.
+            (self.entries_dir / f"{url_key}.json").unlink(missing_ok=True)
+            return None
+        if stat.st_size != entry.get("size") or stat.st_mtime_ns != entry.get("mtime_ns"):
+            logger.warning(f"Cached blob {entry['digest']} was modified outside the cache; discarding it.")
+            blob_path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    # --- Fetch ----------------------------------------------------------------
+
+    async def fetch(
+        self,
+        url: str,
+        session: aiohttp.ClientSession,
+        ssl: Any = None,
+        timeout: Optional[float] = None,
+    ) -> CachedDownload:
+        """
+        Returns a completed blob for `url`, revalidating, resuming or downloading as
+        needed. Raises IOError on HTTP errors; a partially received body is kept for
+        resume. A fetch of a URL already being fetched waits for that download.
+        """
+        url_key = self._url_key(url)
+        while True:
+            with self._inflight_lock:
+                inflight = self._inflight.get(url_key)
+                leading = inflight is None
+                if leading:
+                    inflight = self._inflight[url_key] = concurrent.futures.Future()
+                    inflight.set_running_or_notify_cancel()
+            if leading:
+                break
+            try:
+                # Shielded: a cancelled follower must not cancel the shared future.
+                download = await asyncio.shield(asyncio.wrap_future(inflight))
+            except _FetchAbandoned:
+                continue
+            logger.info(f"Joined in-flight download of {url}")
+            return dataclasses.replace(download, from_cache=True, resumed=False)
+
+        try:
+            download = await self._fetch(url, url_key, session, ssl, timeout)
+            await asyncio.to_thread(self._record_blob, download.digest, download.size)
+        except asyncio.CancelledError:
+            inflight.set_exception(_FetchAbandoned())
+            raise
+        except BaseException as e:
+            inflight.set_exception(e)
+            raise
+        else:
+            inflight.set_result(download)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(url_key, None)
+        return download
+
+    async def _fetch(
+        self,
+        url: str,
+        url_key: str,
+        session: aiohttp.ClientSession,
+        ssl: Any,
+        timeout: Optional[float],
+    ) -> CachedDownload:
+        entry = self._valid_entry(url_key)
+        partial_path = self.partial_dir / f"{url_key}.part"
+        partial_meta_path = self.partial_dir / f"{url_key}.json"
+        partial_meta = self._read_json(partial_meta_path) if partial_path.exists() else None
+
+        headers: Dict[str, str] = {}
+        if entry and (entry.get("etag") or entry.get("last_modified")):
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        elif partial_meta and (partial_meta.get("etag") or partial_meta.get("last_modified")):
+            offset = partial_path.stat().st_size
+            if offset > 0:
+                headers["Range"] = f"bytes={offset}-"
+                headers["If-Range"] = partial_meta.get("etag") or partial_meta["last_modified"]
+
+        request_kwargs: Dict[str, Any] = {"headers": headers}
+        if ssl is not None:
+            request_kwargs["ssl"] = ssl
+        if timeout is not None:
+            request_kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        async with session.get(url, **request_kwargs) as response:
+            response_headers = getattr(response, "headers", None) or {}
+            if response.status == 304 and entry:
+                logger.info(f"Download cache hit (revalidated) for {url}")
+                return CachedDownload(
+                    blob_path=self.blobs_dir / entry["digest"],
+                    content_type=entry.get("content_type"),
+                    digest=entry["digest"],
+                    size=entry["size"],
+                    from_cache=True,
+                )
+            if response.status not in (200, 206):
+                raise IOError(f"Failed to download from {url}: HTTP {response.status}")
+
+            resumed = response.status == 206 and "Range" in headers
+            etag = response_headers.get("ETag")
+            last_modified = response_headers.get("Last-Modified")
+            content_type = response_headers.get("Content-Type")
+            if resumed:
+                content_type = content_type or partial_meta.get("content_type")
+                hasher = await asyncio.to_thread(_hash_file, partial_path)
+                logger.info(f"Resuming download of {url} at byte {partial_path.stat().st_size}")
+            else:
+                hasher = hashlib.sha256()
+                if etag or last_modified:
+                    self._write_json(partial_meta_path, {
+                        "url": url,
+                        "etag": etag,
+                        "last_modified": last_modified,
+                        "content_type": content_type,
+                    })
+                else:
+                    partial_meta_path.unlink(missing_ok=True)
+
+            if resumed:
+                etag = etag or partial_meta.get("etag")
+                last_modified = last_modified or partial_meta.get("last_modified")
+
+            writer = _BlobWriter(partial_path, hasher, append=resumed)
+            try:
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    await writer.write(chunk)
+                await writer.flush()
+            except BaseException:
+                writer.close()
+                if not (etag or last_modified):
+                    # Without validators a partial body cannot be resumed safely.
+                    partial_path.unlink(missing_ok=True)
+                raise
+            writer.close()
+
+        digest = hasher.hexdigest()
+        blob_path = self.blobs_dir / digest
+        size = partial_path.stat().st_size
+        if blob_path.exists():
+            partial_path.unlink(missing_ok=True)
+        else:
+            os.replace(partial_path, blob_path)
+        partial_meta_path.unlink(missing_ok=True)
+
+        stat = blob_path.stat()
+        self._write_json(self.entries_dir / f"{url_key}.json", {
+            "url": url,
+            "digest": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_type": content_type,
+        })
+        logger.info(f"Downloaded {url} into cache ({size} bytes, blob {digest[:12]}).")
+        return CachedDownload(
+            blob_path=blob_path, content_type=content_type, digest=digest, size=size, resumed=resumed
+        )
+
+    # --- Size budget (worker thread) -----------------------------------------------
+
+    def _load_blobs(self) -> None:
+        blobs = []
+        for path in self.blobs_dir.iterdir():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            blobs.append((stat.st_atime_ns, path.name, stat.st_size))
+        self._blobs = OrderedDict((digest, size) for _, digest, size in sorted(blobs))
+        self._blob_bytes = sum(self._blobs.values())
+
+    def _record_blob(self, digest: str, size: int) -> None:
+        """Marks a blob as most recently used and evicts the least recently used past `max_bytes`."""
+        blob_path = self.blobs_dir / digest
+        try:
+            stat = blob_path.stat()
+            # Recency lives in the access time; the mtime is part of the integrity check.
+            os.utime(blob_path, ns=(time.time_ns(), stat.st_mtime_ns))
+        except OSError:
+            pass
+        evicted = []
+        with self._blob_lock:
+            if self._blobs is None:
+                self._load_blobs()
+            if digest not in self._blobs:
+                self._blobs[digest] = size
+                self._blob_bytes += size
+            self._blobs.move_to_end(digest)
+            while self._blob_bytes > self.max_bytes and len(self._blobs) > 1:
+                victim, victim_size = self._blobs.popitem(last=False)
+                self._blob_bytes -= victim_size
+                evicted.append(victim)
+        for victim in evicted:
+            # Hard-linked copies in workspaces keep their data.
+            (self.blobs_dir / victim).unlink(missing_ok=True)
+            logger.info(f"Evicted download cache blob {victim[:12]}.")
+
+    # --- Placement ------------------------------------------------------------
+
+    @staticmethod
+    def _place_sync(blob_path: Path, target: Path) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_target = target.with_name(f".{target.name}.linking")
+        tmp_target.unlink(missing_ok=True)
+        try:
+            os.link(blob_path, tmp_target)
+        except OSError:
+            shutil.copyfile(blob_path, tmp_target)
+        os.replace(tmp_target, target)
+
+    async def place(self, download: CachedDownload, target: Path) -> None:
+        """Hard-links (or copies) the blob to `target`, replacing it atomically."""
+        await asyncio.to_thread(self._place_sync, download.blob_path, Path(target))
+
+
+_default_cache: Optional[DownloadCache] = None
+
+
+def get_download_cache() -> Optional[DownloadCache]:
+    """Returns the process-wide cache, or None when caching is disabled."""
+    global _default_cache
+    if not is_download_cache_enabled():
+        return None
+    root = resolve_download_cache_dir()
+    if _default_cache is None or _default_cache.root != root:
+        _default_cache = DownloadCache(root, resolve_download_cache_max_bytes())
+    return _default_cache
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import aiohttp
 import base64
@@ -6,12 +7,32 @@ import os
 import ssl
 from pathlib import Path
 
+from autobyteus.utils.download_cache import get_download_cache
+
 logger = logging.getLogger(__name__)
 
 SSL_VERIFY_ENV_VAR = "AUTOBYTEUS_DOWNLOAD_VERIFY_SSL"
 SSL_CERT_FILE_ENV_VAR = "AUTOBYTEUS_DOWNLOAD_SSL_CERT_FILE"
 
 
+def _write_data_uri(url: str, file_path: Path) -> None:
+    _, encoded = url.split(",", 1)
+    with open(file_path, "wb") as f:
+        f.write(base64.b64decode(encoded))
+
+
+async def _stream_to_file(session: aiohttp.ClientSession, url: str, file_path: Path, ssl_param) -> None:
+    async with session.get(url, ssl=ssl_param) as response:
+        if response.status != 200:
+            raise IOError(f"Failed to download from {url}: HTTP {response.status}")
+
+        # Open file for writing binary
+        with open(file_path, "wb") as f:
+            # Iterate over chunks to avoid loading large files into memory
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                await asyncio.to_thread(f.write, chunk)
+
+
 def _resolve_ssl_param() -> bool | ssl.SSLContext:
     """
     Resolve SSL verification behavior for downloads.
@@ -42,6 +63,8 @@ async def download_file_from_url(url: str, file_path: Path) -> None:
     - Supports http/https URLs, data: URIs (base64), and local file paths.
     - Creates parent directories if they don't exist.
     - Uses streaming for HTTP URLs to handle large files efficiently.
+    - HTTP downloads go through the shared download cache (conditional revalidation,
+      resume of interrupted transfers, hard-linked placement) unless it is disabled.
     - Guarantees cleanup of partial files on failure.
     
     Args:
@@ -62,10 +85,8 @@ async def download_file_from_url(url: str, file_path: Path) -> None:
         if url.startswith("data:"):
             # Handle Data URI
             try:
-                header, encoded = url.split(",", 1)
-                data = base64.b64decode(encoded)
-                with open(file_path, "wb") as f:
-                    f.write(data)
+                # Decoding multi-megabyte payloads is kept off the event loop.
+                await asyncio.to_thread(_write_data_uri, url, file_path)
                 logger.info(f"Successfully decoded and saved data URI to: {file_path}")
                 return
             except Exception as e:
@@ -75,7 +96,7 @@ async def download_file_from_url(url: str, file_path: Path) -> None:
         if os.path.exists(url) and os.path.isfile(url):
             # Handle Local File Path (Copy)
             try:
-                shutil.copy(url, file_path)
+                await asyncio.to_thread(shutil.copy, url, file_path)
                 logger.info(f"Successfully copied local file from {url} to {file_path}")
                 return
             except Exception as e:
@@ -84,17 +105,15 @@ async def download_file_from_url(url: str, file_path: Path) -> None:
 
         # Handle HTTP URL
         ssl_param = _resolve_ssl_param()
+        cache = get_download_cache()
         async with aiohttp.ClientSession() as session:
-            async with session.get(url, ssl=ssl_param) as response:
-                if response.status != 200:
-                    raise IOError(f"Failed to download from {url}: HTTP {response.status}")
-                
-                # Open file for writing binary
-                with open(file_path, "wb") as f:
-                    # Iterate over chunks to avoid loading large files into memory
-                    async for chunk in response.content.iter_chunked(8192):
-                        f.write(chunk)
-                        
+            if cache is not None:
+                # Revalidated/resumed through the shared cache, then hard-linked into place.
+                download = await cache.fetch(url, session, ssl=ssl_param)
+                await cache.place(download, file_path)
+            else:
+                await _stream_to_file(session, url, file_path, ssl_param)
+
         logger.info(f"Successfully downloaded file to: {file_path}")
 
     except Exception as e:
@@ -0,0 +1,178 @@
+"""
+Line-range reads for large text files.
+
+A `FileLineIndex` records how many newlines precede each fixed-size block of a file.
+Locating line N is then a bisect plus a scan of at most one block, and the requested
+lines are sliced out of an mmap, so a windowed read costs time proportional to the
+window instead of the file. Indexes are cached (per agent, see `AgentRuntimeState`)
+and rebuilt when the file's size, mtime or inode changes.
+
+Lines are split on `\\n`; `\\r\\n` endings are returned as `\\n`, as text-mode reads do.
+Results larger than `AUTOBYTEUS_READ_FILE_MAX_BYTES` (default 1 MiB, 0 disables the
+limit) are cut at a line boundary and flagged as truncated.
+"""
+import logging
+import mmap
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ENV_READ_FILE_MAX_BYTES = "AUTOBYTEUS_READ_FILE_MAX_BYTES"
+DEFAULT_READ_FILE_MAX_BYTES = 1024 * 1024
+BLOCK_SIZE = 256 * 1024
+
+
+def resolve_read_max_bytes() -> int:
+    value = os.getenv(ENV_READ_FILE_MAX_BYTES, "").strip()
+    if not value:
+        return DEFAULT_READ_FILE_MAX_BYTES
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning(f"Invalid {ENV_READ_FILE_MAX_BYTES} value '{value}'; using {DEFAULT_READ_FILE_MAX_BYTES}.")
+        return DEFAULT_READ_FILE_MAX_BYTES
+
+
+def _signature(stat: os.stat_result) -> Tuple[int, int, int]:
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+@dataclass
+class LineRange:
+    text: str
+    first_line: int
+    last_line: int
+    total_lines: int
+    truncated: bool = False
+
+
+class FileLineIndex:
+    """Newline counts per block of one file version."""
+
+    def __init__(self, path: str, signature: Tuple[int, int, int], newlines_before: array, total_newlines: int, ends_with_newline: bool):
+        self.path = path
+        self.signature = signature
+        self.size = signature[0]
+        self._newlines_before = newlines_before
+        self._total_newlines = total_newlines
+        self._ends_with_newline = ends_with_newline
+
+    @classmethod
+    def build(cls, path: str) -> "FileLineIndex":
+        with open(path, "rb") as handle:
+            signature = _signature(os.fstat(handle.fileno()))
+            newlines_before = array("Q")
+            total = 0
+            last_byte = b""
+            while True:
+                block = handle.read(BLOCK_SIZE)
+                if not block:
+                    break
+                newlines_before.append(total)
+                total += block.count(b"\n")
+                last_byte = block[-1:]
+        logger.debug(f"Built line index for '{path}': {total} newlines in {len(newlines_before)} blocks.")
+        return cls(path, signature, newlines_before, total, last_byte == b"\n")
+
+    @property
+    def total_lines(self) -> int:
+        if self.size == 0:
+            return 0
+        return self._total_newlines + (0 if self._ends_with_newline else 1)
+
+    def _line_start(self, mm: mmap.mmap, line_no: int) -> int:
+        """Byte offset of 1-based `line_no`, or the file size if it is past the end."""
+        skip = line_no - 1
+        if skip == 0:
+            return 0
+        if skip > self._total_newlines:
+            return self.size
+        # Last block that starts before the skip-th newline.
+        block = bisect_left(self._newlines_before, skip) - 1
+        position = block * BLOCK_SIZE
+        for _ in range(skip - self._newlines_before[block]):
+            position = mm.find(b"\n", position) + 1
+        return position
+
+    def read_range(self, start_line: int = 1, end_line: Optional[int] = None, max_bytes: int = 0) -> LineRange:
+        total_lines = self.total_lines
+        if self.size == 0 or start_line > total_lines:
+            return LineRange(text="", first_line=start_line, last_line=start_line - 1, total_lines=total_lines)
+
+        last_wanted = total_lines if end_line is None else min(end_line, total_lines)
+        with open(self.path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = self._line_start(mm, start_line)
+            end = start
+            line_no = start_line - 1
+            truncated = False
+            while line_no < last_wanted:
+                newline = mm.find(b"\n", end)
+                next_end = self.size if newline == -1 else newline + 1
+                if max_bytes and next_end - start > max_bytes:
+                    truncated = True
+                    break
+                end = next_end
+                line_no += 1
+            if truncated and line_no < start_line:
+                # A single line is over the limit: return its head.
+                end = start + max_bytes
+                line_no = start_line
+                raw = mm[start:end].decode("utf-8", errors="ignore")
+            else:
+                raw = mm[start:end].decode("utf-8")
+        return LineRange(
+            text=raw.replace("\r\n", "\n"),
+            first_line=start_line,
+            last_line=line_no,
+            total_lines=total_lines,
+            truncated=truncated,
+        )
+
+
+class FileLineIndexCache:
+    """LRU of line indexes keyed by real path, validated against the file's stat on every lookup."""
+
+    def __init__(self, max_entries: int = 16):
+        self._max_entries = max_entries
+        self._indexes: "OrderedDict[str, FileLineIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> FileLineIndex:
+        key = os.path.realpath(path)
+        signature = _signature(os.stat(key))
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None and index.signature == signature:
+                self._indexes.move_to_end(key)
+                return index
+        index = FileLineIndex.build(key)
+        with self._lock:
+            self._indexes[key] = index
+            self._indexes.move_to_end(key)
+            while len(self._indexes) > self._max_entries:
+                self._indexes.popitem(last=False)
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+
+def read_line_range(
+    path: str,
+    start_line: Optional[int] = None,
+    end_line: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cache: Optional[FileLineIndexCache] = None,
+) -> LineRange:
+    """Reads 1-based inclusive lines `start_line`..`end_line` of a UTF-8 file. Blocking; run it in a thread."""
+    index = cache.get(path) if cache is not None else FileLineIndex.build(path)
+    if max_bytes is None:
+        max_bytes = resolve_read_max_bytes()
+    return index.read_range(start_line or 1, end_line, max_bytes)
@@ -1,14 +1,38 @@
 """
 This module provides functionality for cleaning HTML content with various levels of intensity.
 
-It uses BeautifulSoup to parse and manipulate HTML, offering different cleaning modes
-to suit various use cases. Empty tags are removed in all cleaning modes except NONE.
+Cleaning is done in a single streaming pass over the document (an `html.parser.HTMLParser`
+subclass) instead of building and walking a BeautifulSoup tree, so memory stays
+proportional to the kept output and an output budget can stop parsing early. The
+GOOGLE_SEARCH_RESULT mode still uses BeautifulSoup. Empty tags are removed in all
+cleaning modes except NONE.
+
+`clean_async` runs the cleaner on a small worker pool (`AUTOBYTEUS_HTML_CLEAN_WORKERS`,
+default 2) so large pages do not stall the event loop.
 """
 
+import asyncio
+import html
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
 from bs4 import BeautifulSoup, Comment
 from enum import Enum, auto
 import re
 
+logger = logging.getLogger(__name__)
+
+ENV_HTML_CLEAN_WORKERS = "AUTOBYTEUS_HTML_CLEAN_WORKERS"
+ENV_HTML_CLEAN_MAX_CHARS = "AUTOBYTEUS_HTML_CLEAN_MAX_CHARS"
+DEFAULT_HTML_CLEAN_MAX_CHARS = 200_000
+# Documents smaller than this are cleaned inline; a thread hop costs more than the work.
+OFFLOAD_MIN_CHARS = 64 * 1024
+
 class CleaningMode(Enum):
     """
     Enum representing different HTML cleaning modes.
@@ -118,6 +142,227 @@ def clean_google_search_result(soup):
     remove_empty_tags(container)
     return clean_whitespace(str(container))
 
+ULTIMATE_TAGS = frozenset([
+    'p', 'span', 'em', 'strong', 'i', 'b', 'u', 'sub', 'sup',
+    'a', 'img', 'br', 'hr', 'blockquote', 'pre', 'code',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'ul', 'ol', 'li', 'dl', 'dt', 'dd',
+    'table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td'
+])
+
+STRUCTURAL_TAGS = frozenset([
+    'header', 'nav', 'main', 'footer', 'section', 'article', 'aside',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'span', 'div', 'em', 'strong', 'i', 'b', 'u', 'sub', 'sup',
+    'a', 'img',
+    'ul', 'ol', 'li', 'dl', 'dt', 'dd',
+    'table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td',
+    'form', 'input', 'textarea', 'select', 'option', 'button', 'label',
+    'br', 'hr', 'blockquote', 'pre', 'code', 'figure', 'figcaption',
+])
+
+WHITELIST_ATTRS = frozenset([
+    'href', 'src', 'alt', 'title', 'id', 'name', 'value', 'type', 'placeholder',
+    'checked', 'selected', 'disabled', 'readonly', 'for', 'action', 'method', 'target',
+    'width', 'height', 'colspan', 'rowspan', 'lang'
+])
+
+VOID_TAGS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr'
+])
+
+# Elements kept even though they contain no text.
+CONTENTLESS_TAGS = frozenset(['br', 'hr', 'img'])
+
+# Element dispositions while streaming.
+_KEEP, _UNWRAP, _DROP = 0, 1, 2
+
+
+def _escape_attr(value: Optional[str]) -> str:
+    return html.escape(value or '', quote=False).replace('"', '&quot;')
+
+
+class _BudgetReached(Exception):
+    pass
+
+
+@dataclass
+class CleanedHtml:
+    text: str
+    truncated: bool = False
+
+
+class _OpenElement:
+    __slots__ = ('name', 'disposition', 'start_tag', 'parts', 'has_text')
+
+    def __init__(self, name: str, disposition: int, start_tag: str = ''):
+        self.name = name
+        self.disposition = disposition
+        self.start_tag = start_tag
+        self.parts: List[str] = []
+        self.has_text = False
+
+
+class _StreamingCleaner(HTMLParser):
+    """
+    Single-pass cleaner. Each open element buffers its cleaned output; on close the
+    buffer is wrapped in the element's tags (kept), spliced into the parent
+    (unwrapped) or discarded (dropped, or kept but without any text).
+    """
+
+    def __init__(self, mode: CleaningMode, max_chars: int = 0):
+        super().__init__(convert_charrefs=True)
+        self.mode = mode
+        self.max_chars = max_chars
+        self.text_only = mode == CleaningMode.TEXT_CONTENT_FOCUSED
+        self.whitelist_tags = ULTIMATE_TAGS if mode == CleaningMode.ULTIMATE else STRUCTURAL_TAGS
+        self.whitelist_attrs: Optional[frozenset] = None
+        if mode in (CleaningMode.ULTIMATE, CleaningMode.THOROUGH):
+            self.whitelist_attrs = WHITELIST_ATTRS
+        elif mode == CleaningMode.STANDARD:
+            self.whitelist_attrs = WHITELIST_ATTRS | {'class'}
+        self.stack: List[_OpenElement] = [_OpenElement('', _UNWRAP)]
+        self.size = 0
+        # Text arrives in pieces (chunk boundaries, character references); it is
+        # joined and emitted at the next markup event.
+        self._pending_text: List[str] = []
+
+    # --- Output -------------------------------------------------------------------
+
+    def _emit(self, element: _OpenElement, piece: str) -> None:
+        element.parts.append(piece)
+        self.size += len(piece)
+        if self.max_chars and self.size >= self.max_chars:
+            raise _BudgetReached()
+
+    def _flush_text(self) -> None:
+        if not self._pending_text:
+            return
+        text = ''.join(self._pending_text)
+        self._pending_text.clear()
+        top = self.stack[-1]
+        if top.disposition == _DROP or not text.strip():
+            return
+        top.has_text = True
+        if self.text_only:
+            self._emit(top, text.strip())
+        else:
+            self._emit(top, html.escape(text, quote=False))
+
+    def _disposition(self, tag: str) -> int:
+        if self.stack[-1].disposition == _DROP or tag in ('script', 'style', 'template'):
+            return _DROP
+        if self.text_only or tag in ('html', 'body'):
+            return _UNWRAP
+        if tag == 'head':
+            return _DROP
+        if tag in self.whitelist_tags:
+            return _KEEP
+        return _UNWRAP if self.mode == CleaningMode.ULTIMATE else _DROP
+
+    def _start_tag(self, tag: str, attrs: List[Tuple[str, Optional[str]]], self_closing: bool) -> Optional[str]:
+        if tag == 'img' and any(name == 'src' and (value or '').startswith('data:image') for name, value in attrs):
+            return None
+        rendered = [tag]
+        for name, value in attrs:
+            if self.whitelist_attrs is not None and (name not in self.whitelist_attrs or name == 'style'):
+                continue
+            rendered.append(f'{name}="{_escape_attr(value)}"')
+        return f"<{' '.join(rendered)}{'/' if self_closing else ''}>"
+
+    def _close_top(self) -> None:
+        element = self.stack.pop()
+        parent = self.stack[-1]
+        if element.disposition == _DROP or not element.has_text:
+            return
+        parent.has_text = True
+        if element.disposition == _UNWRAP:
+            parent.parts.extend(element.parts)
+            return
+        parent.parts.append(element.start_tag)
+        parent.parts.extend(element.parts)
+        parent.parts.append(f'</{element.name}>')
+        self.size += len(element.name) + 3
+
+    # --- HTMLParser callbacks -----------------------------------------------------------
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_text()
+        disposition = self._disposition(tag)
+        if tag in VOID_TAGS:
+            if disposition == _KEEP and tag in CONTENTLESS_TAGS:
+                start_tag = self._start_tag(tag, attrs, self_closing=True)
+                if start_tag:
+                    self._emit(self.stack[-1], start_tag)
+            return
+        start_tag = self._start_tag(tag, attrs, self_closing=False) if disposition == _KEEP else ''
+        if start_tag is None:
+            disposition = _DROP
+        else:
+            self.size += len(start_tag)
+        self.stack.append(_OpenElement(tag, disposition, start_tag or ''))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        self._flush_text()
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].name == tag:
+                while len(self.stack) > depth:
+                    self._close_top()
+                return
+        # Unmatched end tags are ignored, as BeautifulSoup does.
+
+    def handle_data(self, data):
+        self._pending_text.append(data)
+
+    def handle_comment(self, data):
+        self._flush_text()
+
+    def finish(self, truncated: bool) -> str:
+        if not truncated:
+            self.close()
+            self._flush_text()
+        while len(self.stack) > 1:
+            self._close_top()
+        separator = ' ' if self.text_only else ''
+        return clean_whitespace(separator.join(self.stack[0].parts))
+
+
+def _truncate(text: str, max_chars: int) -> CleanedHtml:
+    if max_chars and len(text) > max_chars:
+        return CleanedHtml(text[:max_chars], truncated=True)
+    return CleanedHtml(text)
+
+
+def clean_bounded(html_text: str, mode: CleaningMode = CleaningMode.STANDARD, max_chars: int = 0) -> CleanedHtml:
+    """
+    Clean HTML like `clean`, stopping once about `max_chars` characters of output have
+    been produced (0 means no limit). Markup modes close the elements that were open
+    when the budget ran out, so their output can exceed the budget by those end tags.
+
+    Returns:
+        CleanedHtml: The cleaned text and whether it was cut short.
+    """
+    if mode == CleaningMode.NONE:
+        return _truncate(html_text, max_chars)
+    if mode == CleaningMode.GOOGLE_SEARCH_RESULT:
+        return _truncate(clean_google_search_result(BeautifulSoup(html_text, 'html.parser')), max_chars)
+
+    parser = _StreamingCleaner(mode, max_chars)
+    truncated = False
+    try:
+        parser.feed(html_text)
+    except _BudgetReached:
+        truncated = True
+    text = parser.finish(truncated)
+    if mode == CleaningMode.TEXT_CONTENT_FOCUSED and max_chars and len(text) > max_chars:
+        text = text[:max_chars]
+    return CleanedHtml(text, truncated)
+
+
 def clean(html_text: str, mode: CleaningMode = CleaningMode.STANDARD) -> str:
     """
     Clean HTML text by removing unwanted elements, attributes, empty tags, and whitespace.
@@ -138,103 +383,45 @@ def clean(html_text: str, mode: CleaningMode = CleaningMode.STANDARD) -> str:
         str: The cleaned HTML text, plain text (for TEXT_CONTENT_FOCUSED mode),
              or original HTML (for NONE mode).
 
-    Raises:
-        ValueError: If an invalid cleaning mode is provided.
-
     Example:
         >>> dirty_html = '<html><body><div class="wrapper" style="color: red;">Hello <script>alert("world");</script><p></p></div></body></html>'
         >>> clean_html = clean(dirty_html, CleaningMode.TEXT_CONTENT_FOCUSED)
         >>> print(clean_html)
         Hello
     """
-    # Handle NONE mode
-    if mode == CleaningMode.NONE:
-        return html_text
-
-    # Create a BeautifulSoup object
-    soup = BeautifulSoup(html_text, 'html.parser')
-
-    # Handle TEXT_CONTENT_FOCUSED mode separately
-    if mode == CleaningMode.TEXT_CONTENT_FOCUSED:
-        # Extract only text content, stripping all HTML tags
-        text_content = soup.get_text(separator=' ', strip=True)
-        return clean_whitespace(text_content)
-
-    # Handle GOOGLE_SEARCH_RESULT mode
-    if mode == CleaningMode.GOOGLE_SEARCH_RESULT:
-        return clean_google_search_result(soup)
-
-    # For other modes, proceed with the existing cleaning logic
-    # Focus on the body content if it exists, otherwise use the whole soup
-    content = soup.body or soup
-
-    # Remove script and style tags
-    for script in content(['script', 'style']):
-        script.decompose()
-
-    # Remove comments
-    for comment in content.find_all(text=lambda text: isinstance(text, Comment)):
-        comment.extract()
-
-    # Define whitelist tags based on cleaning mode
-    if mode == CleaningMode.ULTIMATE:
-        whitelist_tags = [
-            'p', 'span', 'em', 'strong', 'i', 'b', 'u', 'sub', 'sup',
-            'a', 'img', 'br', 'hr', 'blockquote', 'pre', 'code',
-            'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-            'ul', 'ol', 'li', 'dl', 'dt', 'dd',
-            'table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td'
-        ]
-    else:
-        whitelist_tags = [
-            'header', 'nav', 'main', 'footer', 'section', 'article', 'aside',
-            'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'span', 'div', 'em', 'strong', 'i', 'b', 'u', 'sub', 'sup',
-            'a', 'img',
-            'ul', 'ol', 'li', 'dl', 'dt', 'dd',
-            'table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td',
-            'form', 'input', 'textarea', 'select', 'option', 'button', 'label',
-            'br', 'hr', 'blockquote', 'pre', 'code', 'figure', 'figcaption',
-        ]
-
-    # Remove or unwrap unwanted tags
-    for tag in content.find_all(True):
-        if tag.name not in whitelist_tags:
-            if mode == CleaningMode.ULTIMATE:
-                tag.unwrap()  # Keep the content of removed tags
-            else:
-                tag.decompose()  # Remove the tag and its content
-
-    # Remove embedded images with src attribute starting with "data:image"
-    for img in content.find_all('img'):
-        if 'src' in img.attrs and img['src'].startswith('data:image'):
-            img.decompose()
-
-    if mode in [CleaningMode.ULTIMATE, CleaningMode.THOROUGH, CleaningMode.STANDARD]:
-        # Expanded whitelist of attributes to keep
-        whitelist_attrs = [
-            'href', 'src', 'alt', 'title', 'id', 'name', 'value', 'type', 'placeholder',
-            'checked', 'selected', 'disabled', 'readonly', 'for', 'action', 'method', 'target',
-            'width', 'height', 'colspan', 'rowspan', 'lang'
-        ]
-
-        # Add 'class' to whitelist_attrs for STANDARD mode
-        if mode == CleaningMode.STANDARD:
-            whitelist_attrs.append('class')
-
-        # Remove unnecessary attributes
-        for tag in content.find_all(True):
-            attrs = dict(tag.attrs)
-            for attr in attrs:
-                if attr not in whitelist_attrs:
-                    del tag[attr]
-
-        # Remove all style attributes
-        for tag in content.find_all(True):
-            if 'style' in tag.attrs:
-                del tag['style']
-
-    # Remove empty tags for all modes
-    remove_empty_tags(content)
-
-    # Return the cleaned HTML
-    return clean_whitespace(''.join(str(child) for child in content.children))
\ No newline at end of file
+    return clean_bounded(html_text, mode).text
+
+
+def resolve_html_clean_max_chars() -> int:
+    value = os.getenv(ENV_HTML_CLEAN_MAX_CHARS, "").strip()
+    if not value:
+        return DEFAULT_HTML_CLEAN_MAX_CHARS
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning(f"Invalid {ENV_HTML_CLEAN_MAX_CHARS} value '{value}'; using {DEFAULT_HTML_CLEAN_MAX_CHARS}.")
+        return DEFAULT_HTML_CLEAN_MAX_CHARS
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            try:
+                workers = max(1, int(os.getenv(ENV_HTML_CLEAN_WORKERS, "2")))
+            except ValueError:
+                workers = 2
+            _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="html-clean")
+        return _executor
+
+
+async def clean_async(html_text: str, mode: CleaningMode = CleaningMode.STANDARD, max_chars: int = 0) -> CleanedHtml:
+    """`clean_bounded` on the cleaning worker pool; small documents are cleaned inline."""
+    if len(html_text) < OFFLOAD_MIN_CHARS:
+        return clean_bounded(html_text, mode, max_chars)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), clean_bounded, html_text, mode, max_chars)
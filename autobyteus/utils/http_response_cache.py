@@ -0,0 +1,427 @@
+"""
+Private on-disk HTTP cache for GET requests made by the web tools (a subset of RFC 9111).
+
+Layout under the cache root (`AUTOBYTEUS_HTTP_CACHE_DIR`, default `~/.cache/autobyteus/http`):
+
+- `entries/<url-hash>.json`: URL, status, response headers, the request header values
+  named by `Vary`, and the time the response was received.
+- `bodies/<url-hash>`: the response body.
+
+A stored response is served without a request while it is fresh: `Cache-Control:
+max-age` minus `Age`, else `Expires` minus `Date`, else 10% of the time since
+`Last-Modified` (at most a day). Stale responses and `no-cache` responses are
+revalidated with `If-None-Match` / `If-Modified-Since`. A 304 refreshes the stored
+headers and serves the stored body. Only 200 responses that can be served fresh or
+revalidated (they carry `ETag` / `Last-Modified`) are stored. `no-store` and `Vary: *`
+responses are never stored. Concurrent fetches of the same URL with the same request
+headers share one request.
+
+The cache is capped at `AUTOBYTEUS_HTTP_CACHE_MAX_BYTES` (default 256 MiB) by evicting the
+least recently used bodies. Set `AUTOBYTEUS_HTTP_CACHE_ENABLED=false` to bypass it.
+"""
+import asyncio
+import concurrent.futures
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+ENV_HTTP_CACHE_DIR = "AUTOBYTEUS_HTTP_CACHE_DIR"
+ENV_HTTP_CACHE_ENABLED = "AUTOBYTEUS_HTTP_CACHE_ENABLED"
+ENV_HTTP_CACHE_MAX_BYTES = "AUTOBYTEUS_HTTP_CACHE_MAX_BYTES"
+DEFAULT_HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+HEURISTIC_FRESHNESS_CAP = 24 * 60 * 60
+# Headers of a 304 that describe its (empty) body rather than the stored representation.
+_BODY_HEADERS = frozenset({"content-length", "content-encoding", "transfer-encoding", "content-range"})
+
+
+def resolve_http_cache_dir() -> Path:
+    env_value = os.getenv(ENV_HTTP_CACHE_DIR, "").strip()
+    if env_value:
+        return Path(env_value)
+    return Path.home() / ".cache" / "autobyteus" / "http"
+
+
+def is_http_cache_enabled() -> bool:
+    return os.getenv(ENV_HTTP_CACHE_ENABLED, "true").strip().lower() not in ("0", "false", "no", "off")
+
+
+def resolve_http_cache_max_bytes() -> int:
+    try:
+        return int(os.getenv(ENV_HTTP_CACHE_MAX_BYTES, DEFAULT_HTTP_CACHE_MAX_BYTES))
+    except ValueError:
+        logger.warning(f"Invalid {ENV_HTTP_CACHE_MAX_BYTES}; using {DEFAULT_HTTP_CACHE_MAX_BYTES}.")
+        return DEFAULT_HTTP_CACHE_MAX_BYTES
+
+
+@dataclass
+class HttpResponse:
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    from_cache: bool = False
+    revalidated: bool = False
+    # The body's encoding as aiohttp detected it, for bodies without a declared charset.
+    encoding: Optional[str] = None
+
+    def text(self) -> str:
+        charset = self.encoding or "utf-8"
+        for part in self.headers.get("content-type", "").split(";")[1:]:
+            name, _, value = part.strip().partition("=")
+            if name.lower() == "charset" and value:
+                charset = value.strip('"\' ')
+        try:
+            return self.body.decode(charset, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+def _response_encoding(response: aiohttp.ClientResponse) -> Optional[str]:
+    """The declared or detected encoding of a response whose body has been read."""
+    try:
+        return response.get_encoding()
+    except (RuntimeError, LookupError):
+        return None
+
+
+def _cache_control(headers: Dict[str, str]) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for part in headers.get("cache-control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') if value else None
+    return directives
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def _int_or_none(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def freshness_lifetime(headers: Dict[str, str], response_time: float) -> float:
+    directives = _cache_control(headers)
+    max_age = _int_or_none(directives.get("max-age"))
+    if max_age is not None:
+        return float(max_age)
+    date = _http_date(headers.get("date")) or response_time
+    if "expires" in headers:
+        expires = _http_date(headers.get("expires"))
+        # An invalid Expires value means "already expired".
+        return max(0.0, expires - date) if expires is not None else 0.0
+    last_modified = _http_date(headers.get("last-modified"))
+    if last_modified is not None and last_modified < date:
+        return min((date - last_modified) * 0.1, HEURISTIC_FRESHNESS_CAP)
+    return 0.0
+
+
+def _lowercase_headers(headers: Any) -> Dict[str, str]:
+    result: Dict[str, str] = {}
+    for name, value in headers.items():
+        name = name.lower()
+        result[name] = f"{result[name]}, {value}" if name in result else value
+    return result
+
+
+class _FetchAbandoned(Exception):
+    """The leading fetch of a URL was cancelled; a joined fetch takes over."""
+
+
+class HttpResponseCache:
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_HTTP_CACHE_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.entries_dir = self.root / "entries"
+        self.bodies_dir = self.root / "bodies"
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.bodies_dir.mkdir(parents=True, exist_ok=True)
+        # Agents run on their own event loops, so shared state is guarded by thread locks.
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self._inflight: Dict[Tuple, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    # --- Disk side (runs in a worker thread) -------------------------------------
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            entry = json.loads((self.entries_dir / f"{key}.json").read_text(encoding="utf-8"))
+            entry["body"] = (self.bodies_dir / key).read_bytes()
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def _touch(self, key: str) -> None:
+        try:
+            os.utime(self.bodies_dir / key)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _write_temp(directory: Path, data: bytes) -> Path:
+        # Dot-prefixed so the size scan and eviction skip it.
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return Path(tmp_name)
+
+    def _replace(self, tmp_path: Path, path: Path) -> None:
+        try:
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _write_entry(self, key: str, entry: Dict[str, Any]) -> None:
+        tmp_path = self._write_temp(self.entries_dir, json.dumps(entry).encode("utf-8"))
+        self._replace(tmp_path, self.entries_dir / f"{key}.json")
+
+    def _store(self, key: str, entry: Dict[str, Any], body: bytes) -> None:
+        body_path = self.bodies_dir / key
+        tmp_path = self._write_temp(self.bodies_dir, body)
+        with self._lock:
+            previous = body_path.stat().st_size if body_path.exists() else 0
+            self._replace(tmp_path, body_path)
+            self._write_entry(key, entry)
+            self._account(len(body) - previous)
+
+    def _remove(self, key: str) -> None:
+        body_path = self.bodies_dir / key
+        with self._lock:
+            try:
+                size = body_path.stat().st_size
+                body_path.unlink()
+                self._account(-size)
+            except OSError:
+                pass
+            (self.entries_dir / f"{key}.json").unlink(missing_ok=True)
+
+    def _account(self, delta: int) -> None:
+        # Called with self._lock held.
+        if self._total_bytes is None:
+            self._total_bytes = sum(p.stat().st_size for p in self.bodies_dir.iterdir() if not p.name.startswith("."))
+        else:
+            self._total_bytes += delta
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        bodies = []
+        for path in self.bodies_dir.iterdir():
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            bodies.append((stat.st_mtime, stat.st_size, path.name))
+        bodies.sort()
+        total = sum(size for _, size, _ in bodies)
+        target = int(self.max_bytes * 0.9)
+        for _, size, key in bodies:
+            if total <= target:
+                break
+            (self.bodies_dir / key).unlink(missing_ok=True)
+            (self.entries_dir / f"{key}.json").unlink(missing_ok=True)
+            total -= size
+        self._total_bytes = total
+        logger.debug(f"HTTP cache evicted down to {total} bytes.")
+
+    # --- Protocol side -------------------------------------------------------------
+
+    def _is_fresh(self, entry: Dict[str, Any], now: float) -> bool:
+        headers = entry["headers"]
+        if "no-cache" in _cache_control(headers):
+            return False
+        age = max(0, _int_or_none(headers.get("age")) or 0)
+        current_age = age + max(0.0, now - entry["response_time"])
+        return current_age < freshness_lifetime(headers, entry["response_time"])
+
+    def _storable(self, headers: Dict[str, str], size: int) -> bool:
+        if "no-store" in _cache_control(headers):
+            return False
+        if headers.get("vary", "").strip() == "*":
+            return False
+        return size <= self.max_bytes // 8
+
+    def _reusable(self, entry: Dict[str, Any]) -> bool:
+        """Whether a stored entry could ever be served: while fresh, or after revalidation."""
+        headers = entry["headers"]
+        if headers.get("etag") or headers.get("last-modified"):
+            return True
+        return self._is_fresh(entry, entry["response_time"])
+
+    @staticmethod
+    def _vary_values(response_headers: Dict[str, str], request_headers: Dict[str, str]) -> Dict[str, Optional[str]]:
+        lowered = {name.lower(): value for name, value in request_headers.items()}
+        names = [name.strip().lower() for name in response_headers.get("vary", "").split(",") if name.strip()]
+        return {name: lowered.get(name) for name in names}
+
+    async def fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+    ) -> HttpResponse:
+        """GETs `url` through the cache. A fetch already running for the same URL and
+        request headers is joined instead of sending a second request."""
+        key = self._key(url)
+        inflight_key = (key, tuple(sorted((name.lower(), value) for name, value in (headers or {}).items())))
+        while True:
+            with self._inflight_lock:
+                inflight = self._inflight.get(inflight_key)
+                leading = inflight is None
+                if leading:
+                    inflight = self._inflight[inflight_key] = concurrent.futures.Future()
+                    inflight.set_running_or_notify_cancel()
+            if leading:
+                break
+            try:
+                # Shielded: a cancelled follower must not cancel the shared future.
+                response = await asyncio.shield(asyncio.wrap_future(inflight))
+            except _FetchAbandoned:
+                continue
+            logger.debug(f"Joined in-flight fetch of {url}")
+            # Only a successful response counts as served from cache; errors are passed on as they are.
+            return dataclasses.replace(
+                response,
+                headers=dict(response.headers),
+                from_cache=response.from_cache or response.status == 200,
+            )
+
+        try:
+            response = await self._fetch(session, url, key, dict(headers or {}), timeout)
+        except asyncio.CancelledError:
+            inflight.set_exception(_FetchAbandoned())
+            raise
+        except BaseException as e:
+            inflight.set_exception(e)
+            raise
+        else:
+            inflight.set_result(response)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(inflight_key, None)
+        return response
+
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        key: str,
+        request_headers: Dict[str, str],
+        timeout: Optional[aiohttp.ClientTimeout],
+    ) -> HttpResponse:
+        entry = await asyncio.to_thread(self._load, key)
+        if entry is not None and entry["vary"] != self._vary_values(entry["headers"], request_headers):
+            entry = None
+
+        if entry is not None:
+            if self._is_fresh(entry, time.time()):
+                await asyncio.to_thread(self._touch, key)
+                logger.debug(f"HTTP cache hit for {url}")
+                return HttpResponse(
+                    entry["status"], entry["headers"], entry["body"], from_cache=True, encoding=entry.get("encoding")
+                )
+            if entry["headers"].get("etag"):
+                request_headers["If-None-Match"] = entry["headers"]["etag"]
+            if entry["headers"].get("last-modified"):
+                request_headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+
+        async with session.get(url, headers=request_headers, timeout=timeout) as response:
+            response_time = time.time()
+            response_headers = _lowercase_headers(response.headers)
+            if response.status == 304 and entry is not None:
+                body = entry.pop("body")
+                entry["headers"].update(
+                    (name, value) for name, value in response_headers.items() if name not in _BODY_HEADERS
+                )
+                entry["response_time"] = response_time
+                await asyncio.to_thread(self._write_entry, key, entry)
+                await asyncio.to_thread(self._touch, key)
+                logger.debug(f"HTTP cache revalidated {url}")
+                return HttpResponse(
+                    entry["status"], entry["headers"], body,
+                    from_cache=True, revalidated=True, encoding=entry.get("encoding"),
+                )
+            body = await response.read()
+            encoding = _response_encoding(response)
+
+        if response.status == 200:
+            new_entry = {
+                "url": url,
+                "status": response.status,
+                "headers": response_headers,
+                "vary": self._vary_values(response_headers, request_headers),
+                "response_time": response_time,
+                "encoding": encoding,
+            }
+            if self._storable(response_headers, len(body)) and self._reusable(new_entry):
+                await asyncio.to_thread(self._store, key, new_entry, body)
+            elif entry is not None:
+                await asyncio.to_thread(self._remove, key)
+        return HttpResponse(response.status, response_headers, body, encoding=encoding)
+
+
+_default_cache: Optional[HttpResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_http_response_cache() -> Optional[HttpResponseCache]:
+    """Returns the process-wide cache, or None when caching is disabled."""
+    global _default_cache
+    if not is_http_cache_enabled():
+        return None
+    root = resolve_http_cache_dir()
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache.root != root:
+            _default_cache = HttpResponseCache(root, resolve_http_cache_max_bytes())
+        return _default_cache
+
+
+async def fetch_http_response(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Optional[aiohttp.ClientTimeout] = None,
+) -> HttpResponse:
+    """GETs `url` through the HTTP cache when it is enabled, directly otherwise."""
+    cache = get_http_response_cache()
+    if cache is not None:
+        return await cache.fetch(session, url, headers=headers, timeout=timeout)
+    async with session.get(url, headers=headers, timeout=timeout) as response:
+        body = await response.read()
+        return HttpResponse(
+            response.status, _lowercase_headers(response.headers), body, encoding=_response_encoding(response)
+        )
@@ -0,0 +1,47 @@
+"""
+JSON encoding with an optional fast backend.
+
+`orjson` is used when it is installed and the stdlib `json` module otherwise. Both
+backends encode values neither can represent natively as `str(value)`. Encoding can
+still fail on containers JSON cannot express, such as dicts with tuple keys or
+circular references; callers that must not fail catch TypeError/ValueError.
+"""
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # Optional; the stdlib encoder is used instead.
+    orjson = None
+
+DEFAULT_JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+if orjson is not None:
+    # Dataclasses and datetimes go through `default` like every other non-JSON value,
+    # so both backends agree on which values become strings.
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def _to_str(value: Any) -> str:
+    return str(value)
+
+
+def dumps_bytes(value: Any, backend: Optional[str] = None) -> bytes:
+    """Encodes `value` as UTF-8 JSON; non-JSON values become their `str()`."""
+    if (backend or DEFAULT_JSON_BACKEND) == "orjson" and orjson is not None:
+        try:
+            return orjson.dumps(value, default=_to_str, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder handles.
+            pass
+    return json.dumps(value, default=_to_str).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Documents from the stdlib encoder may contain NaN/Infinity, which orjson rejects.
+            pass
+    return json.loads(data)
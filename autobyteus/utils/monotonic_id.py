@@ -0,0 +1,64 @@
+"""
+Sortable, collision-free ids for memory items and agent events.
+
+An id is `<prefix><ms:13 digits><seq:5 digits><node:4 hex>`:
+
+- `ms` is the wall clock in milliseconds, never moving backwards within a generator;
+- `seq` counts ids within that millisecond (past 99999 the id borrows the next ms);
+- `node` is random per generator, so generators in different processes do not collide.
+
+Ids from one generator therefore compare in creation order as plain strings. The
+decimal timestamp also keeps them ordered after the legacy `<prefix><ms>` ids.
+Ids are not used as range-query keys: the stores read ranges through their own
+append cursors (file byte offsets, SQLite `seq`), which need no sorting either.
+"""
+import os
+import threading
+import time
+import weakref
+from typing import Optional
+
+_MAX_SEQ = 99_999
+
+
+class MonotonicIdGenerator:
+    def __init__(self, node: Optional[str] = None) -> None:
+        self.node = node if node is not None else os.urandom(2).hex()
+        self._last_ms = 0
+        self._seq = 0
+        # Formatted `ms` of the current millisecond; only `seq` is formatted per id.
+        self._stamp = ""
+        self._lock = threading.Lock()
+
+    def next_id(self, prefix: str = "") -> str:
+        now_ms = time.time_ns() // 1_000_000
+        with self._lock:
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._stamp = f"{now_ms:013d}"
+                self._seq = seq = 0
+            elif self._seq < _MAX_SEQ:
+                self._seq = seq = self._seq + 1
+            else:
+                self._last_ms += 1
+                self._stamp = f"{self._last_ms:013d}"
+                self._seq = seq = 0
+            stamp = self._stamp
+        return f"{prefix}{stamp}{seq:05d}{self.node}"
+
+
+_generators: "weakref.WeakValueDictionary[str, MonotonicIdGenerator]" = weakref.WeakValueDictionary()
+_generators_lock = threading.Lock()
+
+
+def id_generator_for(agent_id: Optional[str]) -> MonotonicIdGenerator:
+    """The generator shared by an agent's memory and event stores while any of them holds it."""
+    if agent_id is None:
+        return MonotonicIdGenerator()
+    with _generators_lock:
+        generator = _generators.get(agent_id)
+        if generator is None:
+            generator = MonotonicIdGenerator()
+            _generators[agent_id] = generator
+        return generator
+
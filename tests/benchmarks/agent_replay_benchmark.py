@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+End-to-End Benchmark: multi-turn, tool-using agent turns against a replayed LLM.
+
+Agents are built through `AgentFactory` with a `ReplayLLM`, so the full pipeline
+(event loop, streaming parser, tool execution, memory ingest, snapshot persistence)
+runs exactly as in production while the provider is replaced by a deterministic
+recording. Use `--recording` with a file captured through `RecordingLLM` to replay
+real provider timing, or omit it to use a synthetic recording.
+
+Run with: uv run python tests/benchmarks/agent_replay_benchmark.py --agents 4 --turns 10 --speed 0
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from autobyteus.agent.context.agent_config import AgentConfig
+from autobyteus.agent.factory.agent_factory import AgentFactory
+from autobyteus.agent.message.agent_input_user_message import AgentInputUserMessage
+from autobyteus.agent.status.status_enum import AgentStatus
+from autobyteus.agent.streaming.events.stream_events import StreamEventType
+from autobyteus.agent.streaming.streams.agent_event_stream import AgentEventStream
+from autobyteus.llm.api.replay_llm import ReplayLLM
+from autobyteus.llm.utils.stream_recording import RecordedChunk, RecordedExchange, StreamRecording
+from autobyteus.tools import tool
+
+logger = logging.getLogger(__name__)
+
+BENCH_TOOL_NAME = "bench_lookup"
+_tool_call_count = 0
+
+
+@tool(name=BENCH_TOOL_NAME)
+async def bench_lookup(context, key: str) -> str:
+    """Returns a deterministic value for the given key."""
+    global _tool_call_count
+    _tool_call_count += 1
+    return f"value-for-{key}"
+
+
+def build_synthetic_recording(
+    tool_calls_per_turn: int = 2,
+    text_chunks: int = 20,
+    chunk_delay: float = 0.01,
+    first_chunk_delay: float = 0.2,
+) -> StreamRecording:
+    """One scenario turn: a tool-calling exchange followed by a plain text answer."""
+    tool_chunks = [RecordedChunk(delay=first_chunk_delay, content="Looking that up.")]
+    for index in range(tool_calls_per_turn):
+        arguments = json.dumps({"key": f"k{index}"})
+        tool_chunks.append(RecordedChunk(
+            delay=chunk_delay,
+            tool_calls=[{"index": index, "call_id": f"call_{index}", "name": BENCH_TOOL_NAME, "arguments_delta": arguments[:6]}],
+        ))
+        tool_chunks.append(RecordedChunk(
+            delay=chunk_delay,
+            tool_calls=[{"index": index, "call_id": None, "name": None, "arguments_delta": arguments[6:]}],
+        ))
+    tool_chunks.append(RecordedChunk(
+        delay=chunk_delay,
+        is_complete=True,
+        usage={"prompt_tokens": 800, "completion_tokens": 40, "total_tokens": 840},
+    ))
+
+    answer_chunks = [RecordedChunk(delay=first_chunk_delay, reasoning="Combining results.")]
+    answer_chunks.extend(RecordedChunk(delay=chunk_delay, content=f"word{i} ") for i in range(text_chunks))
+    answer_chunks.append(RecordedChunk(
+        delay=chunk_delay,
+        is_complete=True,
+        usage={"prompt_tokens": 900, "completion_tokens": text_chunks, "total_tokens": 900 + text_chunks},
+    ))
+
+    return StreamRecording(
+        provider="OPENAI",
+        model="synthetic",
+        exchanges=[
+            RecordedExchange(chunks=tool_chunks, tool_names=[BENCH_TOOL_NAME]),
+            RecordedExchange(chunks=answer_chunks),
+        ],
+    )
+
+
+@dataclass
+class BenchmarkResult:
+    turn_latencies: List[float] = field(default_factory=list)
+    wall_time: float = 0.0
+    tool_calls: int = 0
+
+    def percentile(self, pct: float) -> float:
+        ordered = sorted(self.turn_latencies)
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def report(self) -> str:
+        turns = len(self.turn_latencies)
+        return "\n".join([
+            f"turns:         {turns}",
+            f"tool calls:    {self.tool_calls}",
+            f"wall time:     {self.wall_time:.3f}s",
+            f"turns/sec:     {turns / self.wall_time if self.wall_time else 0.0:.2f}",
+            f"latency mean:  {statistics.mean(self.turn_latencies) * 1000 if turns else 0.0:.1f}ms",
+            f"latency p50:   {self.percentile(50) * 1000:.1f}ms",
+            f"latency p90:   {self.percentile(90) * 1000:.1f}ms",
+            f"latency p99:   {self.percentile(99) * 1000:.1f}ms",
+        ])
+
+
+async def _wait_for_idle_after(stream: AgentEventStream, replay: ReplayLLM, expected_exchanges: int) -> None:
+    async for event in stream.all_events():
+        if event.event_type != StreamEventType.AGENT_STATUS_UPDATED:
+            continue
+        status = event.data.new_status
+        if status == AgentStatus.ERROR:
+            raise RuntimeError(f"Agent entered ERROR: {event.data.error_message}")
+        if status == AgentStatus.IDLE and replay.exchanges_replayed >= expected_exchanges:
+            return
+
+
+async def _drive_agent(
+    recording: StreamRecording,
+    speed: float,
+    turns: int,
+    memory_dir: str,
+    result: BenchmarkResult,
+) -> None:
+    replay = ReplayLLM(recording, speed=speed, loop=True)
+    config = AgentConfig(
+        name="ReplayBench",
+        role="benchmark",
+        description="Replay benchmark agent",
+        llm_instance=replay,
+        system_prompt="You are a benchmark agent.",
+        tools=[bench_lookup],
+        auto_execute_tools=True,
+        memory_dir=memory_dir,
+    )
+    factory = AgentFactory()
+    agent = factory.create_agent(config)
+    stream = AgentEventStream(agent)
+    exchanges_per_turn = len(recording.exchanges)
+    try:
+        agent.start()
+        bootstrapped = asyncio.create_task(_wait_for_idle_after(stream, replay, 0))
+        await asyncio.wait_for(bootstrapped, timeout=30)
+
+        for turn in range(turns):
+            expected = (turn + 1) * exchanges_per_turn
+            waiter = asyncio.create_task(_wait_for_idle_after(stream, replay, expected))
+            started = time.perf_counter()
+            await agent.post_user_message(AgentInputUserMessage(content=f"Scenario turn {turn}: look up the keys."))
+            await asyncio.wait_for(waiter, timeout=60)
+            result.turn_latencies.append(time.perf_counter() - started)
+    finally:
+        await stream.close()
+        await factory.remove_agent(agent.agent_id)
+
+
+async def run_benchmark(
+    agents: int,
+    turns: int,
+    speed: float,
+    recording: Optional[StreamRecording] = None,
+) -> BenchmarkResult:
+    recording = recording or build_synthetic_recording()
+    result = BenchmarkResult()
+    tool_calls_before = _tool_call_count
+    with tempfile.TemporaryDirectory(prefix="replay_bench_") as memory_dir:
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            _drive_agent(recording, speed, turns, memory_dir, result) for _ in range(agents)
+        ])
+        result.wall_time = time.perf_counter() - started
+    result.tool_calls = _tool_call_count - tool_calls_before
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay-driven end-to-end agent benchmark.")
+    parser.add_argument("--agents", type=int, default=1, help="Concurrent agents.")
+    parser.add_argument("--turns", type=int, default=10, help="Scenario turns per agent.")
+    parser.add_argument("--speed", type=float, default=0.0, help="Replay speed multiplier; 0 = as fast as possible.")
+    parser.add_argument("--recording", type=str, default=None, help="Path to a RecordingLLM JSONL file.")
+    parser.add_argument("--log-level", type=str, default="WARNING")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper(), format="%(message)s")
+    recording = StreamRecording.load(args.recording) if args.recording else None
+    result = asyncio.run(run_benchmark(args.agents, args.turns, args.speed, recording))
+    print(result.report())
+
+
+if __name__ == "__main__":
+    main()
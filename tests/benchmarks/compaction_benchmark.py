@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: summarizer cost per compaction as a session grows.
+
+A deterministic fake summarizer charges for every input token (4 characters per
+token) with a fixed latency per token. The session appends `--turns-per-compaction`
+turns and then compacts, `--compactions` times. Two strategies are compared:
+
+- full: re-summarize every compacted turn from raw traces (what keeping older
+  context required before).
+- rolling: `Compactor.compact_async`, which folds only the new window into the rolling
+  episodic summary and re-consolidates it periodically.
+
+Run with: uv run python tests/benchmarks/compaction_benchmark.py --compactions 50
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import List, Optional
+
+from autobyteus.memory.compaction.compaction_result import CompactionResult
+from autobyteus.memory.compaction.compactor import Compactor
+from autobyteus.memory.compaction.summarizer import AsyncSummarizer
+from autobyteus.memory.models.raw_trace_item import RawTraceItem
+from autobyteus.memory.policies.compaction_policy import CompactionPolicy
+from autobyteus.memory.store.file_store import FileMemoryStore
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class ChargingSummarizer(AsyncSummarizer):
+    """Summary = first words of each input line; cost = input tokens."""
+
+    def __init__(self, seconds_per_token: float):
+        self.seconds_per_token = seconds_per_token
+        self.charges: List[int] = []
+
+    async def _charge(self, text: str) -> None:
+        tokens = _tokens(text)
+        self.charges.append(tokens)
+        await asyncio.sleep(tokens * self.seconds_per_token)
+
+    async def summarize_async(self, traces, previous_summary: Optional[str] = None) -> CompactionResult:
+        lines = [f"{trace.turn_id}: {trace.content}" for trace in traces]
+        await self._charge("\n".join(([previous_summary] if previous_summary else []) + lines))
+        window = " ".join(" ".join(line.split()[:4]) for line in lines)
+        summary = f"{previous_summary}\n{window}" if previous_summary else window
+        return CompactionResult(episodic_summary=summary)
+
+    async def consolidate_async(self, summary: str) -> str:
+        await self._charge(summary)
+        # Keep every other line: a stand-in for an LLM re-compressing older episodes.
+        return "\n".join(summary.splitlines()[::2])
+
+
+def _turn_traces(turn_no: int) -> List[RawTraceItem]:
+    turn_id = f"turn_{turn_no:05d}"
+    body = " ".join(f"word{(turn_no * 7 + i) % 97}" for i in range(120))
+    return [
+        RawTraceItem(id=f"rt_{turn_id}_{seq}", ts=time.time(), turn_id=turn_id, seq=seq,
+                     trace_type=trace_type, content=body, source_event="benchmark")
+        for seq, trace_type in ((1, "user"), (2, "assistant"))
+    ]
+
+
+async def run_full(args) -> ChargingSummarizer:
+    summarizer = ChargingSummarizer(args.seconds_per_token)
+    history: List[RawTraceItem] = []
+    turn_no = 0
+    for _ in range(args.compactions):
+        for _ in range(args.turns_per_compaction):
+            turn_no += 1
+            history.extend(_turn_traces(turn_no))
+        await summarizer.summarize_async(history)
+    return summarizer
+
+
+async def run_rolling(args) -> ChargingSummarizer:
+    summarizer = ChargingSummarizer(args.seconds_per_token)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FileMemoryStore(base_dir=tmp, agent_id="bench")
+        policy = CompactionPolicy(raw_tail_turns=0, consolidate_every=args.consolidate_every,
+                                  max_summary_chars=args.max_summary_chars)
+        compactor = Compactor(store=store, policy=policy, summarizer=summarizer)
+        turn_no = 0
+        for _ in range(args.compactions):
+            for _ in range(args.turns_per_compaction):
+                turn_no += 1
+                store.add(_turn_traces(turn_no))
+            await compactor.compact_async(compactor.select_compaction_window())
+    return summarizer
+
+
+def _report(name: str, summarizer: ChargingSummarizer, elapsed: float) -> None:
+    charges = summarizer.charges
+    print(
+        f"{name:<8} calls {len(charges):4d}  first {charges[0]:7d} tok  last {charges[-1]:7d} tok  "
+        f"max {max(charges):7d} tok  total {sum(charges):9d} tok  wall {elapsed:6.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compaction summarizer cost benchmark.")
+    parser.add_argument("--compactions", type=int, default=50)
+    parser.add_argument("--turns-per-compaction", type=int, default=4)
+    parser.add_argument("--consolidate-every", type=int, default=8)
+    parser.add_argument("--max-summary-chars", type=int, default=8000)
+    parser.add_argument("--seconds-per-token", type=float, default=2e-6)
+    args = parser.parse_args()
+
+    for name, runner in (("full", run_full), ("rolling", run_rolling)):
+        started = time.perf_counter()
+        summarizer = asyncio.run(runner(args))
+        _report(name, summarizer, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
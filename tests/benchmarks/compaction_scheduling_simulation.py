@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Simulation: reactive vs. predictive compaction scheduling.
+
+Scripted agent sessions are driven through the real MemoryManager, Compactor and
+LLMRequestAssembler, following the agent handlers' order of calls: each LLM call is
+`prepare_request`, the provider "counts" the rendered payload (chars / 4 plus a fixed
+tool-schema overhead), the response and its tool intents are ingested, then
+`schedule_compaction` runs as the response handler does. Tools, the summarizer and
+the user sleep to model their latency; tool results vary in size per tool.
+
+- reactive: `predictive=False`; compaction is requested only after a request crossed
+  the trigger and runs in the foreground of the next `prepare_request`.
+- predictive: the next request is predicted (context + pending tool results) and the
+  summarizer runs in the background while tools execute or the user types.
+
+Reported per mode: compactions, peak prompt tokens, requests over the input budget,
+and the latency compaction added to the critical path (time inside `prepare_request`).
+
+Run with: uv run python tests/benchmarks/compaction_scheduling_simulation.py --sessions 5
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from typing import List, Optional
+
+from autobyteus.agent.events.agent_events import ToolResultEvent
+from autobyteus.agent.llm_request_assembler import LLMRequestAssembler
+from autobyteus.agent.tool_invocation import ToolInvocation
+from autobyteus.llm.prompt_renderers.openai_chat_renderer import OpenAIChatRenderer
+from autobyteus.llm.user_message import LLMUserMessage
+from autobyteus.llm.utils.response_types import CompleteResponse
+from autobyteus.memory.compaction.compaction_result import CompactionResult
+from autobyteus.memory.compaction.compactor import Compactor
+from autobyteus.memory.compaction.summarizer import AsyncSummarizer
+from autobyteus.memory.memory_manager import MemoryManager
+from autobyteus.memory.models.raw_trace_item import RawTraceItem
+from autobyteus.memory.policies.compaction_policy import CompactionPolicy
+from autobyteus.memory.store.file_store import FileMemoryStore
+
+SYSTEM_PROMPT = "You are a coding agent. Use the tools to inspect and change the repository. " * 10
+SCHEMA_OVERHEAD_TOKENS = 1500
+# Result sizes in characters per tool: (min, max).
+TOOLS = {
+    "read_file": (2_000, 24_000),
+    "search": (500, 6_000),
+    "run_tests": (300, 12_000),
+    "write_file": (50, 200),
+}
+
+
+class _SlowSummarizer(AsyncSummarizer):
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def summarize_async(
+        self, traces: List[RawTraceItem], previous_summary: Optional[str] = None
+    ) -> CompactionResult:
+        await asyncio.sleep(self.latency)
+        summary = f"Worked through {len(traces)} steps: " + "edited modules and ran tests. " * 20
+        return CompactionResult(episodic_summary=summary, semantic_facts=[])
+
+
+def _count_prompt_tokens(payload) -> int:
+    return len(json.dumps(payload)) // 4 + SCHEMA_OVERHEAD_TOKENS
+
+
+async def run_session(args, seed: int, predictive: bool, tmp: str) -> dict:
+    rng = random.Random(seed)
+    policy = CompactionPolicy(trigger_ratio=args.trigger_ratio, raw_tail_turns=2, predictive=predictive)
+    store = FileMemoryStore(base_dir=tmp, agent_id=f"sim_{seed}_{int(predictive)}")
+    manager = MemoryManager(store=store, compaction_policy=policy)
+    manager.compactor = Compactor(store=store, policy=policy, summarizer=_SlowSummarizer(args.summarizer_latency))
+    assembler = LLMRequestAssembler(memory_manager=manager, renderer=OpenAIChatRenderer())
+    stats = {"compactions": 0, "peak": 0, "overflows": 0, "critical_path": 0.0, "requests": 0}
+
+    async def llm_call(turn_id: str, user_input: str, round_no: int = 0) -> None:
+        started = time.perf_counter()
+        request = await assembler.prepare_request(user_input, current_turn_id=turn_id, system_prompt=SYSTEM_PROMPT)
+        elapsed = time.perf_counter() - started
+        if request.did_compact:
+            stats["compactions"] += 1
+            stats["critical_path"] += elapsed
+        prompt_tokens = _count_prompt_tokens(request.rendered_payload)
+        stats["requests"] += 1
+        stats["peak"] = max(stats["peak"], prompt_tokens)
+        stats["overflows"] += prompt_tokens > args.input_budget
+        await asyncio.sleep(args.llm_latency)
+
+        calls = []
+        if round_no < args.max_tool_rounds and rng.random() < 0.8:
+            for call_no in range(rng.randint(1, 3)):
+                name = rng.choice(list(TOOLS))
+                calls.append(
+                    ToolInvocation(
+                        name=name,
+                        arguments={"path": f"src/m{call_no}.py"},
+                        id=f"call_{stats['requests']}_{call_no}",
+                        turn_id=turn_id,
+                    )
+                )
+        text = "I'll look at the relevant files next. " * rng.randint(1, 8)
+        manager.ingest_assistant_response(CompleteResponse(content=text), turn_id=turn_id, source_event="Sim")
+        for invocation in calls:
+            manager.ingest_tool_intent(invocation)
+        manager.schedule_compaction(prompt_tokens, args.input_budget, request.messages, current_turn_id=turn_id)
+        if not calls:
+            return
+
+        await asyncio.sleep(args.tool_latency)
+        parts = []
+        for invocation in calls:
+            low, high = TOOLS[invocation.name]
+            result = "x" * rng.randint(low, high)
+            manager.ingest_tool_result(
+                ToolResultEvent(
+                    tool_name=invocation.name, result=result, tool_invocation_id=invocation.id, turn_id=turn_id
+                )
+            )
+            parts.append(f"Tool: {invocation.name} (ID: {invocation.id})\nStatus: Success\nResult:\n{result}")
+        results = "The following tool executions have completed.\n\n" + "\n\n---\n\n".join(parts)
+        await llm_call(turn_id, results, round_no + 1)
+
+    for _ in range(args.turns):
+        await asyncio.sleep(args.user_latency)
+        turn_id = manager.start_turn()
+        user_text = "Please continue with the refactoring task. " * rng.randint(1, 10)
+        manager.ingest_user_message(LLMUserMessage(content=user_text), turn_id=turn_id, source_event="Sim")
+        await llm_call(turn_id, user_text)
+    await manager.wait_for_background_compaction()
+    return stats
+
+
+async def main_async(args) -> None:
+    print(
+        f"{args.sessions} sessions x {args.turns} turns, input budget {args.input_budget}, "
+        f"trigger {args.trigger_ratio}, summarizer {args.summarizer_latency * 1000:.0f}ms, "
+        f"tools {args.tool_latency * 1000:.0f}ms"
+    )
+    print(f"{'mode':<11} {'requests':>9} {'compactions':>12} {'peak prompt':>12} {'overflows':>10} {'critical path':>14}")
+    for predictive in (False, True):
+        totals = {"compactions": 0, "peak": 0, "overflows": 0, "critical_path": 0.0, "requests": 0}
+        with tempfile.TemporaryDirectory() as tmp:
+            for seed in range(args.sessions):
+                stats = await run_session(args, seed, predictive, tmp)
+                for key in ("compactions", "overflows", "critical_path", "requests"):
+                    totals[key] += stats[key]
+                totals["peak"] = max(totals["peak"], stats["peak"])
+        mode = "predictive" if predictive else "reactive"
+        print(
+            f"{mode:<11} {totals['requests']:>9} {totals['compactions']:>12} {totals['peak']:>12} "
+            f"{totals['overflows']:>10} {totals['critical_path'] * 1000:>12.0f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compaction scheduling simulation.")
+    parser.add_argument("--sessions", type=int, default=5)
+    parser.add_argument("--turns", type=int, default=30)
+    parser.add_argument("--input-budget", type=int, default=128_000)
+    parser.add_argument("--trigger-ratio", type=float, default=0.8)
+    parser.add_argument("--summarizer-latency", type=float, default=0.2)
+    parser.add_argument("--tool-latency", type=float, default=0.25)
+    parser.add_argument("--llm-latency", type=float, default=0.01)
+    parser.add_argument("--user-latency", type=float, default=0.3, help="Time before each new user message.")
+    parser.add_argument("--max-tool-rounds", type=int, default=6)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark: concurrent write_file-style writes, inline vs the shared atomic write path.
+
+Several coroutines write large files at once while a 5 ms ticker measures how long
+the event loop is stalled. "inline" is the previous behaviour: `open(path, 'w')` on
+the loop. The atomic variants run in a worker thread at each durability level.
+
+Run with: uv run python tests/benchmarks/file_write_benchmark.py --files 16 --size-mb 8
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from autobyteus.utils.atomic_write import FileDurability, atomic_write_text_async
+
+
+async def _inline_write(path: str, content: str) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(content)
+
+
+async def _run(directory: Path, files: int, content: str, writer) -> tuple:
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def probe():
+        nonlocal max_lag
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            max_lag = max(max_lag, time.perf_counter() - started - 0.005)
+
+    probe_task = asyncio.create_task(probe())
+    started = time.perf_counter()
+    await asyncio.gather(*(writer(str(directory / f"file{i}.txt"), content) for i in range(files)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await probe_task
+    return elapsed, max_lag
+
+
+async def main_async(files: int, size_mb: int) -> None:
+    content = ("generated line of source code\n" * (size_mb * 1024 * 1024 // 30))
+    variants = [("inline open/write", _inline_write)]
+    for durability in FileDurability:
+        variants.append((
+            f"atomic, durability={durability.value}",
+            lambda path, text, d=durability: atomic_write_text_async(path, text, durability=d),
+        ))
+
+    print(f"files={files} size={size_mb} MB each")
+    for label, writer in variants:
+        with tempfile.TemporaryDirectory() as tmp:
+            elapsed, max_lag = await _run(Path(tmp), files, content, writer)
+        print(f"  {label:28s} wall {elapsed:7.3f} s   max loop stall {max_lag * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Loop stall and wall clock of concurrent file writes.")
+    parser.add_argument("--files", type=int, default=16, help="Number of files written concurrently.")
+    parser.add_argument("--size-mb", type=int, default=8, help="Size of each file in MB.")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.files, args.size_mb))
+
+
+if __name__ == "__main__":
+    main()
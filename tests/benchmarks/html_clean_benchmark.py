@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cleaning large HTML pages for `read_url`.
+
+Every `*.html` file under `--corpus` is cleaned in TEXT_CONTENT_FOCUSED mode. Each file
+is timed three ways: a BeautifulSoup tree plus `get_text` (what the cleaner used to do),
+the streaming cleaner with no limit, and the streaming cleaner with the default output
+budget. Without `--corpus`, synthetic pages of `--size-mb` are generated. The largest
+page is also cleaned next to a 5 ms ticker, once inline and once through `clean_async`,
+with and without the output budget, to show how long the event loop stalls.
+
+Run with: uv run python tests/benchmarks/html_clean_benchmark.py --corpus ~/saved-pages
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from bs4 import BeautifulSoup
+
+from autobyteus.utils.html_cleaner import (
+    CleaningMode,
+    DEFAULT_HTML_CLEAN_MAX_CHARS,
+    clean_async,
+    clean_bounded,
+    clean_whitespace,
+)
+
+
+def synthetic_page(size_mb: float, seed: int) -> str:
+    rng = random.Random(seed)
+    words = ["agent", "stream", "token", "memory", "cache", "parser", "event", "loop", "tool", "result"]
+    parts = ["<html><head><title>Synthetic</title><style>.x{color:red}</style></head><body>"]
+    size = 0
+    while size < size_mb * 1024 * 1024:
+        sentence = " ".join(rng.choice(words) for _ in range(rng.randint(8, 30)))
+        chunk = (
+            f'<div class="row r{rng.randint(0, 99)}" style="margin:0"><nav><a href="/p/{size}">link</a></nav>'
+            f'<p data-x="{size}">{sentence} <strong>{rng.choice(words)}</strong>.</p>'
+            f"<script>track({size});</script><!-- comment --></div>\n"
+        )
+        parts.append(chunk)
+        size += len(chunk)
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def load_corpus(args) -> List[Tuple[str, str]]:
+    if args.corpus:
+        paths = sorted(Path(args.corpus).expanduser().rglob("*.html"))
+        return [(path.name, path.read_text(encoding="utf-8", errors="replace")) for path in paths]
+    return [(f"synthetic-{i}.html", synthetic_page(args.size_mb, i)) for i in range(args.pages)]
+
+
+def _time(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def tree_text(page: str) -> str:
+    return clean_whitespace(BeautifulSoup(page, "html.parser").get_text(separator=" ", strip=True))
+
+
+async def _max_loop_lag(coro) -> float:
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def probe():
+        nonlocal max_lag
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            max_lag = max(max_lag, time.perf_counter() - started - 0.005)
+
+    probe_task = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+    await coro
+    done.set()
+    await probe_task
+    return max_lag
+
+
+async def _inline(page: str) -> None:
+    clean_bounded(page, CleaningMode.TEXT_CONTENT_FOCUSED)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTML cleaning benchmark.")
+    parser.add_argument("--corpus", help="Directory of saved HTML pages.")
+    parser.add_argument("--pages", type=int, default=3, help="Synthetic pages when no corpus is given.")
+    parser.add_argument("--size-mb", type=float, default=5.0)
+    parser.add_argument("--budget", type=int, default=DEFAULT_HTML_CLEAN_MAX_CHARS)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args)
+    if not corpus:
+        raise SystemExit("No HTML files found.")
+    mode = CleaningMode.TEXT_CONTENT_FOCUSED
+    print(f"{'page':<32} {'size':>9} {'tree':>10} {'stream':>10} {'budget':>10}")
+    for name, page in corpus:
+        tree = _time(lambda: tree_text(page))
+        stream = _time(lambda: clean_bounded(page, mode))
+        budget = _time(lambda: clean_bounded(page, mode, args.budget))
+        assert clean_bounded(page, mode).text == tree_text(page), f"{name}: streaming output differs"
+        print(
+            f"{name[:32]:<32} {len(page) / 1e6:8.2f}M {tree * 1000:8.1f}ms {stream * 1000:8.1f}ms {budget * 1000:8.1f}ms"
+        )
+
+    largest = max((page for _, page in corpus), key=len)
+    inline_lag = asyncio.run(_max_loop_lag(_inline(largest)))
+    async_lag = asyncio.run(_max_loop_lag(clean_async(largest, mode)))
+    budget_lag = asyncio.run(_max_loop_lag(clean_async(largest, mode, args.budget)))
+    print(
+        f"max loop stall on largest page: inline {inline_lag * 1000:.1f}ms, "
+        f"clean_async {async_lag * 1000:.1f}ms, clean_async with budget {budget_lag * 1000:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
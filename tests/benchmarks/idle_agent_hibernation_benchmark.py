@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark: process memory and CPU with many mostly idle agents, with and without hibernation.
+
+`--agents` agents are restored through `AgentFactory.restore_agent` from snapshots of
+`--messages` messages (tool results of `--result-kb` KB), the way a server brings its
+agents back after a restart, in batches of `--batch`. Modes:
+
+- resident: every agent stays in memory once idle (the behaviour without hibernation).
+- hibernate: after each batch is idle, `AgentFactory.hibernate_idle_agents` hibernates it.
+
+After each batch: agents up, RSS (after `gc.collect()` and `malloc_trim`, so freed
+memory shows), live threads, and CPU used over one idle second. At the end, with all
+agents idle for `--idle-seconds`: the same figures plus the footprint reported by
+`AgentFactory.get_memory_footprints()`, by component. Then `--active` agents get a
+message (rehydrating them in hibernate mode), reporting the time until each replied.
+
+The shared agent thread pool is sized to `--agents`: with the default pool
+(min(32, cpus + 4) threads) only that many agents can run at once. Its threads stay
+parked for reuse after agents hibernate, so the thread count does not fall back.
+
+Run with: uv run python tests/benchmarks/idle_agent_hibernation_benchmark.py --agents 1000 --mode hibernate
+"""
+
+import argparse
+import asyncio
+import ctypes
+import gc
+import logging
+import statistics
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import List
+
+from autobyteus.agent.context.agent_config import AgentConfig
+from autobyteus.agent.factory.agent_factory import AgentFactory
+from autobyteus.agent.message.agent_input_user_message import AgentInputUserMessage
+from autobyteus.agent.runtime.agent_thread_pool_manager import AgentThreadPoolManager
+from autobyteus.agent.status.status_enum import AgentStatus
+from autobyteus.llm.base_llm import BaseLLM
+from autobyteus.llm.models import LLMModel
+from autobyteus.llm.providers import LLMProvider
+from autobyteus.llm.runtimes import LLMRuntime
+from autobyteus.llm.utils.llm_config import LLMConfig
+from autobyteus.llm.utils.messages import ToolCallSpec
+from autobyteus.llm.utils.response_types import ChunkResponse, CompleteResponse
+from autobyteus.memory.store.working_context_snapshot_store import WorkingContextSnapshotStore
+from autobyteus.memory.working_context_snapshot import WorkingContextSnapshot
+from autobyteus.memory.working_context_snapshot_serializer import WorkingContextSnapshotSerializer
+
+REPLY = "Done."
+
+
+class BenchLLM(BaseLLM):
+    async def _send_messages_to_llm(self, _messages, **_kwargs):
+        return CompleteResponse(content=REPLY)
+
+    async def _stream_messages_to_llm(self, _messages, **_kwargs):
+        yield ChunkResponse(content=REPLY, is_complete=True)
+
+
+MODEL = LLMModel(
+    name="bench", value="bench", canonical_name="bench",
+    provider=LLMProvider.OPENAI, llm_class=BenchLLM, runtime=LLMRuntime.API,
+)
+
+
+def rss_mb() -> float:
+    gc.collect()
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except OSError:  # pragma: no cover - not glibc
+        pass
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def write_snapshots(tmp: str, agent_ids: List[str], messages: int, result_kb: int) -> None:
+    rows = [{"path": f"src/module_{i}.py", "line": i, "text": "def handler(event): return event"} for i in range(400)]
+    rows = rows[: max(1, result_kb * 1024 // 80)]
+    snapshot = WorkingContextSnapshot()
+    i = 0
+    while len(snapshot.build_messages()) < messages:
+        snapshot.append_user(f"Please look at module {i} and explain the event handling.")
+        snapshot.append_tool_calls([ToolCallSpec(id=f"call_{i}", name="search", arguments={"query": f"handler {i}"})])
+        snapshot.append_tool_result(f"call_{i}", "search", {"matches": rows, "total": len(rows)})
+        snapshot.append_assistant(f"Module {i} dispatches events through a handler table. " * 4)
+        i += 1
+    for agent_id in agent_ids:
+        store = WorkingContextSnapshotStore(base_dir=tmp, agent_id=agent_id)
+        store.write_encoded(agent_id, WorkingContextSnapshotSerializer.encode(snapshot, {"agent_id": agent_id}))
+
+
+async def wait_for(condition, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("condition not met")
+        await asyncio.sleep(0.05)
+
+
+async def idle_cpu_pct(seconds: float) -> float:
+    cpu_before = time.process_time()
+    await asyncio.sleep(seconds)
+    return (time.process_time() - cpu_before) / seconds * 100
+
+
+async def reply_latency(agents) -> List[float]:
+    async def one(agent) -> float:
+        started = time.perf_counter()
+        await agent.post_user_message(AgentInputUserMessage(content="Any news?"))
+        manager = agent.context.state.memory_manager
+        await wait_for(lambda: agent.get_current_status() == AgentStatus.IDLE
+                       and manager.get_working_context_messages()[-2].content == "Any news?", 120)
+        return (time.perf_counter() - started) * 1000
+    return list(await asyncio.gather(*(one(agent) for agent in agents)))
+
+
+async def main_async(args) -> None:
+    AgentThreadPoolManager(max_workers=args.agents + 8)
+    factory = AgentFactory()
+    agent_ids = [f"bench_agent_{n:04d}" for n in range(args.agents)]
+    print(f"mode {args.mode}: {args.agents} agents x {args.messages} messages, batches of {args.batch}")
+    print(f"{'agents':>6} {'up in':>7} {'rss':>8} {'threads':>8} {'idle cpu':>9}")
+    print(f"{0:>6} {'':>7} {rss_mb():>6.0f}MB {threading.active_count():>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        write_snapshots(tmp, agent_ids, args.messages, args.result_kb)
+        agents = []
+        started = time.perf_counter()
+        for offset in range(0, args.agents, args.batch):
+            batch_started = time.perf_counter()
+            batch = []
+            for agent_id in agent_ids[offset:offset + args.batch]:
+                config = AgentConfig(
+                    name="Bench", role="idle", description="idle agent",
+                    llm_instance=BenchLLM(MODEL, LLMConfig()), tools=[],
+                )
+                agent = factory.restore_agent(agent_id, config, memory_dir=tmp)
+                agent.start()
+                batch.append(agent)
+            await wait_for(lambda: all(a.get_current_status() == AgentStatus.IDLE for a in batch), 1800)
+            if args.mode == "hibernate":
+                await factory.hibernate_idle_agents(idle_seconds=0)
+            agents.extend(batch)
+            print(f"{len(agents):>6} {time.perf_counter() - batch_started:>6.1f}s {rss_mb():>6.0f}MB "
+                  f"{threading.active_count():>8} {await idle_cpu_pct(1.0):>8.1f}%", flush=True)
+        print(f"all {len(agents)} agents up in {time.perf_counter() - started:.1f}s")
+
+        cpu_pct = await idle_cpu_pct(args.idle_seconds)
+        started = time.perf_counter()
+        footprints = factory.get_memory_footprints()
+        measure_ms = (time.perf_counter() - started) * 1000
+        by_component: Counter = Counter()
+        for footprint in footprints.values():
+            by_component.update(footprint.components)
+        print(f"idle {args.idle_seconds:.0f}s: rss {rss_mb():.0f}MB, threads {threading.active_count()}, "
+              f"cpu {cpu_pct:.1f}%, resident agents {len(footprints)}")
+        print(f"footprint {sum(by_component.values()) / 1e6:.1f}MB (measured in {measure_ms:.0f}ms): "
+              + ", ".join(f"{key} {value / 1e6:.1f}" for key, value in by_component.items()))
+
+        latencies = await reply_latency(agents[-args.active:])
+        print(f"reply from {len(latencies)} {'hibernated' if args.mode == 'hibernate' else 'resident'} agents: "
+              f"median {statistics.median(latencies):.0f}ms, max {max(latencies):.0f}ms")
+
+        await asyncio.gather(*(factory.remove_agent(agent_id, shutdown_timeout=60) for agent_id in agent_ids))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Idle agent hibernation benchmark.")
+    parser.add_argument("--agents", type=int, default=1000)
+    parser.add_argument("--mode", choices=("resident", "hibernate"), default="hibernate")
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--active", type=int, default=10, help="Agents messaged at the end.")
+    parser.add_argument("--messages", type=int, default=60)
+    parser.add_argument("--result-kb", type=int, default=4)
+    parser.add_argument("--idle-seconds", type=float, default=5.0)
+    parser.add_argument("--log-level", type=str, default="ERROR")
+    args = parser.parse_args()
+    logging.basicConfig(level=args.log_level.upper(), format="%(message)s")
+    logging.getLogger().setLevel(args.log_level.upper())
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: prompt render time for a conversation history that carries images.
+
+Builds a history of `--images` user turns, each attaching one image file, and renders
+it repeatedly with `OpenAIChatRenderer`, the way every LLM call re-renders the whole
+working context. The first render is cold (every image is read and encoded); later
+renders hit the media encoding cache. `--no-cache` clears the cache before every
+render to show the uncached cost.
+
+Run with: uv run python tests/benchmarks/media_render_benchmark.py --images 20 --size-kb 512
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from autobyteus.llm.prompt_renderers.openai_chat_renderer import OpenAIChatRenderer
+from autobyteus.llm.utils.media_encoding_cache import get_media_encoding_cache
+from autobyteus.llm.utils.messages import Message, MessageRole
+
+
+def build_history(image_dir: Path, images: int, size_kb: int) -> List[Message]:
+    messages = [Message(MessageRole.SYSTEM, content="You review screenshots.")]
+    for index in range(images):
+        path = image_dir / f"screenshot_{index}.png"
+        path.write_bytes(os.urandom(size_kb * 1024))
+        messages.append(Message(MessageRole.USER, content=f"Screenshot {index}", image_urls=[str(path)]))
+        messages.append(Message(MessageRole.ASSISTANT, content=f"Noted screenshot {index}."))
+    return messages
+
+
+async def run_benchmark(images: int, size_kb: int, renders: int, use_cache: bool) -> None:
+    renderer = OpenAIChatRenderer()
+    cache = get_media_encoding_cache()
+    cache.clear()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        messages = build_history(Path(tmp), images, size_kb)
+        timings = []
+        for _ in range(renders):
+            if not use_cache:
+                cache.clear()
+            started = time.perf_counter()
+            await renderer.render(messages)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    print(f"images={images} size={size_kb}KB renders={renders} cache={'on' if use_cache else 'off'}")
+    print(f"  cold render:   {timings[0]:8.2f} ms")
+    if len(timings) > 1:
+        warm = timings[1:]
+        print(f"  warm median:   {statistics.median(warm):8.2f} ms")
+        print(f"  warm max:      {max(warm):8.2f} ms")
+    print(f"  cache hits={cache.hits} misses={cache.misses} memory={cache.memory_bytes / 1024 / 1024:.1f}MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render time for an image-heavy conversation history.")
+    parser.add_argument("--images", type=int, default=20, help="Images in the history.")
+    parser.add_argument("--size-kb", type=int, default=512, help="Size of each image file in KB.")
+    parser.add_argument("--renders", type=int, default=10, help="Number of consecutive renders.")
+    parser.add_argument("--no-cache", action="store_true", help="Clear the media cache before each render.")
+    args = parser.parse_args()
+    asyncio.run(run_benchmark(args.images, args.size_kb, args.renders, not args.no_cache))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory item ids at a high ingest rate.
+
+1. Generation: `--ids` ids from each scheme, in a tight loop:
+   - legacy: `f"rt_{int(time.time() * 1000)}"`, as MemoryManager built them before;
+   - uuid4: as the event stores minted event ids;
+   - monotonic: `MonotonicIdGenerator.next_id`.
+   Reported: cost per id, duplicate ids, and whether generation order is id order.
+
+2. Ingest: raw traces are created at `--rate` items/sec (batches every 10ms) for
+   `--seconds` and added to a FileMemoryStore in batches. Reported: the achieved rate,
+   duplicate ids, and whether store order is id order.
+
+Run with: uv run python tests/benchmarks/memory_id_benchmark.py --rate 100000 --seconds 3
+"""
+
+import argparse
+import tempfile
+import time
+import uuid
+
+from autobyteus.memory.models.memory_types import MemoryType
+from autobyteus.memory.models.raw_trace_item import RawTraceItem
+from autobyteus.memory.store.file_store import FileMemoryStore
+from autobyteus.utils.monotonic_id import MonotonicIdGenerator
+
+
+def generation(count: int) -> None:
+    generator = MonotonicIdGenerator()
+    schemes = {
+        "legacy": lambda: f"rt_{int(time.time() * 1000)}",
+        "uuid4": lambda: str(uuid.uuid4()),
+        "monotonic": lambda: generator.next_id("rt_"),
+    }
+    print(f"{'scheme':<10} {'ns/id':>7} {'duplicates':>11} {'sorted':>7}")
+    for name, make in schemes.items():
+        started = time.perf_counter()
+        ids = [make() for _ in range(count)]
+        ns = (time.perf_counter() - started) / count * 1e9
+        print(f"{name:<10} {ns:7.0f} {count - len(set(ids)):>11} {str(ids == sorted(ids)):>7}")
+
+
+def ingest(rate: int, seconds: float) -> None:
+    generator = MonotonicIdGenerator()
+    batch = max(1, rate // 100)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FileMemoryStore(base_dir=tmp, agent_id="bench")
+        started = time.perf_counter()
+        created = 0
+        while created < rate * seconds:
+            items = [
+                RawTraceItem(
+                    id=generator.next_id("rt_"), ts=time.time(), turn_id=f"turn_{created // 1000:05d}",
+                    seq=i + 1, trace_type="assistant", content="ok", source_event="benchmark",
+                )
+                for i in range(batch)
+            ]
+            store.add(items)
+            created += batch
+            delay = started + created / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        achieved = created / (time.perf_counter() - started)
+
+        ids = [trace.id for trace in store.list(MemoryType.RAW_TRACE)]
+
+    print(f"ingest: target {rate}/s, achieved {achieved:.0f}/s, {len(ids)} traces, "
+          f"{len(ids) - len(set(ids))} duplicate ids, store order is id order: {ids == sorted(ids)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Memory id generation and ingest benchmark.")
+    parser.add_argument("--ids", type=int, default=1_000_000)
+    parser.add_argument("--rate", type=int, default=100_000)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    generation(args.ids)
+    ingest(args.rate, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: FileMemoryStore (JSONL) vs SqliteMemoryStore.
+
+`--agents` agents each record `--turns` turns of `--traces-per-turn` raw traces, one
+`add` per trace, the way MemoryManager ingests them. Reported per backend:
+
+- write: traces per second for single-trace adds, and for one batched add per turn.
+- list: latency of `list(RAW_TRACE)` and `list(EPISODIC, limit=3)` for one agent.
+- cross-agent: latency of finding one turn across every agent (the file store has to
+  read each agent's raw trace file).
+
+Run with: uv run python tests/benchmarks/memory_store_benchmark.py --agents 24 --turns 200
+"""
+
+import argparse
+import tempfile
+import time
+from typing import Callable, List
+
+from autobyteus.memory.models.episodic_item import EpisodicItem
+from autobyteus.memory.models.memory_types import MemoryType
+from autobyteus.memory.models.raw_trace_item import RawTraceItem
+from autobyteus.memory.store.file_store import FileMemoryStore
+from autobyteus.memory.store.sqlite_store import SqliteMemoryStore
+
+
+def _traces(agent_no: int, turn_no: int, per_turn: int) -> List[RawTraceItem]:
+    turn_id = f"turn_{turn_no:04d}"
+    return [
+        RawTraceItem(
+            id=f"rt_{agent_no}_{turn_id}_{seq}", ts=time.time(), turn_id=turn_id, seq=seq,
+            trace_type="user" if seq == 1 else "assistant",
+            content=f"agent {agent_no} turn {turn_no} trace {seq} " * 8, source_event="benchmark",
+        )
+        for seq in range(1, per_turn + 1)
+    ]
+
+
+def _median_ms(fn: Callable[[], object], repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return sorted(samples)[len(samples) // 2] * 1000
+
+
+def run(name: str, make_store: Callable[[str, str], object], args) -> None:
+    total = args.agents * args.turns * args.traces_per_turn
+    with tempfile.TemporaryDirectory() as tmp:
+        stores = [make_store(tmp, f"agent_{agent_no:03d}") for agent_no in range(args.agents)]
+        started = time.perf_counter()
+        for turn_no in range(1, args.turns + 1):
+            for agent_no, store in enumerate(stores):
+                for trace in _traces(agent_no, turn_no, args.traces_per_turn):
+                    store.add([trace])
+        single = total / (time.perf_counter() - started)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        batched_stores = [make_store(tmp, f"agent_{agent_no:03d}") for agent_no in range(args.agents)]
+        started = time.perf_counter()
+        for turn_no in range(1, args.turns + 1):
+            for agent_no, store in enumerate(batched_stores):
+                store.add(_traces(agent_no, turn_no, args.traces_per_turn))
+        batched = total / (time.perf_counter() - started)
+        for agent_no, store in enumerate(batched_stores):
+            store.add([EpisodicItem(id=f"ep_{agent_no}_{i}", ts=time.time(), turn_ids=[], summary="s" * 200)
+                       for i in range(20)])
+
+        probe = batched_stores[0]
+        list_raw = _median_ms(lambda: probe.list(MemoryType.RAW_TRACE))
+        list_episodic = _median_ms(lambda: probe.list(MemoryType.EPISODIC, limit=3))
+        wanted = f"turn_{args.turns // 2:04d}"
+        if isinstance(probe, SqliteMemoryStore):
+            cross = _median_ms(lambda: probe.query(MemoryType.RAW_TRACE, turn_ids=[wanted]))
+        else:
+            cross = _median_ms(lambda: [
+                record for store in batched_stores for record in store.list_raw_trace_dicts()
+                if record["turn_id"] == wanted
+            ])
+
+    print(
+        f"{name:<7} single {single:9.0f} tr/s  batched {batched:9.0f} tr/s  "
+        f"list raw {list_raw:7.2f}ms  list episodic {list_episodic:6.2f}ms  cross-agent turn {cross:7.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Memory store backend benchmark.")
+    parser.add_argument("--agents", type=int, default=24)
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--traces-per-turn", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{args.agents} agents x {args.turns} turns x {args.traces_per_turn} traces")
+    run("file", lambda base, agent: FileMemoryStore(base_dir=base, agent_id=agent), args)
+    run("sqlite", lambda base, agent: SqliteMemoryStore(base_dir=base, agent_id=agent), args)
+
+
+if __name__ == "__main__":
+    main()
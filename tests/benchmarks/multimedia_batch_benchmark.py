@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sequential generate_image calls vs one generate_images batch call.
+
+Uses a local stub provider with artificial per-image latency, so only orchestration
+is measured. The sequential baseline calls `GenerateImageTool` once per image, as an
+agent does when it issues one tool turn per image. The LLM round trip between those
+turns is not included, so the real-world gap is larger than shown.
+
+Run with: uv run python tests/benchmarks/multimedia_batch_benchmark.py --images 12 --latency 0.5 --concurrency 4
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from autobyteus.multimedia.providers import MultimediaProvider
+from autobyteus.multimedia.utils.batch_generation import ENV_MAX_CONCURRENCY, ProviderConcurrencyLimiter
+from autobyteus.multimedia.utils.response_types import ImageGenerationResponse
+from autobyteus.tools.multimedia import image_tools
+from autobyteus.tools.multimedia.image_tools import GenerateImageBatchTool, GenerateImageTool
+
+
+class StubImageClient:
+    def __init__(self, latency: float):
+        self.model = SimpleNamespace(provider=MultimediaProvider.OPENAI)
+        self.latency = latency
+
+    async def generate_image(self, prompt, input_image_urls=None, generation_config=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        output_dir = Path(kwargs["output_dir"])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path = output_dir / f"stub-{prompt}.png"
+        path.write_bytes(b"\x89PNG" + prompt.encode("utf-8"))
+        return ImageGenerationResponse(image_urls=[str(path)])
+
+    async def cleanup(self):
+        pass
+
+
+async def run_benchmark(images: int, latency: float) -> None:
+    client = StubImageClient(latency)
+    image_tools._SharedImageClientManager.get_client = classmethod(lambda cls, agent_id, model: client)
+    # The batch tool creates a client per item.
+    image_tools.image_client_factory.create_image_client = lambda model_identifier: StubImageClient(latency)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = SimpleNamespace(get_base_path=lambda: tmp)
+        context = SimpleNamespace(agent_id="bench-agent", workspace=workspace)
+
+        single = GenerateImageTool()
+        started = time.perf_counter()
+        for i in range(images):
+            await single._execute(context, prompt=f"seq{i}", output_file_path=f"sequential/frame{i}.png")
+        sequential = time.perf_counter() - started
+
+        batch = GenerateImageBatchTool()
+        items = [{"prompt": f"batch{i}", "output_file_path": f"batch/frame{i}.png"} for i in range(images)]
+        started = time.perf_counter()
+        result = await batch._execute(context, items=items)
+        batched = time.perf_counter() - started
+
+    print(f"images={images} latency={latency}s cap={os.getenv(ENV_MAX_CONCURRENCY, '4')}")
+    print(f"  sequential tool calls: {sequential:7.2f} s")
+    print(f"  batch tool call:       {batched:7.2f} s  ({result['succeeded']}/{result['total']} ok)")
+    print(f"  speedup:               {sequential / batched:7.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sequential vs batch image generation wall clock.")
+    parser.add_argument("--images", type=int, default=12, help="Number of images to generate.")
+    parser.add_argument("--latency", type=float, default=0.5, help="Stub provider latency per image, seconds.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Provider concurrency cap.")
+    args = parser.parse_args()
+    os.environ[ENV_MAX_CONCURRENCY] = str(args.concurrency)
+    ProviderConcurrencyLimiter.reset()
+    asyncio.run(run_benchmark(args.images, args.latency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: applying a unified diff with stale line numbers to a large file.
+
+The patch was made against the file before `--shift` lines were inserted at the top,
+so every hunk sits `--shift` lines below its header. It is applied with a whole-file
+fuzz window through `apply_unified_diff`, once by scanning candidate positions one by
+one and once through the line index. The async variant is also run
+next to a 5 ms ticker to show how long the event loop is stalled.
+
+Run with: uv run python tests/benchmarks/patch_apply_benchmark.py --lines 200000 --hunks 50
+"""
+
+import argparse
+import asyncio
+import time
+from unittest import mock
+
+from autobyteus.utils import diff_utils
+from autobyteus.utils.diff_utils import apply_unified_diff, apply_unified_diff_async
+
+
+def build_case(lines: int, hunks: int, shift: int) -> tuple:
+    body = [f"    value_{i} = compute({i % 97}, scale={i % 13})\n" for i in range(lines)]
+    original = [f"# inserted header line {i}\n" for i in range(shift)] + body
+    patch = ["--- a/big.py\n", "+++ b/big.py\n"]
+    step = lines // (hunks + 1)
+    for hunk in range(1, hunks + 1):
+        start = hunk * step  # 0-based index into the unshifted body
+        patch.append(f"@@ -{start + 1},4 +{start + 1},4 @@\n")
+        patch.append(" " + body[start])
+        patch.append(" " + body[start + 1])
+        patch.append("-" + body[start + 2])
+        patch.append("+" + body[start + 2].replace("compute", "compute_fast"))
+        patch.append(" " + body[start + 3])
+    return original, "".join(patch)
+
+
+def _time(label: str, fn) -> float:
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<12} {elapsed * 1000:10.1f}ms")
+    return result
+
+
+async def _max_loop_lag(coro) -> float:
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def probe():
+        nonlocal max_lag
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            max_lag = max(max_lag, time.perf_counter() - started - 0.005)
+
+    probe_task = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+    await coro
+    done.set()
+    await probe_task
+    return max_lag
+
+
+async def _inline(original, patch, fuzz) -> None:
+    apply_unified_diff(original, patch, fuzz_factor=fuzz)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Unified diff application benchmark.")
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--hunks", type=int, default=50)
+    parser.add_argument("--shift", type=int, default=5_000, help="Lines inserted since the patch was made.")
+    args = parser.parse_args()
+
+    original, patch = build_case(args.lines, args.hunks, args.shift)
+    fuzz = len(original)
+    print(f"{len(original)} lines, {args.hunks} hunks, line numbers stale by {args.shift}")
+
+    with mock.patch.object(diff_utils, "_SCAN_MAX_FUZZ", fuzz):
+        scanned = _time("scan", lambda: apply_unified_diff(original, patch, fuzz_factor=fuzz))
+    indexed = _time("indexed", lambda: apply_unified_diff(original, patch, fuzz_factor=fuzz))
+    assert scanned == indexed
+
+    inline_lag = asyncio.run(_max_loop_lag(_inline(original, patch, fuzz)))
+    async_lag = asyncio.run(_max_loop_lag(apply_unified_diff_async(original, patch, fuzz_factor=fuzz)))
+    print(f"max loop stall: inline {inline_lag * 1000:.1f}ms, async {async_lag * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: paging through a large log with read_file-style line windows.
+
+"full scan" is the previous behaviour: open the file in text mode and enumerate it up
+to the requested window on every call. "indexed" builds a `FileLineIndex` once (timed
+separately) and then slices each window out of an mmap.
+
+Run with: uv run python tests/benchmarks/read_file_paging_benchmark.py --size-mb 1024 --pages 200
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from autobyteus.utils.file_line_index import FileLineIndexCache, read_line_range
+
+
+def write_log(path: str, size_mb: int) -> int:
+    target = size_mb * 1024 * 1024
+    written = 0
+    lines = 0
+    with open(path, "w", encoding="utf-8") as handle:
+        while written < target:
+            batch = "".join(
+                f"2026-10-18T12:{(lines + i) // 60 % 60:02d}:{(lines + i) % 60:02d}Z INFO worker-{(lines + i) % 16} "
+                f"processed request id={lines + i} status=200 latency_ms={(lines + i) * 7 % 900}\n"
+                for i in range(10_000)
+            )
+            handle.write(batch)
+            written += len(batch)
+            lines += 10_000
+    return lines
+
+
+def full_scan(path: str, start_line: int, end_line: int) -> str:
+    selected = []
+    with open(path, "r", encoding="utf-8") as handle:
+        for line_no, line in enumerate(handle, start=1):
+            if line_no < start_line:
+                continue
+            if line_no > end_line:
+                break
+            selected.append(line)
+    return "".join(selected)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="read_file paging benchmark.")
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--pages", type=int, default=200, help="Indexed window reads.")
+    parser.add_argument("--baseline-pages", type=int, default=3, help="Full-scan window reads (slow).")
+    parser.add_argument("--window", type=int, default=200, help="Lines per page.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="read_file_bench_") as directory:
+        path = os.path.join(directory, "app.log")
+        total_lines = write_log(path, args.size_mb)
+        print(f"{os.path.getsize(path) / 1024 / 1024:.0f} MB log, {total_lines} lines, {args.window}-line windows")
+        rng = random.Random(0)
+        starts = [rng.randint(1, total_lines - args.window) for _ in range(max(args.pages, args.baseline_pages))]
+
+        scan_times = []
+        for start in starts[:args.baseline_pages]:
+            began = time.perf_counter()
+            expected = full_scan(path, start, start + args.window - 1)
+            scan_times.append(time.perf_counter() - began)
+
+        cache = FileLineIndexCache()
+        began = time.perf_counter()
+        cache.get(path)
+        build_time = time.perf_counter() - began
+
+        page_times = []
+        for start in starts[:args.pages]:
+            began = time.perf_counter()
+            result = read_line_range(path, start, start + args.window - 1, max_bytes=0, cache=cache)
+            page_times.append(time.perf_counter() - began)
+        assert result.text == full_scan(path, starts[args.pages - 1], starts[args.pages - 1] + args.window - 1)
+        assert expected
+
+        print(f"full scan   mean {statistics.mean(scan_times) * 1000:9.1f}ms per page")
+        print(f"index build      {build_time * 1000:9.1f}ms (once per file version)")
+        print(f"indexed     mean {statistics.mean(page_times) * 1000:9.3f}ms per page"
+              f"  p99 {sorted(page_times)[int(len(page_times) * 0.99) - 1] * 1000:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: restoring the working context of many agents at server start.
+
+`--agents` snapshots are written with `WorkingContextSnapshotSerializer.encode`. Each
+has `--messages` messages, with tool results of `--result-kb` KB. Each strategy then
+restores every agent through WorkingContextSnapshotBootstrapper:
+
+- load: the whole file via `store.read` (`json.load`), then every message deserialized
+  (the only path before streaming restore).
+- stream: `decode_stream`, with messages over 4 KB left encoded until first use.
+- stream-parallel: as stream, with every agent's restore started at once in worker
+  threads, the way the restore bootstrap step now runs it.
+
+Reported: wall time until every agent is restored, the cost of then rendering one
+agent's request (which decodes its deferred messages), the peak traced Python heap
+during restore, and the heap retained by the restored contexts.
+
+Run with: uv run python tests/benchmarks/snapshot_restore_benchmark.py --agents 200 --messages 200
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from unittest.mock import MagicMock
+
+from autobyteus.llm.prompt_renderers.openai_chat_renderer import OpenAIChatRenderer
+from autobyteus.llm.utils.messages import ToolCallSpec
+from autobyteus.memory.restore.working_context_snapshot_bootstrapper import (
+    WorkingContextSnapshotBootstrapOptions,
+    WorkingContextSnapshotBootstrapper,
+)
+from autobyteus.memory.store.working_context_snapshot_store import WorkingContextSnapshotStore
+from autobyteus.memory.working_context_snapshot import WorkingContextSnapshot
+from autobyteus.memory.working_context_snapshot_serializer import WorkingContextSnapshotSerializer
+
+
+def write_snapshots(tmp: str, agents: int, messages: int, result_kb: int) -> None:
+    rows = [{"path": f"src/module_{i}.py", "line": i, "text": "def handler(event): return event"} for i in range(200)]
+    rows = rows[: max(1, result_kb * 1024 // 80)]
+    for agent_no in range(agents):
+        agent_id = f"agent_{agent_no:03d}"
+        snapshot = WorkingContextSnapshot()
+        i = 0
+        while len(snapshot.build_messages()) < messages:
+            snapshot.append_user(f"Please look at module {i} and explain the event handling.")
+            snapshot.append_tool_calls([ToolCallSpec(id=f"call_{i}", name="search", arguments={"query": f"handler {i}"})])
+            snapshot.append_tool_result(f"call_{i}", "search", {"matches": rows, "total": len(rows)})
+            snapshot.append_assistant(f"Module {i} dispatches events through a handler table. " * 4)
+            i += 1
+        store = WorkingContextSnapshotStore(base_dir=tmp, agent_id=agent_id)
+        store.write_encoded(agent_id, WorkingContextSnapshotSerializer.encode(snapshot, {"agent_id": agent_id}))
+
+
+class _LoadWholeStore(WorkingContextSnapshotStore):
+    """A store without streaming reads, so the bootstrapper loads the whole document."""
+    open_binary = None
+
+
+def _manager(store: WorkingContextSnapshotStore) -> MagicMock:
+    manager = MagicMock()
+    manager.working_context_snapshot_store = store
+    manager.restored = None
+    manager.reset_working_context_snapshot.side_effect = lambda messages: setattr(manager, "restored", messages)
+    return manager
+
+
+async def restore_all(tmp: str, agents: int, strategy: str) -> list:
+    store_class = _LoadWholeStore if strategy == "load" else WorkingContextSnapshotStore
+    managers = [_manager(store_class(base_dir=tmp, agent_id=f"agent_{n:03d}")) for n in range(agents)]
+    bootstrapper = WorkingContextSnapshotBootstrapper()
+    options = WorkingContextSnapshotBootstrapOptions()
+    if strategy == "stream-parallel":
+        await asyncio.gather(
+            *(asyncio.to_thread(bootstrapper.bootstrap, manager, "System", options) for manager in managers)
+        )
+    else:
+        for manager in managers:
+            bootstrapper.bootstrap(manager, "System", options)
+    return [manager.restored for manager in managers]
+
+
+async def main_async(args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        write_snapshots(tmp, args.agents, args.messages, args.result_kb)
+        size = WorkingContextSnapshotStore(tmp, "agent_000")._get_path("agent_000").stat().st_size
+        print(f"{args.agents} agents x {args.messages} messages ({size / 1e6:.1f} MB snapshot each)")
+        print(f"{'strategy':<16} {'restore all':>12} {'first render':>13} {'peak heap':>10} {'retained':>9}")
+        renderer = OpenAIChatRenderer()
+        for strategy in ("load", "stream", "stream-parallel"):
+            started = time.perf_counter()
+            restored = await restore_all(tmp, args.agents, strategy)
+            restore_s = time.perf_counter() - started
+            started = time.perf_counter()
+            await renderer.render(restored[0])
+            render_ms = (time.perf_counter() - started) * 1000
+            del restored
+
+            tracemalloc.start()
+            restored = await restore_all(tmp, args.agents, strategy)
+            retained, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del restored
+            print(
+                f"{strategy:<16} {restore_s * 1000:>10.0f}ms {render_ms:>11.1f}ms "
+                f"{peak / 1e6:>8.0f}MB {retained / 1e6:>7.0f}MB"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Working context restore benchmark.")
+    parser.add_argument("--agents", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--result-kb", type=int, default=8)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
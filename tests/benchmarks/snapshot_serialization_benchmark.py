@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark: persisting a large working context snapshot.
+
+A snapshot of `--messages` messages is built: user and assistant turns, plus tool calls
+whose results are `--result-kb` KB JSON documents. Each strategy is timed for a cold
+persist (every message encoded) and for the steady state (one message appended since
+the last persist, which is what happens after every turn):
+
+- dict+json.dump: `serialize` (which test-encodes every tool value) then `json.dump`,
+  as MemoryManager persisted before.
+- encode[json] / encode[orjson]: `WorkingContextSnapshotSerializer.encode` with the
+  per-message fragment cache, then `write_encoded`.
+
+Run with: uv run python tests/benchmarks/snapshot_serialization_benchmark.py --messages 5000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+
+from autobyteus.llm.utils.messages import ToolCallSpec
+from autobyteus.memory.store.working_context_snapshot_store import WorkingContextSnapshotStore
+from autobyteus.memory.working_context_snapshot import WorkingContextSnapshot
+from autobyteus.memory.working_context_snapshot_serializer import WorkingContextSnapshotSerializer
+from autobyteus.utils.json_codec import orjson
+
+
+def build_snapshot(messages: int, result_kb: int) -> WorkingContextSnapshot:
+    snapshot = WorkingContextSnapshot()
+    rows = [{"path": f"src/module_{i}.py", "line": i, "text": "def handler(event): return event"} for i in range(200)]
+    while len(rows) * 60 > result_kb * 1024 and len(rows) > 1:
+        rows.pop()
+    i = 0
+    while len(snapshot.build_messages()) < messages:
+        snapshot.append_user(f"Please look at module {i} and explain the event handling. " * 3)
+        snapshot.append_tool_calls([ToolCallSpec(id=f"call_{i}", name="search", arguments={"query": f"handler {i}"})])
+        snapshot.append_tool_result(f"call_{i}", "search", {"matches": rows, "total": len(rows)})
+        snapshot.append_assistant(f"Module {i} dispatches events through a handler table. " * 6)
+        i += 1
+    return snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Working context snapshot serialization benchmark.")
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--result-kb", type=int, default=8)
+    parser.add_argument("--persists", type=int, default=20, help="Steady-state persists to average.")
+    args = parser.parse_args()
+
+    metadata = {"schema_version": 1, "agent_id": "bench"}
+    print(f"{args.messages} messages, {args.result_kb} KB tool results")
+    print(f"{'strategy':<16} {'cold':>9} {'steady':>9} {'size':>9} {'cold MB/s':>10}")
+    backends = ["json"] + (["orjson"] if orjson is not None else [])
+    for name in ["dict+json.dump"] + [f"encode[{backend}]" for backend in backends]:
+        snapshot = build_snapshot(args.messages, args.result_kb)
+        with tempfile.TemporaryDirectory() as tmp:
+            store = WorkingContextSnapshotStore(base_dir=tmp, agent_id="bench")
+
+            def persist() -> None:
+                if name == "dict+json.dump":
+                    store.write("bench", WorkingContextSnapshotSerializer.serialize(snapshot, metadata))
+                else:
+                    backend = name[len("encode["):-1]
+                    store.write_encoded("bench", WorkingContextSnapshotSerializer.encode(snapshot, metadata, backend))
+
+            started = time.perf_counter()
+            persist()
+            cold = time.perf_counter() - started
+            size = store._get_path("bench").stat().st_size
+
+            started = time.perf_counter()
+            for turn in range(args.persists):
+                snapshot.append_user(f"follow-up {turn}")
+                persist()
+            steady = (time.perf_counter() - started) / args.persists
+            assert len(json.loads(store._get_path("bench").read_bytes())["messages"]) == len(snapshot.build_messages())
+
+        print(f"{name:<16} {cold * 1000:7.1f}ms {steady * 1000:7.1f}ms {size / 1e6:7.1f}MB {size / 1e6 / cold:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
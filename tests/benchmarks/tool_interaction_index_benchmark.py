@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark: tool interaction queries on an agent with a long tool history.
+
+An agent records `--tool-calls` tool calls (intent + result, `--calls-per-turn` per
+turn) through MemoryManager on a FileMemoryStore. Then, per strategy:
+
+- scan: `build_tool_interactions` over `store.list(RAW_TRACE)` on every query (what
+  `get_tool_interactions` did before).
+- index: the incremental ToolInteractionIndex kept by MemoryManager.
+
+Reported: latency of a per-turn query and of an all-interactions query, the ingest
+cost per tool call, and the restore cost (a fresh MemoryManager's first query).
+
+Run with: uv run python tests/benchmarks/tool_interaction_index_benchmark.py --tool-calls 20000
+"""
+
+import argparse
+import tempfile
+import time
+
+from autobyteus.agent.events.agent_events import ToolResultEvent
+from autobyteus.agent.tool_invocation import ToolInvocation
+from autobyteus.memory.memory_manager import MemoryManager
+from autobyteus.memory.models.memory_types import MemoryType
+from autobyteus.memory.models.raw_trace_item import RawTraceItem
+from autobyteus.memory.store.file_store import FileMemoryStore
+from autobyteus.memory.tool_interaction_builder import build_tool_interactions
+
+
+def scan(store: FileMemoryStore, turn_id=None):
+    raw_items = [item for item in store.list(MemoryType.RAW_TRACE) if isinstance(item, RawTraceItem)]
+    if turn_id:
+        raw_items = [item for item in raw_items if item.turn_id == turn_id]
+    return build_tool_interactions(raw_items)
+
+
+def _median_ms(fn, repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return sorted(samples)[len(samples) // 2] * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tool interaction index benchmark.")
+    parser.add_argument("--tool-calls", type=int, default=20_000)
+    parser.add_argument("--calls-per-turn", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = FileMemoryStore(base_dir=tmp, agent_id="bench")
+        manager = MemoryManager(store=store)
+        started = time.perf_counter()
+        for call_no in range(args.tool_calls):
+            turn_id = f"turn_{call_no // args.calls_per_turn + 1:04d}"
+            call_id = f"call_{call_no}"
+            manager.ingest_tool_intent(
+                ToolInvocation(name="read_file", arguments={"path": f"src/m{call_no}.py"}, id=call_id, turn_id=turn_id)
+            )
+            manager.ingest_tool_result(
+                ToolResultEvent(tool_name="read_file", result="x" * 400, tool_invocation_id=call_id, turn_id=turn_id)
+            )
+        ingest_us = (time.perf_counter() - started) / args.tool_calls * 1e6
+        last_turn = f"turn_{(args.tool_calls - 1) // args.calls_per_turn + 1:04d}"
+
+        assert len(manager.get_tool_interactions()) == len(scan(store)) == args.tool_calls
+        scan_turn = _median_ms(lambda: scan(store, last_turn))
+        scan_all = _median_ms(lambda: scan(store))
+        index_turn = _median_ms(lambda: manager.get_tool_interactions(last_turn))
+        index_all = _median_ms(lambda: manager.get_tool_interactions())
+        restore_log = _median_ms(lambda: MemoryManager(store=FileMemoryStore(base_dir=tmp, agent_id="bench"))
+                                 .get_tool_interactions(last_turn))
+
+    print(f"{args.tool_calls} tool calls, ingest {ingest_us:.0f}us per call (intent + result, index maintained)")
+    print(f"{'strategy':<8} {'turn query':>11} {'all query':>10} {'restore':>9}")
+    print(f"{'scan':<8} {scan_turn:9.1f}ms {scan_all:8.1f}ms {scan_turn:7.1f}ms")
+    print(f"{'index':<8} {index_turn:9.3f}ms {index_all:8.1f}ms {restore_log:7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Benchmark: an agent whose tools return very large outputs.
+
+`--calls` tool calls each return `--output-kb` KB of command output. Each result goes
+through the tool result processors the agent factory installs (the size governor when
+enabled, then memory ingest), is aggregated into the continuation message the way
+ToolResultEventHandler does, and the next request is assembled. Per mode:
+
+- ungoverned: results are kept verbatim (the behaviour without the governor).
+- governed: ToolResultSizeGovernor with the default budget spills them.
+
+Reported: prompt tokens of the last request (chars / 4), Python heap retained after
+the run (tracemalloc), and bytes persisted in the memory directory (raw traces and
+working context snapshot, plus spilled payloads).
+
+Run with: uv run python tests/benchmarks/tool_result_governor_benchmark.py --calls 10 --output-kb 2048
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import tempfile
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+
+from autobyteus.agent.events.agent_events import ToolResultEvent
+from autobyteus.agent.llm_request_assembler import LLMRequestAssembler
+from autobyteus.agent.tool_execution_result_processor.memory_ingest_tool_result_processor import (
+    MemoryIngestToolResultProcessor,
+)
+from autobyteus.agent.tool_execution_result_processor.tool_result_size_governor import ToolResultSizeGovernor
+from autobyteus.agent.tool_invocation import ToolInvocation
+from autobyteus.llm.prompt_renderers.openai_chat_renderer import OpenAIChatRenderer
+from autobyteus.memory.memory_manager import MemoryManager
+from autobyteus.memory.store.file_store import FileMemoryStore
+from autobyteus.memory.store.tool_result_spill_store import ToolResultSpillStore
+from autobyteus.memory.store.working_context_snapshot_store import WorkingContextSnapshotStore
+from autobyteus.utils.llm_output_formatter import format_to_clean_string
+
+
+def _command_output(call_no: int, size: int) -> str:
+    lines = []
+    total = 0
+    line_no = 0
+    while total < size:
+        line = f"[{call_no}:{line_no}] building target module_{line_no % 97}.o ... ok ({line_no * 7 % 1000}ms)\n"
+        lines.append(line)
+        total += len(line)
+        line_no += 1
+    return "".join(lines)
+
+
+def _dir_bytes(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+async def run(args, governed: bool, tmp: str) -> dict:
+    agent_id = "governed" if governed else "ungoverned"
+    spill_store = ToolResultSpillStore(base_dir=tmp, agent_id=agent_id)
+    manager = MemoryManager(
+        store=FileMemoryStore(base_dir=tmp, agent_id=agent_id),
+        working_context_snapshot_store=WorkingContextSnapshotStore(base_dir=tmp, agent_id=agent_id),
+        tool_result_spill_store=spill_store,
+    )
+    context = SimpleNamespace(agent_id=agent_id, state=SimpleNamespace(memory_manager=manager, tool_instances={}))
+    processors = ([ToolResultSizeGovernor()] if governed else []) + [MemoryIngestToolResultProcessor()]
+    assembler = LLMRequestAssembler(memory_manager=manager, renderer=OpenAIChatRenderer())
+
+    tracemalloc.start()
+    request = None
+    for call_no in range(args.calls):
+        turn_id = manager.start_turn()
+        call_id = f"call_{call_no}"
+        manager.ingest_tool_intent(ToolInvocation(name="run_bash", arguments={"command": "make"}, id=call_id, turn_id=turn_id))
+        event = ToolResultEvent(
+            tool_name="run_bash",
+            result=_command_output(call_no, args.output_kb * 1024),
+            tool_invocation_id=call_id,
+            turn_id=turn_id,
+        )
+        for processor in processors:
+            event = await processor.process(event, context)
+        message = (
+            "The following tool executions have completed.\n\n"
+            f"Tool: {event.tool_name} (ID: {call_id})\nStatus: Success\nResult:\n{format_to_clean_string(event.result)}"
+        )
+        del event
+        request = await assembler.prepare_request(message, current_turn_id=turn_id, system_prompt="You are an agent.")
+        manager.persist_working_context_snapshot()
+    prompt_tokens = len(json.dumps(request.rendered_payload)) // 4
+    del request
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    agent_dir = Path(tmp) / "agents" / agent_id
+    spilled = _dir_bytes(spill_store.dir) if spill_store.dir.exists() else 0
+    return {
+        "prompt_tokens": prompt_tokens,
+        "retained": retained,
+        "persisted": _dir_bytes(agent_dir) - spilled,
+        "spilled": spilled,
+    }
+
+
+async def main_async(args) -> None:
+    print(f"{args.calls} tool calls x {args.output_kb} KB output")
+    print(f"{'mode':<11} {'prompt tokens':>14} {'heap retained':>14} {'memory files':>13} {'spilled':>9}")
+    for governed in (False, True):
+        with tempfile.TemporaryDirectory() as tmp:
+            stats = await run(args, governed, tmp)
+        mode = "governed" if governed else "ungoverned"
+        print(
+            f"{mode:<11} {stats['prompt_tokens']:>14} {stats['retained'] / 1e6:>12.1f}MB "
+            f"{stats['persisted'] / 1e6:>11.1f}MB {stats['spilled'] / 1e6:>7.1f}MB"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tool result size governor benchmark.")
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--output-kb", type=int, default=2048)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
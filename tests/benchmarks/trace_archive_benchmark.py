@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark: raw trace archive size and lookup latency over a long history.
+
+`--traces` synthetic traces (two per turn, one second apart) are archived in batches
+of `--batch` traces, as compaction would prune them. Two layouts are compared:
+
+- legacy: one `raw_traces_archive.jsonl`, appended to; every lookup reads and filters
+  the whole file (what the file store did before).
+- segmented: `RawTraceArchive`, rotated compressed segments with a turn/time manifest.
+
+Reported: disk size, archiving time, and the latency of a single-turn lookup, a
+one-minute time-range lookup and a full read.
+
+Run with: uv run python tests/benchmarks/trace_archive_benchmark.py --traces 1000000
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from autobyteus.memory.store.raw_trace_archive import RawTraceArchive, resolve_codec
+
+_WORDS = ["agent", "stream", "token", "memory", "cache", "tool", "result", "turn", "plan", "file"]
+
+
+def synthetic_batches(traces: int, batch: int, seed: int = 7) -> Iterator[List[Dict]]:
+    rng = random.Random(seed)
+    records: List[Dict] = []
+    for index in range(traces):
+        turn_no = index // 2 + 1
+        records.append(
+            {
+                "id": f"rt_{index}",
+                "ts": 1_700_000_000.0 + index,
+                "turn_id": f"turn_{turn_no:04d}",
+                "seq": index % 2 + 1,
+                "trace_type": "user" if index % 2 == 0 else "assistant",
+                "content": " ".join(rng.choice(_WORDS) for _ in range(rng.randint(10, 60))),
+                "source_event": "benchmark",
+            }
+        )
+        if len(records) == batch:
+            yield records
+            records = []
+    if records:
+        yield records
+
+
+def _legacy_lookup(path: Path, turn_ids: Optional[set] = None, since=None, until=None) -> List[Dict]:
+    found = []
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            record = json.loads(line)
+            if turn_ids is not None and record["turn_id"] not in turn_ids:
+                continue
+            if since is not None and not since <= record["ts"] <= until:
+                continue
+            found.append(record)
+    return found
+
+
+def _dir_size(path: Path) -> int:
+    return sum(item.stat().st_size for item in path.rglob("*") if item.is_file())
+
+
+def _time(fn):
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Raw trace archive benchmark.")
+    parser.add_argument("--traces", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=2_000)
+    parser.add_argument("--segment-mb", type=float, default=16.0)
+    parser.add_argument("--codec", default=resolve_codec(), choices=["gzip", "zstd"])
+    args = parser.parse_args()
+
+    lookup_turn = f"turn_{args.traces // 4:04d}"
+    since = 1_700_000_000.0 + args.traces // 2
+    until = since + 60
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = Path(tmp) / "raw_traces_archive.jsonl"
+        archive = RawTraceArchive(Path(tmp) / "segmented", segment_bytes=int(args.segment_mb * 1024 * 1024),
+                                  codec=args.codec)
+
+        def archive_legacy():
+            for batch in synthetic_batches(args.traces, args.batch):
+                with legacy.open("a", encoding="utf-8") as handle:
+                    for record in batch:
+                        handle.write(json.dumps(record) + "\n")
+
+        def archive_segmented():
+            blocked = 0.0
+            for batch in synthetic_batches(args.traces, args.batch):
+                started = time.perf_counter()
+                archive.append(batch)
+                blocked += time.perf_counter() - started
+            archive.flush()
+            return blocked
+
+        rows = []
+        write, _ = _time(archive_legacy)
+        turn, by_turn = _time(lambda: _legacy_lookup(legacy, turn_ids={lookup_turn}))
+        window, by_time = _time(lambda: _legacy_lookup(legacy, since=since, until=until))
+        full, everything = _time(lambda: _legacy_lookup(legacy))
+        rows.append(("legacy", legacy.stat().st_size, write, write, turn, window, full, len(everything)))
+
+        write, blocked = _time(archive_segmented)
+        turn, seg_by_turn = _time(lambda: list(archive.iter_records(turn_ids=[lookup_turn])))
+        window, seg_by_time = _time(lambda: list(archive.iter_records(since=since, until=until)))
+        full, seg_everything = _time(archive.read_all)
+        rows.append(("segmented", _dir_size(archive.directory), write, blocked, turn, window, full, len(seg_everything)))
+        assert seg_by_turn == by_turn and seg_by_time == by_time and len(seg_everything) == len(everything)
+
+        print(f"{args.traces} traces, codec {args.codec}, {len(archive.segments())} segments")
+        print(f"{'layout':<10} {'disk':>9} {'archive':>9} {'blocking':>9} {'turn':>10} {'range':>10} {'full':>9}")
+        for name, size, write, blocked, turn, window, full, count in rows:
+            print(
+                f"{name:<10} {size / 1e6:7.1f}MB {write:8.2f}s {blocked:8.2f}s "
+                f"{turn * 1000:8.1f}ms {window * 1000:8.1f}ms {full:8.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark: write_file time-to-tool-result, with and without streaming-apply.
+
+A `ReplayLLM` streams one large write_file tool call per turn through the full agent
+pipeline with auto-executed tools. The measured latency runs from the end of the
+write_file segment (the LLM finished generating the content) to the tool's success
+event. With `AUTOBYTEUS_STREAM_WRITE_FILE` enabled, the content is already on disk by
+then and the tool only renames it into place.
+
+Run with: uv run python tests/benchmarks/write_file_streaming_benchmark.py --size-mb 16 --turns 5
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+from typing import List, Tuple
+
+from autobyteus.agent.context.agent_config import AgentConfig
+from autobyteus.agent.factory.agent_factory import AgentFactory
+from autobyteus.agent.message.agent_input_user_message import AgentInputUserMessage
+from autobyteus.agent.status.status_enum import AgentStatus
+from autobyteus.agent.streaming.events.stream_events import StreamEventType
+from autobyteus.agent.streaming.streams.agent_event_stream import AgentEventStream
+from autobyteus.agent.streaming.utils.write_file_stager import ENV_STREAM_WRITE_FILE
+from autobyteus.llm.api.replay_llm import ReplayLLM
+from autobyteus.llm.utils.stream_recording import RecordedChunk, RecordedExchange, StreamRecording
+from autobyteus.tools.registry import default_tool_registry
+
+logger = logging.getLogger(__name__)
+
+
+def build_recording(path: str, size_mb: int, chunk_kb: int, chunk_delay: float) -> StreamRecording:
+    """One turn: a write_file tool call streamed in `chunk_kb` pieces, then a short answer."""
+    line = "generated line of file content, long enough to look like real code;\n"
+    content = line * (size_mb * 1024 * 1024 // len(line))
+    arguments = json.dumps({"path": path, "content": content})
+    step = chunk_kb * 1024
+
+    tool_chunks = []
+    for offset in range(0, len(arguments), step):
+        tool_chunks.append(RecordedChunk(
+            delay=chunk_delay,
+            tool_calls=[{
+                "index": 0,
+                "call_id": "call_write" if offset == 0 else None,
+                "name": "write_file" if offset == 0 else None,
+                "arguments_delta": arguments[offset:offset + step],
+            }],
+        ))
+    tool_chunks.append(RecordedChunk(delay=chunk_delay, is_complete=True))
+    answer_chunks = [RecordedChunk(delay=chunk_delay, content="Done."), RecordedChunk(delay=0, is_complete=True)]
+
+    return StreamRecording(
+        provider="OPENAI",
+        model="synthetic",
+        exchanges=[
+            RecordedExchange(chunks=tool_chunks, tool_names=["write_file"]),
+            RecordedExchange(chunks=answer_chunks),
+        ],
+    )
+
+
+async def _run_mode(recording: StreamRecording, turns: int, memory_dir: str) -> Tuple[List[float], List[float]]:
+    replay = ReplayLLM(recording, speed=1.0, loop=True)
+    config = AgentConfig(
+        name="WriteFileBench",
+        role="benchmark",
+        description="write_file streaming benchmark agent",
+        llm_instance=replay,
+        system_prompt="You are a benchmark agent.",
+        tools=[default_tool_registry.create_tool("write_file")],
+        auto_execute_tools=True,
+        memory_dir=memory_dir,
+    )
+    factory = AgentFactory()
+    agent = factory.create_agent(config)
+    stream = AgentEventStream(agent)
+    latencies: List[float] = []
+    executions: List[float] = []
+    exchanges_per_turn = len(recording.exchanges)
+
+    async def observe(expected_exchanges: int, measure: bool) -> None:
+        write_segments = set()
+        segment_end_at = None
+        execution_started_at = None
+        async for event in stream.all_events():
+            if event.event_type == StreamEventType.SEGMENT_EVENT:
+                data = event.data
+                if data.segment_type == "write_file":
+                    write_segments.add(data.segment_id)
+                elif data.event_type.lower().endswith("end") and data.segment_id in write_segments:
+                    segment_end_at = time.perf_counter()
+            elif event.event_type == StreamEventType.TOOL_EXECUTION_STARTED:
+                execution_started_at = time.perf_counter()
+            elif event.event_type == StreamEventType.TOOL_EXECUTION_SUCCEEDED and segment_end_at is not None:
+                if measure:
+                    now = time.perf_counter()
+                    latencies.append(now - segment_end_at)
+                    executions.append(now - execution_started_at)
+            elif event.event_type == StreamEventType.AGENT_STATUS_UPDATED:
+                if event.data.new_status == AgentStatus.ERROR:
+                    raise RuntimeError(f"Agent entered ERROR: {event.data.error_message}")
+                if event.data.new_status == AgentStatus.IDLE and replay.exchanges_replayed >= expected_exchanges:
+                    return
+
+    try:
+        agent.start()
+        await asyncio.wait_for(asyncio.create_task(observe(0, False)), timeout=30)
+        for turn in range(turns):
+            waiter = asyncio.create_task(observe((turn + 1) * exchanges_per_turn, True))
+            await agent.post_user_message(AgentInputUserMessage(content=f"Write the file (turn {turn})."))
+            await asyncio.wait_for(waiter, timeout=300)
+    finally:
+        await stream.close()
+        await factory.remove_agent(agent.agent_id)
+    return latencies, executions
+
+
+async def run_benchmark(size_mb: int, turns: int, chunk_kb: int, chunk_delay: float) -> None:
+    print(f"write_file of {size_mb} MB streamed in {chunk_kb} KB chunks, {turns} turns per mode")
+    for label, enabled in (("baseline", False), ("streaming-apply", True)):
+        if enabled:
+            os.environ[ENV_STREAM_WRITE_FILE] = "1"
+        else:
+            os.environ.pop(ENV_STREAM_WRITE_FILE, None)
+        with tempfile.TemporaryDirectory(prefix="write_file_bench_") as directory:
+            recording = build_recording(os.path.join(directory, "generated.txt"), size_mb, chunk_kb, chunk_delay)
+            latencies, executions = await _run_mode(recording, turns, directory)
+        print(
+            f"{label:<16} time-to-tool-result mean {statistics.mean(latencies) * 1000:8.1f}ms"
+            f"  min {min(latencies) * 1000:8.1f}ms"
+            f"  | tool execution mean {statistics.mean(executions) * 1000:7.1f}ms"
+        )
+    os.environ.pop(ENV_STREAM_WRITE_FILE, None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="write_file streaming-apply benchmark.")
+    parser.add_argument("--size-mb", type=int, default=16)
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--chunk-kb", type=int, default=64, help="Size of each streamed argument delta.")
+    parser.add_argument("--chunk-delay", type=float, default=0.001, help="Seconds between streamed chunks.")
+    parser.add_argument("--log-level", type=str, default="WARNING")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper(), format="%(message)s")
+    asyncio.run(run_benchmark(args.size_mb, args.turns, args.chunk_kb, args.chunk_delay))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import asyncio
+import pytest
+
+from autobyteus.agent.factory.agent_factory import AgentFactory
+from autobyteus.agent.context import AgentContextRegistry, measure_agent_memory
+from autobyteus.agent.context.agent_config import AgentConfig
+from autobyteus.agent.message.agent_input_user_message import AgentInputUserMessage
+from autobyteus.agent.status.status_enum import AgentStatus
+from autobyteus.agent.streaming.agent_event_stream import AgentEventStream
+from autobyteus.llm.base_llm import BaseLLM
+from autobyteus.llm.models import LLMModel
+from autobyteus.llm.providers import LLMProvider
+from autobyteus.llm.runtimes import LLMRuntime
+from autobyteus.llm.utils.llm_config import LLMConfig
+from autobyteus.llm.utils.messages import MessageRole
+from autobyteus.llm.utils.response_types import CompleteResponse, ChunkResponse
+
+
+class DummyLLM(BaseLLM):
+    async def _send_messages_to_llm(self, _messages, **_kwargs):
+        return CompleteResponse(content="ok")
+
+    async def _stream_messages_to_llm(self, _messages, **_kwargs):
+        yield ChunkResponse(content="ok", is_complete=True)
+
+
+async def _wait_until(condition, attempts: int = 100):
+    for _ in range(attempts):
+        if condition():
+            return
+        await asyncio.sleep(0.05)
+    raise AssertionError("Condition not met in time.")
+
+
+@pytest.mark.asyncio
+async def test_hibernated_agent_rehydrates_on_next_message(tmp_path):
+    if hasattr(AgentFactory, '_instance'):
+        AgentFactory._instance = None
+
+    model = LLMModel(
+        name="dummy",
+        value="dummy",
+        canonical_name="dummy",
+        provider=LLMProvider.OPENAI,
+        llm_class=DummyLLM,
+        runtime=LLMRuntime.API,
+    )
+    config = AgentConfig(
+        name="HibernateAgent",
+        role="tester",
+        description="hibernation flow",
+        llm_instance=DummyLLM(model, LLMConfig()),
+        tools=[],
+        memory_dir=str(tmp_path),
+    )
+    factory = AgentFactory()
+    agent = factory.create_agent(config)
+    agent.start()
+    stream = AgentEventStream(agent)
+    statuses = []
+
+    async def _collect():
+        async for update in stream.stream_status_updates():
+            statuses.append(update.new_status)
+
+    collector = asyncio.create_task(_collect())
+
+    def _turns_done(count: int):
+        def _check():
+            messages = agent.context.state.memory_manager.get_working_context_messages()
+            return len(messages) == 1 + 2 * count and agent.get_current_status() == AgentStatus.IDLE
+        return _check
+
+    try:
+        await _wait_until(lambda: agent.get_current_status() == AgentStatus.IDLE)
+        await agent.post_user_message(AgentInputUserMessage(content="Hello"))
+        await _wait_until(_turns_done(1))
+        assert measure_agent_memory(agent.context).components["working_context"] > 0
+
+        assert await factory.hibernate_idle_agents(idle_seconds=0) == [agent.agent_id]
+        assert agent.is_hibernated
+        assert AgentContextRegistry().get_context(agent.agent_id) is None
+
+        # Opening a stream or reading the context leaves the agent hibernated.
+        late_stream = AgentEventStream(agent)
+        assert agent.context.config is config
+        assert agent.context.state.memory_manager is None
+        assert agent.is_hibernated
+        await late_stream.close()
+
+        await agent.post_user_message(AgentInputUserMessage(content="Again"))
+        await _wait_until(_turns_done(2))
+        messages = agent.context.state.memory_manager.get_working_context_messages()
+        assert [m.role for m in messages] == [
+            MessageRole.SYSTEM, MessageRole.USER, MessageRole.ASSISTANT, MessageRole.USER, MessageRole.ASSISTANT,
+        ]
+        assert [m.content for m in messages[1:]] == ["Hello", "ok", "Again", "ok"]
+        # The stream opened before hibernation follows the rehydrated agent; the shutdown is not reported.
+        await _wait_until(lambda: statuses.count(AgentStatus.IDLE) >= 4)
+        assert AgentStatus.SHUTTING_DOWN not in statuses
+    finally:
+        collector.cancel()
+        await stream.close()
+        await factory.remove_agent(agent.agent_id)
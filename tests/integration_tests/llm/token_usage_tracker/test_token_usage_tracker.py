@@ -354,3 +354,27 @@ def test_chunk_response_handling(token_usage_tracker, sample_messages):
     latest_output = token_usage_tracker.get_usage_history()[-1]
     assert latest_output.completion_tokens == 750
     assert latest_output.completion_cost == (750 / 1_000_000) * pricing.output_token_pricing
+
+
+def test_calculate_prompt_cost_bills_cached_tokens_at_cache_rates(mock_token_counter):
+    model = LLMModel["claude-4.5-sonnet"]
+    tracker = TokenUsageTracker(model, mock_token_counter)
+    pricing = model.default_config.pricing_config
+
+    cost = tracker.calculate_prompt_cost(10_000, cached_prompt_tokens=8_000, cache_creation_tokens=1_000)
+
+    expected = (
+        (1_000 / 1_000_000) * pricing.input_token_pricing
+        + (8_000 / 1_000_000) * pricing.cached_input_token_pricing
+        + (1_000 / 1_000_000) * pricing.cache_write_token_pricing
+    )
+    assert cost == pytest.approx(expected)
+    assert cost < tracker.calculate_cost(10_000, True)
+
+
+def test_calculate_prompt_cost_without_cache_rates_uses_input_rate(mock_token_counter):
+    tracker = TokenUsageTracker(LLMModel["kimi-latest"], mock_token_counter)
+
+    assert tracker.calculate_prompt_cost(10_000, cached_prompt_tokens=8_000) == pytest.approx(
+        tracker.calculate_cost(10_000, True)
+    )
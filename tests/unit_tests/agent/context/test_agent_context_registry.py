@@ -98,3 +98,13 @@ class TestAgentContextRegistry:
         assert clean_registry.get_context(agent_id) is None
         # Verify the internal dictionary is also empty for that key
         assert agent_id not in clean_registry._contexts
+
+    def test_get_memory_footprints_measures_live_contexts(self, clean_registry, mock_context):
+        """Verify that footprints are reported for live contexts only."""
+        clean_registry.register_context(mock_context)
+
+        with patch('autobyteus.agent.context.agent_context_registry.measure_agent_memory') as mock_measure:
+            footprints = clean_registry.get_memory_footprints()
+
+        mock_measure.assert_called_once_with(mock_context)
+        assert footprints == {"test_agent_123": mock_measure.return_value}
@@ -0,0 +1,61 @@
+from collections import deque
+
+from autobyteus.agent.context.agent_memory_footprint import COMPONENTS, approximate_size, measure_agent_memory
+from autobyteus.agent.context.agent_runtime_state import AgentRuntimeState
+from autobyteus.agent.events.agent_events import UserMessageReceivedEvent
+from autobyteus.agent.events.event_store import AgentEventStore
+from autobyteus.memory.memory_manager import MemoryManager
+from autobyteus.utils.singleton import SingletonMeta
+
+
+class _Holder:
+    def __init__(self, *items):
+        self.items = list(items)
+
+
+class _Shared(metaclass=SingletonMeta):
+    def __init__(self):
+        self.payload = "x" * 100_000
+
+
+class _Context:
+    def __init__(self, state):
+        self.agent_id = state.agent_id
+        self.state = state
+        self.config = object()
+
+
+def test_approximate_size_counts_shared_objects_once():
+    payload = "x" * 10_000
+    seen = set()
+
+    first = approximate_size(_Holder(payload), seen)
+    second = approximate_size(_Holder(payload), seen)
+
+    assert first > 10_000
+    assert second < 1_000
+
+
+def test_approximate_size_follows_containers_without_dict_and_skips_singletons():
+    assert approximate_size(deque(["y" * 5_000])) > 5_000
+    assert approximate_size(_Holder(_Shared(), _Holder)) < 1_000
+
+
+def test_measure_agent_memory_attributes_bytes_to_components():
+    state = AgentRuntimeState(agent_id="agent_fp")
+    store = type("Store", (), {"agent_id": "agent_fp"})()
+    state.memory_manager = MemoryManager(store=store)
+    state.event_store = AgentEventStore(agent_id="agent_fp")
+    state.custom_data = {"notes": "n" * 2_000}
+
+    baseline = measure_agent_memory(_Context(state))
+    state.memory_manager.working_context_snapshot.append_user("u" * 50_000)
+    for _ in range(100):
+        state.event_store.append(UserMessageReceivedEvent(agent_input_user_message=None))
+    grown = measure_agent_memory(_Context(state))
+
+    assert tuple(grown.components) == COMPONENTS
+    assert grown.components["working_context"] - baseline.components["working_context"] > 50_000
+    assert grown.components["event_store"] - baseline.components["event_store"] > 10_000
+    assert grown.components["runtime_state"] > 2_000
+    assert grown.total_bytes == sum(grown.components.values())
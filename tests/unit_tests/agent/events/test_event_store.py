@@ -19,6 +19,7 @@ def test_append_creates_envelope_and_increments_sequence():
 
     second = store.append(AgentReadyEvent())
     assert second.sequence == 1
+    assert second.event_id > envelope.event_id
 
 
 def test_all_events_returns_copy():
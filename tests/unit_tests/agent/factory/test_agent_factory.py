@@ -1,11 +1,14 @@
 # file: autobyteus/tests/unit_tests/agent/factory/test_agent_factory.py
+import time
 import pytest
-from unittest.mock import MagicMock, patch, ANY
+from unittest.mock import AsyncMock, MagicMock, patch, ANY
 from typing import Any
 
 from autobyteus.agent.factory.agent_factory import AgentFactory
 from autobyteus.agent.context.agent_config import AgentConfig
 from autobyteus.agent.context.agent_runtime_state import AgentRuntimeState
+from autobyteus.agent.context.agent_memory_footprint import AgentMemoryFootprint
+from autobyteus.agent.status.status_enum import AgentStatus
 from autobyteus.agent.runtime.agent_runtime import AgentRuntime
 from autobyteus.agent.agent import Agent
 from autobyteus.llm.base_llm import BaseLLM
@@ -183,3 +186,66 @@ def test_create_runtime_populates_state(MockAgentRuntimeState, MockAgentContext,
         config=valid_agent_config,
         state=mock_state_instance
     )
+
+
+def _idle_agent(last_activity, status=AgentStatus.IDLE, hibernated=False):
+    agent = MagicMock(spec=Agent)
+    agent.is_hibernated = hibernated
+    agent.get_current_status.return_value = status
+    agent.last_activity_time = last_activity
+    agent.hibernate = AsyncMock(return_value=True)
+    return agent
+
+
+def test_created_agent_rehydrates_through_snapshot_restore(agent_factory: AgentFactory, valid_agent_config: AgentConfig):
+    mock_runtime_instance = MagicMock(spec=AgentRuntime)
+    mock_runtime_instance.context = MagicMock()
+    mock_runtime_instance.context.agent_id = "agent_x"
+
+    with patch.object(agent_factory, '_create_runtime_with_id', return_value=mock_runtime_instance) as mock_create_runtime:
+        agent = agent_factory.create_agent(config=valid_agent_config)
+        agent._rehydrate()
+
+    _, kwargs = mock_create_runtime.call_args
+    assert kwargs["config"] is valid_agent_config
+    assert kwargs["memory_dir_override"] is None
+    assert kwargs["restore_options"] is not None
+
+
+@pytest.mark.asyncio
+async def test_hibernate_idle_agents_picks_least_recently_active(agent_factory: AgentFactory):
+    now = time.time()
+    agents = {
+        "recent": _idle_agent(now - 5),
+        "oldest": _idle_agent(now - 600),
+        "older": _idle_agent(now - 300),
+        "busy": _idle_agent(now - 900, status=AgentStatus.EXECUTING_TOOL),
+        "asleep": _idle_agent(now - 900, hibernated=True),
+    }
+
+    with patch.object(agent_factory, '_active_agents', agents):
+        hibernated = await agent_factory.hibernate_idle_agents(idle_seconds=60)
+
+    assert hibernated == ["oldest", "older"]
+    agents["recent"].hibernate.assert_not_awaited()
+    agents["busy"].hibernate.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_hibernate_idle_agents_stops_within_resident_budget(agent_factory: AgentFactory):
+    now = time.time()
+    agents = {
+        "a": _idle_agent(now - 600),
+        "b": _idle_agent(now - 500),
+        "c": _idle_agent(now - 400),
+    }
+    footprints = {
+        agent_id: AgentMemoryFootprint(agent_id=agent_id, components={"working_context": 100})
+        for agent_id in agents
+    }
+
+    with patch.object(agent_factory, '_active_agents', agents), \
+            patch.object(agent_factory, 'get_memory_footprints', return_value=footprints):
+        hibernated = await agent_factory.hibernate_idle_agents(idle_seconds=60, max_resident_bytes=150)
+
+    assert hibernated == ["a", "b"]
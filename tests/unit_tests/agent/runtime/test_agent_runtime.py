@@ -219,3 +219,19 @@ class TestAgentRuntime:
 
         mock_worker_instance.is_alive.return_value = False
         assert not runtime.is_running
+
+    async def test_hibernate_stops_quietly_and_keeps_config_instances(self, agent_runtime_with_mocks: AgentRuntime):
+        from autobyteus.agent.shutdown_steps import MemoryCleanupStep, McpServerCleanupStep, StagedWriteCleanupStep
+        runtime = agent_runtime_with_mocks
+        original_notifier = runtime.external_event_notifier
+        runtime.stop = AsyncMock()
+
+        returned = await runtime.hibernate(timeout=0.5)
+
+        assert returned is original_notifier
+        assert runtime.external_event_notifier is not original_notifier
+        assert runtime.status_manager.notifier is runtime.external_event_notifier
+        assert [type(step) for step in runtime._worker.shutdown_steps] == [
+            MemoryCleanupStep, McpServerCleanupStep, StagedWriteCleanupStep
+        ]
+        runtime.stop.assert_awaited_once_with(timeout=0.5)
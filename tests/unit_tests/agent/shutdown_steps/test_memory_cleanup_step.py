@@ -0,0 +1,24 @@
+# file: autobyteus/tests/unit_tests/agent/shutdown_steps/test_memory_cleanup_step.py
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from autobyteus.agent.context import AgentContext
+from autobyteus.agent.shutdown_steps.memory_cleanup_step import MemoryCleanupStep
+
+@pytest.mark.asyncio
+async def test_execute_closes_memory_manager(agent_context: AgentContext):
+    """Tests that the memory manager is closed so a background compaction cannot outlive the agent."""
+    agent_context.state.memory_manager = MagicMock(close=AsyncMock())
+
+    success = await MemoryCleanupStep().execute(agent_context)
+
+    assert success is True
+    agent_context.state.memory_manager.close.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_execute_skips_without_memory_manager(agent_context: AgentContext):
+    """Tests graceful success when the agent has no memory manager."""
+    agent_context.state.memory_manager = None
+
+    assert await MemoryCleanupStep().execute(agent_context) is True
@@ -0,0 +1,31 @@
+# file: autobyteus/tests/unit_tests/agent/shutdown_steps/test_staged_write_cleanup_step.py
+import os
+
+import pytest
+
+from autobyteus.agent.context import AgentContext
+from autobyteus.agent.shutdown_steps.staged_write_cleanup_step import StagedWriteCleanupStep
+from autobyteus.agent.streaming.segments.segment_events import SegmentEvent, SegmentType
+from autobyteus.agent.streaming.utils.write_file_stager import WriteFileStager
+from autobyteus.utils.atomic_write import FileDurability
+
+@pytest.mark.asyncio
+async def test_execute_removes_staged_files(agent_context: AgentContext, tmp_path):
+    """Tests that content staged for invocations that never ran is removed from disk."""
+    stager = WriteFileStager(lambda path: os.path.join(str(tmp_path), path), durability=FileDurability.NONE)
+    stager.on_segment_event(SegmentEvent.start("call_1", SegmentType.WRITE_FILE, path="a.txt"))
+    stager.on_segment_event(SegmentEvent.content("call_1", "partial"))
+    agent_context.state.write_file_stager = stager
+
+    success = await StagedWriteCleanupStep().execute(agent_context)
+
+    assert success is True
+    assert stager.staged_invocation_ids == []
+    assert os.listdir(tmp_path) == []
+
+@pytest.mark.asyncio
+async def test_execute_skips_without_stager(agent_context: AgentContext):
+    """Tests graceful success when the agent never staged any write_file content."""
+    agent_context.state.write_file_stager = None
+
+    assert await StagedWriteCleanupStep().execute(agent_context) is True
@@ -86,7 +86,7 @@ def real_notifier(agent_id_fixture: str) -> AgentExternalEventNotifier:
 def mock_agent(agent_id_fixture: str, real_notifier: AgentExternalEventNotifier) -> MagicMock:
     """
     Fixture for a mock Agent instance that is correctly configured for the streamer.
-    The streamer's __init__ accesses agent.context.status_manager.notifier.
+    The streamer's __init__ accesses agent.external_event_notifier.
     """
     mock_agent_context = MagicMock(spec=AgentContext)
     mock_agent_context.agent_id = agent_id_fixture
@@ -98,6 +98,7 @@ def mock_agent(agent_id_fixture: str, real_notifier: AgentExternalEventNotifier)
     agent = MagicMock(spec=Agent)
     agent.agent_id = agent_id_fixture
     agent.context = mock_agent_context
+    agent.external_event_notifier = real_notifier
     return agent
 
 @pytest_asyncio.fixture
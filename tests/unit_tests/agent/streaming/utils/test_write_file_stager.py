@@ -0,0 +1,93 @@
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from autobyteus.agent.streaming.segments.segment_events import SegmentEvent, SegmentType
+from autobyteus.agent.streaming.utils import write_file_stager as stager_module
+from autobyteus.agent.streaming.utils.write_file_stager import WriteFileStager
+from autobyteus.tools.file.write_file import write_file
+from autobyteus.utils.atomic_write import FileDurability
+
+pytestmark = pytest.mark.asyncio
+
+
+def _stream(stager: WriteFileStager, segment_id: str, path: str, chunks):
+    stager.on_segment_event(SegmentEvent.start(segment_id, SegmentType.WRITE_FILE, path=path))
+    for chunk in chunks:
+        stager.on_segment_event(SegmentEvent.content(segment_id, chunk))
+    stager.on_segment_event(SegmentEvent.end(segment_id))
+
+
+def _streaming_files(directory) -> list:
+    return [name for name in os.listdir(directory) if name.endswith(".streaming")]
+
+
+@pytest.fixture
+def stager(tmp_path) -> WriteFileStager:
+    return WriteFileStager(lambda path: os.path.join(str(tmp_path), path), durability=FileDurability.NONE)
+
+
+async def test_commit_renames_matching_staged_content(stager, tmp_path, monkeypatch):
+    monkeypatch.setattr(stager_module, "FLUSH_THRESHOLD_CHARS", 8)
+    chunks = ["first line\n", "second ", "line Ü\n", "tail"]
+    _stream(stager, "call_1", "out/a.txt", chunks)
+
+    target = tmp_path / "out" / "a.txt"
+    assert await stager.commit(str(target), "".join(chunks)) is True
+    assert target.read_text(encoding="utf-8") == "".join(chunks)
+    assert stager.staged_invocation_ids == []
+    assert _streaming_files(tmp_path) == []
+
+
+async def test_commit_declines_on_content_mismatch(stager, tmp_path):
+    _stream(stager, "call_1", "a.txt", ["streamed"])
+
+    target = tmp_path / "a.txt"
+    assert await stager.commit(str(target), "different") is False
+    assert not target.exists()
+
+    stager.discard("call_1")
+    stager_module._get_executor().submit(lambda: None).result()
+    assert _streaming_files(tmp_path) == []
+
+
+async def test_incomplete_segment_is_not_committed(stager, tmp_path):
+    stager.on_segment_event(SegmentEvent.start("call_1", SegmentType.WRITE_FILE, path="a.txt"))
+    stager.on_segment_event(SegmentEvent.content("call_1", "partial"))
+
+    assert await stager.commit(str(tmp_path / "a.txt"), "partial") is False
+
+    stager.discard_all()
+    stager_module._get_executor().submit(lambda: None).result()
+    assert _streaming_files(tmp_path) == []
+
+
+async def test_write_file_tool_uses_staged_content(stager, tmp_path):
+    content = "generated content\n" * 100
+    _stream(stager, "call_1", "b.txt", [content[:500], content[500:]])
+
+    context = Mock()
+    context.agent_id = "agent_1"
+    context.workspace = None
+    context.state.write_file_stager = stager
+    target = str(tmp_path / "b.txt")
+
+    result = await write_file.execute(context, path=target, content=content)
+
+    assert result == f"File created/updated at {target}"
+    assert (tmp_path / "b.txt").read_text(encoding="utf-8") == content
+    assert stager.staged_invocation_ids == []
+
+
+async def test_discard_unclaimed_removes_segments_without_invocation(stager, tmp_path):
+    _stream(stager, "call_1", "a.txt", ["kept"])
+    _stream(stager, "call_2", "b.txt", ["never parsed"])
+
+    stager.discard_unclaimed(["call_1"])
+    stager_module._get_executor().submit(lambda: None).result()
+
+    assert stager.staged_invocation_ids == ["call_1"]
+    assert len(_streaming_files(tmp_path)) == 1
+    assert await stager.commit(str(tmp_path / "a.txt"), "kept") is True
+    assert _streaming_files(tmp_path) == []
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from autobyteus.agent.agent import Agent
+from autobyteus.agent.context.agent_config import AgentConfig
+from autobyteus.agent.context.agent_runtime_state import AgentRuntimeState
+from autobyteus.agent.events import UserMessageReceivedEvent
+from autobyteus.agent.events.notifiers import AgentExternalEventNotifier
+from autobyteus.agent.message.agent_input_user_message import AgentInputUserMessage
+from autobyteus.agent.runtime.agent_runtime import AgentRuntime
+from autobyteus.agent.status.status_enum import AgentStatus
+
+
+def _runtime(agent_id: str = "agent_h", status: AgentStatus = AgentStatus.IDLE) -> MagicMock:
+    runtime = MagicMock(spec=AgentRuntime)
+    runtime.context = MagicMock()
+    runtime.context.agent_id = agent_id
+    runtime.context.config = MagicMock(spec=AgentConfig)
+    runtime.context.state = AgentRuntimeState(agent_id=agent_id)
+    runtime.context.state.memory_manager = MagicMock()
+    runtime.current_status_property = status
+    runtime.is_running = True
+    runtime.get_worker_loop.return_value = MagicMock()
+    runtime.hibernate = AsyncMock(return_value=AgentExternalEventNotifier(agent_id=agent_id))
+    runtime.submit_event = AsyncMock()
+    return runtime
+
+
+@pytest.mark.asyncio
+async def test_hibernate_releases_runtime_and_next_message_rehydrates():
+    first, second = _runtime(), _runtime()
+    first.context.state.custom_data["key"] = "value"
+    rehydrate = MagicMock(return_value=second)
+    agent = Agent(runtime=first, rehydrate=rehydrate)
+
+    assert await agent.hibernate(timeout=1.0) is True
+
+    first.hibernate.assert_awaited_once_with(timeout=1.0)
+    first.context.state.memory_manager.persist_working_context_snapshot.assert_called_once()
+    assert agent.is_hibernated
+    assert agent._runtime is None
+    assert agent.get_current_status() == AgentStatus.IDLE
+    assert agent.last_activity_time is None
+    assert agent.context.config is first.context.config
+    assert agent.context.state.custom_data == {"key": "value"}
+    assert agent.external_event_notifier is first.hibernate.return_value
+    rehydrate.assert_not_called()
+
+    await agent.post_user_message(AgentInputUserMessage(content="hello"))
+
+    rehydrate.assert_called_once_with()
+    second.replace_external_event_notifier.assert_called_once_with(first.hibernate.return_value)
+    second.start.assert_called_once()
+    assert second.context.state.custom_data == {"key": "value"}
+    event = second.submit_event.await_args.args[0]
+    assert isinstance(event, UserMessageReceivedEvent)
+    assert not agent.is_hibernated
+
+
+@pytest.mark.asyncio
+async def test_hibernate_refuses_busy_or_unrebuildable_agents():
+    busy = Agent(runtime=_runtime(status=AgentStatus.AWAITING_LLM_RESPONSE), rehydrate=MagicMock())
+    assert await busy.hibernate() is False
+    busy._runtime.hibernate.assert_not_awaited()
+
+    standalone = Agent(runtime=_runtime())
+    assert await standalone.hibernate() is False
+    assert not standalone.is_hibernated
+
+
+@pytest.mark.asyncio
+async def test_stop_cleans_up_hibernated_agent_without_rehydrating():
+    runtime = _runtime()
+    runtime.context.state.llm_instance = MagicMock()
+    runtime.context.state.llm_instance.cleanup = AsyncMock()
+    tool = MagicMock()
+    runtime.context.state.tool_instances = {"tool": tool}
+    rehydrate = MagicMock()
+    agent = Agent(runtime=runtime, rehydrate=rehydrate)
+    await agent.hibernate()
+    statuses = []
+    agent.external_event_notifier.notify_status_updated = lambda new, old=None, data=None: statuses.append(new)
+
+    await agent.stop()
+
+    rehydrate.assert_not_called()
+    runtime.context.state.llm_instance.cleanup.assert_awaited_once()
+    tool.cleanup.assert_called_once()
+    assert statuses == [AgentStatus.SHUTTING_DOWN, AgentStatus.SHUTDOWN_COMPLETE]
+    assert not agent.is_hibernated
+    assert agent.get_current_status() == AgentStatus.SHUTDOWN_COMPLETE
+    assert agent.context.config is runtime.context.config
+    with pytest.raises(RuntimeError):
+        agent.start()
+
+
+def test_agent_built_outside_a_loop_hibernates_inside_one():
+    agent = Agent(runtime=_runtime(), rehydrate=MagicMock(return_value=_runtime()))
+    assert agent._lifecycle_lock_instance is None
+
+    assert asyncio.run(agent.hibernate(timeout=1.0)) is True
+    assert agent.is_hibernated
@@ -20,13 +20,17 @@ class FakeRenderer(BasePromptRenderer):
         return [{"role": m.role.value, "content": m.content} for m in messages]
 
 
+async def _noop_compact(_turns):
+    return None
+
+
 class FakeMemoryManager:
     def __init__(self, raw_tail=None):
         self.working_context_snapshot = WorkingContextSnapshot()
         self.compaction_policy = CompactionPolicy()
         self.compactor = SimpleNamespace()
         self.compactor.select_compaction_window = lambda: []
-        self.compactor.compact = lambda _turns: None
+        self.compactor.compact_async = _noop_compact
         self.retriever = SimpleNamespace()
         self.retriever.retrieve = lambda max_episodic, max_semantic: MemoryBundle()
         self._raw_tail = raw_tail or []
@@ -38,6 +42,9 @@ class FakeMemoryManager:
     def clear_compaction_request(self):
         self.compaction_required = False
 
+    async def wait_for_background_compaction(self):
+        return False
+
     def get_working_context_messages(self):
         return self.working_context_snapshot.build_messages()
 
@@ -85,7 +92,7 @@ async def test_prepare_request_compacts_and_resets_working_context_snapshot():
     memory_manager = FakeMemoryManager(raw_tail=raw_tail)
     memory_manager.compaction_policy = CompactionPolicy(trigger_ratio=0.1)
     memory_manager.compactor.select_compaction_window = lambda: ["turn_0001"]
-    memory_manager.compactor.compact = lambda _turns: None
+    memory_manager.compactor.compact_async = _noop_compact
     memory_manager.retriever.retrieve = lambda max_episodic, max_semantic: MemoryBundle(
         episodic=[EpisodicItem(id="ep_1", ts=time.time(), turn_ids=["turn_0001"], summary="Did a thing.")],
         semantic=[SemanticItem(id="sem_1", ts=time.time(), fact="Use pytest.")],
@@ -0,0 +1,73 @@
+import pytest
+from unittest.mock import MagicMock
+
+from autobyteus.agent.events.agent_events import ToolResultEvent
+from autobyteus.agent.tool_execution_result_processor.tool_result_size_governor import ToolResultSizeGovernor
+from autobyteus.memory.store.tool_result_spill_store import ToolResultSpillStore
+
+
+@pytest.fixture
+def spill_store(tmp_path, agent_context):
+    store = ToolResultSpillStore(base_dir=tmp_path, agent_id="agent_spill")
+    agent_context.state.memory_manager = MagicMock(tool_result_spill_store=store)
+    return store
+
+
+@pytest.mark.asyncio
+async def test_governor_spills_oversized_result(agent_context, spill_store):
+    governor = ToolResultSizeGovernor(max_chars=1000)
+    output = "".join(f"line {i}\n" for i in range(2000))
+    event = ToolResultEvent(tool_name="run_bash", result=output, tool_invocation_id="call_1", turn_id="turn_0001")
+
+    result = await governor.process(event, agent_context)
+
+    assert len(result.result) < 1500
+    assert result.result.startswith("line 0\n")
+    assert result.result.endswith("line 1999\n")
+    ref = spill_store.write(output)
+    assert f"ref {ref}" in result.result
+    assert spill_store.read(ref)[0] == output
+    assert event.result == output
+
+
+@pytest.mark.asyncio
+async def test_governor_keeps_small_and_uses_per_tool_budget(agent_context, spill_store):
+    governor = ToolResultSizeGovernor(max_chars=1000, tool_max_chars={"read_url": 0})
+
+    small = ToolResultEvent(tool_name="run_bash", result="ok", tool_invocation_id="call_1")
+    unlimited = ToolResultEvent(tool_name="read_url", result="x" * 5000, tool_invocation_id="call_2")
+
+    assert (await governor.process(small, agent_context)).result == "ok"
+    assert (await governor.process(unlimited, agent_context)).result == "x" * 5000
+    assert not spill_store.dir.exists()
+
+
+@pytest.mark.asyncio
+async def test_governor_without_spill_store_keeps_result(agent_context):
+    agent_context.state.memory_manager = None
+    governor = ToolResultSizeGovernor(max_chars=10)
+    event = ToolResultEvent(tool_name="run_bash", result="x" * 100, tool_invocation_id="call_1")
+
+    assert (await governor.process(event, agent_context)).result == "x" * 100
+
+
+@pytest.mark.asyncio
+async def test_governor_keeps_page_read_with_suggested_arguments(agent_context, spill_store):
+    from autobyteus.tools.registry import default_tool_registry
+
+    paging_tool = default_tool_registry.create_tool("read_tool_result")
+    agent_context.state.tool_instances = {"read_tool_result": paging_tool}
+    governor = ToolResultSizeGovernor(max_chars=1000)
+    output = "".join(f"line {i}\n" for i in range(2000))
+    event = ToolResultEvent(tool_name="run_bash", result=output, tool_invocation_id="call_1")
+    preview = (await governor.process(event, agent_context)).result
+    ref = spill_store.write(output)
+    offset = len(preview.split("\n[tool result truncated", 1)[0])
+    assert f'read_tool_result(ref="{ref}", offset={offset}, length=1000)' in preview
+
+    page = await paging_tool.execute(agent_context, ref=ref, offset=offset, length=1000)
+    page_event = ToolResultEvent(tool_name="read_tool_result", result=page, tool_invocation_id="call_2")
+
+    assert len(page) > 1000
+    assert page.startswith(output[offset:offset + 1000])
+    assert (await governor.process(page_event, agent_context)).result == page
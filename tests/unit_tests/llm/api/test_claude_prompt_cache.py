@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autobyteus.llm.api.claude_llm import ClaudeLLM
+from autobyteus.llm.models import LLMModel
+from autobyteus.llm.providers import LLMProvider
+from autobyteus.llm.user_message import LLMUserMessage
+from autobyteus.llm.utils.llm_config import LLMConfig
+
+
+def _make_model():
+    return LLMModel(
+        name="claude-test",
+        value="claude-test-v1",
+        provider=LLMProvider.ANTHROPIC,
+        llm_class=ClaudeLLM,
+        canonical_name="claude-test",
+    )
+
+
+def _response():
+    return SimpleNamespace(
+        content=[SimpleNamespace(type="text", text="Hi.")],
+        usage=SimpleNamespace(
+            input_tokens=10,
+            output_tokens=5,
+            cache_read_input_tokens=900,
+            cache_creation_input_tokens=100,
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_claude_request_carries_breakpoints_and_reports_cache_tokens():
+    mock_client = MagicMock()
+    mock_client.messages.create.return_value = _response()
+
+    with patch("autobyteus.llm.api.claude_llm.ClaudeLLM.initialize", return_value=mock_client):
+        llm = ClaudeLLM(model=_make_model(), llm_config=LLMConfig(system_message="Be brief."))
+        result = await llm._send_user_message_to_llm(LLMUserMessage(content="hello"))
+
+    call_kwargs = mock_client.messages.create.call_args.kwargs
+    assert call_kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+    assert call_kwargs["messages"][-1]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+
+    assert result.usage.prompt_tokens == 1010
+    assert result.usage.cached_prompt_tokens == 900
+    assert result.usage.cache_creation_tokens == 100
+    assert result.usage.total_tokens == 1015
+
+
+@pytest.mark.asyncio
+async def test_claude_prompt_cache_can_be_disabled():
+    mock_client = MagicMock()
+    mock_client.messages.create.return_value = _response()
+
+    with patch("autobyteus.llm.api.claude_llm.ClaudeLLM.initialize", return_value=mock_client):
+        llm = ClaudeLLM(
+            model=_make_model(),
+            llm_config=LLMConfig(system_message="Be brief.", extra_params={"prompt_cache_enabled": False}),
+        )
+        await llm._send_user_message_to_llm(LLMUserMessage(content="hello"))
+
+    call_kwargs = mock_client.messages.create.call_args.kwargs
+    assert call_kwargs["system"] == "Be brief."
+    assert call_kwargs["messages"] == [{"role": "user", "content": "hello"}]
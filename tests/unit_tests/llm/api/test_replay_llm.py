@@ -0,0 +1,132 @@
+import asyncio
+import time
+
+import pytest
+
+from autobyteus.llm.api.recording_llm import RecordingLLM
+from autobyteus.llm.api.replay_llm import ReplayLLM
+from autobyteus.llm.base_llm import BaseLLM
+from autobyteus.llm.models import LLMModel
+from autobyteus.llm.providers import LLMProvider
+from autobyteus.llm.utils.llm_config import LLMConfig
+from autobyteus.llm.utils.messages import Message, MessageRole
+from autobyteus.llm.utils.response_types import ChunkResponse, CompleteResponse
+from autobyteus.llm.utils.stream_recording import RecordedChunk, RecordedExchange, StreamRecording
+from autobyteus.llm.utils.token_usage import TokenUsage
+from autobyteus.llm.utils.tool_call_delta import ToolCallDelta
+
+
+class _ScriptedLLM(BaseLLM):
+    """Stands in for a provider: streams fixed chunks with fixed delays."""
+
+    def __init__(self, chunks, delay: float):
+        model = LLMModel(
+            name="scripted",
+            value="scripted-model",
+            provider=LLMProvider.ANTHROPIC,
+            llm_class=_ScriptedLLM,
+            canonical_name="scripted",
+        )
+        super().__init__(model=model, llm_config=LLMConfig())
+        self.chunks = chunks
+        self.delay = delay
+
+    async def _send_messages_to_llm(self, messages, **kwargs):
+        return CompleteResponse(content="".join(c.content for c in self.chunks))
+
+    async def _stream_messages_to_llm(self, messages, **kwargs):
+        for chunk in self.chunks:
+            await asyncio.sleep(self.delay)
+            yield chunk
+
+
+def _scripted_chunks():
+    return [
+        ChunkResponse(content="", reasoning="thinking"),
+        ChunkResponse(content="Writing the file."),
+        ChunkResponse(
+            content="",
+            tool_calls=[ToolCallDelta(index=0, call_id="call_1", name="write_file", arguments_delta='{"path":')],
+        ),
+        ChunkResponse(content="", tool_calls=[ToolCallDelta(index=0, arguments_delta='"a.txt"}')]),
+        ChunkResponse(
+            content="",
+            is_complete=True,
+            usage=TokenUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        ),
+    ]
+
+
+def _messages():
+    return [Message(MessageRole.USER, content="hi")]
+
+
+async def _collect(llm, **kwargs):
+    return [chunk async for chunk in llm.stream_messages(_messages(), **kwargs)]
+
+
+@pytest.mark.asyncio
+async def test_recording_round_trips_chunks_and_timing(tmp_path):
+    path = tmp_path / "session.jsonl"
+    recorder = RecordingLLM(_ScriptedLLM(_scripted_chunks(), delay=0.02), path)
+    tools = [{"type": "function", "function": {"name": "write_file"}}]
+
+    recorded = await _collect(recorder, tools=tools)
+
+    recording = StreamRecording.load(path)
+    assert recording.provider == "ANTHROPIC"
+    assert recording.model == "scripted-model"
+    assert len(recording.exchanges) == 1
+    exchange = recording.exchanges[0]
+    assert exchange.tool_names == ["write_file"]
+    assert all(chunk.delay >= 0.015 for chunk in exchange.chunks)
+
+    replay = ReplayLLM(path, speed=1.0)
+    assert replay.model.provider == LLMProvider.ANTHROPIC
+    started = time.perf_counter()
+    replayed = await _collect(replay)
+    elapsed = time.perf_counter() - started
+
+    assert replayed == recorded
+    assert elapsed >= exchange.duration * 0.9
+
+
+@pytest.mark.asyncio
+async def test_replay_speed_scales_and_zero_means_as_fast_as_possible():
+    exchange = RecordedExchange(chunks=[RecordedChunk(delay=0.1, content="a"), RecordedChunk(delay=0.1, content="b", is_complete=True)])
+    recording = StreamRecording(exchanges=[exchange])
+
+    started = time.perf_counter()
+    await _collect(ReplayLLM(recording, speed=4.0))
+    scaled_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    chunks = await _collect(ReplayLLM(recording, speed=0))
+    fast_elapsed = time.perf_counter() - started
+
+    assert 0.04 <= scaled_elapsed < 0.15
+    assert fast_elapsed < 0.02
+    assert [c.content for c in chunks] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_replay_consumes_exchanges_in_order_and_reports_exhaustion():
+    recording = StreamRecording(exchanges=[
+        RecordedExchange(chunks=[RecordedChunk(delay=0.0, content="first", is_complete=True)]),
+        RecordedExchange(chunks=[RecordedChunk(delay=0.0, content="second", is_complete=True)]),
+    ])
+    replay = ReplayLLM(recording, speed=0)
+
+    assert (await replay.send_messages(_messages())).content == "first"
+    assert (await replay.send_messages(_messages())).content == "second"
+    with pytest.raises(RuntimeError, match="exhausted"):
+        await replay.send_messages(_messages())
+
+    looping = ReplayLLM(recording, speed=0, loop=True)
+    contents = [(await looping.send_messages(_messages())).content for _ in range(3)]
+    assert contents == ["first", "second", "first"]
+
+
+def test_replay_rejects_negative_speed():
+    with pytest.raises(ValueError):
+        ReplayLLM(StreamRecording(), speed=-1)
@@ -0,0 +1,127 @@
+import pytest
+
+from autobyteus.llm.prompt_renderers.anthropic_cache_planner import (
+    MAX_CACHE_BREAKPOINTS,
+    AnthropicCachePlanner,
+    PromptCachePolicy,
+)
+from autobyteus.llm.prompt_renderers.anthropic_prompt_renderer import AnthropicPromptRenderer
+from autobyteus.llm.utils.messages import Message, MessageRole
+
+CACHE = {"type": "ephemeral"}
+
+
+def _conversation(turns: int, summary: bool = False):
+    messages = []
+    if summary:
+        messages.append({"role": "user", "content": "[MEMORY:EPISODIC]\n1) Earlier work."})
+    for turn in range(turns):
+        messages.append({"role": "user", "content": f"question {turn}"})
+        messages.append({"role": "assistant", "content": f"answer {turn}"})
+    messages.append({"role": "user", "content": "latest question"})
+    return messages
+
+
+def _marked_indices(messages):
+    marked = []
+    for index, message in enumerate(messages):
+        content = message["content"]
+        if isinstance(content, list) and any("cache_control" in block for block in content):
+            marked.append(index)
+    return marked
+
+
+def test_system_breakpoint_covers_tools_and_latest_message_is_marked():
+    planner = AnthropicCachePlanner()
+    tools = [{"name": "a"}, {"name": "b"}]
+    messages = _conversation(turns=1)
+
+    system, marked, marked_tools, plan = planner.apply("You are helpful.", messages, tools)
+
+    assert system == [{"type": "text", "text": "You are helpful.", "cache_control": CACHE}]
+    assert marked_tools == tools
+    assert _marked_indices(marked) == [len(messages) - 1]
+    assert marked[-1]["content"] == [{"type": "text", "text": "latest question", "cache_control": CACHE}]
+    # Inputs are not mutated.
+    assert messages[-1]["content"] == "latest question"
+
+
+def test_tools_are_marked_when_there_is_no_system_prompt():
+    tools = [{"name": "a"}, {"name": "b"}]
+    _, _, marked_tools, plan = AnthropicCachePlanner().apply(None, _conversation(0), tools)
+
+    assert plan.tool_index == 1
+    assert marked_tools[1]["cache_control"] == CACHE
+    assert "cache_control" not in tools[1]
+
+
+def test_compacted_summary_gets_its_own_breakpoint():
+    messages = _conversation(turns=2, summary=True)
+    plan = AnthropicCachePlanner().plan("system", messages, tools=None)
+
+    assert plan.labels["summary"] == 0
+    assert 0 in plan.message_indices
+    assert len(messages) - 1 in plan.message_indices
+
+
+def test_breakpoints_never_exceed_provider_limit():
+    policy = PromptCachePolicy(history_breakpoints=10, history_boundary_interval=1)
+    messages = _conversation(turns=30, summary=True)
+
+    plan = AnthropicCachePlanner(policy).plan("system", messages, tools=[{"name": "a"}])
+
+    assert plan.count == MAX_CACHE_BREAKPOINTS
+
+
+def test_history_boundary_is_stable_as_turns_are_appended():
+    policy = PromptCachePolicy(history_breakpoints=2, history_boundary_interval=2)
+    planner = AnthropicCachePlanner(policy)
+
+    earlier = planner.plan("system", _conversation(turns=4), tools=None)
+    later_messages = _conversation(turns=4)[:-1] + [
+        {"role": "user", "content": "question 4"},
+        {"role": "assistant", "content": "answer 4"},
+        {"role": "user", "content": "latest question"},
+    ]
+    later = planner.plan("system", later_messages, tools=None)
+
+    # The newest breakpoint of one turn becomes a cached prefix the next turn can read.
+    assert earlier.message_indices[-1] < later.message_indices[-1]
+    assert all(messages_index % 2 == 0 for messages_index in later.message_indices)
+
+
+def test_empty_messages_are_never_marked():
+    messages = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": ""}]
+    plan = AnthropicCachePlanner().plan(None, messages, tools=None)
+    assert plan.message_indices == [0]
+
+
+def test_disabled_policy_leaves_request_untouched():
+    messages = _conversation(turns=1)
+    system, marked, tools, plan = AnthropicCachePlanner(PromptCachePolicy(enabled=False)).apply(
+        "system", messages, None
+    )
+    assert plan.count == 0
+    assert system == "system"
+    assert marked is messages
+
+
+def test_ttl_is_forwarded_to_cache_control():
+    system, _, _, _ = AnthropicCachePlanner(PromptCachePolicy(ttl="1h")).apply("system", [], None)
+    assert system[0]["cache_control"] == {"type": "ephemeral", "ttl": "1h"}
+
+
+@pytest.mark.asyncio
+async def test_renderer_render_request_applies_breakpoints():
+    renderer = AnthropicPromptRenderer()
+    request = await renderer.render_request(
+        "System",
+        [Message(role=MessageRole.USER, content="Hello")],
+        tools=[{"name": "search"}],
+    )
+
+    assert request["system"][0]["cache_control"] == CACHE
+    assert request["tools"] == [{"name": "search"}]
+    assert request["messages"] == [
+        {"role": "user", "content": [{"type": "text", "text": "Hello", "cache_control": CACHE}]}
+    ]
@@ -0,0 +1,170 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from autobyteus.llm.lmstudio_provider import LMStudioModelProvider
+from autobyteus.llm.ollama_provider import OllamaModelProvider
+from autobyteus.llm.utils.local_model_discovery import LocalModelDiscovery
+
+
+class _FakeModelServer:
+    """Local HTTP server answering Ollama `/api/tags` and LM Studio `/v1/models`."""
+
+    def __init__(self, model_names, delay: float = 0.0):
+        self.model_names = list(model_names)
+        self.delay = delay
+        self.request_count = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.request_count += 1
+                if server.delay:
+                    time.sleep(server.delay)
+                if self.path.startswith("/api/tags"):
+                    payload = {"models": [{"name": name, "model": name} for name in server.model_names]}
+                elif self.path.startswith("/v1/models"):
+                    payload = {
+                        "object": "list",
+                        "data": [
+                            {"id": name, "object": "model", "created": 0, "owned_by": "local"}
+                            for name in server.model_names
+                        ],
+                    }
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                body = json.dumps(payload).encode("utf-8")
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def discovery_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUTOBYTEUS_MODEL_DISCOVERY_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("AUTOBYTEUS_MODEL_DISCOVERY_CACHE_TTL", raising=False)
+    monkeypatch.setattr(OllamaModelProvider, "CONNECTION_TIMEOUT", 0.5)
+    monkeypatch.setattr(LMStudioModelProvider, "CONNECTION_TIMEOUT", 0.5)
+    return tmp_path
+
+
+def test_ollama_get_models_queries_hosts_concurrently(monkeypatch):
+    with _FakeModelServer(["hung:latest"], delay=3.0) as hung, \
+            _FakeModelServer(["slow:latest"], delay=0.3) as slow, \
+            _FakeModelServer(["llama3:latest", "qwen3:8b"]) as healthy:
+        monkeypatch.setenv("OLLAMA_HOSTS", f"{hung.url},{slow.url},{healthy.url}")
+
+        started = time.monotonic()
+        models = OllamaModelProvider.get_models()
+        elapsed = time.monotonic() - started
+
+    by_host = {}
+    for model in models:
+        by_host.setdefault(model.host_url, []).append(model.name)
+    assert by_host == {slow.url: ["slow:latest"], healthy.url: ["llama3:latest", "qwen3:8b"]}
+    # The hung host costs one timeout, not the sum of all host latencies.
+    assert elapsed < 1.5
+
+
+def test_lmstudio_get_models_skips_hung_host(monkeypatch):
+    with _FakeModelServer(["hung-model"], delay=3.0) as hung, \
+            _FakeModelServer(["qwen2.5-7b-instruct"]) as healthy:
+        monkeypatch.setenv("LMSTUDIO_HOSTS", f"{hung.url},{healthy.url}")
+
+        started = time.monotonic()
+        models = LMStudioModelProvider.get_models()
+        elapsed = time.monotonic() - started
+
+    assert [(m.host_url, m.name) for m in models] == [(healthy.url, "qwen2.5-7b-instruct")]
+    assert elapsed < 1.5
+
+
+def test_discover_serves_fresh_cache_without_network(discovery_env):
+    with _FakeModelServer(["llama3:latest"]) as server:
+        discovery = LocalModelDiscovery(
+            "ollama", OllamaModelProvider._fetch_model_names, timeout=0.5, ttl_seconds=60
+        )
+        assert discovery.discover([server.url]) == {server.url: ["llama3:latest"]}
+        assert server.request_count == 1
+
+        server.model_names = ["changed:latest"]
+        assert discovery.discover([server.url]) == {server.url: ["llama3:latest"]}
+        assert server.request_count == 1
+
+    assert (discovery_env / "ollama_models.json").exists()
+
+
+def test_discover_returns_stale_cache_and_refreshes_in_background():
+    with _FakeModelServer(["llama3:latest"]) as server:
+        discovery = LocalModelDiscovery(
+            "ollama", OllamaModelProvider._fetch_model_names, timeout=0.5, ttl_seconds=60
+        )
+        discovery.fetch([server.url])
+        discovery.ttl_seconds = 0.01
+        time.sleep(0.02)
+        server.model_names = ["llama3:latest", "mistral:7b"]
+        server.delay = 0.3
+
+        refreshed = []
+        started = time.monotonic()
+        result = discovery.discover([server.url], on_refresh=refreshed.append)
+        elapsed = time.monotonic() - started
+
+        assert result == {server.url: ["llama3:latest"]}
+        assert elapsed < 0.2
+
+        discovery.wait_for_refresh(timeout=2.0)
+
+    assert refreshed == [{server.url: ["llama3:latest", "mistral:7b"]}]
+    assert discovery.cache.load()[server.url].model_names == ["llama3:latest", "mistral:7b"]
+
+
+def test_failed_host_is_cached_as_empty_so_next_startup_does_not_wait():
+    with _FakeModelServer(["hung:latest"], delay=3.0) as hung:
+        discovery = LocalModelDiscovery(
+            "ollama", OllamaModelProvider._fetch_model_names, timeout=0.3, ttl_seconds=60
+        )
+        assert discovery.discover([hung.url]) == {}
+
+        started = time.monotonic()
+        assert discovery.discover([hung.url]) == {}
+        assert time.monotonic() - started < 0.1
+        assert hung.request_count == 1
+
+
+def test_zero_ttl_disables_cache(discovery_env):
+    with _FakeModelServer(["llama3:latest"]) as server:
+        discovery = LocalModelDiscovery(
+            "ollama", OllamaModelProvider._fetch_model_names, timeout=0.5, ttl_seconds=0
+        )
+        discovery.discover([server.url])
+        discovery.discover([server.url])
+
+        assert server.request_count == 2
+    assert not (discovery_env / "ollama_models.json").exists()
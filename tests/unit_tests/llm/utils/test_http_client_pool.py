@@ -0,0 +1,137 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from autobyteus.llm.utils.http_client_pool import HttpClientPool, HttpClientPoolConfig
+from autobyteus.llm.utils.messages import Message, MessageRole
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.connections = 0
+        self._count_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self._count_lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._send(b"ok", "text/plain")
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        chunks = [
+            {"choices": [{"delta": {"content": "Hello"}}]},
+            {"choices": [{"delta": {"content": " there"}}],
+             "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}},
+        ]
+        body = "".join(f"data: {json.dumps(chunk)}\n\n" for chunk in chunks) + "data: [DONE]\n\n"
+        self._send(body.encode("utf-8"), "text/event-stream")
+
+    def _send(self, body, content_type):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = _CountingServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _pool():
+    return HttpClientPool(HttpClientPoolConfig(http2=False))
+
+
+@pytest.mark.asyncio
+async def test_async_client_reuses_one_connection(server):
+    pool = _pool()
+    for _ in range(5):
+        client = pool.get_async_client("provider")
+        response = await client.get(server.url)
+        assert response.text == "ok"
+
+    assert pool.get_async_client("provider") is client
+    assert pool.get_async_client("other") is not client
+    assert server.connections == 1
+    await pool.aclose()
+    assert client.is_closed
+
+
+def test_sync_client_is_shared_across_threads(server):
+    pool = _pool()
+    client = pool.get_sync_client("provider")
+    clients = []
+
+    def worker():
+        shared = pool.get_sync_client("provider")
+        clients.append(shared)
+        shared.get(server.url)
+
+    for _ in range(3):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+    assert all(shared is client for shared in clients)
+    assert server.connections == 1
+    pool.close()
+    assert client.is_closed
+
+
+def test_async_clients_are_per_event_loop():
+    pool = _pool()
+
+    async def get_client():
+        return pool.get_async_client("provider")
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_mistral_streaming_reuses_pooled_connection(server, monkeypatch):
+    from autobyteus.llm.api import mistral_llm
+    from autobyteus.llm.api.mistral_llm import MistralLLM
+    from autobyteus.llm.extensions import token_usage_tracking_extension
+
+    monkeypatch.setenv("MISTRAL_API_KEY", "test-key")
+    monkeypatch.setattr(token_usage_tracking_extension, "get_token_counter", lambda model, llm: None)
+    monkeypatch.setattr(mistral_llm, "get_http_client_pool", lambda: pool)
+    monkeypatch.setattr(MistralLLM, "CHAT_COMPLETIONS_URL", f"{server.url}/v1/chat/completions")
+    pool = _pool()
+    llm = MistralLLM()
+
+    for _ in range(3):
+        chunks = [chunk async for chunk in llm._stream_messages_to_llm([Message(MessageRole.USER, content="hi")])]
+        assert "".join(chunk.content for chunk in chunks) == "Hello there"
+        assert chunks[-1].usage.total_tokens == 5
+
+    assert server.connections == 1
+    await pool.aclose()
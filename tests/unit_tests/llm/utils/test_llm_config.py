@@ -70,6 +70,16 @@ def test_token_pricing_config_merge_with_another_config():
     assert base_config_2.input_token_pricing == 0.0 
     assert base_config_2.output_token_pricing == 0.45
 
+def test_token_pricing_config_cache_rates_round_trip_and_merge():
+    """Cache rates serialize only when set and are kept when an override leaves them unset."""
+    config = TokenPricingConfig(3.0, 15.0, cached_input_token_pricing=0.3, cache_write_token_pricing=3.75)
+    assert TokenPricingConfig.from_dict(config.to_dict()) == config
+
+    config.merge_with(TokenPricingConfig(input_token_pricing=2.0, output_token_pricing=10.0))
+    assert config.input_token_pricing == 2.0
+    assert config.cached_input_token_pricing == 0.3
+    assert config.cache_write_token_pricing == 3.75
+
 # Tests for LLMConfig
 
 def test_llm_config_initialization_defaults():
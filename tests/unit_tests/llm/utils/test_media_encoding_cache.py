@@ -0,0 +1,185 @@
+import base64
+import os
+
+import httpx
+import pytest
+
+from autobyteus.llm.utils.media_encoding_cache import MediaEncodingCache
+
+IMAGE_BYTES = b"\x89PNG fake image payload"
+IMAGE_B64 = base64.b64encode(IMAGE_BYTES).decode("utf-8")
+
+
+@pytest.mark.asyncio
+async def test_file_is_encoded_once_until_it_changes(tmp_path):
+    cache = MediaEncodingCache()
+    image = tmp_path / "shot.png"
+    image.write_bytes(IMAGE_BYTES)
+
+    first = await cache.encode_file(str(image))
+    second = await cache.encode_file(str(image))
+
+    assert first.base64_data == IMAGE_B64
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    image.write_bytes(b"changed content")
+    stat = image.stat()
+    os.utime(image, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    third = await cache.encode_file(str(image))
+    assert third.base64_data == base64.b64encode(b"changed content").decode("utf-8")
+    assert cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_content_is_stored_once(tmp_path):
+    cache = MediaEncodingCache()
+    for name in ("a.png", "b.png"):
+        (tmp_path / name).write_bytes(IMAGE_BYTES)
+
+    a = await cache.encode_file(str(tmp_path / "a.png"))
+    b = await cache.encode_file(str(tmp_path / "b.png"))
+
+    assert a.digest == b.digest
+    assert cache.memory_bytes == len(IMAGE_B64)
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_evicts_least_recently_used(tmp_path):
+    payload_size = len(base64.b64encode(b"x" * 30))
+    cache = MediaEncodingCache(max_memory_bytes=payload_size * 2)
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"{index}.png"
+        path.write_bytes(bytes([index]) * 30)
+        paths.append(str(path))
+
+    await cache.encode_file(paths[0])
+    await cache.encode_file(paths[1])
+    await cache.encode_file(paths[0])  # Touch 0 so 1 becomes the LRU entry.
+    await cache.encode_file(paths[2])
+
+    assert cache.memory_bytes <= payload_size * 2
+    misses = cache.misses
+    await cache.encode_file(paths[0])
+    assert cache.misses == misses
+    await cache.encode_file(paths[1])
+    assert cache.misses == misses + 1
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_a_new_cache_instance(tmp_path):
+    image = tmp_path / "shot.png"
+    image.write_bytes(IMAGE_BYTES)
+    disk_dir = tmp_path / "cache"
+
+    await MediaEncodingCache(disk_dir=disk_dir).encode_file(str(image))
+
+    reopened = MediaEncodingCache(disk_dir=disk_dir)
+    media = await reopened.encode_file(str(image))
+    assert media.base64_data == IMAGE_B64
+    assert (reopened.hits, reopened.misses) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_url_is_revalidated_with_etag():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.headers))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=IMAGE_BYTES, headers={"etag": '"v1"', "content-type": "image/png"})
+
+    cache = MediaEncodingCache()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first = await cache.encode_url("https://example.com/a.png", client)
+        second = await cache.encode_url("https://example.com/a.png", client)
+
+    assert first.base64_data == second.base64_data == IMAGE_B64
+    assert second.mime_type == "image/png"
+    assert "if-none-match" not in requests[0]
+    assert requests[1]["if-none-match"] == '"v1"'
+    assert cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_url_is_refetched_when_payload_is_evicted_during_revalidation():
+    requests = []
+    cache = MediaEncodingCache()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(dict(request.headers))
+        if request.headers.get("if-none-match") == '"v1"':
+            cache._payloads.clear()  # Evicted while the conditional request was in flight.
+            return httpx.Response(304)
+        return httpx.Response(200, content=IMAGE_BYTES, headers={"etag": '"v1"', "content-type": "image/png"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await cache.encode_url("https://example.com/a.png", client)
+        second = await cache.encode_url("https://example.com/a.png", client)
+
+    assert second.base64_data == IMAGE_B64
+    assert [headers.get("if-none-match") for headers in requests] == [None, '"v1"', None]
+
+
+@pytest.mark.asyncio
+async def test_url_within_max_age_is_not_refetched():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, content=IMAGE_BYTES, headers={"cache-control": "public, max-age=60"})
+
+    cache = MediaEncodingCache()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await cache.encode_url("https://example.com/a.png", client)
+        await cache.encode_url("https://example.com/a.png", client)
+
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_url_without_validators_is_always_downloaded():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, content=IMAGE_BYTES)
+
+    cache = MediaEncodingCache()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await cache.encode_url("https://example.com/a.png", client)
+        await cache.encode_url("https://example.com/a.png", client)
+
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_evicts_least_recently_used_past_its_cap(tmp_path):
+    payload_size = len(base64.b64encode(b"x" * 30))
+    disk_dir = tmp_path / "cache"
+    cache = MediaEncodingCache(max_memory_bytes=0, disk_dir=disk_dir, max_disk_bytes=payload_size * 2)
+    digests = []
+    for index in range(3):
+        path = tmp_path / f"{index}.png"
+        path.write_bytes(bytes([index]) * 30)
+        digests.append((await cache.encode_file(str(path))).digest)
+
+    assert cache.disk_bytes == payload_size * 2
+    assert sorted(p.stem for p in disk_dir.glob("*.b64")) == sorted(digests[1:])
+    assert MediaEncodingCache(disk_dir=disk_dir).disk_bytes == payload_size * 2
+
+
+@pytest.mark.asyncio
+async def test_file_keys_are_bounded(tmp_path):
+    cache = MediaEncodingCache(max_index_entries=2)
+    for index in range(3):
+        path = tmp_path / f"{index}.png"
+        path.write_bytes(IMAGE_BYTES)
+        await cache.encode_file(str(path))
+
+    assert len(cache._file_keys) == 2
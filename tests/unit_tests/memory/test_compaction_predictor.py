@@ -0,0 +1,133 @@
+import asyncio
+import time
+
+import pytest
+
+from autobyteus.agent.events.agent_events import ToolResultEvent
+from autobyteus.agent.tool_invocation import ToolInvocation
+from autobyteus.llm.utils.messages import Message, MessageRole
+from autobyteus.memory.compaction.compactor import Compactor
+from autobyteus.memory.memory_manager import MemoryManager
+from autobyteus.memory.models.memory_types import MemoryType
+from autobyteus.memory.models.raw_trace_item import RawTraceItem
+from autobyteus.memory.policies.compaction_policy import CompactionPolicy
+from autobyteus.memory.policies.compaction_predictor import MESSAGE_OVERHEAD_TOKENS, CompactionPredictor
+from autobyteus.memory.store.file_store import FileMemoryStore
+
+
+class _Summarizer:
+    def __init__(self):
+        self.calls = 0
+
+    def summarize(self, traces):
+        self.calls += 1
+        return type("Result", (), {"episodic_summary": "Summary", "semantic_facts": []})
+
+
+def _user_trace(turn_id: str) -> RawTraceItem:
+    return RawTraceItem(
+        id=f"rt_{turn_id}",
+        ts=time.time(),
+        turn_id=turn_id,
+        seq=1,
+        trace_type="user",
+        content="hello",
+        source_event="LLMUserMessageReadyEvent",
+    )
+
+
+def test_predictor_calibrates_offset_from_reported_prompt_tokens():
+    predictor = CompactionPredictor()
+    messages = [Message(role=MessageRole.USER, content="x" * 400)]
+
+    assert predictor.estimate_tokens(messages) == 100 + MESSAGE_OVERHEAD_TOKENS
+    predictor.observe_prompt(messages, prompt_tokens=1104)
+
+    assert predictor.offset_tokens == 1000
+    messages.append(Message(role=MessageRole.ASSISTANT, content="y" * 40))
+    assert predictor.predict_prompt_tokens(messages) == 1104 + 10 + MESSAGE_OVERHEAD_TOKENS
+
+
+def test_predictor_reserves_pending_tool_results_by_history():
+    predictor = CompactionPredictor(default_tool_result_tokens=500)
+
+    assert predictor.expected_tool_result_tokens("search") == 500
+    predictor.observe_tool_result("search", "r" * 4000)
+    predictor.observe_tool_result("search", "r" * 40)
+
+    assert predictor.expected_tool_result_tokens("search") == 1000
+    assert predictor.predict_prompt_tokens([], pending_tool_names=["search", "unknown"]) == (
+        1000 + 500 + 2 * MESSAGE_OVERHEAD_TOKENS
+    )
+
+
+def test_schedule_compaction_predicts_pending_tool_results(tmp_path):
+    policy = CompactionPolicy(trigger_ratio=0.8, default_tool_result_tokens=300)
+    store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_predict")
+    manager = MemoryManager(store=store, compaction_policy=policy)
+    manager.compactor = Compactor(store=store, policy=policy, summarizer=_Summarizer())
+
+    assert manager.schedule_compaction(prompt_tokens=600, input_budget=1000, sent_messages=[]) is False
+
+    manager.ingest_tool_intent(ToolInvocation(name="search", arguments={}, id="call_1", turn_id="turn_0001"))
+    assert manager.schedule_compaction(prompt_tokens=600, input_budget=1000, sent_messages=[]) is True
+    assert manager.compaction_required is True
+
+    manager.clear_compaction_request()
+    manager.ingest_tool_result(
+        ToolResultEvent(tool_name="search", result="ok", tool_invocation_id="call_1", turn_id="turn_0001")
+    )
+    assert manager.predict_next_prompt_tokens() < 800
+
+
+def test_schedule_compaction_without_predictive_only_reacts(tmp_path):
+    policy = CompactionPolicy(trigger_ratio=0.8, predictive=False, default_tool_result_tokens=300)
+    store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_reactive")
+    manager = MemoryManager(store=store, compaction_policy=policy)
+    manager.compactor = Compactor(store=store, policy=policy, summarizer=_Summarizer())
+    manager.ingest_tool_intent(ToolInvocation(name="search", arguments={}, id="call_1", turn_id="turn_0001"))
+
+    assert manager.schedule_compaction(prompt_tokens=600, input_budget=1000, sent_messages=[]) is False
+    assert manager.schedule_compaction(prompt_tokens=850, input_budget=1000, sent_messages=[]) is True
+
+
+@pytest.mark.asyncio
+async def test_schedule_compaction_runs_in_background_excluding_current_turn(tmp_path):
+    policy = CompactionPolicy(trigger_ratio=0.5, raw_tail_turns=0)
+    store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_background")
+    manager = MemoryManager(store=store, compaction_policy=policy)
+    summarizer = _Summarizer()
+    manager.compactor = Compactor(store=store, policy=policy, summarizer=summarizer)
+    store.add([_user_trace("turn_0001"), _user_trace("turn_0002"), _user_trace("turn_0003")])
+
+    assert manager.schedule_compaction(900, 1000, sent_messages=[], current_turn_id="turn_0003") is True
+    await asyncio.sleep(0)
+
+    assert await manager.wait_for_background_compaction() is True
+    assert summarizer.calls == 1
+    remaining = {item.turn_id for item in store.list(MemoryType.RAW_TRACE)}
+    assert remaining == {"turn_0003"}
+    assert await manager.wait_for_background_compaction() is False
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_background_compaction_before_it_writes(tmp_path):
+    class _SlowSummarizer(_Summarizer):
+        def summarize(self, traces):
+            time.sleep(0.2)
+            return super().summarize(traces)
+
+    policy = CompactionPolicy(trigger_ratio=0.5, raw_tail_turns=0)
+    store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_close")
+    manager = MemoryManager(store=store, compaction_policy=policy)
+    manager.compactor = Compactor(store=store, policy=policy, summarizer=_SlowSummarizer())
+    store.add([_user_trace("turn_0001"), _user_trace("turn_0002")])
+    assert manager.schedule_compaction(900, 1000, sent_messages=[], current_turn_id="turn_0002") is True
+    await asyncio.sleep(0.05)
+
+    await manager.close()
+    await asyncio.sleep(0.3)
+
+    assert store.list(MemoryType.EPISODIC) == []
+    assert {item.turn_id for item in store.list(MemoryType.RAW_TRACE)} == {"turn_0001", "turn_0002"}
+    assert await manager.wait_for_background_compaction() is False
@@ -1,10 +1,16 @@
 import time
 
-from autobyteus.memory.compaction.compactor import Compactor
+import pytest
+
+from autobyteus.memory.compaction.compactor import CONSOLIDATED_TAG, ROLLING_TAG, Compactor
 from autobyteus.memory.compaction.compaction_result import CompactionResult
-from autobyteus.memory.compaction.summarizer import Summarizer
+from autobyteus.memory.compaction.summarizer import AsyncSummarizer, Summarizer
+from autobyteus.memory.models.episodic_item import EpisodicItem
+from autobyteus.memory.models.memory_types import MemoryType
 from autobyteus.memory.models.raw_trace_item import RawTraceItem
 from autobyteus.memory.policies.compaction_policy import CompactionPolicy
+from autobyteus.memory.retrieval.retriever import Retriever
+from autobyteus.memory.store.base_store import MemoryStore
 from autobyteus.memory.store.file_store import FileMemoryStore
 
 
@@ -104,3 +110,99 @@ def test_compactor_does_not_prune_on_failure(tmp_path):
 
     archive = store.read_archive_raw_traces()
     assert archive == []
+
+
+class _InMemoryStore(MemoryStore):
+    """Store without prune support, so compacted traces stay listed."""
+
+    def __init__(self):
+        self.items = []
+
+    def add(self, items):
+        self.items.extend(items)
+
+    def list(self, memory_type, limit=None):
+        matching = [item for item in self.items if item.memory_type == memory_type]
+        return matching[-limit:] if limit is not None else matching
+
+
+class _FoldingSummarizer(AsyncSummarizer):
+    def __init__(self):
+        self.calls = []
+        self.consolidations = []
+
+    async def summarize_async(self, traces, previous_summary=None):
+        self.calls.append(([trace.turn_id for trace in traces], previous_summary))
+        window = ",".join(trace.content for trace in traces)
+        summary = f"{previous_summary}|{window}" if previous_summary else window
+        return CompactionResult(episodic_summary=summary, semantic_facts=[])
+
+    async def consolidate_async(self, summary):
+        self.consolidations.append(summary)
+        return f"C({len(summary)})"
+
+
+def _add_turns(store, *turn_ids):
+    store.add([
+        RawTraceItem(
+            id=f"rt_{turn_id}",
+            ts=time.time(),
+            turn_id=turn_id,
+            seq=1,
+            trace_type="user",
+            content=turn_id[-1],
+            source_event="LLMUserMessageReadyEvent",
+        )
+        for turn_id in turn_ids
+    ])
+
+
+@pytest.mark.asyncio
+async def test_compact_async_folds_new_turns_into_rolling_summary():
+    store = _InMemoryStore()
+    summarizer = _FoldingSummarizer()
+    compactor = Compactor(store=store, policy=CompactionPolicy(raw_tail_turns=1), summarizer=summarizer)
+
+    _add_turns(store, "turn_0001", "turn_0002")
+    await compactor.compact_async(compactor.select_compaction_window())
+    _add_turns(store, "turn_0003")
+    # The store cannot prune, so turn_0001 is still in the window but already covered.
+    await compactor.compact_async(compactor.select_compaction_window())
+
+    assert summarizer.calls == [(["turn_0001"], None), (["turn_0002"], "1")]
+    bundle = Retriever(store=store).retrieve(max_episodic=3, max_semantic=0)
+    assert [item.summary for item in bundle.episodic] == ["1|2"]
+    assert bundle.episodic[0].tags == [ROLLING_TAG]
+
+
+@pytest.mark.asyncio
+async def test_compact_async_reconsolidates_periodically():
+    store = _InMemoryStore()
+    summarizer = _FoldingSummarizer()
+    policy = CompactionPolicy(raw_tail_turns=0, consolidate_every=3)
+    compactor = Compactor(store=store, policy=policy, summarizer=summarizer)
+
+    for turn in range(1, 6):
+        turn_id = f"turn_000{turn}"
+        _add_turns(store, turn_id)
+        await compactor.compact_async([turn_id])
+
+    assert summarizer.consolidations == ["1|2|3"]
+    episodic = store.list(MemoryType.EPISODIC)
+    assert [item.summary for item in episodic] == ["1", "1|2", "C(5)", "C(5)|4", "C(5)|4|5"]
+    assert CONSOLIDATED_TAG in episodic[2].tags
+    assert summarizer.calls[-1] == (["turn_0005"], "C(5)|4")
+
+
+def test_sync_summarizer_folds_through_default_async_contract(tmp_path):
+    store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_sync")
+    policy = CompactionPolicy(raw_tail_turns=0, max_summary_chars=10)
+    compactor = Compactor(store=store, policy=policy, summarizer=_NoopSummarizer())
+
+    store.add([EpisodicItem(id="ep_0", ts=time.time(), turn_ids=["turn_0000"], summary="earlier", tags=[ROLLING_TAG])])
+    _add_turns(store, "turn_0001")
+    compactor.compact(["turn_0001"])
+
+    latest = store.list(MemoryType.EPISODIC)[-1]
+    assert latest.summary == "earlier"
+    assert latest.turn_ids == ["turn_0001"]
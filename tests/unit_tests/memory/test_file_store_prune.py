@@ -1,5 +1,7 @@
 import time
 
+import pytest
+
 from autobyteus.memory.models.raw_trace_item import RawTraceItem
 from autobyteus.memory.store.file_store import FileMemoryStore
 
@@ -36,3 +38,17 @@ def test_prune_raw_traces_archives_removed(tmp_path):
     archive = store.read_archive_raw_traces()
     assert len(archive) == 1
     assert archive[0]["turn_id"] == "turn_0001"
+
+
+def test_prune_raw_traces_keeps_traces_when_archiving_fails(tmp_path, monkeypatch):
+    store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_1")
+    store.add([_make_trace("turn_0001", 1), _make_trace("turn_0002", 1)])
+
+    def fail(records):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store.archive, "_append_records", fail)
+    with pytest.raises(OSError):
+        store.prune_raw_traces(keep_turn_ids={"turn_0002"}, archive=True)
+
+    assert [item["turn_id"] for item in store.list_raw_trace_dicts()] == ["turn_0001", "turn_0002"]
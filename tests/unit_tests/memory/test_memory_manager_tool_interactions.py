@@ -1,9 +1,14 @@
 import time
 
+import pytest
+
+from autobyteus.agent.events.agent_events import ToolResultEvent
+from autobyteus.agent.tool_invocation import ToolInvocation
 from autobyteus.memory.memory_manager import MemoryManager
 from autobyteus.memory.models.raw_trace_item import RawTraceItem
 from autobyteus.memory.models.tool_interaction import ToolInteractionStatus
 from autobyteus.memory.store.file_store import FileMemoryStore
+from autobyteus.memory.store.sqlite_store import SqliteMemoryStore
 
 
 def _trace(**kwargs) -> RawTraceItem:
@@ -68,3 +73,57 @@ def test_memory_manager_get_tool_interactions_filters_by_turn(tmp_path):
     turn_2_interactions = manager.get_tool_interactions(turn_id="turn_0002")
     assert len(turn_2_interactions) == 1
     assert turn_2_interactions[0].status == ToolInteractionStatus.PENDING
+
+
+def _run_tool(manager: MemoryManager, turn_id: str, call_id: str, error: str = None) -> None:
+    manager.ingest_tool_intent(ToolInvocation(name="search", arguments={"q": call_id}, id=call_id, turn_id=turn_id))
+    manager.ingest_tool_result(
+        ToolResultEvent(tool_name="search", result={"hits": 1}, error=error, tool_invocation_id=call_id, turn_id=turn_id)
+    )
+
+
+def _forbid_full_scan(store, monkeypatch) -> None:
+    def fail(*args, **kwargs):
+        raise AssertionError("tool interactions were rebuilt from a full raw trace scan")
+
+    monkeypatch.setattr(store, "list", fail)
+
+
+def test_tool_interactions_are_indexed_incrementally_and_restored_from_log(tmp_path, monkeypatch):
+    store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_tool")
+    manager = MemoryManager(store=store)
+    _run_tool(manager, "turn_0001", "call_1")
+    _run_tool(manager, "turn_0002", "call_2", error="boom")
+    manager.ingest_tool_intent(ToolInvocation(name="search", arguments={}, id="call_3", turn_id="turn_0002"))
+
+    _forbid_full_scan(store, monkeypatch)
+    assert [i.status for i in manager.get_tool_interactions(turn_id="turn_0002")] == [
+        ToolInteractionStatus.ERROR,
+        ToolInteractionStatus.PENDING,
+    ]
+
+    # A restarted agent replays the log; only a trace appended after it is read.
+    restored_store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_tool")
+    restored_store.add([_trace(trace_type="tool_result", turn_id="turn_0002", seq=9, tool_call_id="call_3")])
+    _forbid_full_scan(restored_store, monkeypatch)
+    restored = MemoryManager(store=restored_store)
+
+    interactions = restored.get_tool_interactions()
+    assert [i.tool_call_id for i in interactions] == ["call_1", "call_2", "call_3"]
+    assert interactions[0].result == {"hits": 1}
+    assert interactions[2].status == ToolInteractionStatus.SUCCESS
+
+
+@pytest.mark.parametrize("store_cls", [FileMemoryStore, SqliteMemoryStore])
+def test_tool_interaction_index_follows_pruning(tmp_path, store_cls):
+    store = store_cls(base_dir=tmp_path, agent_id="agent_tool")
+    manager = MemoryManager(store=store)
+    _run_tool(manager, "turn_0001", "call_1")
+    _run_tool(manager, "turn_0002", "call_2")
+    assert len(manager.get_tool_interactions()) == 2
+
+    store.prune_raw_traces(keep_turn_ids={"turn_0002"}, archive=True)
+    _run_tool(manager, "turn_0003", "call_3")
+
+    assert [i.tool_call_id for i in manager.get_tool_interactions()] == ["call_2", "call_3"]
+    assert [i.tool_call_id for i in MemoryManager(store=store).get_tool_interactions()] == ["call_2", "call_3"]
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from autobyteus.memory.path_resolver import resolve_agent_memory_dir, resolve_memory_base_dir
+from autobyteus.memory.path_resolver import resolve_agent_memory_dir, resolve_memory_backend, resolve_memory_base_dir
 
 
 def test_resolve_memory_base_dir_override_wins():
@@ -31,3 +31,9 @@ def test_resolve_memory_base_dir_default(tmp_path, monkeypatch):
 def test_resolve_agent_memory_dir():
     resolved = resolve_agent_memory_dir("/base", "agent_1")
     assert resolved == str(Path("/base") / "agents" / "agent_1")
+
+
+def test_resolve_memory_backend():
+    assert resolve_memory_backend(env={}) == "file"
+    assert resolve_memory_backend(env={"AUTOBYTEUS_MEMORY_BACKEND": " SQLite "}) == "sqlite"
+    assert resolve_memory_backend(env={"AUTOBYTEUS_MEMORY_BACKEND": "redis"}) == "file"
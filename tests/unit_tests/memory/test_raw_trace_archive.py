@@ -0,0 +1,128 @@
+import json
+
+import pytest
+
+from autobyteus.memory.store.file_store import FileMemoryStore
+from autobyteus.memory.store.raw_trace_archive import MANIFEST_NAME, RawTraceArchive
+
+
+def _record(turn_no: int, seq: int, ts: float) -> dict:
+    return {
+        "id": f"rt_turn_{turn_no:04d}_{seq}",
+        "ts": ts,
+        "turn_id": f"turn_{turn_no:04d}",
+        "seq": seq,
+        "trace_type": "user",
+        "content": "x" * 40,
+        "source_event": "LLMUserMessageReadyEvent",
+    }
+
+
+def _history(turns: int) -> list:
+    return [_record(turn_no, seq, 1000.0 + turn_no) for turn_no in range(1, turns + 1) for seq in (1, 2)]
+
+
+def test_archive_rotates_and_seals_segments(tmp_path):
+    archive = RawTraceArchive(tmp_path / "archive", segment_bytes=1024, codec="gzip")
+    records = _history(40)
+
+    for start in range(0, len(records), 10):
+        archive.append(records[start:start + 10])
+
+    segments = archive.segments()
+    assert len(segments) > 2
+    assert all(segment.codec == "gzip" for segment in segments[:-1])
+    assert sum(segment.count for segment in segments) == len(records)
+    assert archive.read_all() == records
+    assert not list((tmp_path / "archive").glob("*.tmp"))
+
+
+def test_turn_lookup_reads_only_matching_segments(tmp_path, monkeypatch):
+    archive = RawTraceArchive(tmp_path / "archive", segment_bytes=1024, codec="gzip")
+    archive.append(_history(40))
+    segments = archive.segments()
+
+    opened = []
+    original = RawTraceArchive._segment_lines
+
+    def recording(self, segment):
+        opened.append(segment.file)
+        return original(self, segment)
+
+    monkeypatch.setattr(RawTraceArchive, "_segment_lines", recording)
+    found = list(archive.iter_records(turn_ids=["turn_0017"]))
+
+    assert [record["id"] for record in found] == ["rt_turn_0017_1", "rt_turn_0017_2"]
+    assert len(opened) == 1
+    assert len(segments) > 2
+
+
+def test_time_range_lookup(tmp_path):
+    archive = RawTraceArchive(tmp_path / "archive", segment_bytes=1024, codec="gzip")
+    archive.append(_history(40))
+
+    found = list(archive.iter_records(since=1010.0, until=1012.0))
+
+    assert sorted({record["turn_id"] for record in found}) == ["turn_0010", "turn_0011", "turn_0012"]
+
+
+def test_stale_manifest_is_reindexed(tmp_path):
+    directory = tmp_path / "archive"
+    RawTraceArchive(directory, codec="gzip").append(_history(2)).result()
+    # Simulate a crash between appending to the active segment and writing the manifest.
+    active = directory / "segment-000001.jsonl"
+    with active.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(_record(3, 1, 1003.0)) + "\n")
+
+    reopened = RawTraceArchive(directory, codec="gzip")
+
+    assert [record["turn_id"] for record in reopened.iter_records(turn_ids=["turn_0003"])] == ["turn_0003"]
+    assert reopened.segments()[-1].count == 5
+
+
+def test_torn_last_line_is_dropped_on_recovery(tmp_path):
+    directory = tmp_path / "archive"
+    RawTraceArchive(directory, codec="gzip").append(_history(2)).result()
+    active = directory / "segment-000001.jsonl"
+    intact = active.read_bytes()
+    with active.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(_record(3, 1, 1003.0))[:25])
+
+    reopened = RawTraceArchive(directory, codec="gzip")
+
+    assert len(reopened.read_all()) == 4
+    assert active.read_bytes() == intact
+    reopened.append([_record(3, 1, 1003.0)]).result()
+    assert [record["turn_id"] for record in reopened.iter_records(turn_ids=["turn_0003"])] == ["turn_0003"]
+
+
+def test_failed_write_is_raised_by_flush_once(tmp_path, monkeypatch):
+    archive = RawTraceArchive(tmp_path / "archive", codec="gzip")
+
+    def fail(records):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(archive, "_append_records", fail)
+    assert isinstance(archive.append(_history(1)).exception(), OSError)
+    monkeypatch.undo()
+    archive.append(_history(2))
+
+    with pytest.raises(OSError, match="disk full"):
+        archive.flush()
+    archive.flush()
+    assert [record["turn_id"] for record in archive.read_all()] == ["turn_0001", "turn_0001", "turn_0002", "turn_0002"]
+
+
+def test_file_store_migrates_legacy_archive(tmp_path):
+    store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_1")
+    legacy = store.agent_dir / "raw_traces_archive.jsonl"
+    legacy.write_text("".join(json.dumps(record) + "\n" for record in _history(3)), encoding="utf-8")
+
+    store.archive.append([_record(4, 1, 1004.0)])
+
+    assert [record["turn_id"] for record in store.read_archive_raw_traces()] == [
+        "turn_0001", "turn_0001", "turn_0002", "turn_0002", "turn_0003", "turn_0003", "turn_0004",
+    ]
+    assert not legacy.exists()
+    assert (store.agent_dir / "raw_traces_archive" / MANIFEST_NAME).exists()
+    assert len(store.read_archived_traces(turn_ids=["turn_0002"])) == 2
@@ -0,0 +1,154 @@
+import json
+import threading
+import time
+
+import pytest
+
+from autobyteus.memory.compaction.compaction_result import CompactionResult
+from autobyteus.memory.compaction.compactor import Compactor
+from autobyteus.memory.compaction.summarizer import Summarizer
+from autobyteus.memory.models.episodic_item import EpisodicItem
+from autobyteus.memory.models.memory_types import MemoryType
+from autobyteus.memory.models.raw_trace_item import RawTraceItem
+from autobyteus.memory.models.semantic_item import SemanticItem
+from autobyteus.memory.policies.compaction_policy import CompactionPolicy
+from autobyteus.memory.store.file_store import FileMemoryStore
+from autobyteus.memory.store.sqlite_migration import migrate_file_store_to_sqlite
+from autobyteus.memory.store.sqlite_store import SqliteMemoryStore
+
+
+class _Summarizer(Summarizer):
+    def summarize(self, traces):
+        return CompactionResult(episodic_summary="Summary", semantic_facts=[{"fact": "fact", "tags": ["t"]}])
+
+
+def _trace(turn_id: str, seq: int, ts: float = None) -> RawTraceItem:
+    return RawTraceItem(
+        id=f"rt_{turn_id}_{seq}",
+        ts=ts if ts is not None else time.time(),
+        turn_id=turn_id,
+        seq=seq,
+        trace_type="user",
+        content=f"{turn_id}:{seq}",
+        source_event="LLMUserMessageReadyEvent",
+    )
+
+
+def test_sqlite_store_add_and_list(tmp_path):
+    store = SqliteMemoryStore(base_dir=tmp_path, agent_id="agent_1")
+    store.add(
+        [
+            _trace("turn_0001", 1),
+            _trace("turn_0001", 2),
+            EpisodicItem(id="ep_1", ts=time.time(), turn_ids=["turn_0001"], summary="s", tags=["rolling"]),
+            SemanticItem(id="sem_1", ts=time.time(), fact="f", confidence=0.5),
+        ]
+    )
+
+    raw_items = store.list(MemoryType.RAW_TRACE)
+    assert [item.id for item in raw_items] == ["rt_turn_0001_1", "rt_turn_0001_2"]
+    assert [item.id for item in store.list(MemoryType.RAW_TRACE, limit=1)] == ["rt_turn_0001_2"]
+    assert store.list(MemoryType.EPISODIC)[0].tags == ["rolling"]
+    assert store.list(MemoryType.SEMANTIC)[0].fact == "f"
+    journal_mode = store._connection().execute("PRAGMA journal_mode").fetchone()[0]
+    assert journal_mode == "wal"
+
+
+def test_sqlite_store_agents_are_isolated_and_queryable_together(tmp_path):
+    first = SqliteMemoryStore(base_dir=tmp_path, agent_id="agent_1")
+    second = SqliteMemoryStore(base_dir=tmp_path, agent_id="agent_2")
+    first.add([_trace("turn_0001", 1, ts=10.0)])
+    second.add([_trace("turn_0001", 1, ts=20.0), _trace("turn_0002", 1, ts=30.0)])
+
+    assert len(first.list(MemoryType.RAW_TRACE)) == 1
+    assert first.list_agent_ids() == ["agent_1", "agent_2"]
+    records = first.query(MemoryType.RAW_TRACE, since=15.0)
+    assert [(record["agent_id"], record["turn_id"]) for record in records] == [
+        ("agent_2", "turn_0001"),
+        ("agent_2", "turn_0002"),
+    ]
+    by_turn = first.query(MemoryType.RAW_TRACE, turn_ids=["turn_0001"])
+    assert {record["agent_id"] for record in by_turn} == {"agent_1", "agent_2"}
+
+
+def test_sqlite_store_prune_archives_and_compacts(tmp_path):
+    store = SqliteMemoryStore(base_dir=tmp_path, agent_id="agent_1")
+    store.add([_trace("turn_0001", 1), _trace("turn_0002", 1), _trace("turn_0003", 1)])
+    compactor = Compactor(store=store, policy=CompactionPolicy(raw_tail_turns=1), summarizer=_Summarizer())
+
+    compactor.compact(compactor.select_compaction_window())
+
+    assert [item["turn_id"] for item in store.list_raw_trace_dicts()] == ["turn_0003"]
+    assert [item["turn_id"] for item in store.read_archive_raw_traces()] == ["turn_0001", "turn_0002"]
+    assert [item["turn_id"] for item in store.read_archived_traces(turn_ids=["turn_0002"])] == ["turn_0002"]
+    assert store.list(MemoryType.EPISODIC)[0].turn_ids == ["turn_0001", "turn_0002"]
+
+    store.prune_raw_traces(keep_turn_ids=set(), archive=False)
+    assert store.list_raw_trace_dicts() == []
+    assert len(store.read_archive_raw_traces()) == 2
+
+
+def test_sqlite_store_is_usable_from_worker_threads(tmp_path):
+    store = SqliteMemoryStore(base_dir=tmp_path, agent_id="agent_1")
+
+    def write(turn_no: int) -> None:
+        store.add([_trace(f"turn_{turn_no:04d}", seq) for seq in range(1, 11)])
+
+    threads = [threading.Thread(target=write, args=(turn_no,)) for turn_no in range(1, 9)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store.list(MemoryType.RAW_TRACE)) == 80
+
+
+def test_migrate_file_store_to_sqlite(tmp_path):
+    file_store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_1")
+    file_store.add([_trace("turn_0001", 1), _trace("turn_0002", 1)])
+    file_store.add([EpisodicItem(id="ep_1", ts=time.time(), turn_ids=["turn_0001"], summary="s")])
+    file_store.prune_raw_traces(keep_turn_ids={"turn_0002"}, archive=True)
+    FileMemoryStore(base_dir=tmp_path, agent_id="agent_2").add([_trace("turn_0001", 1)])
+
+    migrated = migrate_file_store_to_sqlite(tmp_path)
+    rerun = migrate_file_store_to_sqlite(tmp_path)
+
+    assert migrated["agent_1"] == {"raw_trace": 1, "episodic": 1, "semantic": 0, "archived_raw_trace": 1}
+    assert migrated["agent_2"]["raw_trace"] == 1
+    assert rerun == {}
+    store = SqliteMemoryStore(base_dir=tmp_path, agent_id="agent_1")
+    assert [item.turn_id for item in store.list(MemoryType.RAW_TRACE)] == ["turn_0002"]
+    assert [item["turn_id"] for item in store.read_archive_raw_traces()] == ["turn_0001"]
+    assert store.list(MemoryType.EPISODIC)[0].summary == "s"
+
+
+def test_migration_of_an_agent_is_all_or_nothing(tmp_path):
+    file_store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_1")
+    file_store.add([_trace("turn_0001", 1), EpisodicItem(id="ep_1", ts=time.time(), turn_ids=["turn_0001"], summary="s")])
+    episodic_path = file_store._get_file_path(MemoryType.EPISODIC)
+    valid = episodic_path.read_text(encoding="utf-8")
+    episodic_path.write_text(valid + "{truncated\n", encoding="utf-8")
+
+    with pytest.raises(json.JSONDecodeError):
+        migrate_file_store_to_sqlite(tmp_path)
+    assert not SqliteMemoryStore(base_dir=tmp_path, agent_id="agent_1").has_items()
+
+    episodic_path.write_text(valid, encoding="utf-8")
+    migrated = migrate_file_store_to_sqlite(tmp_path)
+
+    assert migrated["agent_1"] == {"raw_trace": 1, "episodic": 1, "semantic": 0}
+
+
+def test_migration_reads_legacy_archive_without_rewriting_it(tmp_path):
+    file_store = FileMemoryStore(base_dir=tmp_path, agent_id="agent_1")
+    legacy = file_store._get_archive_path()
+    legacy.write_text(json.dumps(_trace("turn_0001", 1).to_dict()) + "\n", encoding="utf-8")
+    source = legacy.read_bytes()
+
+    migrated = migrate_file_store_to_sqlite(tmp_path)
+
+    assert migrated["agent_1"]["archived_raw_trace"] == 1
+    assert legacy.read_bytes() == source
+    assert not (file_store.agent_dir / "raw_traces_archive").exists()
+    store = SqliteMemoryStore(base_dir=tmp_path, agent_id="agent_1")
+    assert [item["turn_id"] for item in store.read_archive_raw_traces()] == ["turn_0001"]
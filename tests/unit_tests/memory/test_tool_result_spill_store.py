@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from autobyteus.memory.store.tool_result_spill_store import ToolResultSpillStore
+
+
+def test_spill_store_is_content_addressed(tmp_path):
+    store = ToolResultSpillStore(base_dir=tmp_path, agent_id="agent_spill")
+
+    ref = store.write("payload")
+
+    assert store.write("payload") == ref
+    assert store.path(ref) == tmp_path / "agents" / "agent_spill" / "tool_results" / f"{ref}.txt"
+    assert len(list(store.dir.iterdir())) == 1
+
+
+def test_spill_store_reads_character_ranges(tmp_path):
+    store = ToolResultSpillStore(base_dir=tmp_path, agent_id="agent_spill")
+    ref = store.write("Ümlaut-" * 10)
+
+    assert store.read(ref, 0, 7) == ("Ümlaut-", True)
+    assert store.read(ref, 63, 100) == ("Ümlaut-", False)
+    assert store.read(ref, 500) == ("", False)
+
+
+def test_spill_store_rejects_invalid_refs(tmp_path):
+    store = ToolResultSpillStore(base_dir=tmp_path, agent_id="agent_spill")
+
+    with pytest.raises(ValueError):
+        store.read("../../etc/passwd")
+    with pytest.raises(FileNotFoundError):
+        store.read("0" * 64)
+
+
+def test_concurrent_writes_of_one_payload_all_succeed(tmp_path):
+    store = ToolResultSpillStore(base_dir=tmp_path, agent_id="agent_spill")
+    payload = "x" * 1_000_000
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        refs = set(pool.map(lambda _: store.write(payload), range(32)))
+
+    assert len(refs) == 1
+    assert [p.name for p in store.dir.iterdir()] == [f"{refs.pop()}.txt"]
@@ -8,6 +8,7 @@ from autobyteus.memory.restore.working_context_snapshot_bootstrapper import (
     WorkingContextSnapshotBootstrapOptions,
 )
 from autobyteus.memory.retrieval.memory_bundle import MemoryBundle
+from autobyteus.memory.store.working_context_snapshot_store import WorkingContextSnapshotStore
 
 
 def test_bootstrapper_uses_cache_when_valid():
@@ -58,3 +59,21 @@ def test_bootstrapper_falls_back_to_rebuild_when_cache_missing():
 
     snapshot_builder.build.assert_called_once()
     memory_manager.reset_working_context_snapshot.assert_called_once_with(snapshot_builder.build.return_value)
+
+
+def test_bootstrapper_streams_snapshot_from_store(tmp_path):
+    snapshot = WorkingContextSnapshot()
+    snapshot.append_message(Message(role=MessageRole.SYSTEM, content="System"))
+    snapshot.append_tool_result("call_1", "run_bash", "y" * 20_000)
+    store = WorkingContextSnapshotStore(base_dir=tmp_path, agent_id="agent_1")
+    store.write_encoded("agent_1", WorkingContextSnapshotSerializer.encode(snapshot, {"agent_id": "agent_1"}))
+    store.read = MagicMock(side_effect=AssertionError("snapshot should be streamed"))
+
+    memory_manager = MagicMock()
+    bootstrapper = WorkingContextSnapshotBootstrapper(working_context_snapshot_store=store)
+    bootstrapper.bootstrap(memory_manager, system_prompt="System", options=WorkingContextSnapshotBootstrapOptions())
+
+    messages = memory_manager.reset_working_context_snapshot.call_args[0][0]
+    assert [m.role for m in messages] == [MessageRole.SYSTEM, MessageRole.TOOL]
+    assert messages[1].tool_payload.tool_result == "y" * 20_000
+    memory_manager.retriever.retrieve.assert_not_called()
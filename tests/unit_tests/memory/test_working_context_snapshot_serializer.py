@@ -1,3 +1,4 @@
+import io
 import json
 
 from autobyteus.llm.utils.messages import Message, MessageRole, ToolCallPayload, ToolCallSpec, ToolResultPayload
@@ -93,3 +94,98 @@ def test_serializer_handles_non_json_tool_result():
 def test_serializer_validate_rejects_missing_fields():
     payload = {"schema_version": 1, "messages": []}
     assert not WorkingContextSnapshotSerializer.validate(payload)
+
+
+def _tool_snapshot() -> WorkingContextSnapshot:
+    snapshot = WorkingContextSnapshot()
+    snapshot.append_user("Hello ✓")
+    snapshot.append_tool_calls([ToolCallSpec(id="call_1", name="search", arguments={"q": "abc", 1: "int key"})])
+    snapshot.append_tool_result("call_1", "search", {"ok": True, "items": list(range(5))})
+    return snapshot
+
+
+def test_encode_matches_serialize_for_both_backends():
+    snapshot = _tool_snapshot()
+    metadata = {"agent_id": "agent_1", "schema_version": 1}
+    expected = json.loads(json.dumps(WorkingContextSnapshotSerializer.serialize(snapshot, metadata)))
+
+    for backend in ("json", "orjson"):
+        assert json.loads(WorkingContextSnapshotSerializer.encode(snapshot, metadata, backend=backend)) == expected
+
+
+def test_encode_stringifies_only_non_json_values():
+    class Weird:
+        def __str__(self) -> str:
+            return "<weird>"
+
+    snapshot = WorkingContextSnapshot()
+    snapshot.append_tool_result("call_2", "weird", {"value": Weird(), "count": 2})
+
+    payload = json.loads(WorkingContextSnapshotSerializer.encode(snapshot, {"agent_id": "agent_2"}))
+
+    assert payload["messages"][0]["tool_payload"]["tool_result"] == {"value": "<weird>", "count": 2}
+
+
+def test_encode_normalises_tool_results_the_encoder_rejects():
+    snapshot = WorkingContextSnapshot()
+    snapshot.append_user("Hello")
+    snapshot.append_tool_result("call_3", "grid", {(0, 1): "cell"})
+    metadata = {"agent_id": "agent_3", "schema_version": 1}
+    expected = json.loads(json.dumps(WorkingContextSnapshotSerializer.serialize(snapshot, metadata)))
+
+    for backend in ("json", "orjson"):
+        payload = json.loads(WorkingContextSnapshotSerializer.encode(snapshot, metadata, backend=backend))
+        assert payload == expected
+        assert payload["messages"][1]["tool_payload"]["tool_result"] == "{(0, 1): 'cell'}"
+
+
+def test_encode_reuses_fragments_until_a_message_changes(monkeypatch):
+    from autobyteus.memory import working_context_snapshot_serializer as module
+
+    snapshot = _tool_snapshot()
+    encoded = []
+    original = module.dumps_bytes
+
+    def counting(value, backend=None):
+        encoded.append(value)
+        return original(value, backend)
+
+    monkeypatch.setattr(module, "dumps_bytes", counting)
+    WorkingContextSnapshotSerializer.encode(snapshot, {"agent_id": "agent_1"})
+    assert len(encoded) == 4  # header + 3 messages
+
+    encoded.clear()
+    snapshot.append_user("Next")
+    snapshot.build_messages()[0].content = "Edited"
+    payload = json.loads(WorkingContextSnapshotSerializer.encode(snapshot, {"agent_id": "agent_1"}))
+
+    assert len(encoded) == 3  # header + the edited and the new message
+    assert payload["messages"][0]["content"] == "Edited"
+    assert payload["messages"][-1]["content"] == "Next"
+
+
+def test_decode_stream_round_trips_and_defers_large_messages():
+    snapshot = _tool_snapshot()
+    snapshot.append_tool_result("call_2", "read_file", "x" * 10_000)
+    data = WorkingContextSnapshotSerializer.encode(snapshot, {"agent_id": "agent_1", "epoch_id": 3})
+
+    restored, metadata = WorkingContextSnapshotSerializer.decode_stream(io.BytesIO(data), lazy_message_bytes=1000)
+
+    assert metadata["agent_id"] == "agent_1"
+    assert restored.epoch_id == 3
+    large = restored.build_messages()[-1]
+    assert large.role == MessageRole.TOOL
+    assert "tool_payload" not in vars(large)
+    # Re-encoding a message that was never read reuses its JSON as is.
+    assert WorkingContextSnapshotSerializer.encode(restored, {"agent_id": "agent_1", "epoch_id": 3}) == data
+    assert large.tool_payload.tool_result == "x" * 10_000
+    assert [m.to_dict() for m in restored.build_messages()] == json.loads(data)["messages"]
+
+
+def test_decode_stream_rejects_other_layouts():
+    payload = WorkingContextSnapshotSerializer.serialize(_tool_snapshot(), {"agent_id": "agent_1"})
+    legacy = json.dumps(payload).encode("utf-8")
+    encoded = WorkingContextSnapshotSerializer.encode(_tool_snapshot(), {"agent_id": "agent_1"})
+
+    assert WorkingContextSnapshotSerializer.decode_stream(io.BytesIO(legacy)) is None
+    assert WorkingContextSnapshotSerializer.decode_stream(io.BytesIO(encoded[: len(encoded) // 2])) is None
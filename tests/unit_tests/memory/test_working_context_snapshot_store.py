@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from autobyteus.memory.store.working_context_snapshot_store import WorkingContextSnapshotStore
 
 
@@ -12,3 +14,14 @@ def test_working_context_snapshot_store_read_write_exists(tmp_path):
     assert store.exists("agent_1")
     loaded = store.read("agent_1")
     assert loaded == payload
+
+
+def test_working_context_snapshot_store_concurrent_encoded_writes(tmp_path):
+    store = WorkingContextSnapshotStore(base_dir=tmp_path, agent_id="agent_1")
+    payloads = [f'{{"schema_version": 1, "agent_id": "agent_1", "messages": [], "n": {i}}}'.encode() for i in range(32)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda data: store.write_encoded("agent_1", data), payloads))
+
+    assert store.read("agent_1")["n"] in range(32)
+    assert [path.name for path in (tmp_path / "agents" / "agent_1").iterdir()] == ["working_context_snapshot.json"]
@@ -0,0 +1,193 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from openai import AsyncOpenAI
+
+from autobyteus.multimedia.audio.api.openai_audio_client import OpenAIAudioClient
+from autobyteus.multimedia.image.api.openai_image_client import OpenAIImageClient
+from autobyteus.multimedia.utils.media_output import generated_media_dir, move_generated_media
+from autobyteus.multimedia.utils.multimedia_config import MultimediaConfig
+
+GENERATION_DELAY = 0.3
+IMAGE_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 4096
+AUDIO_BYTES = b"ID3" + b"\x01" * 8192
+
+
+class _FakeOpenAIHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(GENERATION_DELAY)
+        if self.path.endswith("/images/generations") or self.path.endswith("/images/edits"):
+            body = json.dumps({
+                "created": 0,
+                "data": [{"b64_json": base64.b64encode(IMAGE_BYTES).decode("utf-8")}],
+            }).encode("utf-8")
+            content_type = "application/json"
+        elif self.path.endswith("/audio/speech"):
+            body, content_type = AUDIO_BYTES, "audio/mpeg"
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_openai():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOpenAIHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
+async def _max_loop_lag_during(coro):
+    """Runs `coro` while a 10ms ticker measures the worst event-loop stall."""
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def probe():
+        nonlocal max_lag
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.01)
+            max_lag = max(max_lag, time.perf_counter() - started - 0.01)
+
+    probe_task = asyncio.create_task(probe())
+    try:
+        result = await coro
+    finally:
+        done.set()
+        await probe_task
+    return result, max_lag
+
+
+def _client(cls, base_url, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    client = cls(SimpleNamespace(name="fake", value="fake-model"), MultimediaConfig())
+    client.client = AsyncOpenAI(api_key="test-key", base_url=base_url, max_retries=0)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_openai_image_generation_writes_file_without_blocking_loop(fake_openai, tmp_path, monkeypatch):
+    client = _client(OpenAIImageClient, fake_openai, monkeypatch)
+
+    response, max_lag = await _max_loop_lag_during(
+        client.generate_image(prompt="a cat", output_dir=str(tmp_path))
+    )
+
+    image_path = Path(response.image_urls[0])
+    assert image_path.parent == tmp_path
+    assert image_path.read_bytes() == IMAGE_BYTES
+    assert max_lag < GENERATION_DELAY / 3
+    await client.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_openai_image_generation_without_output_dir_returns_data_uri(fake_openai, monkeypatch):
+    client = _client(OpenAIImageClient, fake_openai, monkeypatch)
+
+    response = await client.generate_image(prompt="a cat")
+
+    assert response.image_urls[0].startswith("data:image/png;base64,")
+    await client.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_openai_image_edit_reads_source_off_loop(fake_openai, tmp_path, monkeypatch):
+    client = _client(OpenAIImageClient, fake_openai, monkeypatch)
+    source = tmp_path / "source.png"
+    source.write_bytes(IMAGE_BYTES)
+
+    response, max_lag = await _max_loop_lag_during(
+        client.edit_image(prompt="add a hat", input_image_urls=[str(source)], output_dir=str(tmp_path / "out"))
+    )
+
+    assert Path(response.image_urls[0]).read_bytes() == IMAGE_BYTES
+    assert max_lag < GENERATION_DELAY / 3
+    await client.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_openai_speech_streams_to_file(fake_openai, tmp_path, monkeypatch):
+    client = _client(OpenAIAudioClient, fake_openai, monkeypatch)
+
+    response, max_lag = await _max_loop_lag_during(
+        client.generate_speech(prompt="hello", output_dir=str(tmp_path))
+    )
+
+    audio_path = Path(response.audio_urls[0])
+    assert audio_path.parent == tmp_path
+    assert audio_path.suffix == ".mp3"
+    assert audio_path.read_bytes() == AUDIO_BYTES
+    assert max_lag < GENERATION_DELAY / 3
+    await client.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_gemini_speech_uses_async_client(tmp_path, monkeypatch):
+    from autobyteus.multimedia.audio.api import gemini_audio_client as ga
+
+    async def generate_content(model, contents, config=None):
+        await asyncio.sleep(GENERATION_DELAY)
+        inline = SimpleNamespace(mime_type="audio/L16;rate=24000", data=b"\x00\x01" * 2400)
+        return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[SimpleNamespace(inline_data=inline)]))])
+
+    sync_client = MagicMock()
+    sync_client.models.generate_content.side_effect = AssertionError("sync client must not be used")
+    sync_client.aio = SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+    monkeypatch.setattr(ga, "initialize_gemini_client_with_runtime", lambda: (sync_client, SimpleNamespace(runtime="api_key")))
+    monkeypatch.setattr(ga, "resolve_model_for_runtime", lambda model_value, modality, runtime=None: model_value)
+    monkeypatch.setattr(ga.genai_types, "SpeechConfig", MagicMock())
+    monkeypatch.setattr(ga.genai_types, "GenerateContentConfig", MagicMock())
+
+    client = ga.GeminiAudioClient(SimpleNamespace(name="tts", value="tts-model"), MultimediaConfig())
+    response, max_lag = await _max_loop_lag_during(
+        client.generate_speech(prompt="hello", output_dir=str(tmp_path))
+    )
+
+    audio_path = Path(response.audio_urls[0])
+    assert audio_path.parent == tmp_path and audio_path.suffix == ".wav"
+    assert max_lag < GENERATION_DELAY / 3
+
+
+@pytest.mark.asyncio
+async def test_move_generated_media_moves_staged_files_into_place(tmp_path):
+    async with generated_media_dir() as staging_dir:
+        generated = Path(staging_dir) / "generated.png"
+        generated.write_bytes(IMAGE_BYTES)
+        (Path(staging_dir) / "extra.png").write_bytes(IMAGE_BYTES)
+        target = tmp_path / "workspace" / "final.png"
+
+        await move_generated_media(str(generated), target, staging_dir)
+
+        assert target.read_bytes() == IMAGE_BYTES
+        assert not generated.exists()
+    assert not Path(staging_dir).exists()
+    assert [p.name for p in target.parent.iterdir()] == ["final.png"]
+
+    data_uri = "data:image/png;base64," + base64.b64encode(IMAGE_BYTES).decode("utf-8")
+    other_target = tmp_path / "nested" / "from_data_uri.png"
+    await move_generated_media(data_uri, other_target)
+    assert other_target.read_bytes() == IMAGE_BYTES
@@ -206,13 +206,19 @@ async def test_read_io_error_functional(tmp_path, mocker, file_reader_tool_insta
     file_path_str = str(tmp_path / "reader_io_error_file.txt")
     with open(file_path_str, 'w') as f: f.write("content") 
 
-    original_open = open 
-    def mock_open_for_reader(path_arg, *args, **kwargs):
-        if path_arg == file_path_str: 
-            raise IOError("Simulated open error for read_file")
-        return original_open(path_arg, *args, **kwargs) 
-    
-    mocker.patch('autobyteus.tools.file.read_file.open', side_effect=mock_open_for_reader)
+    mocker.patch('autobyteus.tools.file.read_file.read_line_range', side_effect=IOError("Simulated open error for read_file"))
     
     with pytest.raises(IOError, match=f"Could not read file at {file_path_str}: Simulated open error for read_file"):
         await file_reader_tool_instance.execute(mock_agent_context_file_ops, path=file_path_str)
+
+@pytest.mark.asyncio
+async def test_read_file_truncates_oversized_output(tmp_path, monkeypatch, file_reader_tool_instance: BaseTool, mock_agent_context_file_ops: AgentContext):
+    monkeypatch.setenv("AUTOBYTEUS_READ_FILE_MAX_BYTES", "12")
+    file_path = tmp_path / "big.txt"
+    file_path.write_text("alpha\nbeta\ngamma\ndelta\n", encoding="utf-8")
+
+    content = await file_reader_tool_instance.execute(mock_agent_context_file_ops, path=str(file_path))
+    assert content == (
+        "1: alpha\n2: beta\n"
+        "[read_file: output truncated after line 2 of 4 (size limit); call again with start_line=3 to continue]"
+    )
@@ -125,8 +125,7 @@ async def test_overwrite_existing_file_functional(file_writer_tool_instance: Bas
 @pytest.mark.asyncio
 async def test_write_io_error_functional(mocker, file_writer_tool_instance: BaseTool, temp_dir_for_functional_writer: str, mock_agent_context_file_ops: AgentContext):
     path = os.path.join(temp_dir_for_functional_writer, "writer_io_error.txt")
-    mocker.patch('autobyteus.tools.file.write_file.os.makedirs') 
-    mocker.patch('autobyteus.tools.file.write_file.open', side_effect=IOError("Simulated write permission denied"))
+    mocker.patch('autobyteus.tools.file.write_file.atomic_write_text_async', side_effect=IOError("Simulated write permission denied"))
     
     with pytest.raises(IOError, match=f"Could not write file at '{path}': Simulated write permission denied"):
         await file_writer_tool_instance.execute(mock_agent_context_file_ops, path=path, content="test")
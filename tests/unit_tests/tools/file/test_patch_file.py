@@ -117,6 +117,55 @@ async def test_patch_retries_with_whitespace_tolerance(file_patch_tool_instance:
     assert result == f"File patched successfully at {file_path}"
     assert file_path.read_text(encoding='utf-8') == "alpha\n BETA\ngamma\n"
 
+@pytest.mark.asyncio
+async def test_patch_with_stale_line_numbers_in_large_file(file_patch_tool_instance: BaseTool, mock_agent_context_file_ops, tmp_path):
+    file_path = tmp_path / "shifted_patch.txt"
+    lines = [f"line {i}\n" for i in range(5000)]
+    file_path.write_text("".join(lines), encoding='utf-8')
+
+    # Made before 300 lines were inserted above both hunks.
+    patch = """@@ -100,3 +100,3 @@
+ line 400
+-line 401
++LINE 401
+ line 402
+@@ -3900,3 +3900,3 @@
+ line 4200
+-line 4201
++LINE 4201
+ line 4202
+"""
+
+    result = await file_patch_tool_instance.execute(
+        mock_agent_context_file_ops,
+        path=str(file_path),
+        patch=patch,
+    )
+
+    assert result == f"File patched successfully at {file_path}"
+    lines[401] = "LINE 401\n"
+    lines[4201] = "LINE 4201\n"
+    assert file_path.read_text(encoding='utf-8') == "".join(lines)
+
+@pytest.mark.asyncio
+async def test_patch_with_ambiguous_stale_context_is_rejected(file_patch_tool_instance: BaseTool, mock_agent_context_file_ops, tmp_path):
+    file_path = tmp_path / "stale_patch.txt"
+    original = "target\n" + "".join(f"line{i}\n" for i in range(1, 21)) + "target\n"
+    file_path.write_text(original, encoding='utf-8')
+
+    patch = """@@ -11,1 +11,1 @@
+-target
++updated
+"""
+
+    with pytest.raises(PatchApplicationError):
+        await file_patch_tool_instance.execute(
+            mock_agent_context_file_ops,
+            path=str(file_path),
+            patch=patch,
+        )
+    assert file_path.read_text(encoding='utf-8') == original
+
 @pytest.mark.asyncio
 async def test_missing_file_raises_error(file_patch_tool_instance: BaseTool, mock_agent_context_file_ops, tmp_path):
     target_path = tmp_path / "nonexistent.txt"
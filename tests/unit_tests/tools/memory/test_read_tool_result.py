@@ -0,0 +1,36 @@
+import pytest
+from unittest.mock import Mock
+
+from autobyteus.agent.context import AgentContext
+from autobyteus.memory.store.tool_result_spill_store import ToolResultSpillStore
+from autobyteus.tools.registry import default_tool_registry
+
+
+@pytest.fixture
+def spill_context(tmp_path):
+    context = Mock(spec=AgentContext)
+    context.agent_id = "agent_read_tool_result"
+    context.state = Mock()
+    context.state.memory_manager.tool_result_spill_store = ToolResultSpillStore(tmp_path, "agent_read_tool_result")
+    return context
+
+
+@pytest.mark.asyncio
+async def test_read_tool_result_pages_through_stored_output(spill_context):
+    ref = spill_context.state.memory_manager.tool_result_spill_store.write("abcdefghij")
+    tool_instance = default_tool_registry.create_tool("read_tool_result")
+
+    first = await tool_instance.execute(spill_context, ref=ref, offset=0, length=4)
+    last = await tool_instance.execute(spill_context, ref=ref, offset=8, length=4)
+
+    assert first.startswith("abcd\n")
+    assert "offset=4" in first
+    assert last == "ij"
+
+
+@pytest.mark.asyncio
+async def test_read_tool_result_unknown_ref(spill_context):
+    tool_instance = default_tool_registry.create_tool("read_tool_result")
+
+    with pytest.raises(FileNotFoundError):
+        await tool_instance.execute(spill_context, ref="f" * 64)
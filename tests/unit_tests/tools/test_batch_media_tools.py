@@ -0,0 +1,165 @@
+import asyncio
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from autobyteus.multimedia.providers import MultimediaProvider
+from autobyteus.multimedia.utils.batch_generation import ProviderConcurrencyLimiter, run_batch
+from autobyteus.multimedia.utils.response_types import ImageGenerationResponse, SpeechGenerationResponse
+from autobyteus.tools.multimedia import audio_tools, image_tools
+from autobyteus.tools.multimedia.audio_tools import GenerateSpeechBatchTool
+from autobyteus.tools.multimedia.image_tools import GenerateImageBatchTool
+
+LATENCY = 0.1
+
+
+class _StubMediaClients:
+    """Fake provider factory: every client writes a small file into output_dir after a fixed latency."""
+
+    def __init__(self, fail_prompts=()):
+        self.fail_prompts = set(fail_prompts)
+        self.created = []
+        self.active = 0
+        self.peak = 0
+
+    def create(self, model_identifier=None):
+        client = _StubMediaClient(self)
+        self.created.append(client)
+        return client
+
+
+class _StubMediaClient:
+    def __init__(self, provider: _StubMediaClients):
+        self.model = SimpleNamespace(provider=MultimediaProvider.OPENAI)
+        self.provider = provider
+        self.prompts = []
+        self.cleaned_up = False
+
+    async def _produce(self, prompt, output_dir, suffix):
+        provider = self.provider
+        self.prompts.append(prompt)
+        provider.active += 1
+        provider.peak = max(provider.peak, provider.active)
+        try:
+            await asyncio.sleep(LATENCY)
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            path = Path(output_dir) / f"generated-{prompt}.{suffix}"
+            path.write_bytes(prompt.encode("utf-8"))
+            if prompt in provider.fail_prompts:
+                # Leaves a partial output behind, as a provider failing mid-write would.
+                raise ValueError(f"provider rejected '{prompt}'")
+            return str(path)
+        finally:
+            provider.active -= 1
+
+    async def generate_image(self, prompt, input_image_urls=None, generation_config=None, **kwargs):
+        return ImageGenerationResponse(image_urls=[await self._produce(prompt, kwargs["output_dir"], "png")])
+
+    async def generate_speech(self, prompt, generation_config=None, **kwargs):
+        return SpeechGenerationResponse(audio_urls=[await self._produce(prompt, kwargs["output_dir"], "wav")])
+
+    async def cleanup(self):
+        self.cleaned_up = True
+
+
+def _context(tmp_path):
+    workspace = SimpleNamespace(get_base_path=lambda: str(tmp_path))
+    return SimpleNamespace(agent_id="agent-1", workspace=workspace)
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiter(monkeypatch):
+    monkeypatch.delenv("AUTOBYTEUS_MULTIMEDIA_MAX_CONCURRENCY", raising=False)
+    monkeypatch.delenv("AUTOBYTEUS_MULTIMEDIA_MAX_CONCURRENCY_OPENAI", raising=False)
+    ProviderConcurrencyLimiter.reset()
+    yield
+    ProviderConcurrencyLimiter.reset()
+
+
+@pytest.mark.asyncio
+async def test_image_batch_runs_concurrently_and_saves_every_item(tmp_path, monkeypatch):
+    client = _StubMediaClients()
+    monkeypatch.setattr(image_tools.image_client_factory, "create_image_client", client.create)
+    items = [{"prompt": f"frame{i}", "output_file_path": f"storyboard/frame{i}.png"} for i in range(8)]
+
+    started = time.perf_counter()
+    result = await GenerateImageBatchTool()._execute(_context(tmp_path), items=items)
+    elapsed = time.perf_counter() - started
+
+    assert result["succeeded"] == 8 and result["failed"] == 0
+    assert client.peak == 4  # Default provider cap.
+    assert elapsed < LATENCY * 8 / 2
+    for i in range(8):
+        assert (tmp_path / "storyboard" / f"frame{i}.png").read_bytes() == f"frame{i}".encode("utf-8")
+    assert not list((tmp_path / "storyboard").glob("generated-*"))
+
+
+@pytest.mark.asyncio
+async def test_image_batch_reports_partial_failures(tmp_path, monkeypatch):
+    client = _StubMediaClients(fail_prompts={"bad"})
+    monkeypatch.setattr(image_tools.image_client_factory, "create_image_client", client.create)
+    items = [
+        {"prompt": "good", "output_file_path": "a.png"},
+        {"prompt": "bad", "output_file_path": "b.png"},
+    ]
+
+    result = await GenerateImageBatchTool()._execute(_context(tmp_path), items=items)
+
+    assert (result["total"], result["succeeded"], result["failed"]) == (2, 1, 1)
+    by_index = {item["index"]: item for item in result["results"]}
+    assert by_index[0]["status"] == "success"
+    assert by_index[1]["status"] == "error" and "rejected" in by_index[1]["error"]
+    assert [p.name for p in tmp_path.iterdir()] == ["a.png"]
+
+
+@pytest.mark.asyncio
+async def test_speech_batch_respects_provider_specific_cap(tmp_path, monkeypatch):
+    monkeypatch.setenv("AUTOBYTEUS_MULTIMEDIA_MAX_CONCURRENCY_OPENAI", "2")
+    client = _StubMediaClients()
+    monkeypatch.setattr(audio_tools.audio_client_factory, "create_audio_client", client.create)
+    items = [{"prompt": f"line{i}", "output_file_path": f"audio/line{i}.wav"} for i in range(4)]
+
+    result = await GenerateSpeechBatchTool()._execute(_context(tmp_path), items=items)
+
+    assert result["succeeded"] == 4
+    assert client.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_run_batch_returns_results_in_completion_order():
+    delays = [0.06, 0.01, 0.03]
+
+    async def worker(index, delay):
+        await asyncio.sleep(delay)
+        return f"file{index}"
+
+    seen = []
+    results = await run_batch(delays, worker, asyncio.Semaphore(3), on_result=lambda r: seen.append(r.index))
+
+    assert [r.index for r in results] == [1, 2, 0] == seen
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_malformed_items(tmp_path, monkeypatch):
+    monkeypatch.setattr(image_tools.image_client_factory, "create_image_client", _StubMediaClients().create)
+    with pytest.raises(ValueError, match="Item 0"):
+        await GenerateImageBatchTool()._execute(_context(tmp_path), items=[{"prompt": "no path"}])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tool_cls, factory, create_name", [
+    (GenerateImageBatchTool, image_tools.image_client_factory, "create_image_client"),
+    (GenerateSpeechBatchTool, audio_tools.audio_client_factory, "create_audio_client"),
+])
+async def test_batch_items_do_not_share_a_client(tmp_path, monkeypatch, tool_cls, factory, create_name):
+    clients = _StubMediaClients()
+    monkeypatch.setattr(factory, create_name, clients.create)
+    items = [{"prompt": f"item{i}", "output_file_path": f"out/item{i}.bin"} for i in range(5)]
+
+    result = await tool_cls()._execute(_context(tmp_path), items=items)
+
+    assert result["succeeded"] == 5
+    assert sorted(len(client.prompts) for client in clients.created) == [1] * 5
+    assert all(client.cleaned_up for client in clients.created)
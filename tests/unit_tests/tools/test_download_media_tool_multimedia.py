@@ -43,6 +43,11 @@ from autobyteus.tools.multimedia import download_media_tool
 from autobyteus.tools.multimedia.download_media_tool import DownloadMediaTool
 
 
+@pytest.fixture(autouse=True)
+def _isolated_download_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("AUTOBYTEUS_DOWNLOAD_CACHE_DIR", str(tmp_path / "download-cache"))
+
+
 # --- Dummy HTTP layer to avoid real network calls ---
 class _DummyContent:
     async def iter_chunked(self, size: int):
@@ -51,6 +56,7 @@ class _DummyContent:
 
 class _DummyResponse:
     def __init__(self, headers: dict):
+        self.status = 200
         self.headers = headers
         self.content = _DummyContent()
 
@@ -74,7 +80,7 @@ class _DummySession:
     async def __aexit__(self, exc_type, exc, tb):
         return False
 
-    def get(self, url: str, timeout: int):
+    def get(self, url: str, timeout, **kwargs):
         return _DummyResponse(self._headers)
 
 
@@ -0,0 +1,160 @@
+import os
+import shutil
+
+import pytest
+
+from autobyteus.tools.transaction_management.backup_handler import BackupHandler
+
+
+def _atomic_write(path, data: bytes):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
+    os.replace(tmp_path, path)
+
+
+@pytest.fixture
+def handler(tmp_path):
+    handler = BackupHandler(store_dir=str(tmp_path / "store"), allow_hard_links=True)
+    handler._reflink_supported = False  # Exercise the hard-link path regardless of filesystem.
+    return handler
+
+
+@pytest.fixture
+def copying_handler(tmp_path):
+    handler = BackupHandler(store_dir=str(tmp_path / "store"))
+    handler._reflink_supported = False
+    return handler
+
+
+def _objects(handler):
+    return [p for p in handler.objects_dir.iterdir() if not p.name.startswith(".")]
+
+
+def test_backup_links_instead_of_copying_and_restores_after_atomic_replace(handler, tmp_path):
+    target = tmp_path / "data.bin"
+    target.write_bytes(b"original")
+
+    handler.create_backup("tx1", str(target))
+    (stored,) = _objects(handler)
+    assert stored.stat().st_ino == target.stat().st_ino
+
+    _atomic_write(target, b"edited")
+    handler.restore_backup("tx1", str(target))
+
+    assert target.read_bytes() == b"original"
+    assert target.stat().st_ino != stored.stat().st_ino
+
+
+def test_identical_revisions_are_stored_once(handler, tmp_path):
+    first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+    first.write_bytes(b"same content")
+    second.write_bytes(b"same content")
+
+    handler.create_backup("tx1", str(first))
+    handler.create_backup("tx2", str(first))
+    handler.create_backup("tx3", str(second))
+
+    assert len(_objects(handler)) == 1
+
+
+def test_first_backup_in_transaction_wins_and_restore_all(handler, tmp_path):
+    first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+    first.write_bytes(b"a0")
+    second.write_bytes(b"b0")
+
+    handler.create_backup("tx", str(first))
+    _atomic_write(first, b"a1")
+    handler.create_backup("tx", str(first))
+    handler.create_backup("tx", str(second))
+    _atomic_write(first, b"a2")
+    _atomic_write(second, b"b1")
+
+    handler.restore_backup("tx")
+
+    assert (first.read_bytes(), second.read_bytes()) == (b"a0", b"b0")
+
+
+def test_in_place_edit_through_hard_link_is_detected(handler, tmp_path):
+    target = tmp_path / "data.bin"
+    target.write_bytes(b"original")
+    handler.create_backup("tx", str(target))
+
+    with open(target, "r+b") as handle:
+        handle.write(b"EDITED!!")
+
+    with pytest.raises(IOError, match="modified after it was taken"):
+        handler.restore_backup("tx", str(target))
+
+
+def test_discard_backups_drops_unreferenced_objects(handler, tmp_path):
+    shared, own = tmp_path / "shared.txt", tmp_path / "own.txt"
+    shared.write_bytes(b"shared")
+    own.write_bytes(b"own")
+    handler.create_backup("tx1", str(shared))
+    handler.create_backup("tx1", str(own))
+    handler.create_backup("tx2", str(shared))
+
+    handler.discard_backups("tx1")
+
+    assert len(_objects(handler)) == 1
+    _atomic_write(shared, b"changed")
+    handler.restore_backup("tx2", str(shared))
+    assert shared.read_bytes() == b"shared"
+
+
+def test_revisions_differing_outside_sampled_blocks_are_kept_apart(handler, tmp_path):
+    size = 1024 * 1024
+    first, second = bytearray(size), bytearray(size)
+    second[size // 4] = 1  # Outside the first/middle/last fingerprint samples.
+    (tmp_path / "a.bin").write_bytes(bytes(first))
+    (tmp_path / "b.bin").write_bytes(bytes(second))
+
+    handler.create_backup("tx", str(tmp_path / "a.bin"))
+    handler.create_backup("tx", str(tmp_path / "b.bin"))
+    _atomic_write(tmp_path / "a.bin", b"")
+    _atomic_write(tmp_path / "b.bin", b"")
+    handler.restore_backup("tx")
+
+    assert len(_objects(handler)) == 2
+    assert (tmp_path / "b.bin").read_bytes() == bytes(second)
+
+
+def test_backups_are_copies_unless_hard_links_are_allowed(copying_handler, tmp_path):
+    target = tmp_path / "data.bin"
+    target.write_bytes(b"original")
+    copying_handler.create_backup("tx", str(target))
+    (stored,) = _objects(copying_handler)
+    assert stored.stat().st_ino != target.stat().st_ino
+
+    with open(target, "r+b") as handle:
+        handle.write(b"EDITED!!")
+    copying_handler.restore_backup("tx", str(target))
+
+    assert target.read_bytes() == b"original"
+
+
+def test_discard_backups_reads_only_its_own_manifest(handler, tmp_path):
+    target = tmp_path / "data.txt"
+    target.write_bytes(b"data")
+    handler.create_backup("tx1", str(target))
+    (handler.transactions_dir / "unrelated.json").write_text("not json", encoding="utf-8")
+
+    handler.discard_backups("tx1")
+
+    assert _objects(handler) == []
+    assert (handler.transactions_dir / "unrelated.json").exists()
+
+
+def test_references_are_rebuilt_for_stores_without_them(handler, tmp_path):
+    target = tmp_path / "data.txt"
+    target.write_bytes(b"data")
+    handler.create_backup("tx1", str(target))
+    handler.create_backup("tx2", str(target))
+    shutil.rmtree(handler.refs_dir)
+
+    reopened = BackupHandler(store_dir=str(handler.store_dir))
+    reopened.discard_backups("tx1")
+    assert len(_objects(reopened)) == 1
+    reopened.discard_backups("tx2")
+    assert _objects(reopened) == []
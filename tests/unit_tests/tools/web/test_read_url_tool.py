@@ -1,118 +1,148 @@
-import pytest
-from unittest.mock import MagicMock, AsyncMock
-from autobyteus.tools.web.read_url_tool import ReadUrl
-from autobyteus.utils.html_cleaner import CleaningMode
-
-# Mock aiohttp
-class _MockResponse:
-    def __init__(self, status=200, text_content="<html><body><p>Hello World</p></body></html>"):
-        self.status = status
-        self._text_content = text_content
-
-    async def text(self):
-        return self._text_content
-
-    async def __aenter__(self):
-        return self
+import socket
 
-    async def __aexit__(self, exc_type, exc, tb):
-        pass
-
-class _MockSession:
-    def __init__(self, response_map=None):
-        self.response_map = response_map or {}
-
-    def get(self, url, timeout=30):
-        # Return mapped response or default success response
-        return self.response_map.get(url, _MockResponse())
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from unittest.mock import MagicMock
 
-    async def __aenter__(self):
-        return self
+from autobyteus.tools.web.read_url_tool import ReadUrl
+from autobyteus.utils.aiohttp_session_pool import shutdown_aiohttp_session_pool
+
+
+class _Server:
+    """Local HTTP server that records client connections and conditional requests."""
+
+    def __init__(self):
+        self.routes = {}
+        self.peers = set()
+        self.requests = 0
+        self.conditional_requests = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        status, body, headers = self.routes.get(request.path, (404, "missing", {}))
+        etag = headers.get("ETag")
+        if "If-None-Match" in request.headers:
+            self.conditional_requests += 1
+            if etag and request.headers["If-None-Match"] == etag:
+                return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(status=status, text=body, content_type="text/html", headers=headers)
+
+
+@pytest.fixture(autouse=True)
+def http_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AUTOBYTEUS_HTTP_CACHE_DIR", str(tmp_path / "http-cache"))
+
+
+@pytest_asyncio.fixture
+async def server():
+    state = _Server()
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", state.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    state.base_url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+    yield state
+    await shutdown_aiohttp_session_pool()
+    await runner.cleanup()
 
-    async def __aexit__(self, exc_type, exc, tb):
-        pass
 
 @pytest.fixture
 def tool():
     return ReadUrl()
 
+
 @pytest.fixture
 def context():
     ctx = MagicMock()
     ctx.agent_id = "test-agent"
     return ctx
 
+
 @pytest.mark.asyncio
-async def test_read_url_success_text(tool, context, monkeypatch):
-    # Setup mock
-    mock_html = "<html><body><h1>Title</h1><p>Some text content.</p></body></html>"
-    
-    def mock_session():
-        return _MockSession(response_map={
-            "http://example.com": _MockResponse(text_content=mock_html)
-        })
-    
-    monkeypatch.setattr("aiohttp.ClientSession", mock_session)
-
-    # Execute
-    result = await tool.execute(context, url="http://example.com")
-
-    # Verify - should be cleaned text
+async def test_read_url_success_text(tool, context, server):
+    server.routes["/page"] = (200, "<html><body><h1>Title</h1><p>Some text content.</p></body></html>", {})
+
+    result = await tool.execute(context, url=f"{server.base_url}/page")
+
     assert "Title" in result
     assert "Some text content." in result
     assert "<html>" not in result
 
+
 @pytest.mark.asyncio
-async def test_read_url_success_html(tool, context, monkeypatch):
-    # Setup mock
-    mock_html = "<html><body><div id='content'>Important Data</div><script>bad</script></body></html>"
-    
-    def mock_session():
-        return _MockSession(response_map={
-            "http://example.com": _MockResponse(text_content=mock_html)
-        })
-    
-    monkeypatch.setattr("aiohttp.ClientSession", mock_session)
-
-    # Execute with html format
-    result = await tool.execute(context, url="http://example.com", output_format="html")
-
-    # Verify - should contain tags but be cleaned
-    assert "<div>" in result or "***" not in result # Cleaning behavior depends on cleaner, but tags should remain
+async def test_read_url_success_html(tool, context, server):
+    server.routes["/page"] = (200, "<html><body><div id='content'>Important Data</div><script>bad</script></body></html>", {})
+
+    result = await tool.execute(context, url=f"{server.base_url}/page", output_format="html")
+
     assert "Important Data" in result
-    assert "<script>" not in result # Cleaner removes scripts
+    assert "<script>" not in result
+
 
 @pytest.mark.asyncio
-async def test_read_url_error_404(tool, context, monkeypatch):
-    # Setup mock for 404
-    def mock_session():
-        return _MockSession(response_map={
-            "http://example.com/notfound": _MockResponse(status=404)
-        })
-    
-    monkeypatch.setattr("aiohttp.ClientSession", mock_session)
-
-    # Execute
-    result = await tool.execute(context, url="http://example.com/notfound")
-
-    # Verify error message
+async def test_read_url_error_404(tool, context, server):
+    result = await tool.execute(context, url=f"{server.base_url}/notfound")
+
     assert "Failed to fetch content" in result
     assert "404" in result
 
-@pytest.mark.asyncio
-async def test_read_url_network_error(tool, context, monkeypatch):
-    # Setup mock to raise exception
-    class _ErrorSession:
-        def get(self, url, timeout=30):
-            raise Exception("Connection refused")
-        async def __aenter__(self): return self
-        async def __aexit__(self, *args): pass
 
-    monkeypatch.setattr("aiohttp.ClientSession", _ErrorSession)
+@pytest.mark.asyncio
+async def test_read_url_network_error(tool, context, server):
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        closed_port = probe.getsockname()[1]
 
-    # Execute
-    result = await tool.execute(context, url="http://example.com")
+    result = await tool.execute(context, url=f"http://127.0.0.1:{closed_port}/")
 
-    # Verify error handling
     assert "Error reading URL" in result
-    assert "Connection refused" in result
+    assert "Network error" in result
+
+
+@pytest.mark.asyncio
+async def test_read_url_reuses_pooled_connection(tool, context, server):
+    for i in range(5):
+        server.routes[f"/p{i}"] = (200, f"<p>page {i}</p>", {"Cache-Control": "no-store"})
+        assert f"page {i}" in await tool.execute(context, url=f"{server.base_url}/p{i}")
+
+    assert server.requests == 5
+    assert len(server.peers) == 1
+
+
+@pytest.mark.asyncio
+async def test_read_url_revalidates_with_etag(tool, context, server):
+    server.routes["/doc"] = (200, "<p>cached body</p>", {"ETag": '"v1"', "Cache-Control": "no-cache"})
+
+    first = await tool.execute(context, url=f"{server.base_url}/doc")
+    second = await tool.execute(context, url=f"{server.base_url}/doc")
+
+    assert first == second and "cached body" in second
+    assert server.requests == 2
+    assert server.conditional_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_read_url_serves_fresh_response_without_request(tool, context, server):
+    server.routes["/fresh"] = (200, "<p>fresh body</p>", {"Cache-Control": "max-age=60"})
+
+    await tool.execute(context, url=f"{server.base_url}/fresh")
+    result = await tool.execute(context, url=f"{server.base_url}/fresh")
+
+    assert "fresh body" in result
+    assert server.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_read_url_truncates_to_output_budget(tool, context, server, monkeypatch):
+    monkeypatch.setenv("AUTOBYTEUS_HTML_CLEAN_MAX_CHARS", "50")
+    server.routes["/long"] = (200, "".join(f"<p>sentence number {i}</p>" for i in range(1000)), {})
+
+    result = await tool.execute(context, url=f"{server.base_url}/long")
+
+    assert result.startswith("sentence number 0")
+    assert "sentence number 999" not in result
+    assert "[read_url: content truncated at about 50 characters]" in result
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import stat
+import time
+
+import pytest
+
+from autobyteus.utils import atomic_write as atomic_write_module
+from autobyteus.utils.atomic_write import FileDurability, atomic_write_text, atomic_write_text_async
+
+
+@pytest.fixture
+def fsync_calls(monkeypatch):
+    calls = []
+    real_fsync = os.fsync
+
+    def counting_fsync(fd):
+        calls.append(stat.S_ISDIR(os.fstat(fd).st_mode))
+        real_fsync(fd)
+
+    monkeypatch.setattr(atomic_write_module.os, "fsync", counting_fsync)
+    return calls
+
+
+@pytest.mark.parametrize(
+    "durability, expected",
+    [(FileDurability.NONE, []), (FileDurability.FILE, [False]), (FileDurability.DIR, [False, True])],
+)
+def test_durability_levels_control_fsync(tmp_path, fsync_calls, durability, expected):
+    atomic_write_text(str(tmp_path / "out.txt"), "hello", durability=durability)
+
+    assert (tmp_path / "out.txt").read_text() == "hello"
+    assert fsync_calls == expected
+
+
+def test_durability_is_read_from_environment(tmp_path, fsync_calls, monkeypatch):
+    monkeypatch.setenv("AUTOBYTEUS_FILE_WRITE_DURABILITY", "none")
+    atomic_write_text(str(tmp_path / "out.txt"), "hello")
+    assert fsync_calls == []
+
+
+def test_failed_write_keeps_original_and_leaves_no_temp_file(tmp_path):
+    target = tmp_path / "out.txt"
+    target.write_text("original")
+
+    def broken_lines():
+        yield "partial\n"
+        raise RuntimeError("generator failed")
+
+    with pytest.raises(RuntimeError):
+        atomic_write_text(str(target), broken_lines())
+
+    assert target.read_text() == "original"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.txt"]
+
+
+def test_replacement_keeps_mode_and_writes_through_symlinks(tmp_path):
+    real = tmp_path / "real.sh"
+    real.write_text("old")
+    os.chmod(real, 0o750)
+    link = tmp_path / "link.sh"
+    link.symlink_to(real)
+
+    atomic_write_text(str(link), ["line 1\n", "line 2\n"])
+
+    assert link.is_symlink()
+    assert real.read_text() == "line 1\nline 2\n"
+    assert stat.S_IMODE(real.stat().st_mode) == 0o750
+
+
+@pytest.mark.asyncio
+async def test_async_write_does_not_block_the_loop(tmp_path):
+    content = "x" * (32 * 1024 * 1024)
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def probe():
+        nonlocal max_lag
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            max_lag = max(max_lag, time.perf_counter() - started - 0.005)
+
+    probe_task = asyncio.create_task(probe())
+    started = time.perf_counter()
+    await atomic_write_text_async(str(tmp_path / "nested" / "big.txt"), content)
+    write_seconds = time.perf_counter() - started
+    done.set()
+    await probe_task
+
+    assert (tmp_path / "nested" / "big.txt").stat().st_size == len(content)
+    assert max_lag < max(0.05, write_seconds / 2)
@@ -1,6 +1,11 @@
 
+import asyncio
+import random
 import unittest
-from autobyteus.utils.diff_utils import apply_unified_diff, PatchApplicationError
+from unittest import mock
+
+from autobyteus.utils import diff_utils
+from autobyteus.utils.diff_utils import apply_unified_diff, apply_unified_diff_async, PatchApplicationError
 
 class TestFuzzyPatching(unittest.TestCase):
     
@@ -91,5 +96,79 @@ index 1234567..89abcde 100644
         patched = apply_unified_diff(original, patch)
         self.assertEqual(patched, ["line1\n", "LINE2"])
 
+    def test_wide_fuzz_finds_hunk_with_stale_line_numbers(self):
+        original = [f"line {i}\n" for i in range(1000)]
+        patch = """@@ -10,3 +10,3 @@
+ line 700
+-line 701
++LINE 701
+ line 702
+"""
+        with self.assertRaises(PatchApplicationError):
+            apply_unified_diff(original, patch, fuzz_factor=2)
+
+        patched = apply_unified_diff(original, patch, fuzz_factor=len(original))
+        self.assertEqual(patched[701], "LINE 701\n")
+        self.assertEqual(len(patched), len(original))
+
+    def test_wide_fuzz_prefers_nearest_match(self):
+        original = ["dup\n", "x\n"] * 20
+        patch = """@@ -32,1 +32,1 @@
+-dup
++DUP
+"""
+        patched = apply_unified_diff(original, patch, fuzz_factor=len(original))
+        # Line 32 is 'x'; the duplicates at lines 31 and 33 are equally far, the earlier one wins.
+        self.assertEqual([i for i, line in enumerate(patched) if line == "DUP\n"], [30])
+
+    def test_reject_ambiguous_refuses_repeated_context(self):
+        original = ["dup\n", "x\n"] * 20
+        patch = """@@ -32,1 +32,1 @@
+-dup
++DUP
+"""
+        with self.assertRaises(PatchApplicationError):
+            apply_unified_diff(original, patch, fuzz_factor=len(original), reject_ambiguous=True)
+
+        original[30] = "unique\n"
+        patch = """@@ -2,1 +2,1 @@
+-unique
++UNIQUE
+"""
+        patched = apply_unified_diff(original, patch, fuzz_factor=len(original), reject_ambiguous=True)
+        self.assertEqual(patched[30], "UNIQUE\n")
+
+    def test_indexed_matching_agrees_with_scanning(self):
+        rng = random.Random(7)
+        original = [f"{rng.choice(['a', 'b', ' c', 'd '])}\n" for _ in range(300)] + ["b"]
+        for _ in range(300):
+            start = rng.randrange(len(original) - 2)
+            context = [line.strip() + "\n" for line in original[start:start + 3]]
+            stated = max(1, start + 1 + rng.randint(-20, 20))
+            patch = f"@@ -{stated},3 +{stated},3 @@\n" + "".join(" " + line for line in context)
+            fuzz = rng.choice([9, 15, 40])
+            ignore_whitespace = rng.choice([False, True])
+            with mock.patch.object(diff_utils, "_SCAN_MAX_FUZZ", 10**9):
+                try:
+                    scanned = apply_unified_diff(original, patch, fuzz, ignore_whitespace)
+                except PatchApplicationError:
+                    scanned = None
+            try:
+                indexed = apply_unified_diff(original, patch, fuzz, ignore_whitespace)
+            except PatchApplicationError:
+                indexed = None
+            self.assertEqual(indexed, scanned)
+
+    def test_async_variant_offloads_large_inputs(self):
+        original = [f"line {i}\n" for i in range(diff_utils.OFFLOAD_MIN_LINES)]
+        patch = """@@ -1,1 +1,1 @@
+-line 0
++LINE 0
+"""
+        with mock.patch.object(diff_utils.asyncio, "to_thread", wraps=asyncio.to_thread) as to_thread:
+            patched = asyncio.run(apply_unified_diff_async(original, patch))
+        to_thread.assert_called_once()
+        self.assertEqual(patched[0], "LINE 0\n")
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,187 @@
+import asyncio
+import hashlib
+import os
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from autobyteus.utils.download_cache import DownloadCache
+from autobyteus.utils.download_utils import download_file_from_url
+
+PAYLOAD = os.urandom(3 * 1024 * 1024 + 17)
+ETAG = '"v1"'
+
+
+class _MediaServer:
+    """Local media server with ETag/Range support and a switch to drop the first transfer midway."""
+
+    def __init__(self):
+        self.full_bodies_sent = 0
+        self.not_modified_sent = 0
+        self.range_requests = []
+        self.drop_next_after = None
+
+    async def handle_asset(self, request: web.Request) -> web.StreamResponse:
+        if request.headers.get("If-None-Match") == ETAG:
+            self.not_modified_sent += 1
+            return web.Response(status=304, headers={"ETag": ETAG})
+
+        start = 0
+        range_header = request.headers.get("Range")
+        if range_header and request.headers.get("If-Range") == ETAG:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            self.range_requests.append(start)
+
+        body = PAYLOAD[start:]
+        status = 206 if start else 200
+        response = web.StreamResponse(status=status, headers={"ETag": ETAG, "Content-Type": "image/png"})
+        response.content_length = len(body)
+        if start:
+            response.headers["Content-Range"] = f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}"
+        await response.prepare(request)
+
+        if self.drop_next_after is not None:
+            cutoff, self.drop_next_after = self.drop_next_after, None
+            await response.write(body[:cutoff])
+            request.transport.close()
+            return response
+
+        if not start:
+            self.full_bodies_sent += 1
+        await response.write(body)
+        await response.write_eof()
+        return response
+
+    async def handle_mirror(self, request: web.Request) -> web.Response:
+        # Same bytes under a different URL and without validators.
+        return web.Response(body=PAYLOAD, content_type="image/png")
+
+    async def handle_other(self, request: web.Request) -> web.Response:
+        return web.Response(body=PAYLOAD[::-1], content_type="image/png")
+
+
+@pytest_asyncio.fixture
+async def media_server():
+    state = _MediaServer()
+    app = web.Application()
+    app.router.add_get("/asset.png", state.handle_asset)
+    app.router.add_get("/mirror.png", state.handle_mirror)
+    app.router.add_get("/other.png", state.handle_other)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield state, f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_revalidated_download_reuses_blob_and_hard_links(media_server, tmp_path):
+    state, base_url = media_server
+    cache = DownloadCache(tmp_path / "cache")
+
+    async with aiohttp.ClientSession() as session:
+        first = await cache.fetch(f"{base_url}/asset.png", session)
+        second = await cache.fetch(f"{base_url}/asset.png", session)
+
+    assert (state.full_bodies_sent, state.not_modified_sent) == (1, 1)
+    assert second.from_cache and second.blob_path == first.blob_path
+    assert first.digest == hashlib.sha256(PAYLOAD).hexdigest()
+    assert second.content_type == "image/png"
+
+    target = tmp_path / "workspace" / "asset.png"
+    await cache.place(second, target)
+    assert target.read_bytes() == PAYLOAD
+    assert os.stat(target).st_ino == os.stat(first.blob_path).st_ino
+
+
+@pytest.mark.asyncio
+async def test_interrupted_download_resumes_with_range(media_server, tmp_path):
+    state, base_url = media_server
+    state.drop_next_after = 1024 * 1024
+    cache = DownloadCache(tmp_path / "cache")
+
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(aiohttp.ClientError):
+            await cache.fetch(f"{base_url}/asset.png", session)
+        download = await cache.fetch(f"{base_url}/asset.png", session)
+
+    assert download.resumed
+    assert len(state.range_requests) == 1 and state.range_requests[0] >= 1024 * 1024
+    assert state.full_bodies_sent == 0
+    assert download.blob_path.read_bytes() == PAYLOAD
+    assert not list((tmp_path / "cache" / "partial").iterdir())
+
+
+@pytest.mark.asyncio
+async def test_identical_content_under_different_urls_is_stored_once(media_server, tmp_path):
+    _, base_url = media_server
+    cache = DownloadCache(tmp_path / "cache")
+
+    async with aiohttp.ClientSession() as session:
+        first = await cache.fetch(f"{base_url}/asset.png", session)
+        second = await cache.fetch(f"{base_url}/mirror.png", session)
+
+    assert first.blob_path == second.blob_path
+    assert len(list((tmp_path / "cache" / "blobs").iterdir())) == 1
+
+
+@pytest.mark.asyncio
+async def test_blob_modified_through_workspace_link_is_not_served(media_server, tmp_path):
+    state, base_url = media_server
+    cache = DownloadCache(tmp_path / "cache")
+    target = tmp_path / "workspace" / "asset.png"
+
+    async with aiohttp.ClientSession() as session:
+        await cache.place(await cache.fetch(f"{base_url}/asset.png", session), target)
+        with open(target, "r+b") as handle:  # In-place edit shares the inode with the blob.
+            handle.write(b"edited")
+        download = await cache.fetch(f"{base_url}/asset.png", session)
+
+    assert state.full_bodies_sent == 2
+    assert download.blob_path.read_bytes() == PAYLOAD
+
+
+@pytest.mark.asyncio
+async def test_download_file_from_url_uses_shared_cache(media_server, tmp_path, monkeypatch):
+    state, base_url = media_server
+    monkeypatch.setenv("AUTOBYTEUS_DOWNLOAD_CACHE_DIR", str(tmp_path / "cache"))
+
+    await download_file_from_url(f"{base_url}/asset.png", tmp_path / "a" / "asset.png")
+    await download_file_from_url(f"{base_url}/asset.png", tmp_path / "b" / "asset.png")
+
+    assert (state.full_bodies_sent, state.not_modified_sent) == (1, 1)
+    assert (tmp_path / "b" / "asset.png").read_bytes() == PAYLOAD
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_of_one_url_share_a_single_download(media_server, tmp_path):
+    state, base_url = media_server
+    cache = DownloadCache(tmp_path / "cache")
+
+    async with aiohttp.ClientSession() as session:
+        downloads = await asyncio.gather(*(cache.fetch(f"{base_url}/asset.png", session) for _ in range(3)))
+
+    assert state.full_bodies_sent == 1
+    assert {download.blob_path for download in downloads} == {downloads[0].blob_path}
+    assert downloads[0].blob_path.read_bytes() == PAYLOAD
+
+
+@pytest.mark.asyncio
+async def test_blobs_past_the_byte_budget_are_evicted_least_recently_used(media_server, tmp_path):
+    state, base_url = media_server
+    cache = DownloadCache(tmp_path / "cache", max_bytes=len(PAYLOAD) + 1)
+
+    async with aiohttp.ClientSession() as session:
+        first = await cache.fetch(f"{base_url}/asset.png", session)
+        second = await cache.fetch(f"{base_url}/other.png", session)
+        assert not first.blob_path.exists() and second.blob_path.exists()
+        assert cache.blob_bytes == len(PAYLOAD)
+
+        await cache.fetch(f"{base_url}/asset.png", session)
+
+    assert state.full_bodies_sent == 2
+    assert not second.blob_path.exists()
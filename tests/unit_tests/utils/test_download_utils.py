@@ -4,6 +4,10 @@ from pathlib import Path
 import aiohttp
 from autobyteus.utils.download_utils import download_file_from_url
 
+@pytest.fixture(autouse=True)
+def _isolated_download_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("AUTOBYTEUS_DOWNLOAD_CACHE_DIR", str(tmp_path / "download-cache"))
+
 # Helper to create a mock response context manager
 class MockResponse:
     def __init__(self, status=200, content=b"data"):
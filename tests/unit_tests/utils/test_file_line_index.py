@@ -0,0 +1,78 @@
+import os
+import random
+
+import pytest
+
+from autobyteus.utils import file_line_index
+from autobyteus.utils.file_line_index import FileLineIndex, FileLineIndexCache, read_line_range
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    # Small blocks exercise lookups that start in the middle of the file.
+    monkeypatch.setattr(file_line_index, "BLOCK_SIZE", 64)
+
+
+def _reference(lines, start, end):
+    return "".join(lines[start - 1:end]).replace("\r\n", "\n")
+
+
+def test_ranges_match_reference_slicing(tmp_path, small_blocks):
+    rng = random.Random(3)
+    lines = [("x" * rng.randint(0, 40)) + rng.choice(["\n", "\r\n"]) for _ in range(500)] + ["tail Ü"]
+    path = tmp_path / "data.txt"
+    path.write_bytes("".join(lines).encode("utf-8"))
+    index = FileLineIndex.build(str(path))
+    assert index.total_lines == len(lines)
+
+    for _ in range(200):
+        start = rng.randint(1, len(lines) + 2)
+        end = rng.randint(start, len(lines) + 5)
+        result = index.read_range(start, end)
+        assert result.text == _reference(lines, start, end)
+        if start <= len(lines):
+            assert result.last_line == min(end, len(lines))
+
+
+def test_open_ended_and_empty_files(tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert read_line_range(str(empty)).text == ""
+
+    path = tmp_path / "data.txt"
+    path.write_text("a\nb\nc\n", encoding="utf-8")
+    assert read_line_range(str(path), start_line=2).text == "b\nc\n"
+    assert read_line_range(str(path), start_line=4).text == ""
+
+
+def test_max_bytes_truncates_at_line_boundary(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("".join(f"line {i:03d}\n" for i in range(1, 101)), encoding="utf-8")
+
+    result = read_line_range(str(path), start_line=10, max_bytes=45)
+    assert result.truncated is True
+    assert result.text == "line 010\nline 011\nline 012\nline 013\nline 014\n"
+    assert result.last_line == 14
+
+    long_line = tmp_path / "long.txt"
+    long_line.write_text("y" * 100 + "\n", encoding="utf-8")
+    head = read_line_range(str(long_line), max_bytes=10)
+    assert head.truncated is True and head.text == "y" * 10
+
+
+def test_cache_reuses_index_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "data.txt"
+    path.write_text("one\ntwo\n", encoding="utf-8")
+    cache = FileLineIndexCache()
+    builds = []
+    original_build = FileLineIndex.build.__func__
+    monkeypatch.setattr(FileLineIndex, "build", classmethod(lambda cls, p: builds.append(p) or original_build(cls, p)))
+
+    assert read_line_range(str(path), 2, 2, cache=cache).text == "two\n"
+    assert read_line_range(str(path), 1, 1, cache=cache).text == "one\n"
+    assert len(builds) == 1
+
+    path.write_text("one\ntwo\nthree\n", encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert read_line_range(str(path), 3, 3, cache=cache).text == "three\n"
+    assert len(builds) == 2
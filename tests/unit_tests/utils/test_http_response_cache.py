@@ -0,0 +1,147 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from autobyteus.utils import http_response_cache
+from autobyteus.utils.http_response_cache import HttpResponseCache, HttpResponse, freshness_lifetime
+
+
+@pytest_asyncio.fixture
+async def page_server():
+    requests = []
+
+    async def handle_page(request: web.Request) -> web.Response:
+        requests.append(request.path)
+        await asyncio.sleep(0.05)
+        return web.Response(text="cached page", headers={"Cache-Control": "max-age=60"})
+
+    async def handle_uncacheable(request: web.Request) -> web.Response:
+        requests.append(request.path)
+        return web.Response(text="no freshness, no validators")
+
+    async def handle_latin1(request: web.Request) -> web.Response:
+        requests.append(request.path)
+        return web.Response(
+            body="café".encode("latin-1"), headers={"Content-Type": "text/html", "Cache-Control": "max-age=60"}
+        )
+
+    async def handle_error(request: web.Request) -> web.Response:
+        requests.append(request.path)
+        await asyncio.sleep(0.05)
+        return web.Response(status=500, text="server error")
+
+    app = web.Application()
+    app.router.add_get("/page", handle_page)
+    app.router.add_get("/uncacheable", handle_uncacheable)
+    app.router.add_get("/latin1", handle_latin1)
+    app.router.add_get("/error", handle_error)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield requests, f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+def test_freshness_lifetime_precedence():
+    date = "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert freshness_lifetime({"cache-control": "public, max-age=120", "expires": date}, 0) == 120
+    assert freshness_lifetime({"date": date, "expires": "Mon, 01 Jan 2024 00:10:00 GMT"}, 0) == 600
+    assert freshness_lifetime({"date": date, "expires": "0"}, 0) == 0
+    # Heuristic: 10% of the age of Last-Modified, capped at a day.
+    assert freshness_lifetime({"date": date, "last-modified": "Sun, 31 Dec 2023 23:00:00 GMT"}, 0) == 360
+    assert freshness_lifetime({"date": date, "last-modified": "Mon, 01 Jan 2018 00:00:00 GMT"}, 0) == 86400
+    assert freshness_lifetime({}, 0) == 0
+
+
+def test_eviction_drops_least_recently_used_bodies(tmp_path):
+    cache = HttpResponseCache(tmp_path, max_bytes=3000)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache._store(key, {"url": key, "status": 200, "headers": {}, "vary": {}, "response_time": 0}, b"x" * 900)
+        os.utime(cache.bodies_dir / key, (i, i))
+    cache._touch("a")
+
+    cache._store("d", {"url": "d", "status": 200, "headers": {}, "vary": {}, "response_time": 0}, b"x" * 900)
+
+    assert sorted(p.name for p in cache.bodies_dir.iterdir()) == ["a", "c", "d"]
+    assert not (cache.entries_dir / "b.json").exists()
+
+
+def test_text_uses_declared_charset():
+    body = "café".encode("latin-1")
+    assert HttpResponse(200, {"content-type": "text/html; charset=ISO-8859-1"}, body).text() == "café"
+    assert HttpResponse(200, {"content-type": "text/html; charset=bogus"}, b"ok").text() == "ok"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_of_one_url_share_a_single_request(page_server, tmp_path):
+    requests, base_url = page_server
+    cache = HttpResponseCache(tmp_path)
+
+    async with aiohttp.ClientSession() as session:
+        responses = await asyncio.gather(*(cache.fetch(session, f"{base_url}/page") for _ in range(20)))
+        again = await cache.fetch(session, f"{base_url}/page")
+
+    assert requests == ["/page"]
+    assert {response.text() for response in responses} == {"cached page"}
+    assert sum(not response.from_cache for response in responses) == 1
+    assert again.from_cache
+    assert [p.name for p in cache.bodies_dir.iterdir()] == [cache._key(f"{base_url}/page")]
+
+
+@pytest.mark.asyncio
+async def test_response_without_freshness_or_validators_is_not_stored(page_server, tmp_path):
+    requests, base_url = page_server
+    cache = HttpResponseCache(tmp_path)
+
+    async with aiohttp.ClientSession() as session:
+        first = await cache.fetch(session, f"{base_url}/uncacheable")
+        second = await cache.fetch(session, f"{base_url}/uncacheable")
+
+    assert first.text() == second.text() == "no freshness, no validators"
+    assert not second.from_cache
+    assert len(requests) == 2
+    assert list(cache.bodies_dir.iterdir()) == []
+    assert list(cache.entries_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_text_keeps_the_detected_encoding_through_the_cache(page_server, tmp_path):
+    requests, base_url = page_server
+    cache = HttpResponseCache(tmp_path)
+
+    async with aiohttp.ClientSession(fallback_charset_resolver=lambda response, body: "latin-1") as session:
+        fetched = await cache.fetch(session, f"{base_url}/latin1")
+        cached = await cache.fetch(session, f"{base_url}/latin1")
+
+    assert cached.from_cache and requests == ["/latin1"]
+    assert fetched.text() == cached.text() == "café"
+
+
+@pytest.mark.asyncio
+async def test_requests_joining_a_failed_fetch_are_not_marked_cached(page_server, tmp_path):
+    requests, base_url = page_server
+    cache = HttpResponseCache(tmp_path)
+
+    async with aiohttp.ClientSession() as session:
+        responses = await asyncio.gather(*(cache.fetch(session, f"{base_url}/error") for _ in range(5)))
+
+    assert requests == ["/error"]
+    assert {response.status for response in responses} == {500}
+    assert not any(response.from_cache for response in responses)
+
+
+def test_concurrent_first_calls_share_one_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv(http_response_cache.ENV_HTTP_CACHE_DIR, str(tmp_path))
+    monkeypatch.setattr(http_response_cache, "_default_cache", None)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        caches = list(pool.map(lambda _: http_response_cache.get_http_response_cache(), range(32)))
+
+    assert len({id(cache) for cache in caches}) == 1
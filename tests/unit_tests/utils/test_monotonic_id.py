@@ -0,0 +1,40 @@
+from autobyteus.utils import monotonic_id
+from autobyteus.utils.monotonic_id import MonotonicIdGenerator, id_generator_for
+
+
+def test_ids_are_unique_and_sorted_within_a_millisecond(monkeypatch):
+    monkeypatch.setattr(monotonic_id.time, "time_ns", lambda: 1_700_000_000_000 * 1_000_000)
+    generator = MonotonicIdGenerator(node="abcd")
+
+    ids = [generator.next_id("rt_") for _ in range(1000)]
+
+    assert ids[0] == "rt_170000000000000000abcd"
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+
+
+def test_ids_stay_monotonic_when_clock_goes_back_or_sequence_overflows(monkeypatch):
+    clock = [2_000 * 1_000_000]
+    monkeypatch.setattr(monotonic_id.time, "time_ns", lambda: clock[0])
+    monkeypatch.setattr(monotonic_id, "_MAX_SEQ", 2)
+    generator = MonotonicIdGenerator(node="0000")
+
+    ids = [generator.next_id() for _ in range(4)]
+    clock[0] = 1_000 * 1_000_000
+    ids.append(generator.next_id())
+
+    assert ids == sorted(ids)
+    assert ids[3] == f"{2001:013d}{0:05d}0000"
+    assert len(set(ids)) == len(ids)
+
+
+def test_new_ids_sort_after_legacy_millisecond_ids():
+    legacy = "rt_1700000000000"
+    assert legacy < MonotonicIdGenerator().next_id("rt_")
+
+
+def test_id_generator_is_shared_per_agent():
+    generator = id_generator_for("agent_ids")
+    assert id_generator_for("agent_ids") is generator
+    assert id_generator_for("other_agent") is not generator
+
@@ -7,7 +7,7 @@ covering different cleaning modes and edge cases.
 
 import pytest
 from bs4 import BeautifulSoup
-from autobyteus.utils.html_cleaner import clean, CleaningMode
+from autobyteus.utils.html_cleaner import clean, clean_async, clean_bounded, CleaningMode, OFFLOAD_MIN_CHARS
 
 # Test HTML inputs - can be modified as needed
 SAMPLE_HTML = """
@@ -183,4 +183,30 @@ def test_whitespace_cleaning():
             </div>
         """
     result = clean(messy_html, CleaningMode.STANDARD)
-    assert "Multiple Spaces And Lines" in normalize_html(result)
\ No newline at end of file
+    assert "Multiple Spaces And Lines" in normalize_html(result)
+
+
+def test_output_budget_stops_early():
+    """Test that cleaning stops once the output budget is reached."""
+    page = "<html><body>" + "".join(f"<p>paragraph {i}</p>" for i in range(10000)) + "</body></html>"
+    text = clean_bounded(page, CleaningMode.TEXT_CONTENT_FOCUSED, max_chars=100)
+    assert text.truncated is True
+    assert len(text.text) <= 100
+    assert text.text.startswith("paragraph 0 paragraph 1")
+
+    markup = clean_bounded(page, CleaningMode.THOROUGH, max_chars=100)
+    assert markup.truncated is True
+    assert markup.text.startswith("<p>paragraph 0</p>")
+    assert markup.text.endswith("</p>")
+
+    assert clean_bounded(page, CleaningMode.THOROUGH).truncated is False
+
+
+@pytest.mark.asyncio
+async def test_clean_async_matches_clean(complex_html):
+    """Test that offloaded cleaning returns the same result as inline cleaning."""
+    large = complex_html * 200
+    assert len(large) >= OFFLOAD_MIN_CHARS
+    for mode in (CleaningMode.TEXT_CONTENT_FOCUSED, CleaningMode.STANDARD):
+        result = await clean_async(large, mode)
+        assert result.text == clean(large, mode)